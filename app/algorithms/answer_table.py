@@ -0,0 +1,279 @@
+import os
+import threading
+
+import numpy as np
+
+from .feature_store import get_feature_store
+from .instrumentation import count
+from .result_store import preference_hash
+
+try:
+    import fcntl
+except ImportError:
+    #No cross-process write lock on Windows, writers in one process still serialize
+    fcntl = None
+
+# Persistent answer table behind the match cache. Every preferences page input
+# is discrete, so the features dicts it can produce form a finite set. The
+# table maps a preference to its ANSWER_DEPTH best feature store rows, so a
+# Dijkstra request that hits is one hash probe with no kNN graph and no
+# search. Only Dijkstra uses it (see result_cache.py): the Bellman-Ford
+# variants are there to compare searches, so they always run theirs.
+#
+# On disk it is one .npy file of fixed-size slots, open addressing with linear
+# probing on the 64-bit preference hash (0 marks an empty slot), memory-mapped
+# by every process. utils/build_answers.py fills it offline from the
+# reachable preference space or logged profiles; Dijkstra misses are computed
+# as usual and written back by result_cache.cache_match. A writer
+# fills the rows before the key, under a file lock, and doubles the table when
+# it gets too full, judged by an entry count kept in memory: it is recounted
+# when the file is (re)opened and when a probe runs long, which is how writes
+# by other processes into the same file show up. The file name carries the dataset digest, so a rebuilt
+# dataset starts a fresh table. Filtered requests are not stored.
+
+#Ranked rows kept per preference, matches result_cache.CACHE_DEPTH
+ANSWER_DEPTH = 20
+
+#Slots in a table created by the first write-back
+INITIAL_CAPACITY = 1 << 16
+
+#Largest share of used slots before the table is doubled
+MAX_LOAD = 0.7
+
+#Probes of one insert past which the entry count is recounted
+MAX_PROBES = 32
+
+
+def answer_path(store, depth=ANSWER_DEPTH):
+    return os.path.join(store.cache_dir, f"answers_{store.digest[:16]}_k{depth}.npy")
+
+
+def answer_key(features: dict):
+    """64-bit table key of a features dict, never 0."""
+    return int(preference_hash(features), 16) or 1
+
+
+def slot_dtype(n_rows, depth=ANSWER_DEPTH):
+    row_type = "<u2" if n_rows < np.iinfo(np.uint16).max else "<u4"
+    return np.dtype([("key", "<u8"), ("rows", row_type, (depth,))])
+
+
+def _capacity_for(n_entries):
+    capacity = INITIAL_CAPACITY
+    while n_entries > MAX_LOAD * capacity:
+        capacity *= 2
+    return capacity
+
+
+def _insert(slots, key, rows):
+    #Linear probing from the key's home slot, returns the slots probed or 0 if the key was already there
+    mask = len(slots) - 1
+    i = key & mask
+    probes = 1
+    while True:
+        found = int(slots["key"][i])
+        if found == key:
+            return 0
+        if found == 0:
+            padded = np.full(slots.dtype["rows"].shape, np.iinfo(slots.dtype["rows"].base).max)
+            padded[:len(rows)] = rows
+            slots["rows"][i] = padded
+            slots["key"][i] = key
+            return probes
+        i = (i + 1) & mask
+        probes += 1
+
+
+def write_answers(path, dtype, keys, rows, capacity=None):
+    """Write a new table holding keys[i] -> rows[i], replacing path; returns how many entries it holds."""
+    capacity = capacity or _capacity_for(len(keys))
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    slots = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=dtype, shape=(capacity,))
+    n_entries = 0
+    for key, ranked in zip(keys, rows):
+        n_entries += _insert(slots, int(key), ranked) > 0
+    slots.flush()
+    del slots
+    os.replace(tmp_path, path)
+    return n_entries
+
+
+class AnswerTable:
+    def __init__(self, store, depth=ANSWER_DEPTH):
+        self.path = answer_path(store, depth)
+        self.digest = store.digest
+        self.depth = depth
+        self.dtype = slot_dtype(store.n_rows, depth)
+        self._missing = np.iinfo(self.dtype["rows"].base).max
+        self._lock = threading.Lock()
+        self._slots = None
+        self._stat = None
+        self._count = 0
+        self._open()
+
+    def _open(self):
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            self._slots, self._stat, self._count = None, None, 0
+            return
+        try:
+            slots = np.load(self.path, mmap_mode="r+")
+        except PermissionError:
+            slots = np.load(self.path, mmap_mode="r")
+        if slots.dtype != self.dtype:
+            #Left over from another layout, rebuilt on the next write
+            slots = None
+        self._slots, self._stat = slots, (st.st_ino, st.st_size)
+        self._count = self._used()
+
+    def _used(self):
+        slots = self._slots
+        return 0 if slots is None else int(np.count_nonzero(slots["key"]))
+
+    def _reopen_if_replaced(self):
+        #Another process may have replaced the file (offline build or growth). In-place
+        #writes through the mmap touch the mtime, so only a new inode or size counts
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            self._slots, self._stat, self._count = None, None, 0
+            return
+        if (st.st_ino, st.st_size) != self._stat:
+            self._open()
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def capacity(self):
+        return 0 if self._slots is None else len(self._slots)
+
+    def get(self, key):
+        """Ranked feature store rows stored for key, or None."""
+        with self._lock:
+            self._reopen_if_replaced()
+            slots = self._slots
+        if slots is None:
+            return None
+        mask = len(slots) - 1
+        i = key & mask
+        while True:
+            found = int(slots["key"][i])
+            if found == key:
+                rows = slots["rows"][i]
+                return rows[rows != self._missing].astype(np.intp)
+            if found == 0:
+                return None
+            i = (i + 1) & mask
+
+    def put(self, key, rows):
+        """Store the ranked rows for key unless it is there already."""
+        rows = np.asarray(rows)[:self.depth]
+        try:
+            with self._lock, _FileLock(f"{self.path}.lock"):
+                self._reopen_if_replaced()
+                if self._slots is None:
+                    write_answers(self.path, self.dtype, [key], [rows])
+                    self._open()
+                elif self._slots.flags.writeable:
+                    if self._count + 1 > MAX_LOAD * len(self._slots):
+                        self._grow()
+                    probes = _insert(self._slots, key, rows)
+                    if probes > MAX_PROBES:
+                        #Other processes' in-place inserts are not in the count
+                        self._count = self._used()
+                    elif probes:
+                        self._count += 1
+        except OSError:
+            #Read-only deployments just keep answering from the match cache
+            pass
+
+    def _grow(self):
+        used = self._slots[self._slots["key"] != 0]
+        write_answers(self.path, self.dtype, used["key"], used["rows"], capacity=2 * len(self._slots))
+        self._open()
+
+    def entries(self):
+        """(keys, rows) of every stored preference, a copy."""
+        with self._lock:
+            self._reopen_if_replaced()
+        if self._slots is None:
+            return np.empty(0, dtype=np.uint64), np.empty((0, self.depth), dtype=self.dtype["rows"].base)
+        used = self._slots[self._slots["key"] != 0]
+        return used["key"].copy(), used["rows"].copy()
+
+
+class _FileLock:
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+
+    def __enter__(self):
+        if fcntl is not None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._file = open(self.path, "a")
+            fcntl.flock(self._file, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        if self._file is not None:
+            fcntl.flock(self._file, fcntl.LOCK_UN)
+            self._file.close()
+
+
+_table = None
+_table_lock = threading.Lock()
+
+
+def get_answer_table():
+    """AnswerTable for the current feature store, reopened when the dataset changes."""
+    global _table
+    store = get_feature_store()
+    table = _table
+    if table is not None and table.digest == store.digest:
+        return table
+    with _table_lock:
+        if _table is None or _table.digest != store.digest:
+            _table = AnswerTable(store)
+        return _table
+
+
+def distance_column(features: dict):
+    """DistanceToIdeal for every feature store row (NaN where unusable), as the algorithms compute it."""
+    store = get_feature_store()
+    rows, normalized = store.normalized(list(features))
+    column = np.full(store.n_rows, np.nan)
+    column[rows] = np.linalg.norm(normalized - np.array(list(features.values())), axis=1)
+    return column
+
+
+def row_distances(features: dict, rows):
+    """DistanceToIdeal of the given usable feature store rows only, as distance_column has them."""
+    usable, normalized = get_feature_store().normalized(list(features))
+    #Column-major like the full matrix, so each row sums in the same order
+    picked = np.asfortranarray(normalized[np.searchsorted(usable, rows)])
+    return np.linalg.norm(picked - np.array(list(features.values())), axis=1)
+
+
+def lookup(features: dict):
+    """(rows, distances) of the stored ranking for an unfiltered request, or None on a miss.
+
+    Only the ranked rows are scored; callers needing every row's distance build distance_column themselves.
+    """
+    table = get_answer_table()
+    rows = table.get(answer_key(features))
+    if rows is None:
+        count("county_answer_table_lookups_total", result="miss")
+        return None
+    count("county_answer_table_lookups_total", result="hit")
+    return rows, row_distances(features, rows)
+
+
+def store_answer(features: dict, rows):
+    """Write back the ranked rows of an unfiltered request computed on a miss."""
+    table = get_answer_table()
+    if len(rows) < min(table.depth, get_feature_store().n_rows):
+        return
+    table.put(answer_key(features), rows)
@@ -1,114 +1,200 @@
-import pandas as pd
 import numpy as np
-import networkx as nx
-import os
 import time
-
-
-def bellman_ford_algorithm(features: dict):
-    from sklearn.preprocessing import MinMaxScaler
-    from sklearn.neighbors import NearestNeighbors
-    
-    #Normalizing the ideal features and creating the graph is basically 
+import logging
+from collections import deque
+
+from .feature_store import get_feature_store
+from .instrumentation import span, traced
+from .knn_cache import request_graph
+from .ranking import best_per_state, ranked_matches, top_k_indices
+from .result_cache import CACHE_DEPTH, cache_match, cached_match
+from .result_store import export_distances, get_result_store, preference_hash
+
+logger = logging.getLogger(__name__)
+
+#SPFA reports progress every this many queue pops
+SPFA_PROGRESS_EVERY = 256
+
+
+#progress, when given, is called as progress(done, total) between relaxation rounds
+#(queue pops for SPFA) and may raise to abandon the search. stats, when given, is
+#filled with relaxations (edges tried), improvements, and rounds or queue_pops
+def bellman_ford(graph, start, progress=None, stats=None):
+    #Initialize distances and predecessors
+    dist = [float('inf')] * graph.n_nodes
+    pred = [-1] * graph.n_nodes
+    dist[start] = 0
+
+    #Extract all edges, the CSR graph already stores both directions
+    src, dst, weights = graph.edge_arrays()
+    edges = list(zip(src.tolist(), dst.tolist(), weights.tolist()))
+
+    V = graph.n_nodes
+
+    #Relax edges repeatedly
+    rounds = 0
+    improvements = 0
+    for round_ in range(V - 1):
+        if progress is not None:
+            progress(round_, V - 1)
+        rounds += 1
+        updated = False
+        for u, v, w in edges:
+            if dist[u] + w < dist[v]:
+                dist[v] = dist[u] + w
+                pred[v] = u
+                updated = True
+                improvements += 1
+        if not updated:
+            break  #Stop when no more updates
+
+    if stats is not None:
+        stats.update(relaxations=rounds * len(edges), improvements=improvements, rounds=rounds)
+    return np.array(dist)
+
+
+def bellman_ford_vectorized(graph, start, progress=None, stats=None):
+    #Same relaxation as bellman_ford, but each round relaxes every edge at once
+    src, dst, weights = graph.edge_arrays()
+
+    #Group edges by destination so a round is one minimum-reduce per node
+    order = np.argsort(dst, kind="stable")
+    src, dst, weights = src[order], dst[order], weights[order]
+    targets, starts = np.unique(dst, return_index=True)
+
+    dist = np.full(graph.n_nodes, np.inf)
+    dist[start] = 0.0
+
+    V = graph.n_nodes
+    rounds = 0
+    improvements = 0
+    for round_ in range(V - 1):
+        if progress is not None:
+            progress(round_, V - 1)
+        rounds += 1
+        candidates = dist[src] + weights
+        best = np.minimum.reduceat(candidates, starts)
+        improved = best < dist[targets]
+        if not improved.any():
+            break  #Stop when no more updates
+        dist[targets[improved]] = best[improved]
+        improvements += int(improved.sum())
+
+    if stats is not None:
+        stats.update(relaxations=rounds * len(src), improvements=improvements, rounds=rounds)
+    return dist
+
+
+def spfa(graph, start, progress=None, stats=None):
+    #Shortest Path Faster Algorithm: only relax edges out of nodes whose distance changed
+    indptr = graph.indptr.tolist()
+    indices = graph.indices.tolist()
+    weights = graph.weights.tolist()
+
+    dist = [float('inf')] * graph.n_nodes
+    dist[start] = 0
+    in_queue = [False] * graph.n_nodes
+    queue = deque([start])
+    in_queue[start] = True
+
+    pops = 0
+    relaxations = 0
+    improvements = 0
+    while queue:
+        #Progress is the number of queue pops, roughly one per node when the graph is well behaved
+        if progress is not None and pops % SPFA_PROGRESS_EVERY == 0:
+            progress(pops, graph.n_nodes)
+        pops += 1
+        u = queue.popleft()
+        in_queue[u] = False
+        relaxations += indptr[u + 1] - indptr[u]
+        for e in range(indptr[u], indptr[u + 1]):
+            v = indices[e]
+            new_dist = dist[u] + weights[e]
+            if new_dist < dist[v]:
+                dist[v] = new_dist
+                improvements += 1
+                if not in_queue[v]:
+                    queue.append(v)
+                    in_queue[v] = True
+
+    if stats is not None:
+        stats.update(relaxations=relaxations, improvements=improvements, queue_pops=pops)
+    return np.array(dist)
+
+
+BELLMAN_FORD_MODES = {
+    "classic": bellman_ford,
+    "vectorized": bellman_ford_vectorized,
+    "spfa": spfa,
+}
+
+
+@traced("bellman_ford")
+def bellman_ford_algorithm(features: dict, mode: str = "vectorized", k: int = 5, session_id=None, export: bool = False,
+                           progress=None, run_search=None, filters=None, per_state=False):
+    #run_search(mode, graph, start, progress) lets a caller run the search elsewhere (jobs.py uses a process pool)
+    #filters (a filters.CountyFilter) limits the candidates before anything is scored
+    #per_state adds the best county of every state as matches.attrs["per_state"]
+    if mode not in BELLMAN_FORD_MODES:
+        raise ValueError(f"Unknown Bellman-Ford mode {mode!r}, expected one of {list(BELLMAN_FORD_MODES)}")
+    search = BELLMAN_FORD_MODES[mode]
+
+    #Identical preferences from any session are served from the match cache
+    with span("cache_lookup"):
+        cached = None if export else cached_match(f"bellman_ford:{mode}", features, k, session_id, filters, per_state)
+    if cached is not None:
+        return cached
+
+    logger.debug("Provided features: %s", features)
+
+    #Normalizing the ideal features and creating the graph is basically
     #the same as the process in Dijkstra's algorithm
 
-    file_path = os.path.join(os.path.dirname(__file__), "../../app/data/county_demographics.csv")
-    data = pd.read_csv(file_path)
-
-    feature_names = list(features.keys())
-
-    #Extract relevant columns
-    subset = data[["County", "State"] + feature_names].dropna()
-
-    scaler = MinMaxScaler()
-    normalized = scaler.fit_transform(subset[feature_names])
-    subset[feature_names] = normalized
-
-    #Array of weights
-    ideal = np.array(list(features.values()))
-
-    #Normalize the weights
-    subset["distance_to_ideal"] = np.linalg.norm(subset[feature_names].values - ideal, axis=1)
-
-    X = subset[feature_names].values
-    k = 5  #number of neighbors, make it so it's not too clustered
-    nbrs = NearestNeighbors(n_neighbors=k+1).fit(X)
-    distances, indices = nbrs.kneighbors(X)
-
-    G = nx.Graph()
-
-    #Add counties as nodes
-    for i, row in subset.iterrows():
-        G.add_node(i, county=row["County"], state=row["State"])
-
-    #Add weighted edges
-    for i in range(len(subset)):
-        for j, d in zip(indices[i][1:], distances[i][1:]):
-            G.add_edge(i, j, weight=d)
-
-    perfect_index = len(subset)
-    #Adding the perfect county node based on user's preferences
-    G.add_node(perfect_index, county="Perfect County", state="Ideal")
-
-    #Adding the edges of perfect county to the graph, edge weight using distance_to_ideal
-    for i, row in subset.iterrows():
-        G.add_edge(perfect_index, i, weight=row["distance_to_ideal"])
-    
-    def bellman_ford(graph, start):
-        #Initialize distances and predecessors
-        dist = {node: float('inf') for node in graph.nodes}
-        pred = {node: None for node in graph.nodes}
-        dist[start] = 0
-
-        #Extract all edges
-        edges = []
-        for u, v, data in graph.edges(data=True):
-            weight = data.get('weight', 1.0)
-            edges.append((u, v, weight))
-            #For undirected graphs, add both directions
-            if not isinstance(graph, nx.DiGraph):
-                edges.append((v, u, weight))
-
-        V = len(graph.nodes)
-
-        #Relax edges repeatedly
-        for _ in range(V - 1):
-            updated = False
-            for u, v, w in edges:
-                if dist[u] + w < dist[v]:
-                    dist[v] = dist[u] + w
-                    pred[v] = u
-                    updated = True
-            if not updated:
-                break  #Stop when no more updates
-
-        return dist
-    
-
-    start_time = time.time()
-    shortest_distances = bellman_ford(G, perfect_index)
-    end_time = time.time()
-    time_elapsed = end_time - start_time
-
-    #Accessing the distances from shortest_distances
-    distance_map = {node: dist for node, dist in shortest_distances.items() if node in subset.index}
-
-    #Creating the new column
-    data["DistanceToIdeal"] = data.index.map(distance_map)
-
-    #Saving it to the data folder
-    output_path = "app/data/county_demographics_with_distances.csv"
-    data.to_csv(output_path, index=False)
-
-    #Find node with smallest distance
-    closest_idx = min(
-        (i for i in shortest_distances if i != perfect_index),
-        key=lambda i: shortest_distances[i]
-    )
-
-    best_county = subset.loc[closest_idx]
-    print("Closest to Perfect County:")
-    print(best_county[["County", "State"]])
-    print("Time elapsed:", time_elapsed)
-
-    return best_county[["County", "State"]], time_elapsed
\ No newline at end of file
+    #County table and normalized features come from the shared memory-mapped store
+    with span("load"):
+        store = get_feature_store()
+
+    n_neighbors = 5  #number of neighbors, make it so it's not too clustered
+
+    #Usable rows of the table (those passing filters), their distance to the ideal and the graph;
+    #the kNN adjacency is cached per feature set, only the perfect county edges are new
+    rows, distance_to_ideal, G = request_graph(features, filters, n_neighbors)
+    perfect_index = G.perfect_index
+
+    with span("search"):
+        start_time = time.time()
+        if run_search is None:
+            shortest_distances = search(G, perfect_index, progress)
+        else:
+            shortest_distances = run_search(mode, G, perfect_index, progress)
+        end_time = time.time()
+        time_elapsed = end_time - start_time
+
+    with span("materialize"):
+        #Creating the new column, counties dropped for missing data stay NaN
+        county_distances = shortest_distances[:perfect_index]
+        distance_column = np.full(store.n_rows, np.nan)
+        distance_column[rows] = county_distances
+
+        #Keep the column in memory for this session's map, writing the CSV only on request
+        if session_id is not None:
+            get_result_store().put(session_id, preference_hash(features, filters), distance_column)
+
+        #Rank the k nodes with smallest distance
+        closest = top_k_indices(county_distances, max(k, CACHE_DEPTH))
+        matches = ranked_matches(store, rows, closest, county_distances[closest])
+        cache_match(f"bellman_ford:{mode}", features, matches, distance_column, time_elapsed, filters)
+
+    if export:
+        with span("export"):
+            export_distances(store.frame(), distance_column)
+
+    logger.debug("Closest to Perfect County: %s, %s (search %.6f s)",
+                 matches["County"].iloc[0], matches["State"].iloc[0], time_elapsed)
+
+    matches = matches.head(k)
+    if per_state:
+        with span("per_state"):
+            matches.attrs["per_state"] = best_per_state(store, distance_column)
+    return matches, time_elapsed
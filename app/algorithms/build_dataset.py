@@ -0,0 +1,187 @@
+import argparse
+import os
+import re
+import sys
+
+import numpy as np
+import pandas as pd
+
+from .feature_store import (DATASET_PATH, DATASET_VERSION, DATA_DIR, FIPS_COLUMN, LABEL_COLUMNS, DatasetError,
+                            canonical_column, map_table, write_table)
+
+# Build step for app/data/county_demographics.bin, the typed binary dataset the
+# feature store memory-maps. Reads the raw county CSV, validates it and writes
+# the table with a content hash:
+#   - the file must not contain merge conflict markers
+#   - column names are canonicalized (runs of whitespace, such as the tab in
+#     "Ethnicities.White Alone\t not Hispanic or Latino", become one space)
+#     and must be unique, with County, State and fips present
+#   - rows with no values at all are dropped; every other row needs a county,
+#     a state and a FIPS code
+#   - FIPS codes must be whole numbers from 1 to 99999 and unique; they are
+#     stored once as five-digit strings
+#   - every other column must be numeric and finite, "Percent" columns within
+#     [-1, 100] (-1 is the source's "not available" value)
+# Invalid input is refused with the full list of problems.
+#
+#   python -m app.algorithms.build_dataset
+#   python -m app.algorithms.build_dataset --check
+
+SOURCE_PATH = os.path.join(DATA_DIR, "county_demographics.csv")
+
+_CONFLICT_MARKER = re.compile(r"^(<{7}|={7}|>{7})(\s|$)", re.M)
+
+#How many offending rows to list per problem
+_EXAMPLES = 5
+
+
+def _examples(rows):
+    rows = list(rows)
+    listed = ", ".join(str(r) for r in rows[:_EXAMPLES])
+    return listed + (f" and {len(rows) - _EXAMPLES} more" if len(rows) > _EXAMPLES else "")
+
+
+def read_source(csv_path):
+    """Raw CSV as a DataFrame of strings with canonical column names, refusing files with conflict markers."""
+    with open(csv_path, encoding="utf-8") as f:
+        text = f.read()
+    markers = [text.count("\n", 0, m.start()) + 1 for m in _CONFLICT_MARKER.finditer(text)]
+    if markers:
+        raise DatasetError(f"{csv_path} contains merge conflict markers on lines {_examples(markers)}")
+    data = pd.read_csv(csv_path, dtype=str, keep_default_na=False)
+    data.columns = [canonical_column(name) for name in data.columns]
+    return data
+
+
+def validate(data):
+    """(numeric frame, problems) for a frame from read_source; the row labels are CSV line numbers."""
+    problems = []
+    duplicated = sorted(set(data.columns[data.columns.duplicated()]))
+    if duplicated:
+        problems.append(f"duplicate columns after canonicalizing names: {duplicated}")
+    missing = [name for name in LABEL_COLUMNS + [FIPS_COLUMN] if name not in data.columns]
+    if missing:
+        problems.append(f"missing required columns: {missing}")
+    if problems:
+        return None, problems
+
+    #Line numbers in the CSV, header is line 1
+    data = data.set_axis(np.arange(len(data)) + 2)
+    stripped = data.apply(lambda column: column.str.strip())
+    empty = (stripped == "").all(axis=1)
+    data = stripped[~empty]
+    if data.empty:
+        return None, ["no rows with data"]
+
+    for name in LABEL_COLUMNS:
+        blank = data.index[data[name] == ""]
+        if len(blank):
+            problems.append(f"{name} is empty on lines {_examples(blank)}")
+
+    numeric_columns = [name for name in data.columns if name not in LABEL_COLUMNS]
+    numeric = data[numeric_columns].apply(pd.to_numeric, errors="coerce")
+    for name in numeric_columns:
+        unparsed = data.index[numeric[name].isna() & (data[name] != "")]
+        if len(unparsed):
+            problems.append(f"{name} is not numeric on lines {_examples(unparsed)}")
+        infinite = data.index[np.isinf(numeric[name])]
+        if len(infinite):
+            problems.append(f"{name} is infinite on lines {_examples(infinite)}")
+        if "Percent" in name:
+            outside = data.index[(numeric[name] < -1) | (numeric[name] > 100)]
+            if len(outside):
+                problems.append(f"{name} is outside [-1, 100] on lines {_examples(outside)}")
+
+    fips = numeric[FIPS_COLUMN]
+    bad_fips = data.index[fips.isna() | (fips != fips.round()) | (fips < 1) | (fips > 99999)]
+    if len(bad_fips):
+        problems.append(f"fips is not a code from 1 to 99999 on lines {_examples(bad_fips)}")
+    repeated = data.index[fips.duplicated(keep=False) & fips.notna()]
+    if len(repeated):
+        problems.append(f"fips is repeated on lines {_examples(repeated)}")
+
+    labels = data[LABEL_COLUMNS]
+    return pd.concat([labels, numeric], axis=1)[list(data.columns)], problems
+
+
+def build_table(data):
+    """(header, arrays) for write_table from a validated frame."""
+    columns = [name for name in data.columns if name not in LABEL_COLUMNS and name != FIPS_COLUMN]
+    matrix = np.asfortranarray(data[columns].to_numpy(dtype=np.float32))
+    county_ids, county_names = pd.factorize(data["County"], sort=True)
+    state_ids, state_names = pd.factorize(data["State"], sort=True)
+    fips = np.array([f"{int(code):05d}" for code in data[FIPS_COLUMN]], dtype="S5")
+
+    #Column-wise min/max over rows that have a value, used for normalization
+    values = matrix.astype(np.float64)
+    valid = ~np.isnan(values)
+    header = {
+        "version": DATASET_VERSION,
+        "column_order": list(data.columns),
+        "columns": columns,
+        "county_names": list(county_names),
+        "state_names": list(state_names),
+        "col_min": np.where(valid, values, np.inf).min(axis=0).tolist(),
+        "col_max": np.where(valid, values, -np.inf).max(axis=0).tolist(),
+    }
+    arrays = {
+        "matrix": matrix,
+        "county_ids": county_ids.astype(np.int32),
+        "state_ids": state_ids.astype(np.int16),
+        "fips": fips,
+    }
+    return header, arrays
+
+
+def load_validated(csv_path):
+    data, problems = validate(read_source(csv_path))
+    if problems:
+        raise DatasetError(f"{csv_path} failed validation:\n  " + "\n  ".join(problems))
+    return data
+
+
+def build(csv_path=SOURCE_PATH, output_path=DATASET_PATH):
+    """Validate csv_path and write the dataset to output_path; returns (content hash, rows)."""
+    data = load_validated(csv_path)
+    header, arrays = build_table(data)
+    content_hash = write_table(output_path, header, arrays)
+    #Read it back the way the app will, so a bad write never ships
+    map_table(output_path)
+    return content_hash, len(data)
+
+
+def check(csv_path=SOURCE_PATH, output_path=DATASET_PATH):
+    """True if output_path is intact and holds exactly what building csv_path would produce."""
+    import tempfile
+
+    header, _ = map_table(output_path)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        expected, _ = build(csv_path, os.path.join(tmp_dir, "dataset.bin"))
+    return header["content_hash"] == expected
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate the county CSV and build the binary dataset.")
+    parser.add_argument("source", nargs="?", default=SOURCE_PATH, help="raw county CSV")
+    parser.add_argument("--output", default=DATASET_PATH)
+    parser.add_argument("--check", action="store_true",
+                        help="verify the output is intact and up to date with the source instead of writing it")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.check:
+            if not check(args.source, args.output):
+                print(f"{args.output} is out of date with {args.source}, rebuild it")
+                return 1
+            print(f"{args.output} is up to date")
+            return 0
+        content_hash, n_rows = build(args.source, args.output)
+    except (DatasetError, OSError) as e:
+        print(e, file=sys.stderr)
+        return 1
+    print(f"Wrote {n_rows} counties to {args.output} (sha256 {content_hash[:16]})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
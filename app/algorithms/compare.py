@@ -0,0 +1,165 @@
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from .bellman_ford import bellman_ford, bellman_ford_vectorized, spfa
+from .dijkstra import dijkstra
+from .feature_store import get_feature_store
+from .graph import CSRGraph
+from .knn_cache import request_graph
+
+# Side-by-side comparison of the search algorithms on one graph. The graph is
+# built once, written to a scratch directory as .npy files and memory-mapped
+# read-only by every worker, so all searches read the same bytes from the page
+# cache and only the search itself is timed. The distance vectors are
+# cross-checked against the first search's.
+#
+# Searches run as many at a time as the executor has workers (the app's match
+# pool has MAX_WORKERS, fewer than the searches), so the times are per search,
+# measured inside the worker without the wait for one, and not a race run
+# concurrently; Comparison.concurrency records how many ran at once.
+#
+#   python -m app.algorithms.compare features.json
+
+#Searches that return the full distance vector, in display order
+COMPARE_SEARCHES = {
+    "Dijkstra": dijkstra,
+    "Bellman-Ford (vectorized)": bellman_ford_vectorized,
+    "SPFA": spfa,
+    "Bellman-Ford (classic)": bellman_ford,
+}
+
+#Largest difference between two distance vectors still counted as agreeing
+DISTANCE_TOLERANCE = 1e-9
+
+Comparison = namedtuple("Comparison", ["table", "consistent", "build_time", "n_nodes", "n_edges", "concurrency"])
+
+_GRAPH_ARRAYS = ("indptr", "indices", "weights")
+
+
+def _write_graph(graph, directory):
+    for name in _GRAPH_ARRAYS:
+        np.save(os.path.join(directory, f"{name}.npy"), getattr(graph, name))
+
+
+def _map_graph(directory, n_counties):
+    arrays = [np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r") for name in _GRAPH_ARRAYS]
+    return CSRGraph(*arrays, n_counties)
+
+
+def _run_search(name, graph_dir, n_counties, start):
+    """Time one search on the memory-mapped graph, returns (name, seconds, distances, stats)."""
+    graph = _map_graph(graph_dir, n_counties)
+    stats = {}
+    start_time = time.perf_counter()
+    distances = COMPARE_SEARCHES[name](graph, start, stats=stats)
+    return name, time.perf_counter() - start_time, distances, stats
+
+
+def compare_graph(graph, searches=tuple(COMPARE_SEARCHES), executor=None, progress=None):
+    """Run every search on graph on executor's workers; returns (rows, consistent) with one dict per search."""
+    graph_dir = tempfile.mkdtemp(prefix="county-compare-")
+    own_executor = executor is None
+    if own_executor:
+        import multiprocessing
+        executor = ProcessPoolExecutor(len(searches), mp_context=multiprocessing.get_context("spawn"))
+    try:
+        _write_graph(graph, graph_dir)
+        futures = [executor.submit(_run_search, name, graph_dir, graph.n_counties, graph.perfect_index)
+                   for name in searches]
+        results = {}
+        for future in as_completed(futures):
+            name, seconds, distances, stats = future.result()
+            results[name] = (seconds, distances, stats)
+            if progress is not None:
+                progress(len(results), len(searches))
+    finally:
+        if own_executor:
+            executor.shutdown(cancel_futures=True)
+        shutil.rmtree(graph_dir, ignore_errors=True)
+
+    reference = results[searches[0]][1]
+    rows = []
+    consistent = True
+    for name in searches:
+        seconds, distances, stats = results[name]
+        max_diff = float(np.max(np.abs(distances - reference)))
+        consistent = consistent and max_diff <= DISTANCE_TOLERANCE
+        rows.append({
+            "Algorithm": name,
+            "Search (ms)": seconds * 1000,
+            "Relaxations": stats.get("relaxations", 0),
+            "Improvements": stats.get("improvements", 0),
+            "Heap ops": stats.get("heap_pushes", 0) + stats.get("heap_pops", 0),
+            "Rounds / pops": stats.get("rounds", stats.get("queue_pops", 0)),
+            "Max diff": max_diff,
+        })
+    return rows, consistent
+
+
+def compare_algorithms(features: dict, searches=tuple(COMPARE_SEARCHES), executor=None, progress=None, n_neighbors=5,
+                       filters=None, concurrency=None):
+    """Build the county graph for features once and compare every search on it.
+
+    concurrency is how many searches executor runs at once, every search when it is None (own executor).
+    """
+    import pandas as pd
+
+    start_time = time.perf_counter()
+    _, _, graph = request_graph(features, filters, n_neighbors)
+    build_time = time.perf_counter() - start_time
+
+    rows, consistent = compare_graph(graph, searches, executor, progress)
+    concurrency = len(searches) if concurrency is None else min(concurrency, len(searches))
+    return Comparison(pd.DataFrame(rows), consistent, build_time, graph.n_nodes, graph.n_edges, concurrency)
+
+
+def neutral_features():
+    #Every numeric column at the middle of its range, for triage without a saved profile
+    store = get_feature_store()
+    return {name: 0.5 for name in store.columns}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare the search algorithms on one shared county graph.")
+    parser.add_argument("features", nargs="?",
+                        help="JSON file with a features dict {column: ideal value}; defaults to every column at 0.5")
+    parser.add_argument("--searches", nargs="+", choices=list(COMPARE_SEARCHES), default=list(COMPARE_SEARCHES))
+    parser.add_argument("--json", action="store_true", help="print the comparison as JSON instead of a table")
+    args = parser.parse_args(argv)
+
+    if args.features:
+        with open(args.features) as f:
+            features = json.load(f)
+    else:
+        features = neutral_features()
+
+    comparison = compare_algorithms(features, tuple(args.searches))
+    if args.json:
+        print(json.dumps({
+            "consistent": comparison.consistent,
+            "build_time": comparison.build_time,
+            "n_nodes": comparison.n_nodes,
+            "n_edges": comparison.n_edges,
+            "concurrency": comparison.concurrency,
+            "searches": comparison.table.to_dict(orient="records"),
+        }, indent=2))
+    else:
+        print(f"Graph: {comparison.n_nodes} nodes, {comparison.n_edges} directed edges, "
+              f"built in {comparison.build_time * 1000:.1f} ms; searches ran {comparison.concurrency} at a time, "
+              f"each timed in its own worker")
+        print(comparison.table.to_string(index=False, float_format=lambda v: f"{v:.3f}" if v >= 1e-3 or v == 0 else f"{v:.1e}"))
+        print("Distance vectors agree" if comparison.consistent else "Distance vectors DISAGREE")
+    return 0 if comparison.consistent else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,110 +1,256 @@
-import pandas as pd
 import numpy as np
-import networkx as nx
-import os
 import time
 import heapq
+import logging
+from collections import namedtuple
 
-def dijkstra_algorithm(features: dict):
-    from sklearn.preprocessing import MinMaxScaler
-    from sklearn.neighbors import NearestNeighbors
-    # Print provided features as "key: value" for debugging
-    print("Provided features:")
-    for k, v in features.items():
-        print(f"{k}: {v}")
-    
-    file_path = os.path.join(os.path.dirname(__file__), "../../app/data/county_demographics.csv")
-    data = pd.read_csv(file_path)
-
-    #Extract the keys from features (dict), will serve as a list of the column names
-    feature_names = list(features.keys())
-
-    #Extract relevant columns
-    subset = data[["County", "State"] + feature_names].dropna()
-
-    scaler = MinMaxScaler()
-    normalized = scaler.fit_transform(subset[feature_names])
-    subset[feature_names] = normalized
-
-    #Extract the weights from the values of features (dict), make into numpy array
-    ideal = np.array(list(features.values()))
-
-    #Normalize the weights
-    subset["distance_to_ideal"] = np.linalg.norm(subset[feature_names].values - ideal, axis=1)
-
-    X = subset[feature_names].values
-    k = 5  # number of neighbors, make it so it's not too clustered
-    nbrs = NearestNeighbors(n_neighbors=k+1).fit(X)
-    distances, indices = nbrs.kneighbors(X)
-
-    G = nx.Graph()
-
-    #Add counties as nodes
-    for i, row in subset.iterrows():
-        G.add_node(i, county=row["County"], state=row["State"])
-
-    #Add weighted edges
-    for i in range(len(subset)):
-        for j, d in zip(indices[i][1:], distances[i][1:]):
-            G.add_edge(i, j, weight=d)
-
-    perfect_index = len(subset)
-    #Adding the perfect county node based on user's preferences
-    G.add_node(perfect_index, county="Perfect County", state="Ideal")
-
-    #Adding the edges of perfect county to the graph, edge weight using distance_to_ideal
-    for i, row in subset.iterrows():
-        G.add_edge(perfect_index, i, weight=row["distance_to_ideal"])
-
-    #Isolate the dijkstra search algorithm in order to time it
-    def dijkstra(graph, start):
-        #initializing the starting distance:
-        dist = {node: float('inf') for node in graph} #assume all routes are infinity
-        dist[start] = 0 #route from ideal index to ideal index is 0
-        prev_nodes = {node: None for node in graph} #keep track of the previous nodes
-        pq = [(0, start)]  #using a priority queue, adding pairs like (distance, node)
-        
-        while pq:
-            current_dist, current_node = heapq.heappop(pq) #O(logn) time, use a min heapq to pop the shortest distance
-            
-            #Skip if we already found a shorter path before
-            if current_dist > dist[current_node]:
-                continue
-            
-            for neighbor, weight in graph[current_node].items():
-                new_dist = current_dist + weight['weight'] #add the distances
-                if new_dist < dist[neighbor]: #found a better distance, reset the min distance and previous node
-                    dist[neighbor] = new_dist
-                    prev_nodes[neighbor] = current_node
-                    heapq.heappush(pq, (new_dist, neighbor)) #O(logn) time, add in new neighbor, smallest distance will be in first
-        
-        return dist
-
-
-    start_time = time.time()
-    shortest_distances = dijkstra(G, perfect_index)
-    end_time = time.time()
-    time_elapsed = end_time - start_time
-
-    #Accessing the distances from shortest_distances
-    distance_map = {node: dist for node, dist in shortest_distances.items() if node in subset.index}
-
-    #Creating the new column
-    data["DistanceToIdeal"] = data.index.map(distance_map)
-
-    #Saving it to the data folder
-    output_path = "app/data/county_demographics_with_distances.csv"
-    data.to_csv(output_path, index=False)
-
-    #Finding node with shortest distance from the dict
-    closest_idx = min(
-        (i for i in shortest_distances if i != perfect_index),
-        key=lambda i: shortest_distances[i]
-    )
-
-    best_county = subset.loc[closest_idx]
-    print("Closest to Perfect County:")
-    print(best_county[["County", "State"]])
-    print("Time elapsed:", time_elapsed)
-
-    return best_county[["County", "State"]], time_elapsed
\ No newline at end of file
+from .feature_store import get_feature_store
+from .instrumentation import span, traced
+from .graph import CSRGraph
+from .knn_cache import knn_adjacency, request_graph, scored_rows
+from .ranking import best_per_state, ranked_matches, top_k_indices
+from .result_cache import CACHE_DEPTH, cache_match, cached_match
+from .result_store import export_distances, get_result_store, preference_hash
+
+logger = logging.getLogger(__name__)
+
+#Label of the hub node in paths
+PERFECT_COUNTY = "Perfect County"
+
+#A* result: distance is the path length, rows/labels the counties along it (empty if there is no path),
+#settled how many nodes the search settled before reaching the target
+CountyPath = namedtuple("CountyPath", ["distance", "rows", "labels", "settled", "n_nodes", "search_time"])
+
+#Dijkstra search over the CSR county graph.
+#stats, when given, is filled with relaxations, improvements, heap_pushes and heap_pops
+def dijkstra(graph, start, stats=None):
+    indptr = graph.indptr.tolist()
+    indices = graph.indices.tolist()
+    weights = graph.weights.tolist()
+
+    #initializing the starting distance:
+    dist = [float('inf')] * graph.n_nodes #assume all routes are infinity
+    dist[start] = 0 #route from ideal index to ideal index is 0
+    pq = [(0, start)]  #using a priority queue, adding pairs like (distance, node)
+    pushes = 1
+    relaxations = 0
+
+    while pq:
+        current_dist, current_node = heapq.heappop(pq) #O(logn) time, use a min heapq to pop the shortest distance
+
+        #Skip if we already found a shorter path before
+        if current_dist > dist[current_node]:
+            continue
+
+        relaxations += indptr[current_node + 1] - indptr[current_node]
+        for e in range(indptr[current_node], indptr[current_node + 1]):
+            neighbor = indices[e]
+            new_dist = current_dist + weights[e] #add the distances
+            if new_dist < dist[neighbor]: #found a better distance, reset the min distance
+                dist[neighbor] = new_dist
+                heapq.heappush(pq, (new_dist, neighbor)) #O(logn) time, add in new neighbor, smallest distance will be in first
+                pushes += 1
+
+    if stats is not None:
+        #Every push is an improvement except the start, and the loop pops until the heap is empty
+        stats.update(relaxations=relaxations, improvements=pushes - 1, heap_pushes=pushes, heap_pops=pushes)
+    return np.array(dist)
+
+
+#Nodes from the search's start to target, following prev_nodes (a dict, -1 at the start)
+def shortest_path(prev_nodes, target):
+    path = [target]
+    while prev_nodes[path[-1]] != -1:
+        path.append(prev_nodes[path[-1]])
+    return path[::-1]
+
+
+#A* from source to target. heuristic[v] must never overestimate v's distance to target;
+#straight-line distance to the target in normalized feature space (to the ideal for the Perfect
+#County) does that, since every edge weight is such a distance (triangle inequality). Returns (distance, path, settled nodes), (inf, [], settled) when target is unreachable
+def astar(graph, source, target, heuristic):
+    h = heuristic.tolist() if isinstance(heuristic, np.ndarray) else heuristic
+    dist = {source: 0.0}
+    prev_nodes = {source: -1}
+    settled = set()
+    pq = [(h[source], 0.0, source)]  #(distance so far + heuristic, distance so far, node)
+
+    while pq:
+        _, current_dist, current_node = heapq.heappop(pq)
+        if current_node in settled or current_dist > dist[current_node]:
+            continue
+        settled.add(current_node)
+        if current_node == target:
+            return current_dist, shortest_path(prev_nodes, target), len(settled)
+
+        neighbors, weights = graph.neighbors(current_node)
+        for neighbor, weight in zip(neighbors.tolist(), weights.tolist()):
+            new_dist = current_dist + weight
+            if new_dist < dist.get(neighbor, float('inf')):
+                dist[neighbor] = new_dist
+                prev_nodes[neighbor] = current_node
+                heapq.heappush(pq, (new_dist + h[neighbor], new_dist, neighbor))
+
+    return float('inf'), [], len(settled)
+
+
+#Dijkstra that stops as soon as k county nodes are settled, for top-k queries.
+#progress, when given, is called as progress(settled, k) and may raise to abandon the search
+def dijkstra_top_k(graph, start, k, progress=None):
+    dist = {start: 0}
+    settled = set()
+    matches = []
+
+    #Seed the queue with the start node's edges in one heapify instead of one push per edge,
+    #the hub touches every county so this keeps the rest of the search proportional to k
+    neighbors, weights = graph.neighbors(start)
+    pq = list(zip(weights.tolist(), neighbors.tolist()))
+    heapq.heapify(pq)
+    for d, v in pq:
+        if d < dist.get(v, float('inf')):
+            dist[v] = d
+    settled.add(start)
+
+    while pq and len(matches) < k:
+        current_dist, current_node = heapq.heappop(pq)
+
+        #Skip stale queue entries and nodes we already finished
+        if current_node in settled or current_dist > dist[current_node]:
+            continue
+        settled.add(current_node)
+        if current_node < graph.n_counties:
+            matches.append((current_node, current_dist))
+            if progress is not None:
+                progress(len(matches), k)
+
+        neighbors, weights = graph.neighbors(current_node)
+        for neighbor, weight in zip(neighbors.tolist(), weights.tolist()):
+            new_dist = current_dist + weight
+            if new_dist < dist.get(neighbor, float('inf')):
+                dist[neighbor] = new_dist
+                heapq.heappush(pq, (new_dist, neighbor))
+
+    nodes = np.array([node for node, _ in matches], dtype=np.intp)
+    distances = np.array([d for _, d in matches], dtype=np.float64)
+    return nodes, distances
+
+
+@traced("dijkstra")
+def dijkstra_algorithm(features: dict, k: int = 5, session_id=None, export: bool = False, progress=None, filters=None,
+                       per_state=False):
+    #filters (a filters.CountyFilter) limits the candidates before anything is scored
+    #per_state adds the best county of every state as matches.attrs["per_state"]
+    #Identical preferences from any session are served from the match cache
+    with span("cache_lookup"):
+        cached = None if export else cached_match("dijkstra", features, k, session_id, filters, per_state)
+    if cached is not None:
+        return cached
+
+    logger.debug("Provided features: %s", features)
+
+    #County table and normalized features come from the shared memory-mapped store
+    with span("load"):
+        store = get_feature_store()
+
+    #Counties are nodes 0..n-1 (positions in rows), the perfect county is node n
+    n_neighbors = 5  # number of neighbors, make it so it's not too clustered
+
+    #Usable rows of the table (those passing filters), their distance to the ideal and the graph;
+    #the kNN adjacency is cached per feature set, only the perfect county edges are new
+    rows, distance_to_ideal, G = request_graph(features, filters, n_neighbors)
+    perfect_index = G.perfect_index
+
+    with span("search"):
+        start_time = time.time()
+        #Settle enough counties to fill a cache entry, it costs about the same as k
+        nodes, node_distances = dijkstra_top_k(G, perfect_index, max(k, CACHE_DEPTH), progress)
+        end_time = time.time()
+        time_elapsed = end_time - start_time
+
+    with span("materialize"):
+        #Creating the new column from the perfect county edge weights. Those edges are
+        #already shortest paths (triangle inequality), so a full search gives the same values
+        distance_column = np.full(store.n_rows, np.nan)
+        distance_column[rows] = distance_to_ideal
+
+        #Keep the column in memory for this session's map, writing the CSV only on request
+        if session_id is not None:
+            get_result_store().put(session_id, preference_hash(features, filters), distance_column)
+
+        #Counties in the order the search settled them, closest first
+        matches = ranked_matches(store, rows, nodes, node_distances)
+        cache_match("dijkstra", features, matches, distance_column, time_elapsed, filters)
+
+    if export:
+        with span("export"):
+            export_distances(store.frame(), distance_column)
+
+    logger.debug("Closest to Perfect County: %s, %s (search %.6f s)",
+                 matches["County"].iloc[0], matches["State"].iloc[0], time_elapsed)
+
+    matches = matches.head(k)
+    if per_state:
+        with span("per_state"):
+            matches.attrs["per_state"] = best_per_state(store, distance_column)
+    return matches, time_elapsed
+
+
+@traced("point_to_point")
+def county_to_ideal(features: dict, row, filters=None):
+    """CountyPath from one county (a feature store row) to the Perfect County, by A*.
+
+    The Perfect County's edges are straight-line distances to the ideal, so by the triangle inequality no
+    detour through other counties is shorter: the path is always [county, Perfect County] and distance is
+    the county's own edge, the DistanceToIdeal the matchers rank by.
+    """
+    store = get_feature_store()
+    n_neighbors = 5
+
+    rows, distance_to_ideal, G = request_graph(features, filters, n_neighbors)
+    source = np.searchsorted(rows, row)
+    if source == len(rows) or rows[source] != row:
+        raise KeyError(f"Row {row} is not scored for these preferences (missing data or filtered out)")
+
+    with span("search"):
+        start_time = time.time()
+        #Straight-line distance to the ideal, 0 at the Perfect County itself
+        heuristic = np.append(distance_to_ideal, 0.0)
+        distance, path, settled = astar(G, int(source), G.perfect_index, heuristic)
+        time_elapsed = time.time() - start_time
+
+    path_rows = [int(rows[node]) for node in path if node != G.perfect_index]
+    labels = [f"{county}, {state}" for county, state in
+              zip(store.county_labels(path_rows), store.state_labels(path_rows))]
+    return CountyPath(distance, path_rows, labels + [PERFECT_COUNTY], settled, G.n_nodes, time_elapsed)
+
+
+@traced("best_match_route")
+def route_to_best_match(features: dict, row, filters=None):
+    """CountyPath from one county (a feature store row) through similar counties to the best match, by A*.
+
+    Runs on the kNN graph without the Perfect County; distance is the route's length, inf when no chain of
+    neighbors connects the two.
+    """
+    store = get_feature_store()
+    n_neighbors = 5
+
+    with span("normalize"):
+        rows, normalized, distance_to_ideal = scored_rows(features, filters, n_neighbors)
+        source = np.searchsorted(rows, row)
+        if source == len(rows) or rows[source] != row:
+            raise KeyError(f"Row {row} is not scored for these preferences (missing data or filtered out)")
+
+    target = int(top_k_indices(distance_to_ideal, 1)[0])
+    G = CSRGraph(*knn_adjacency(list(features), n_neighbors, filters), len(rows))
+
+    with span("search"):
+        start_time = time.time()
+        #Straight-line distance to the best match, the kNN edge weights are the same distances
+        heuristic = np.linalg.norm(normalized - normalized[target], axis=1)
+        distance, path, settled = astar(G, int(source), target, heuristic)
+        time_elapsed = time.time() - start_time
+
+    path_rows = [int(rows[node]) for node in path]
+    labels = [f"{county}, {state}" for county, state in
+              zip(store.county_labels(path_rows), store.state_labels(path_rows))]
+    return CountyPath(distance, path_rows, labels, settled, G.n_nodes, time_elapsed)
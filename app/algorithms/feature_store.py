@@ -0,0 +1,282 @@
+import hashlib
+import json
+import os
+import re
+import threading
+
+import numpy as np
+import pandas as pd
+
+# Process-wide store for the county table. The table is the typed binary
+# dataset written by build_dataset.py from the source CSV: float32 feature
+# columns in column-major order, int-coded county and state ids with their
+# name lists, fixed-width FIPS codes and precomputed min/max, under a JSON
+# header with a content hash. Every process (Streamlit and the match worker
+# processes) memory-maps the one file read-only, so its pages are shared
+# through the page cache. A file that fails its hash or schema version is
+# refused; nothing parses CSV at request time.
+
+DATA_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), "../../app/data"))
+DATASET_PATH = os.path.join(DATA_DIR, "county_demographics.bin")
+CACHE_DIR = os.path.join(DATA_DIR, "cache")
+
+LABEL_COLUMNS = ["County", "State"]
+FIPS_COLUMN = "fips"
+
+DATASET_VERSION = 3
+
+_TABLE_MAGIC = b"CNTYTBL\0"
+
+#Array blocks in the table file start on this byte boundary
+_ALIGN = 64
+
+
+class DatasetError(ValueError):
+    pass
+
+
+def canonical_column(name):
+    """Column name with runs of whitespace collapsed to one space, as stored in the dataset."""
+    return re.sub(r"\s+", " ", name).strip()
+
+
+def _atomic_write(path, write):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    write(tmp_path)
+    os.replace(tmp_path, path)
+
+
+def _aligned(offset):
+    return -(-offset // _ALIGN) * _ALIGN
+
+
+def _content_hash(header, body):
+    #Covers the header (array layout included) and every data byte
+    h = hashlib.sha256(json.dumps(header, sort_keys=True).encode("utf-8"))
+    h.update(body)
+    return h.hexdigest()
+
+
+def write_table(path, header: dict, arrays: dict):
+    """Write header (JSON-serializable) and named arrays to one file map_table can memory-map; returns the content hash."""
+    layout = {}
+    offset = 0
+    for name, array in arrays.items():
+        order = "F" if array.flags.f_contiguous and not array.flags.c_contiguous else "C"
+        layout[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "order": order, "offset": offset}
+        offset = _aligned(offset + array.nbytes)
+
+    body = bytearray(offset)
+    for name, array in arrays.items():
+        data = array.tobytes(order=layout[name]["order"])
+        start = layout[name]["offset"]
+        body[start:start + len(data)] = data
+    header = {**header, "arrays": layout}
+    content_hash = _content_hash(header, body)
+    header_bytes = json.dumps({**header, "content_hash": content_hash}).encode("utf-8")
+    data_start = _aligned(len(_TABLE_MAGIC) + 8 + len(header_bytes))
+
+    def write(tmp_path):
+        with open(tmp_path, "wb") as f:
+            f.write(_TABLE_MAGIC)
+            f.write(len(header_bytes).to_bytes(8, "little"))
+            f.write(header_bytes)
+            f.seek(data_start)
+            f.write(body)
+    _atomic_write(path, write)
+    return content_hash
+
+
+def map_table(path, verify=True):
+    """(header, {name: read-only array}) of a file written by write_table, arrays are views of one mmap."""
+    try:
+        with open(path, "rb") as f:
+            if f.read(len(_TABLE_MAGIC)) != _TABLE_MAGIC:
+                raise DatasetError(f"{path} is not a county table file")
+            header_size = int.from_bytes(f.read(8), "little")
+            header = json.loads(f.read(header_size))
+        layout = header["arrays"]
+        content_hash = header.pop("content_hash")
+    except (UnicodeDecodeError, json.JSONDecodeError, KeyError, TypeError) as e:
+        raise DatasetError(f"{path} has a corrupt header") from e
+    data_start = _aligned(len(_TABLE_MAGIC) + 8 + header_size)
+    buffer = np.memmap(path, dtype=np.uint8, mode="r")
+    if verify and _content_hash(header, buffer[data_start:]) != content_hash:
+        raise DatasetError(f"{path} does not match its content hash, rebuild it with build_dataset.py")
+
+    arrays = {}
+    for name, spec in layout.items():
+        dtype = np.dtype(spec["dtype"])
+        shape = tuple(spec["shape"])
+        start = data_start + spec["offset"]
+        nbytes = int(np.prod(shape)) * dtype.itemsize
+        if start + nbytes > len(buffer):
+            raise DatasetError(f"{path} is truncated")
+        arrays[name] = buffer[start:start + nbytes].view(dtype).reshape(shape, order=spec["order"])
+    del header["arrays"]
+    header["content_hash"] = content_hash
+    return header, arrays
+
+
+class FeatureStore:
+    def __init__(self, path=DATASET_PATH, cache_dir=CACHE_DIR):
+        self.path = path
+        self.cache_dir = cache_dir
+        self.file_stat = _stat_key(path)
+
+        header, arrays = map_table(path)
+        if header.get("version") != DATASET_VERSION:
+            raise DatasetError(f"{path} is dataset version {header.get('version')}, expected {DATASET_VERSION}; "
+                               "rebuild it with build_dataset.py")
+        try:
+            self.digest = header["content_hash"]
+            self.column_order = header["column_order"]
+            self.columns = tuple(header["columns"])
+            self.county_names = tuple(header["county_names"])
+            self.state_names = tuple(header["state_names"])
+            self.col_min = np.asarray(header["col_min"], dtype=np.float64)
+            self.col_max = np.asarray(header["col_max"], dtype=np.float64)
+            self.matrix = arrays["matrix"]
+            self.county_ids = arrays["county_ids"]
+            self.state_ids = arrays["state_ids"]
+            self.fips = arrays["fips"]
+        except KeyError as e:
+            raise DatasetError(f"{path} is missing {e}") from e
+
+        self.column_index = {name: j for j, name in enumerate(self.columns)}
+        self.label_valid = (self.county_ids >= 0) & (self.state_ids >= 0)
+        self._normalized = {}
+        self._frame = None
+        self._lock = threading.Lock()
+
+    @property
+    def n_rows(self):
+        return self.matrix.shape[0]
+
+    def fips_codes(self, rows):
+        """Five-digit FIPS codes of the given rows."""
+        return self.fips[rows].astype(str).tolist()
+
+    def county_labels(self, rows):
+        """County names of the given rows, None where the label is missing."""
+        return [self.county_names[i] if i >= 0 else None for i in self.county_ids[rows].tolist()]
+
+    def state_labels(self, rows):
+        """State names of the given rows, None where the label is missing."""
+        return [self.state_names[i] if i >= 0 else None for i in self.state_ids[rows].tolist()]
+
+    def column_positions(self, feature_names):
+        #Profiles saved before the names were canonicalized still resolve
+        return np.array([self.column_index[canonical_column(name)] for name in feature_names], dtype=np.intp)
+
+    def normalized(self, feature_names, candidates=None):
+        """Return (rows, X): the usable row numbers and their min-max scaled features."""
+        #candidates (row numbers from filters.py) restricts and rescales to those rows, uncached here
+        key = tuple(feature_names)
+        cached = self._normalized.get(key) if candidates is None else None
+        if cached is not None:
+            return cached
+
+        cols = self.column_positions(key)
+        raw = self.matrix[:, cols]
+        keep = self.label_valid & ~np.isnan(raw).any(axis=1)
+        if candidates is not None:
+            in_candidates = np.zeros(self.n_rows, dtype=bool)
+            in_candidates[candidates] = True
+            keep &= in_candidates
+        rows = np.flatnonzero(keep)
+        #Column-major like a pandas block, so row-wise reductions sum in the same order.
+        #Stored values are float32, the scaling and every distance after it run in float64
+        raw = np.asfortranarray(raw[rows], dtype=np.float64)
+
+        col_min = self.col_min[cols]
+        col_max = self.col_max[cols]
+        if len(rows) != self.n_rows and len(rows):
+            #Dropped rows can move the bounds, so only reuse them when every row survives
+            col_min = raw.min(axis=0)
+            col_max = raw.max(axis=0)
+
+        #Same arithmetic as sklearn's MinMaxScaler so distances stay bit-identical
+        data_range = col_max - col_min
+        data_range[data_range == 0.0] = 1.0
+        scale = 1.0 / data_range
+        X = raw * scale
+        X += -col_min * scale
+
+        rows.setflags(write=False)
+        X.setflags(write=False)
+        if candidates is None:
+            with self._lock:
+                self._normalized[key] = (rows, X)
+        return rows, X
+
+    def frame(self):
+        """The full county table as a DataFrame, built once. Treat it as read-only."""
+        #Only exports and benchmarks need it, matching reads the mapped arrays directly
+        if self._frame is None:
+            data = pd.DataFrame(np.asarray(self.matrix), columns=list(self.columns))
+            data.insert(0, "County", pd.Categorical.from_codes(self.county_ids, self.county_names))
+            data.insert(1, "State", pd.Categorical.from_codes(self.state_ids, self.state_names))
+            data[FIPS_COLUMN] = self.fips.astype(str)
+            with self._lock:
+                self._frame = data[self.column_order]
+        return self._frame
+
+
+def _stat_key(path):
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_feature_store():
+    """Shared FeatureStore for this process, reloaded if the dataset file changes on disk."""
+    global _store
+    store = _store
+    if store is not None and store.file_stat == _stat_key(store.path):
+        return store
+    with _store_lock:
+        if _store is None or _store.file_stat != _stat_key(_store.path):
+            _store = FeatureStore()
+        return _store
+
+
+# Derived data (kNN graphs, similarity indexes) is cached per feature set as
+# .npz files in the store's cache dir, tagged with the dataset digest and the
+# feature names so a rebuilt dataset or another column set never matches.
+
+def feature_cache_path(store, prefix, feature_names, tag):
+    names_hash = hashlib.sha1(json.dumps(list(feature_names)).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(store.cache_dir, f"{prefix}_{names_hash}_{tag}.npz")
+
+
+def load_feature_cache(path, digest, feature_names):
+    """Arrays saved by save_feature_cache, or None if missing, unreadable or for another dataset/feature set."""
+    try:
+        with np.load(path) as cached:
+            if str(cached["digest"]) != digest or json.loads(str(cached["feature_names"])) != list(feature_names):
+                return None
+            return {name: cached[name] for name in cached.files if name not in ("digest", "feature_names")}
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def save_feature_cache(path, digest, feature_names, arrays: dict):
+    def write(tmp_path):
+        with open(tmp_path, "wb") as f:
+            np.savez(f, digest=digest, feature_names=json.dumps(list(feature_names)), **arrays)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        _atomic_write(path, write)
+    except OSError:
+        #Read-only deployments just rebuild once per process
+        pass
+
+
+def drop_stale(entries: dict, digest):
+    """Remove in-memory entries keyed (digest, ...) for another dataset digest, dead once the store reloads."""
+    for stale in [key for key in entries if key[0] != digest]:
+        del entries[stale]
@@ -0,0 +1,136 @@
+import threading
+from collections import namedtuple
+
+import numpy as np
+
+from .feature_store import get_feature_store
+
+# Candidate filters applied before scoring. Per dataset the index keeps one
+# packed row bitmap per state and, per numeric column, the usable rows sorted
+# by value, so "only these states, population above 50k" is a few ORs, two
+# binary searches per range and one AND. Only the surviving rows go through
+# normalization, the kNN graph and the search (see knn_cache.filtered_entry).
+#
+# A filter is a CountyFilter(states, ranges): states is a sorted tuple of state
+# names (empty means every state), ranges a sorted tuple of (column, low, high)
+# with None for an open end. None stands for "no filter" everywhere.
+
+#Numeric columns indexed up front, any other column is indexed on first use
+INDEXED_COLUMNS = ("Population.2020 Population", "Population.Population per Square Mile")
+
+CountyFilter = namedtuple("CountyFilter", ["states", "ranges"])
+
+
+class NoMatchingCounties(ValueError):
+    pass
+
+
+def county_filter(states=None, ranges=None):
+    """Canonical CountyFilter for the given states and {column: (low, high)} ranges, None if it keeps every row."""
+    states = tuple(sorted(set(states or ())))
+    canonical = []
+    for column, (low, high) in sorted((ranges or {}).items()):
+        low = None if low is None else float(low)
+        high = None if high is None else float(high)
+        if low is not None or high is not None:
+            canonical.append((column, low, high))
+    if not states and not canonical:
+        return None
+    return CountyFilter(states, tuple(canonical))
+
+
+def describe_filter(filters):
+    if filters is None:
+        return "all counties"
+    parts = []
+    if filters.states:
+        parts.append(", ".join(filters.states))
+    for column, low, high in filters.ranges:
+        name = column.split(".", 1)[-1]
+        if low is not None and high is not None:
+            parts.append(f"{low:g} <= {name} <= {high:g}")
+        elif low is not None:
+            parts.append(f"{name} >= {low:g}")
+        else:
+            parts.append(f"{name} <= {high:g}")
+    return "; ".join(parts)
+
+
+class FilterIndex:
+    def __init__(self, store):
+        self.digest = store.digest
+        self.n_rows = store.n_rows
+        self._store = store
+        self._lock = threading.Lock()
+
+        #Rows without a county/state label never match anything
+        self._usable = np.packbits(store.label_valid)
+        self.states = store.state_names
+        self._state_bitmaps = {
+            state: np.packbits(store.label_valid & (store.state_ids == code)) for code, state in enumerate(self.states)
+        }
+        self._sorted = {}
+        for column in INDEXED_COLUMNS:
+            if column in store.column_index:
+                self._sorted_column(column)
+
+    def _sorted_column(self, column):
+        #(values ascending, their row numbers) for the usable rows with a value in column
+        entry = self._sorted.get(column)
+        if entry is not None:
+            return entry
+        if column not in self._store.column_index:
+            raise KeyError(f"Unknown filter column {column!r}")
+        values = self._store.matrix[:, self._store.column_index[column]]
+        rows = np.flatnonzero(self._store.label_valid & ~np.isnan(values))
+        order = rows[np.argsort(values[rows], kind="stable")]
+        entry = (np.ascontiguousarray(values[order]), order)
+        with self._lock:
+            self._sorted[column] = entry
+        return entry
+
+    def bounds(self, column):
+        """(min, max) of column over the usable rows."""
+        values, _ = self._sorted_column(column)
+        return float(values[0]), float(values[-1])
+
+    def state_bitmap(self, states):
+        bitmaps = [self._state_bitmaps[state] for state in states if state in self._state_bitmaps]
+        if not bitmaps:
+            return np.zeros_like(self._usable)
+        return np.bitwise_or.reduce(bitmaps)
+
+    def range_bitmap(self, column, low=None, high=None):
+        values, order = self._sorted_column(column)
+        start = 0 if low is None else np.searchsorted(values, low, side="left")
+        end = len(values) if high is None else np.searchsorted(values, high, side="right")
+        hits = np.zeros(self.n_rows, dtype=bool)
+        hits[order[start:end]] = True
+        return np.packbits(hits)
+
+    def rows(self, filters):
+        """Sorted row numbers of the feature store passing filters."""
+        bitmap = self._usable
+        if filters is not None:
+            if filters.states:
+                bitmap = bitmap & self.state_bitmap(filters.states)
+            for column, low, high in filters.ranges:
+                bitmap = bitmap & self.range_bitmap(column, low, high)
+        return np.flatnonzero(np.unpackbits(bitmap, count=self.n_rows))
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_filter_index():
+    """FilterIndex for the current feature store, rebuilt when the dataset changes."""
+    global _index
+    store = get_feature_store()
+    index = _index
+    if index is not None and index.digest == store.digest:
+        return index
+    with _index_lock:
+        if _index is None or _index.digest != store.digest:
+            _index = FilterIndex(store)
+        return _index
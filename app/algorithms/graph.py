@@ -0,0 +1,117 @@
+import numpy as np
+
+# Compact county graph in CSR form. Node i < n_counties is the i-th usable
+# county row from the feature store, and node n_counties is the "Perfect
+# County" hub joined to every county by its distance_to_ideal. Neighbors of
+# node u are indices[indptr[u]:indptr[u + 1]] with matching weights.
+
+
+class CSRGraph:
+    def __init__(self, indptr, indices, weights, n_counties):
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.n_counties = n_counties
+
+    @property
+    def n_nodes(self):
+        return len(self.indptr) - 1
+
+    @property
+    def n_edges(self):
+        #Directed entries, every undirected edge is stored once per direction
+        return len(self.indices)
+
+    @property
+    def perfect_index(self):
+        return self.n_counties
+
+    @property
+    def nbytes(self):
+        return self.indptr.nbytes + self.indices.nbytes + self.weights.nbytes
+
+    def neighbors(self, node):
+        start, end = self.indptr[node], self.indptr[node + 1]
+        return self.indices[start:end], self.weights[start:end]
+
+    def edge_arrays(self):
+        """(src, dst, weight) arrays covering every directed edge."""
+        src = np.repeat(np.arange(self.n_nodes, dtype=np.int32), np.diff(self.indptr))
+        return src, self.indices, self.weights
+
+
+def knn_edges(indices, distances):
+    #Undirected kNN edges from kneighbors output, skipping each row's own entry.
+    #A pair listed from both ends keeps the weight seen last, like nx.Graph.add_edge.
+    n, width = indices.shape
+    src = np.repeat(np.arange(n, dtype=np.int32), width - 1)
+    dst = indices[:, 1:].ravel().astype(np.int32)
+    w = distances[:, 1:].ravel().astype(np.float64)
+
+    keep = src != dst
+    src, dst, w = src[keep], dst[keep], w[keep]
+
+    lo = np.minimum(src, dst)
+    hi = np.maximum(src, dst)
+    pair = lo.astype(np.int64) * n + hi
+    _, last = np.unique(pair[::-1], return_index=True)
+    last = len(pair) - 1 - last
+    return lo[last], hi[last], w[last]
+
+
+def knn_csr(indices, distances):
+    """County-only CSR arrays (indptr, indices, weights) of the undirected kNN graph."""
+    n = len(indices)
+    lo, hi, w = knn_edges(indices, distances)
+
+    #Both directions of every edge
+    src = np.concatenate([lo, hi])
+    dst = np.concatenate([hi, lo])
+    weights = np.concatenate([w, w])
+
+    order = np.argsort(src, kind="stable")
+    counts = np.bincount(src, minlength=n)
+    indptr = np.zeros(n + 1, dtype=np.int32)
+    np.cumsum(counts, out=indptr[1:])
+    return indptr, dst[order], weights[order]
+
+
+def add_perfect_county(knn_indptr, knn_indices, knn_weights, distance_to_ideal):
+    """CSRGraph of a cached kNN graph plus the per-user Perfect County hub edges."""
+    n = len(distance_to_ideal)
+    hub = np.int32(n)
+    hub_weights = np.asarray(distance_to_ideal, dtype=np.float64)
+
+    #Every county row gets one extra entry, its edge to the hub, after its kNN neighbors
+    ends = knn_indptr[1:]
+    indices = np.insert(knn_indices, ends, hub)
+    weights = np.insert(knn_weights, ends, hub_weights)
+
+    #The hub row itself lists every county
+    indices = np.concatenate([indices, np.arange(n, dtype=np.int32)])
+    weights = np.concatenate([weights, hub_weights])
+
+    indptr = np.empty(n + 2, dtype=np.int32)
+    indptr[:n + 1] = knn_indptr + np.arange(n + 1, dtype=np.int32)
+    indptr[n + 1] = len(indices)
+    return CSRGraph(indptr, indices, weights, n)
+
+
+def build_county_graph(indices, distances, distance_to_ideal):
+    """Build the CSR graph from kneighbors output plus the Perfect County hub edges."""
+    return add_perfect_county(*knn_csr(indices, distances), distance_to_ideal)
+
+
+def fit_knn(normalized, k=5):
+    """kneighbors output (indices, distances) with each county's own row first."""
+    from sklearn.neighbors import NearestNeighbors
+
+    nbrs = NearestNeighbors(n_neighbors=k+1).fit(normalized)
+    distances, indices = nbrs.kneighbors(normalized)
+    return indices, distances
+
+
+def county_graph(normalized, distance_to_ideal, k=5):
+    """Fit the k-nearest-neighbor county graph for one normalized feature matrix."""
+    indices, distances = fit_knn(normalized, k)
+    return build_county_graph(indices, distances, distance_to_ideal)
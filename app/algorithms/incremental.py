@@ -0,0 +1,85 @@
+import numpy as np
+
+from .feature_store import get_feature_store
+from .knn_cache import normalized_rows
+from .ranking import ranked_matches, top_k_indices
+
+# Incremental scoring for the live preview on the preferences page. A session's
+# IncrementalScorer keeps the squared distance of every candidate county to
+# the previous ideal. Users move one slider at a time, so an update usually
+# changes a few feature values: for each changed column j only its term is
+# swapped, (x - new)^2 - (x - old)^2 = (old - new) * (2x - old - new), read
+# from the shared normalized matrix (for filters, the filtered matrix in
+# knn_cache's LRU, so sessions with the same filter share it), before
+# re-ranking. Only the totals and the previous ideal are kept per session, not
+# a county x feature matrix. The totals are summed from scratch when many columns change or after
+# REFRESH_EVERY incremental updates, so rounding drift never builds up; a new
+# feature set, filter or dataset starts over.
+#
+# Distances are Euclidean to the ideal, which is also the order Dijkstra
+# settles counties in (every county hangs off the Perfect County).
+
+#Incremental updates between two full re-sums
+REFRESH_EVERY = 64
+
+#Above this share of changed columns a full re-sum is as cheap
+FULL_UPDATE_SHARE = 0.25
+
+
+class IncrementalScorer:
+    """Distances to the ideal for one session, updated column by column as the preferences change."""
+
+    def __init__(self):
+        self._key = None
+        self._rows = None
+        self._normalized = None
+        self._ideal = None
+        self._totals = None
+        self._since_refresh = 0
+        self.full_updates = 0
+        self.incremental_updates = 0
+        #Columns the last update recomputed
+        self.last_changed = 0
+
+    def _refresh(self, ideal):
+        diff = self._normalized - ideal
+        self._totals = np.einsum("ij,ij->i", diff, diff)
+        self._ideal = ideal
+        self._since_refresh = 0
+        self.full_updates += 1
+        self.last_changed = len(ideal)
+
+    def update(self, features: dict, filters=None):
+        """(rows, distances) of the candidate counties for features, reusing the previous query's totals."""
+        store = get_feature_store()
+        feature_names = tuple(features)
+        ideal = np.fromiter(features.values(), dtype=np.float64, count=len(feature_names))
+        key = (store.digest, feature_names, filters)
+
+        if key != self._key:
+            self._rows, self._normalized = normalized_rows(feature_names, filters)
+            self._key = key
+            self._refresh(ideal)
+        else:
+            changed = np.flatnonzero(ideal != self._ideal)
+            if len(changed) > FULL_UPDATE_SHARE * len(ideal) or self._since_refresh >= REFRESH_EVERY:
+                self._refresh(ideal)
+            elif len(changed):
+                for j in changed.tolist():
+                    old, new = self._ideal[j], ideal[j]
+                    self._totals += (old - new) * (2.0 * self._normalized[:, j] - old - new)
+                self._ideal = ideal
+                self._since_refresh += 1
+                self.incremental_updates += 1
+                self.last_changed = len(changed)
+            else:
+                self.last_changed = 0
+
+        #Swapped terms can leave a zero total a hair below zero
+        return self._rows, np.sqrt(np.maximum(self._totals, 0.0))
+
+    def top_matches(self, features: dict, k=3, filters=None):
+        """County/State/DistanceToIdeal of the k closest counties, best first."""
+        rows, distances = self.update(features, filters)
+        positions = top_k_indices(distances, k)
+        return ranked_matches(get_feature_store(), rows, positions, distances[positions])
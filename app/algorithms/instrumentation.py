@@ -0,0 +1,265 @@
+import bisect
+import contextvars
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import nullcontext
+
+# Per-request timing spans and process-wide metrics. A request (one algorithm
+# call or one map render) is wrapped with @traced; every `with span(...)` inside
+# it appends (name, seconds) to that request's breakdown and feeds a latency
+# histogram labelled by request and span. Counters and histograms export as
+# Prometheus text or JSON lines. With COUNTY_METRICS=0 span() returns a shared
+# no-op context manager and @traced calls straight through.
+#
+#   COUNTY_METRICS=0                          disable instrumentation
+#   COUNTY_METRICS_FILE=metrics.prom          rewrite Prometheus text after every request
+#   COUNTY_METRICS_FILE=requests.jsonl        append one JSON line per request
+
+logger = logging.getLogger(__name__)
+
+ENABLED = os.environ.get("COUNTY_METRICS", "1") != "0"
+METRICS_FILE = os.environ.get("COUNTY_METRICS_FILE")
+
+#Histogram bucket upper bounds in seconds, 50 µs up to 10 s
+BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+           0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        """(upper bound, cumulative count) pairs ending with +Inf."""
+        total = 0
+        pairs = []
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+
+def _label_key(labels):
+    return tuple(sorted(labels.items()))
+
+
+def _format_labels(labels, extra=()):
+    items = list(labels) + list(extra)
+    if not items:
+        return ""
+    return "{" + ",".join(f'{name}="{value}"' for name, value in items) + "}"
+
+
+def _format_bound(bound):
+    return "+Inf" if bound == float("inf") else repr(bound)
+
+
+class Metrics:
+    def __init__(self):
+        self._counters = {}
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name, value=1, **labels):
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name, value, **labels):
+        key = (name, _label_key(labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(value)
+
+    def clear(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def snapshot(self):
+        """Plain dict of every counter and histogram, safe to serialize."""
+        with self._lock:
+            return {
+                "counters": [
+                    {"name": name, "labels": dict(labels), "value": value}
+                    for (name, labels), value in self._counters.items()
+                ],
+                "histograms": [
+                    {"name": name, "labels": dict(labels), "count": h.count, "sum": h.sum,
+                     "buckets": [[_format_bound(bound), count] for bound, count in h.cumulative()]}
+                    for (name, labels), h in self._histograms.items()
+                ],
+            }
+
+    def prometheus_text(self):
+        lines = []
+        with self._lock:
+            typed = set()
+            for (name, labels), value in sorted(self._counters.items()):
+                if name not in typed:
+                    lines.append(f"# TYPE {name} counter")
+                    typed.add(name)
+                lines.append(f"{name}{_format_labels(labels)} {value}")
+            for (name, labels), h in sorted(self._histograms.items()):
+                if name not in typed:
+                    lines.append(f"# TYPE {name} histogram")
+                    typed.add(name)
+                for bound, count in h.cumulative():
+                    lines.append(f"{name}_bucket{_format_labels(labels, [('le', _format_bound(bound))])} {count}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {h.sum!r}")
+                lines.append(f"{name}_count{_format_labels(labels)} {h.count}")
+        return "\n".join(lines) + "\n"
+
+
+_metrics = Metrics()
+
+
+def get_metrics():
+    return _metrics
+
+
+class Trace:
+    def __init__(self, request):
+        self.request = request
+        self.spans = []
+        self.start = time.perf_counter()
+        self.total = None
+
+    def finish(self):
+        self.total = time.perf_counter() - self.start
+
+    def record(self):
+        return {
+            "timestamp": time.time(),
+            "request": self.request,
+            "total": self.total,
+            "spans": [{"name": name, "seconds": seconds} for name, seconds in self.spans],
+        }
+
+
+_current_trace = contextvars.ContextVar("county_trace", default=None)
+
+#Latency of the first request of each kind in this process, the one that pays for cold caches
+_first_requests = {}
+_first_requests_lock = threading.Lock()
+
+
+def current_trace():
+    """The Trace of the request running in this context, or None."""
+    return _current_trace.get()
+
+
+def first_request_times():
+    """{request: seconds} for the first completed request of each kind in this process."""
+    with _first_requests_lock:
+        return dict(_first_requests)
+
+
+class _Span:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        trace = _current_trace.get()
+        request = trace.request if trace is not None else ""
+        if trace is not None:
+            trace.spans.append((self.name, elapsed))
+        _metrics.observe("county_span_seconds", elapsed, request=request, span=self.name)
+        return False
+
+
+_NULL_SPAN = nullcontext()
+
+
+def span(name):
+    """Time the enclosed block as one stage of the current request."""
+    if not ENABLED:
+        return _NULL_SPAN
+    return _Span(name)
+
+
+def count(name, value=1, **labels):
+    if ENABLED:
+        _metrics.inc(name, value, **labels)
+
+
+def traced(request):
+    """Decorator making each call one traced request.
+
+    When the call returns (matches, ...), the span breakdown is attached to
+    matches.attrs["timings"] as (name, seconds) pairs.
+    """
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not ENABLED:
+                return fn(*args, **kwargs)
+            trace = Trace(request)
+            token = _current_trace.set(trace)
+            try:
+                result = fn(*args, **kwargs)
+            finally:
+                _current_trace.reset(token)
+                trace.finish()
+                _finish(trace)
+            if isinstance(result, tuple) and hasattr(result[0], "attrs"):
+                result[0].attrs["timings"] = list(trace.spans)
+            return result
+        return wrapper
+    return decorate
+
+
+def _finish(trace):
+    _metrics.inc("county_requests_total", request=trace.request)
+    _metrics.observe("county_request_seconds", trace.total, request=trace.request)
+    with _first_requests_lock:
+        first = trace.request not in _first_requests
+        if first:
+            _first_requests[trace.request] = trace.total
+    if first:
+        _metrics.observe("county_first_request_seconds", trace.total, request=trace.request)
+    if logger.isEnabledFor(logging.DEBUG):
+        breakdown = ", ".join(f"{name} {seconds * 1000:.2f} ms" for name, seconds in trace.spans)
+        logger.debug("%s %.2f ms: %s", trace.request, trace.total * 1000, breakdown)
+    if METRICS_FILE:
+        try:
+            if METRICS_FILE.endswith(".jsonl"):
+                with open(METRICS_FILE, "a") as f:
+                    f.write(json.dumps(trace.record()) + "\n")
+            else:
+                export_metrics(METRICS_FILE)
+        except OSError:
+            logger.warning("Could not write metrics to %s", METRICS_FILE, exc_info=True)
+
+
+def export_metrics(path):
+    """Write current metrics to path, Prometheus text unless it ends in .jsonl (one snapshot line appended)."""
+    if path.endswith(".jsonl"):
+        with open(path, "a") as f:
+            f.write(json.dumps({"timestamp": time.time(), **_metrics.snapshot()}) + "\n")
+        return
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(_metrics.prometheus_text())
+    os.replace(tmp_path, path)
@@ -0,0 +1,260 @@
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import CancelledError, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from .bellman_ford import BELLMAN_FORD_MODES, bellman_ford_algorithm
+from .compare import compare_algorithms
+from .dijkstra import dijkstra_algorithm
+from .graph import CSRGraph
+from .instrumentation import count
+from .result_store import preference_hash
+
+# Bounded worker pool for match requests, so the Streamlit script thread only
+# submits and polls. Every job runs its algorithm call on one of MAX_WORKERS
+# threads; Bellman-Ford hands its search (the CPU-bound part) to a process
+# pool of the same size. Jobs report progress and watch a cancel flag through
+# a slot in a shared array, which works the same from a thread or a worker
+# process. A session has at most one job: submitting again cancels the old one.
+# A "compare" job runs every search on one shared graph across the process pool,
+# MAX_WORKERS searches at a time (see compare.py), and resolves to a
+# compare.Comparison instead of matches.
+
+logger = logging.getLogger(__name__)
+
+MAX_WORKERS = int(os.environ.get("COUNTY_MATCH_WORKERS", min(2, os.cpu_count() or 1)))
+
+#Jobs admitted at once (running plus queued) across all sessions, beyond that submit raises PoolBusy
+MAX_PENDING = 8 * MAX_WORKERS
+
+#Fields of one slot in the shared progress array
+_DONE, _TOTAL, _CANCEL = range(3)
+_SLOT_WIDTH = 3
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class PoolBusy(RuntimeError):
+    pass
+
+
+def _progress_reporter(slots, slot):
+    base = slot * _SLOT_WIDTH
+
+    def progress(done, total):
+        if slots[base + _CANCEL]:
+            raise JobCancelled()
+        slots[base + _DONE] = done
+        slots[base + _TOTAL] = total
+    return progress
+
+
+#Shared progress array inside worker processes, set by the pool initializer
+_worker_slots = None
+
+
+def _init_worker(slots):
+    global _worker_slots
+    _worker_slots = slots
+
+
+def _ping():
+    return os.getpid()
+
+
+def _search_worker(mode, indptr, indices, weights, n_counties, start, slot):
+    graph = CSRGraph(indptr, indices, weights, n_counties)
+    return BELLMAN_FORD_MODES[mode](graph, start, _progress_reporter(_worker_slots, slot))
+
+
+class MatchJob:
+    def __init__(self, slots, slot, algorithm, mode, k, pref_hash, session_id):
+        self.algorithm = algorithm
+        self.mode = mode
+        self.k = k
+        self.pref_hash = pref_hash
+        self.session_id = session_id
+        self.submitted = time.perf_counter()
+        self.future = None
+        self._slots = slots
+        self._slot = slot
+        self._final_progress = None
+
+    def progress(self):
+        """(done, total) as last reported by the search."""
+        if self._final_progress is not None:
+            return self._final_progress
+        base = self._slot * _SLOT_WIDTH
+        return int(self._slots[base + _DONE]), int(self._slots[base + _TOTAL])
+
+    def describe_progress(self):
+        done, total = self.progress()
+        if total == 0:
+            return "queued"
+        if self.algorithm == "dijkstra":
+            return f"{done} of {total} closest counties settled"
+        if self.algorithm == "compare":
+            return f"{done} of {total} searches finished"
+        if self.mode == "spfa":
+            return f"{done} queue pops"
+        return f"relaxation round {done + 1}"
+
+    def done(self):
+        return self.future.done()
+
+    def result(self, timeout=None):
+        """(matches, time_elapsed), or a Comparison for compare jobs; raises JobCancelled if the job was cancelled."""
+        try:
+            return self.future.result(timeout)
+        except CancelledError:
+            raise JobCancelled() from None
+
+
+class MatchPool:
+    def __init__(self, max_workers=MAX_WORKERS, max_pending=MAX_PENDING):
+        self.max_workers = max_workers
+        self._context = multiprocessing.get_context("spawn")
+        self._slots = self._context.RawArray("d", _SLOT_WIDTH * max_pending)
+        self._free = list(range(max_pending))
+        self._jobs = {}
+        self._by_session = {}
+        self._lock = threading.RLock()
+        self._threads = ThreadPoolExecutor(max_workers, thread_name_prefix="county-match")
+        self._processes = None
+
+    def _process_pool(self):
+        with self._lock:
+            if self._processes is None:
+                self._processes = ProcessPoolExecutor(
+                    self.max_workers, mp_context=self._context,
+                    initializer=_init_worker, initargs=(self._slots,),
+                )
+            return self._processes
+
+    def _reset_processes(self, pool):
+        with self._lock:
+            if self._processes is pool:
+                self._processes = None
+
+    def warm(self):
+        """Start the worker processes now instead of on the first Bellman-Ford job."""
+        pool = self._process_pool()
+        try:
+            for future in [pool.submit(_ping) for _ in range(self.max_workers)]:
+                future.result()
+        except BrokenProcessPool:
+            self._reset_processes(pool)
+            raise
+
+    def _search_runner(self, slot):
+        def run_search(mode, graph, start, progress):
+            pool = self._process_pool()
+            try:
+                future = pool.submit(
+                    _search_worker, mode, graph.indptr, graph.indices, graph.weights,
+                    graph.n_counties, start, slot,
+                )
+                return future.result()
+            except BrokenProcessPool:
+                #A worker died (e.g. killed for memory): answer from this thread, the next job starts a fresh pool
+                logger.warning("Match worker process pool broke, running the search in-process", exc_info=True)
+                self._reset_processes(pool)
+                return BELLMAN_FORD_MODES[mode](graph, start, progress)
+        return run_search
+
+    def _compare(self, features, progress, filters):
+        pool = self._process_pool()
+        try:
+            return compare_algorithms(features, executor=pool, progress=progress, filters=filters,
+                                      concurrency=self.max_workers)
+        except BrokenProcessPool:
+            logger.warning("Match worker process pool broke, comparing in-process", exc_info=True)
+            self._reset_processes(pool)
+            with ThreadPoolExecutor(1) as threads:
+                return compare_algorithms(features, executor=threads, progress=progress, filters=filters,
+                                          concurrency=1)
+
+    def submit(self, algorithm, features: dict, k=5, mode="vectorized", session_id=None, filters=None, per_state=False):
+        """Queue one match and return its MatchJob, cancelling this session's previous job."""
+        if algorithm == "bellman_ford" and mode not in BELLMAN_FORD_MODES:
+            raise ValueError(f"Unknown Bellman-Ford mode {mode!r}, expected one of {list(BELLMAN_FORD_MODES)}")
+        if algorithm not in ("dijkstra", "bellman_ford", "compare"):
+            raise ValueError(f"Unknown algorithm {algorithm!r}")
+        features = dict(features)
+
+        with self._lock:
+            previous = self._by_session.get(session_id) if session_id is not None else None
+            if previous is not None:
+                self.cancel(previous)
+            if not self._free:
+                raise PoolBusy(f"{len(self._jobs)} match jobs already pending")
+            slot = self._free.pop()
+            base = slot * _SLOT_WIDTH
+            self._slots[base:base + _SLOT_WIDTH] = [0.0] * _SLOT_WIDTH
+
+            job = MatchJob(self._slots, slot, algorithm, mode, k, preference_hash(features, filters), session_id)
+            progress = _progress_reporter(self._slots, slot)
+            if algorithm == "dijkstra":
+                job.future = self._threads.submit(
+                    dijkstra_algorithm, features, k, session_id, progress=progress, filters=filters,
+                    per_state=per_state)
+            elif algorithm == "compare":
+                job.future = self._threads.submit(self._compare, features, progress, filters)
+            else:
+                job.future = self._threads.submit(
+                    bellman_ford_algorithm, features, mode, k, session_id,
+                    progress=progress, run_search=self._search_runner(slot), filters=filters,
+                    per_state=per_state)
+            self._jobs[slot] = job
+            if session_id is not None:
+                self._by_session[session_id] = job
+            job.future.add_done_callback(lambda _: self._release(job))
+        return job
+
+    def cancel(self, job):
+        with self._lock:
+            if self._jobs.get(job._slot) is not job:
+                return
+            self._slots[job._slot * _SLOT_WIDTH + _CANCEL] = 1.0
+            job.future.cancel()
+
+    def _release(self, job):
+        if job.future.cancelled():
+            status = "cancelled"
+        elif job.future.exception() is not None:
+            status = "cancelled" if isinstance(job.future.exception(), JobCancelled) else "failed"
+        else:
+            status = "completed"
+        count("county_match_jobs_total", algorithm=job.algorithm, status=status)
+
+        with self._lock:
+            if self._jobs.get(job._slot) is not job:
+                return
+            job._final_progress = job.progress()
+            del self._jobs[job._slot]
+            self._free.append(job._slot)
+            if self._by_session.get(job.session_id) is job:
+                del self._by_session[job.session_id]
+
+    def stats(self):
+        with self._lock:
+            running = sum(1 for job in self._jobs.values() if job.future.running())
+            return {"pending": len(self._jobs), "running": running, "max_workers": self.max_workers}
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_match_pool():
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = MatchPool()
+    return _pool
@@ -0,0 +1,147 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from .feature_store import drop_stale, feature_cache_path, get_feature_store, load_feature_cache, save_feature_cache
+from .filters import NoMatchingCounties, describe_filter, get_filter_index
+from .graph import add_perfect_county, fit_knn, knn_csr
+from .instrumentation import span
+
+# The kNN part of the county graph depends only on the normalized county
+# matrix and the feature column set, never on the user's ideal values. It is
+# fitted once per (dataset, feature tuple, k), kept in memory as CSR arrays and
+# persisted next to the feature store cache so new processes skip the fit.
+# Files record the dataset digest and are refitted when the CSV changes.
+# Filtered requests fit on the surviving rows only; those entries stay in a
+# small in-memory LRU since filters vary far more than feature sets. Each
+# filtered key is built under its own lock, so identical concurrent requests
+# fit once while different filters fit in parallel.
+
+_knn_graphs = {}
+_knn_lock = threading.Lock()
+
+#Filtered (feature set, filter) entries kept in memory, least recently used dropped first
+FILTERED_ENTRIES = 32
+_filtered_graphs = OrderedDict()
+#Per-key build locks, dropped once the entry is in _filtered_graphs
+_filtered_locks = {}
+
+
+def _load_knn(path, digest, feature_names):
+    arrays = load_feature_cache(path, digest, feature_names)
+    if arrays is None or "indices" not in arrays or "distances" not in arrays:
+        return None
+    return arrays["indices"], arrays["distances"]
+
+
+def county_knn(feature_names, k=5):
+    """(indices, distances) kneighbors output for the store's normalized rows, fitted at most once."""
+    return _knn_entry(feature_names, k)["knn"]
+
+
+def _knn_entry(feature_names, k):
+    store = get_feature_store()
+    key = (store.digest, tuple(feature_names), k)
+    entry = _knn_graphs.get(key)
+    if entry is not None:
+        return entry
+
+    with _knn_lock:
+        entry = _knn_graphs.get(key)
+        if entry is not None:
+            return entry
+        path = feature_cache_path(store, "knn", feature_names, f"k{k}")
+        knn = _load_knn(path, store.digest, feature_names)
+        if knn is None:
+            _, normalized = store.normalized(feature_names)
+            indices, distances = fit_knn(normalized, k)
+            knn = (indices.astype(np.int32), distances)
+            save_feature_cache(path, store.digest, feature_names, {"indices": knn[0], "distances": knn[1]})
+
+        csr = knn_csr(*knn)
+        for array in knn + csr:
+            array.setflags(write=False)
+        drop_stale(_knn_graphs, store.digest)
+        entry = {"knn": knn, "csr": csr}
+        _knn_graphs[key] = entry
+        return entry
+
+
+def filtered_entry(feature_names, filters, k=5):
+    """{"rows", "normalized", "csr"} for the counties passing filters, built at most once per recent filter."""
+    store = get_feature_store()
+    key = (store.digest, tuple(feature_names), k, filters)
+    with _knn_lock:
+        entry = _filtered_graphs.get(key)
+        if entry is not None:
+            _filtered_graphs.move_to_end(key)
+            return entry
+        key_lock = _filtered_locks.setdefault(key, threading.Lock())
+
+    with key_lock:
+        with _knn_lock:
+            entry = _filtered_graphs.get(key)
+        if entry is not None:
+            return entry
+        try:
+            entry = _fit_filtered(store, feature_names, filters, k)
+        except Exception:
+            with _knn_lock:
+                _filtered_locks.pop(key, None)
+            raise
+        with _knn_lock:
+            _filtered_graphs[key] = entry
+            while len(_filtered_graphs) > FILTERED_ENTRIES:
+                _filtered_graphs.popitem(last=False)
+            _filtered_locks.pop(key, None)
+        return entry
+
+
+def _fit_filtered(store, feature_names, filters, k):
+    rows, normalized = store.normalized(feature_names, get_filter_index().rows(filters))
+    if len(rows) == 0:
+        raise NoMatchingCounties(f"No counties match the filters ({describe_filter(filters)})")
+    #A small selection can have fewer than k other counties
+    indices, distances = fit_knn(normalized, min(k, len(rows) - 1))
+    csr = knn_csr(indices.astype(np.int32), distances)
+    for array in csr:
+        array.setflags(write=False)
+    return {"rows": rows, "normalized": normalized, "csr": csr}
+
+
+def normalized_rows(feature_names, filters=None, k=5):
+    """(rows, normalized) scored by a request, every usable row when filters is None."""
+    if filters is None:
+        return get_feature_store().normalized(feature_names)
+    entry = filtered_entry(feature_names, filters, k)
+    return entry["rows"], entry["normalized"]
+
+
+def knn_adjacency(feature_names, k=5, filters=None):
+    """County-only CSR arrays (indptr, indices, weights) of the cached kNN graph, without the Perfect County."""
+    with span("knn"):
+        if filters is None:
+            return _knn_entry(feature_names, k)["csr"]
+        return filtered_entry(feature_names, filters, k)["csr"]
+
+
+def cached_county_graph(feature_names, distance_to_ideal, k=5, filters=None):
+    """CSRGraph from the cached kNN adjacency plus this request's Perfect County edges."""
+    csr = knn_adjacency(feature_names, k, filters)
+    with span("graph_build"):
+        return add_perfect_county(*csr, distance_to_ideal)
+
+
+def scored_rows(features: dict, filters=None, k=5):
+    """(rows, normalized, distance_to_ideal) of the counties a request scores, distances Euclidean to the ideal."""
+    rows, normalized = normalized_rows(list(features), filters, k)
+    ideal = np.array(list(features.values()), dtype=np.float64)
+    return rows, normalized, np.linalg.norm(normalized - ideal, axis=1)
+
+
+def request_graph(features: dict, filters=None, k=5):
+    """(rows, distance_to_ideal, graph) for a request: its scored rows and the county graph with its Perfect County."""
+    with span("normalize"):
+        rows, _, distance_to_ideal = scored_rows(features, filters, k)
+    return rows, distance_to_ideal, cached_county_graph(list(features), distance_to_ideal, k, filters)
@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+
+
+def top_k_indices(values, k):
+    """Positions of the k smallest values, best first; ties go to the lower position."""
+    values = np.asarray(values)
+    k = min(k, len(values))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k < len(values):
+        candidates = np.argpartition(values, k - 1)[:k]
+        #argpartition is not stable, so widen to every position tied with the k-th value
+        kth = values[candidates].max()
+        candidates = np.flatnonzero(values <= kth)
+    else:
+        candidates = np.arange(len(values))
+    order = np.lexsort((candidates, values[candidates]))
+    return candidates[order[:k]]
+
+
+def ranked_matches(store, rows, positions, distances):
+    """County/State/DistanceToIdeal rows for the given graph positions, in the given order."""
+    #Built straight from the store's id arrays, indexed by table row like the full frame
+    selected = rows[positions]
+    return pd.DataFrame({
+        "County": store.county_labels(selected),
+        "State": store.state_labels(selected),
+        "DistanceToIdeal": np.asarray(distances, dtype=np.float64),
+    }, index=pd.Index(selected))
+
+
+def best_per_state(store, distance_column):
+    """County/State/DistanceToIdeal of the closest county in each state, best state first."""
+    #One grouped argmin over the scored rows (NaN are unscored), ties go to the lower row like top_k_indices
+    rows = np.flatnonzero(store.label_valid & ~np.isnan(distance_column))
+    states = store.state_ids[rows]
+    distances = distance_column[rows]
+    best = np.full(len(store.state_names), np.inf)
+    np.minimum.at(best, states, distances)
+    winners = rows[distances == best[states]]
+    _, first = np.unique(store.state_ids[winners], return_index=True)
+    winners = winners[first]
+    order = np.lexsort((winners, distance_column[winners]))
+    return ranked_matches(store, winners, order, distance_column[winners[order]])
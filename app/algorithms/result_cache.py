@@ -0,0 +1,142 @@
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from .answer_table import distance_column as full_distance_column, lookup, store_answer
+from .feature_store import get_feature_store
+from .instrumentation import count
+from .ranking import best_per_state, ranked_matches
+from .result_store import get_result_store, preference_hash
+
+# Cross-session LRU cache in front of the algorithm entry points. The
+# preferences page only has a few discrete inputs, so many users submit the
+# same features dict; a hit returns the stored ranking without touching the
+# feature store, sklearn or the graph. Entries are bounded by count and by
+# bytes, and hit/miss/eviction counters are kept for monitoring. Unfiltered
+# Dijkstra misses fall through to the persistent answer table (answer_table.py),
+# shared by every process, before any graph work. The Bellman-Ford variants
+# never read it, so their reported search time is always a real search.
+# Entries rebuilt from the table score only their ranked rows; the full
+# distance column (session map, per-state list) is built the first time a hit
+# needs it and kept in the entry.
+
+#Only this algorithm reads and writes the answer table
+ANSWER_TABLE_ALGORITHM = "dijkstra"
+
+#How many ranked matches each entry keeps, so any k up to this is a hit
+CACHE_DEPTH = 20
+
+#distance_column is None until needed for entries rebuilt from the answer table
+CachedMatch = namedtuple("CachedMatch", ["matches", "distance_column", "search_time", "nbytes"])
+
+
+class MatchCache:
+    def __init__(self, max_entries=1024, max_bytes=64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, matches, distance_column, search_time):
+        nbytes = int(matches.memory_usage(deep=True).sum())
+        if distance_column is not None:
+            distance_column.setflags(write=False)
+            nbytes += distance_column.nbytes
+        entry = CachedMatch(matches, distance_column, search_time, nbytes)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= old.nbytes
+            self._entries[key] = entry
+            self.nbytes += nbytes
+            while self._entries and (len(self._entries) > self.max_entries or self.nbytes > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self.nbytes -= evicted.nbytes
+                self.evictions += 1
+        return entry
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.nbytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+_match_cache = MatchCache()
+
+
+def get_match_cache():
+    return _match_cache
+
+
+def match_key(algorithm, features: dict, filters=None):
+    return (algorithm, preference_hash(features, filters))
+
+
+def cached_match(algorithm, features: dict, k, session_id=None, filters=None, per_state=False):
+    """(matches, lookup_time) from the cache, or None on a miss or when k is deeper than CACHE_DEPTH."""
+    if k > CACHE_DEPTH:
+        return None
+    start_time = time.perf_counter()
+    pref_hash = preference_hash(features, filters)
+    entry = _match_cache.get((algorithm, pref_hash))
+    if entry is None:
+        count("county_match_cache_lookups_total", algorithm=algorithm, result="miss")
+        entry = _answer_table_match(algorithm, features, filters)
+        if entry is None:
+            return None
+    else:
+        count("county_match_cache_lookups_total", algorithm=algorithm, result="hit")
+    if entry.distance_column is None and (session_id is not None or per_state):
+        entry = _match_cache.put((algorithm, pref_hash), entry.matches, full_distance_column(features),
+                                 entry.search_time)
+    if session_id is not None:
+        get_result_store().put(session_id, pref_hash, entry.distance_column)
+    matches = entry.matches.head(k)
+    matches.attrs["cached"] = True
+    if per_state:
+        matches.attrs["per_state"] = best_per_state(get_feature_store(), entry.distance_column)
+    return matches, time.perf_counter() - start_time
+
+
+def _answer_table_match(algorithm, features: dict, filters):
+    #Rebuilds a cache entry from the answer table's ranked rows, None on a miss
+    if filters is not None or algorithm != ANSWER_TABLE_ALGORITHM:
+        return None
+    answer = lookup(features)
+    if answer is None:
+        return None
+    rows, distances = answer
+    matches = ranked_matches(get_feature_store(), rows, slice(None), distances)
+    return _match_cache.put(match_key(algorithm, features), matches, None, 0.0)
+
+
+def cache_match(algorithm, features: dict, matches, distance_column, search_time, filters=None):
+    _match_cache.put(match_key(algorithm, features, filters), matches, distance_column, search_time)
+    if filters is None and algorithm == ANSWER_TABLE_ALGORITHM:
+        store_answer(features, matches.index.to_numpy())
@@ -0,0 +1,79 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from .feature_store import DATA_DIR
+
+# In-memory home for per-session match results. Only the DistanceToIdeal
+# vector is kept (one float32 per county row of the feature store, enough for
+# the map's colors and hover text), keyed by session id and a hash of the
+# preferences that produced it. The map page joins it back onto the shared
+# base table, so nothing goes through disk.
+
+EXPORT_PATH = os.path.join(DATA_DIR, "county_demographics_with_distances.csv")
+
+
+def preference_hash(features: dict, filters=None):
+    """Stable hash of a features dict, independent of key order and int/float spelling."""
+    canonical = sorted((name, float(value)) for name, value in features.items())
+    if filters is not None:
+        #A filtered request scores different rows; unfiltered hashes stay as they were
+        canonical = [canonical, list(filters.states), [list(r) for r in filters.ranges]]
+    payload = json.dumps(canonical, separators=(",", ":"))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class ResultStore:
+    def __init__(self, max_sessions=256, results_per_session=4):
+        self.max_sessions = max_sessions
+        self.results_per_session = results_per_session
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, session_id, pref_hash, distances):
+        distances = np.asarray(distances, dtype=np.float32)
+        distances.setflags(write=False)
+        with self._lock:
+            results = self._sessions.pop(session_id, None) or OrderedDict()
+            results.pop(pref_hash, None)
+            results[pref_hash] = distances
+            while len(results) > self.results_per_session:
+                results.popitem(last=False)
+            self._sessions[session_id] = results
+            #Sessions end without telling us, so drop the least recently used ones
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+
+    def get(self, session_id, pref_hash):
+        with self._lock:
+            results = self._sessions.get(session_id)
+            if results is None or pref_hash not in results:
+                return None
+            self._sessions.move_to_end(session_id)
+            results.move_to_end(pref_hash)
+            return results[pref_hash]
+
+    def clear_session(self, session_id):
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def __len__(self):
+        with self._lock:
+            return sum(len(results) for results in self._sessions.values())
+
+
+_result_store = ResultStore()
+
+
+def get_result_store():
+    return _result_store
+
+
+def export_distances(data, distances, path=EXPORT_PATH):
+    """Optional disk export of the full table with a DistanceToIdeal column."""
+    data.assign(DistanceToIdeal=distances).to_csv(path, index=False)
+    return path
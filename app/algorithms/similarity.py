@@ -0,0 +1,250 @@
+import argparse
+import json
+import sys
+import threading
+import time
+
+import numpy as np
+
+from .feature_store import drop_stale, feature_cache_path, get_feature_store, load_feature_cache, save_feature_cache
+from .instrumentation import span, traced
+from .ranking import ranked_matches, top_k_indices
+
+# "Counties similar to this one": nearest neighbors of a county in the
+# normalized feature space, from an index kept per (dataset, feature set,
+# method). Methods:
+#   exact       brute force, one matrix-vector product over every county
+#   ball_tree   sklearn BallTree, exact, prunes well on the few features of
+#               a preference set, not on all of them (see bench_similarity.py)
+#   projection  approximate: Gaussian random projection to PROJECTED_DIMS
+#               float32 dims, brute force there for a candidate pool, then an
+#               exact re-rank of the pool
+# Projection indexes are saved as .npz next to the kNN graph cache (see
+# feature_store.save_feature_cache), so new processes load instead of
+# building; the normalized matrix is never part of the file, it is the feature
+# store's and shared. Ball trees are rebuilt once per process rather than
+# pickled.
+#
+#   python -m app.algorithms.similarity "Cook County" Illinois --k 10 --method ball_tree
+
+DEFAULT_METHOD = "exact"
+
+BALL_TREE_LEAF_SIZE = 40
+
+PROJECTED_DIMS = 16
+#Candidates re-ranked exactly per requested neighbor, and at least this many
+CANDIDATES_PER_NEIGHBOR = 16
+MIN_CANDIDATES = 64
+PROJECTION_SEED = 0
+
+
+def _exact_top(X, positions, x, k):
+    #Exact distances for the candidate positions, the k closest first (ties to the lower position)
+    diff = X[positions] - x
+    distances = np.sqrt(np.einsum("ij,ij->i", diff, diff))
+    best = top_k_indices(distances, k)
+    return positions[best], distances[best]
+
+
+class ExactIndex:
+    approximate = False
+    persisted = False
+
+    def __init__(self, X):
+        self.attach(X)
+
+    def attach(self, X):
+        self.X = X
+        self.sq_norms = np.einsum("ij,ij->i", X, X)
+
+    def query(self, x, k):
+        """(positions, distances) of the k rows of X closest to x, closest first."""
+        #||a||^2 - 2ab picks the candidates, the winners get exact distances
+        d2 = self.sq_norms - 2.0 * (self.X @ x)
+        candidates = top_k_indices(d2, min(len(d2), k + MIN_CANDIDATES))
+        return _exact_top(self.X, candidates, x, k)
+
+    @property
+    def nbytes(self):
+        return self.sq_norms.nbytes
+
+
+class BallTreeIndex:
+    approximate = False
+    persisted = False
+
+    def __init__(self, X):
+        from sklearn.neighbors import BallTree
+
+        self.tree = BallTree(X, leaf_size=BALL_TREE_LEAF_SIZE)
+        self.X = X
+
+    def attach(self, X):
+        self.X = X
+
+    def query(self, x, k):
+        distances, positions = self.tree.query(x[None, :], k=min(k, len(self.X)))
+        #The tree's own order for equal distances is arbitrary, re-rank for stable ties
+        return _exact_top(self.X, positions[0], x, k)
+
+    @property
+    def nbytes(self):
+        return sum(array.nbytes for array in self.tree.get_arrays() if isinstance(array, np.ndarray))
+
+
+class ProjectionIndex:
+    approximate = True
+    persisted = True
+
+    def __init__(self, X, dims=PROJECTED_DIMS, seed=PROJECTION_SEED):
+        rng = np.random.default_rng(seed)
+        dims = min(dims, X.shape[1])
+        self.projection = rng.standard_normal((X.shape[1], dims)) / np.sqrt(dims)
+        self.projected = np.ascontiguousarray(X @ self.projection, dtype=np.float32)
+        self.projected_sq = np.einsum("ij,ij->i", self.projected, self.projected)
+        self.X = X
+
+    @classmethod
+    def from_arrays(cls, X, projection, projected, projected_sq):
+        """Index over X from the arrays state() returned, without projecting again."""
+        index = cls.__new__(cls)
+        index.projection = projection
+        index.projected = projected
+        index.projected_sq = projected_sq
+        index.X = X
+        return index
+
+    def attach(self, X):
+        self.X = X
+
+    def state(self):
+        return {"projection": self.projection, "projected": self.projected, "projected_sq": self.projected_sq}
+
+    def query(self, x, k):
+        y = (x @ self.projection).astype(np.float32)
+        d2 = self.projected_sq - 2.0 * (self.projected @ y)
+        pool = min(len(d2), max(CANDIDATES_PER_NEIGHBOR * k, MIN_CANDIDATES))
+        return _exact_top(self.X, top_k_indices(d2, pool), x, k)
+
+    @property
+    def nbytes(self):
+        return self.projection.nbytes + self.projected.nbytes + self.projected_sq.nbytes
+
+
+SIMILARITY_METHODS = {
+    "exact": ExactIndex,
+    "ball_tree": BallTreeIndex,
+    "projection": ProjectionIndex,
+}
+
+
+def _load_index(path, digest, feature_names, method, X):
+    arrays = load_feature_cache(path, digest, feature_names)
+    if arrays is None:
+        return None
+    try:
+        return SIMILARITY_METHODS[method].from_arrays(X, **arrays)
+    except TypeError:
+        #Saved by another version of the index
+        return None
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def get_similarity_index(feature_names, method=DEFAULT_METHOD):
+    """(rows, index) for the store's usable rows over feature_names, built or loaded at most once."""
+    if method not in SIMILARITY_METHODS:
+        raise ValueError(f"Unknown similarity method {method!r}, expected one of {list(SIMILARITY_METHODS)}")
+    store = get_feature_store()
+    key = (store.digest, tuple(feature_names), method)
+    entry = _indexes.get(key)
+    if entry is not None:
+        return entry
+
+    with _indexes_lock:
+        entry = _indexes.get(key)
+        if entry is not None:
+            return entry
+        rows, X = store.normalized(feature_names)
+        cls = SIMILARITY_METHODS[method]
+        index = None
+        if cls.persisted:
+            path = feature_cache_path(store, "similar", feature_names, method)
+            index = _load_index(path, store.digest, feature_names, method, X)
+        if index is None:
+            index = cls(X)
+            if cls.persisted:
+                save_feature_cache(path, store.digest, feature_names, index.state())
+        drop_stale(_indexes, store.digest)
+        entry = (rows, index)
+        _indexes[key] = entry
+        return entry
+
+
+def county_row(county, state):
+    """Feature store row of a county by its County and State labels."""
+    store = get_feature_store()
+    try:
+        county_id = store.county_names.index(county)
+        state_id = store.state_names.index(state)
+    except ValueError:
+        raise KeyError(f"Unknown county {county}, {state}") from None
+    hits = np.flatnonzero((store.county_ids == county_id) & (store.state_ids == state_id))
+    if not len(hits):
+        raise KeyError(f"Unknown county {county}, {state}")
+    return int(hits[0])
+
+
+@traced("similar")
+def similar_counties(row, k=10, feature_names=None, method=DEFAULT_METHOD):
+    """(similar, query_time): County/State/Distance of the k counties closest to feature store row, closest first."""
+    store = get_feature_store()
+    feature_names = list(store.columns if feature_names is None else feature_names)
+
+    with span("index"):
+        rows, index = get_similarity_index(feature_names, method)
+
+    position = np.searchsorted(rows, row)
+    if position == len(rows) or rows[position] != row:
+        raise KeyError(f"Row {row} has no value for some of the features")
+
+    with span("query"):
+        start_time = time.perf_counter()
+        #One extra neighbor, the county itself comes back at distance 0
+        positions, distances = index.query(index.X[position], k + 1)
+        keep = positions != position
+        positions, distances = positions[keep][:k], distances[keep][:k]
+        query_time = time.perf_counter() - start_time
+
+    similar = ranked_matches(store, rows, positions, distances).rename(columns={"DistanceToIdeal": "Distance"})
+    return similar, query_time
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="List the counties most similar to one county.")
+    parser.add_argument("county", help='county name as in the data, e.g. "Cook County"')
+    parser.add_argument("state")
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--method", choices=list(SIMILARITY_METHODS), default=DEFAULT_METHOD)
+    parser.add_argument("--features", help="JSON file with a features dict or list of columns; defaults to every column")
+    args = parser.parse_args(argv)
+
+    feature_names = None
+    if args.features:
+        with open(args.features) as f:
+            feature_names = list(json.load(f))
+    try:
+        row = county_row(args.county, args.state)
+        similar, query_time = similar_counties(row, args.k, feature_names, args.method)
+    except KeyError as e:
+        print(e.args[0], file=sys.stderr)
+        return 1
+    print(similar.to_string(index=False))
+    print(f"{args.method}: {query_time * 1000:.3f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
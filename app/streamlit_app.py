@@ -1,23 +1,40 @@
 import streamlit as st
-from urllib.request import urlopen
-import json
-import pandas as pd
-import plotly.express as px
-from algorithms.dijkstra import dijkstra_algorithm
-from algorithms.bellman_ford import bellman_ford_algorithm
-import os
+import time
+from algorithms.instrumentation import count, first_request_times, span, traced
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from utils.assets import inline_payload, static_url, stylesheet
+from utils.preferences import build_features
+from utils.warmup import start_warmup
 
-if "features" not in st.session_state:
-    st.session_state.features = {}
+# numpy, pandas, plotly and the algorithm modules are imported inside the pages
+# that use them; the warm-up thread loads them (and the data) in the background.
+# Nothing runs at import time: match worker processes re-import this file.
 
-def local_css(file_name):
-    with open(file_name) as f:
-        st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+# counties shown in the live preview on the preferences page
+PREVIEW_MATCHES = 3
+
+# states listed before the full per-state table on the results page
+TOP_STATES = 5
+
+def local_css():
+    # minified once per process, images are served from app/static (see utils/assets.py)
+    st.markdown(inline_payload('css', f"<style>{stylesheet()}</style>"), unsafe_allow_html=True)
+
+def current_session_id():
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx is not None else None
 
 def change_page(page_name):
     st.session_state.current_page = page_name
 
 def main():
+    start_warmup()
+
+    if "features" not in st.session_state:
+        st.session_state.features = {}
+    if "filters" not in st.session_state:
+        st.session_state.filters = None
+
     query_params = st.query_params
     if "page" in query_params:
         if query_params["page"] == "home":
@@ -27,14 +44,12 @@ def main():
     if 'current_page' not in st.session_state:
         st.session_state.current_page = 'home'
 
-    css_path = os.path.join('app', 'static', 'css', 'style.css')
-    local_css(css_path)
+    count('county_reruns_total')
+    local_css()
 
     if st.session_state.current_page != 'home':
-        LOGO_BASE64 = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAyAAAAPkCAYAAABRCVrKAAAAIGNIUk0AAHomAACAhAAA+gAAAIDoAAB1MAAA6mAAADqYAAAXcJy6UTwAAAAGYktHRAD/AP8A/6C9p5MAAAAJcEhZcwAAFE0AABRNAZTKjS8AAAAHdElNRQfpCwgIJgpi48KWAAACo3pUWHRSYXcgcHJvZmlsZSB0eXBlIHhtcAAASImNVkmSpDAMvOsV8wQj2bJ5Ds1y64g5zvMnZRYbF0sV0VUNSJmptCygf79/6Q8+HQcmGWOSISadotNJQ/TasbNzHXWOYvdkYtZOvS7KGmRYrx/RCzM7KjC4+GMpIfkpOHZedIlIZCfKs7j8xzK7gZ0dkMAAVxkCe09eG/71pmlI0eNwMoBzifnDc0QQz5ki8iKd9HbwQuKEcYHxPa0g+JXYAxayY+LJCOx20dIq8l4DRVHBhT6X1sOFGQq3APjC4IYTphBGnIDqIyYqRcG6BKiLsrKmudiN/+GfTriz5VhpXTZxeearPDTd+klHT3x7kpn6RkdnPoDJxYo5+MQ6ltWyOCsMecH6SWdCuGyM3fcF+nVxRPzagx6rltY1aezdAosGtIRXz8snhCGY2YxOcoJ+yR014bw3ZW3X7L1zrO1gnQ+FIAoSHcFkwf5BYTKW5WzD9qh7cFrTgkMxyczDTrO1ygaiWXOLgoYF1uD7RFZn0VXaW1EVQL/nU8PrxEu65e3vaanlPToXwwFg2SnbbWtaAARgfSYdS8vKQM/h10VWZE6TGtxC65yz/a/i1+GBLo42AfL828E/NRSQ7NF3IG/KMCERKHHbL9F727yTdUzI51Zg3k8eo7cDiY8x9/rPWd0D0KuGPCE29WgyOhwIDUcT+FYkHYlL9ipss7pY3DUEN3H0usDpqkEygdTrSE/BryR9yaMnljb4iYS2DWmjaijLfa3m0LQ/zzqAb/1Pd+HnFID3+7DNZx02UbTJmh+h9oCE/g59BGSbil+1YQVelF8oqoNr8VdxxRJ68kTG61FvBLXOUAN9U9QTLJ1xr/WdivW5GZoXj6qz62B7cQIx4PLVjzc6u0P/AdLGSolBt36DAAAAAW9yTlQBz6J3mgAAgABJREFUeNrsnXeAE0Ubxp93Uq8X7ui9dwQpgmJDsWBFUVQUAbE3pCl2P7uioqIiKmBv2EVFEQFRQaV3pNfjuMb1lJ3vj1yOXC5lN213k/l98sFdNsnO7OzMPPs2QCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUAgEAgEAoFAIBAIBAKBQCAQCAQCgUAgEAgEAoFAIBDoGFL7BAQCgUCgOgYADEBSzb9LALQCYKr5fQ8A6wH0BmAHkF7z+8YA8mo+owCAEcCamuP+BeCoeW1vzXsAoByAVPOHq91wgUAgEMQeIUAEAoFA/6TCtfkfCKAjgFPhEg+tATQBkAyXsDDANe9rce7nNX+cNX8qABwCsAdAFYCVcImbfwDY4BIyAoFAINAhWlyEBAKBQOCyRqQByAZwNoCeAAYDaAiX4GAQczjgEi0SgDIAhwEsBbAKwPdwWWCOAahU+yQFAoFAcByxeAkEAoE6pANoBGAQgJFwWSuawmWtYGqfXBzihMtqkgdgE4BvAPwF4CBcIkUgEAgEMUIIEIFAIIgOBKAvgCdr/k6Fdt2fBC7cbmClAP4GcB+A1RCxKgKBQBBRxEIoEAgE4WGCKxh7sMefFgBSIObYeIDDZTnZA2A5gGUAfoPL3UtS++QEAoFAj4jFUSAQCOTTAsApAE4GMARAcwBWCMtGouG2lFQA2A/gZwAr4BIoe9U+OYFAINA6YsEUCAQC33QGcBqAoXCJjmwkltAg9/8TCK79dvCmc+7TWylRXJjcwuQoXPElX8DlyrVF7RMTCAQCLZEoC6lAIBAEoi+AXgDugKv+hTttbbzMkXRcSNT8rE348X9wT9miZwHjTi1cAZd1ZDpc6YTXqX1iAoFAoBZaXYQEAoEgWmQBGA9gOIAOcGWj0rdlg0A6EBfRgHsIFT2JFLelpATAZgBfAZgNkY1LIBAkCIm0UAkEgsQjGUAXAKMAXAEgB/q0bHhaMPR27mrDAYD78Q3TEG5LST6AeQC+BrAWQLXaJyYQCASRRixkAoEgnkgCcDFcFo7+cAWI66WmBhGpKzBqvr/2DBgRQAQigHOAMYIkcTDmOkCSOFyHUO2/3XDu+j/Jve93/6U9HcABXmNK0RwSXBm4lgOYA2ABXK5cAoFAoGuEABEIBHqGAJwE4F4AZ8Bl8dD6vBZxoeEWDowRDEYDjCYjUjNSkJKRDIvFjOZtm/D2PVsjIzONp6QnIyklCSarERarGQ67A0aTEYzFTqdJkuT6XqMRdrsDVRXVOFZcBqfNgfzDhbR78z7s33mI7DY7SgpLUVFaCafDCYfdAUmq8beKjZDhGrOcuGuU/ArgCbgqvgsEAoHu0PpCLRAIBJ4Y4QoSnwFXKtw0aHAeoxqHKfePoX2G6yMYY0hKscCSZEV2w0xk56Tznid3Q3ZOBm/YPBcp6UnHj08AOOcgInDOUVZcjgP78qisqBxrl29EUX4JFR89horyKlSVV7qsLzziYkVLooTDFTeyFMBdAA4AcKh9UgKBQBCMxFixBAKBnmkI4BYA1wNoCpcI0QbHg78Vz6VEBGIEa5IFaZmpSM9OQ6sOzXiXvh3QqFkOz2iQDpPZmDDCIhq4LC1OFB8twf7dh2nHut3YtWUvHSsqR3lpBaoqqsAlHhGBUuPEpbYwsQM4BOA1AO8AKFD5fAQCgcAnYmUTCARawwTgErie6PYGYIG6c1XYLlPECBaLGblNs9GuW2veqU87dOjelqdlpqjYLAEAlBaXY+vaHbRl1X/YtXkv5R8sgM1mB5fC1hJqW0o4XAHsKwC8COBHuASKQCAQqI4QIAKBQAskAbgdwN1wWTxUCxyvURuy5kbPoG2j0QCDyYjcxllo0qoRb925Bdr3aMObtWkMo9GgVnMEIeJwOLF/5yHs3LibdmzYjbz9Ryn/cBGcdgccDmcoQfVuPaKWKHECyAPwLFwpf6tUOg+BQCAQAkQgEKjGSQCehKsIoFrB47KtG54xGZYkCzKyU9G0VSPeuU97dDqhPW/QKBNGk3a8wwTRwVZtR+GRYpfV5N/t2L8rj44VlcJebYckSUpiTtS0kHC4smmtADAVIphdIBDEGCFABAJBLDkDruw9feGqxxFz5Fg4PMWG0WxEg0ZZaNK6Ie89sBu69+/ELUkWMINesvsKoo3klFBVUY31f2+hdcs3Yv/Ow1SUX+LK2iU/EF5NQeIE8BeA+wEsU+kcBAJBAiEEiEAgiDZuS8cpUEd0BLVyECMQEcxWM9LSU5DdKBMDh57I23VrxRs2y1Gn1wS658iBo9i6Zget/HUNFR0pQWlxmSu+hHMZMSacq1SbxAFgCYCHAfypwvcLBIIEQAgQgUAQDdoDmAvgRADmGH93QMHhnd42p3E22ndvw8+6fDDPaJAW03oYgsRCkiSUFJRi4adLaMeG3VRwpAiV5dWQnBKAwFaSGutIrAWJDS43rbEAdqrUbQKBIA4RAkQgEESKHgDeANAH6ogO/4IDADMwWJOtaNamMXoO7MwHDe3LU9KTVe0wgaCspBzLf/yb1v6xiQ7vO4KqCpssQSKTSLp12QD8AeBOABtV6zCBQBAXCAEiEAjCIRPAWwCGIdaiw1WDo94c5rZwmExGWJPNaNOlNe8/5AQ0adWQN2vdWO3+EggCsm/nIRzadZj+/HkV9u84SJXl1XA4HJEqqBgpQVIN4FsA4+EqhCgQCASKEAJEIBAoJR0u//AxNf+O5TxSz9Lh/tFgZLAkWdGpVxt+4um90KV3e2HhEOie0qIy2rJ2B/3721psW7czkhaSSIgRDqAYrocQT0KIEYFAIBMhQAQCgVzGAPgfgMaI8dxBRMzrZzBGSEpLQlZOBvqd2YsPOLMPz8xJV7uPBIJIUi9jW1F+Cf5ZshYrfl6NoqPFqCyrghR2NfeIBLxzAAcBPADgXXW7TSAQaB0hQAQCQSB6AngdQH/Eujigh4uV263KaDSiQeNMdOrVnp987om8ebumMIgif4L4JWDKaIfDiX3bD2DZgpXYsWE3CvKK4HQ4wUN314qUi5YEYDmAmwFsUaXnBAKBphECRCAQ+OINAKPgqlAeO7xEBzGCyWRE8/ZN0a1fBz7gzD48p0m22n0jEMSKoDVrPDl6qBD/LFmHNcs34uCuw7DbHeAhWkc451KE2lAB4G0Ad8eiwwQCgT4QAkQgELhpBeArAN0RY2sHETHP9LjubFXDRg/hHbu14aLonyBBUSRAPHE6nNi2bhe+f38RDu057Er3q6xSOwCAg3NEph6JBFfF9YsA5MWi8wQCgXYRAkQgENwNV2xHLCO2iYhq/s+VsSo9MxXN2zfj51xxKm/TtSX8ZNUVCBKNsNW35JSwff1uLJq/DPt3HEBpSQXsNgcARWIkkil9ywFMhcu9UyAQJCBihRcIEpPeAD4G0A4xnAeoBgAwmV2io/fgHnzguSeKFLkCgW9CtoL4Y9+OQ1j+w99Y++cmlBWXwW5zKLOKRM49iwPYDuACADsi2UaBQKBthAARCBKLYQA+AJAWqy8kckd2EBkMDNmNstH3tB78lPP78waNstTuD4FA60RcgHhy5MBRLP/xH/y7ZD2K8ovgdMp304qgexbgSuF7GYBfo9VWgUCgHYQAEQgSg88R42KBRK7IDqPRiLSMZPQ74wR+6oUniSBygUA5MQmCytt/FMsWrMC/i9eitKRCSQHESFdc/xbAFbFos0AgUAchQASC+CUHwG8AOiNG93qNoYOMJiOyGmahS+/2/LSLTxLuVdEh2DWN1jWXu9GM1IZUEGUriC/27TiIZd+t5Jv+3U5F+UVwOiSZbloRqSkCuMbPvwDOgavYoUAgiCOEABEI4o/mAP4G0DBWX0iMyMAYWZIsaNOlJb90/Hm8eZvGIpA8OBTk50SBB/lZoIIIAVxyYv9/B/lns75n+/47gOpKm+zChxGMFTkMoB9chQ4FAkEckKiLnUAQjwwB8CFclo+oQ0RgBkZmq5latG2CISMG896DuomNowvy829BeHA//04U1MxHzTnnfNXvG2jR/N9p/85DcFTbZYmRGvesSFyvPLhcs35XsR8EAkEEEAujQKB/JgJ4FLEpGsgZI5gtZpaenUb9zujFh444lSelxrZeoQYQAkN7JIo4UbsoDgfAKyuq8Mtny2jFojVUWlQKm80uo+hhxNyzKgFMgqtgqkAg0CFi4RQI9Ms7AK4GYIrBd3Gj0UApGcnUa2BXnDJsAG/dsbna7Y8F5PW3QL9wr7/1jNoiBHAVFgQAbF2/g/5Y8A82/bOVKsqq5MSLRCpo3Q7gLQC3q90ZAoFAGWJRFQj0xy8ATgVgiPL3cCKC2WpiLdo2xRnDT0bf03ryOIzrENYMgR7FiSoxIV7Uca3inGPlotW0+Os/6eCuw7DZ7MGyaEVKiDgBLAJwnsr9IRAIZKL25CUQCOSRDFfhwPMQ/aefktFkpJS0JNa1b0eMvO2ieHKx0sKmTaAf9CBM1B7TPuM7ykoq8MnMr2nTqu1UVV4Fp1MCl6IuRCQA3wC4Cq50vgKBQKOIhVgg0D6bAXRADO5Xk9lEOY2zcObwk3HahQO1vOmSg9obM0H8oWVBouZ4Dxhk/ts3f9DiL/+ggrxiOOyOWFhEOIAtALqr1B8CgSAIYnEWCLTLagA9EN37lDNGlJRspQ492+LC68/mLdo1Beq7JWl54+V5nmJOE8QaLd4basWIBEy7u2f7AXz9zk+0a/NeqqqsDhS0Hkkh8g+Ak1TqD4FA4AexWAsE2mMlgD6IsvAwGAyUmZtB/c/shYtGD4XBaFDyfZFKqxkOQnAItIgW7g1AvQQKQWt/OB1OzH9zAa1etp5KisogOf0HrUeolggHsBzAaTHuC4FA4AexeAsE2oAALAEwCFGuYG0ym6hlu6bU98xeGDL8lHC/K9abLSE6BHoiUe8P2aJh4WdL6J9f19LBPXlwOJx+g9YjKEQWAzhb7Q4SCBIdLUxUAkGiMx/ARYie2wQnIp6SnkQ9B3YzXHXbxbAkmyP6+Yj+JksLaUf1Bkdd9zlfrwHyrp1WNrZ6Jpr3idauj+K2VpZV4qNXv6aNf2+lyrIqvwUOOThH+LVEJADfAhiudkcJBImKliYsgSDRuAfAM4im8GAkpWelGk+/+GQ658rTYDRGNXNvJJ5QeiJqcPhGDwX3KMjPiUykhYjWxEdY7bRV2/D9+4vojx//ofLSSr/uWRGyiEhw1RCZpXZnCQSJhhYnLYEg3jkVwM8AjFH6fMloMiK3SbbxnJGnY+DQExGj2h2R3FhpdVMVK7QY2BwrEkW8REqwa9k6GHIbJUnCXz+vogUfLKaSghLY7Q6faXwjJETsAAbClfhDIBDEgHid2AUCLTIQwE8AUqLx4UTETWYT5TbNZuePGoJ+p/dSo42R2AwkivhIZJERDlrecCslXNGuh3sl7Dnhj5/+oZ8/XUL5h4r8pfGNVNasUgCnA1gT814SCBIMrU9cAkE8kAJgD4CsaHw4Y4zMSWY0ap5LY++9Ek1aNlSzreFuqOJpc+mJEBuRRw+bb7mEuknXQx9EzDK6b/sBvDv9c5a3/yhsNrsvi0ikhEgBgJYAqmLbVQJB4qD1iUsg0Ds7ALSO5AeSy5+KiAhmiwnN2zbBlbddiFadWqjdVjdKNxx62EQpabvn34LoEy/jJxQRope2RzQ+bOemPfj0je/YwZ2HYau2R9Mish1A51h1kkCQSOhh4hII9MgPcKV6jMg95ik6QIDZbEKHnm1xybhz0aJdE7Xb6o0cAaKXjVMk2iqIHXq3oEmof18EG196aXOkk1Rg3/YD+GrOQtq2dgf5ihGpESHh3p8cwI8ALohZTwkECUA8bAAEAi1xF4DnAEQk3RQR1W4umIHBZDGhfbfWuPaey5CVm6F2W/3hb9HXs+gQlo3wiOV1d6cY1utYC9QuPd9XERcgbgqPFOP9F7+g/9bvIrvdAclZ96silLrXCeBuAK9FvacEggRAD5OWQKAHGgHYDCAiqsAtPDwtHt36dcTlN12ABo2jEkoSSTxXf71sjrxJVMtGsGulx2sZj+j1HouaCAGAvP1H8dXbP9CGlVujaREpBNCp5m+BQBAiepm0BAItE7E4D7erFQAYDAxGiwkt2zfDzQ9fi9SMZLXbKRfPInd6IZ4EByn8vUC/uMdtwrph+eJYYRlee2QeO7g7Dw6bA06Hs87rERIiOwB0jEV7BIJ4RCxIAkHovA5gPCJwH3laPIgRTCYjWnZsjstvHobWHZur3c54RI+Cg2T+TpB46EX0x/S+27lxD76Y/QPb+98B2Gx2gKNOwHoEaohwAM8CmBarNgkE8YIeJiyBQGs0BLALgDXcD/KM8SBGSEq2onm7prj2nkt5w2a54v6MLFoUHYlSdE8gAFS6B/P25eP9l75ge7YfgK3K5ss1K1whUgFX2t6iWLdNINArYrETCJSxF0CzcD/EW3iYTEa06tQCNz5wDU/PThX3ZWyIdmC5sFiEj/vJvl6e8AsCo+pDgCMHjuKdpz9hB3Ye8lVZPRKpe3cDaKdW+wQCPRGRTD0CQQLwJFypGMMKMiciVhPnASKCwWhAZnYaRtxyAb/i1gvJkmQWm6zYQR5/Qqlb4v7DfPzO3594gPv5XTT+wOvvcD/LE71fD3eb9N6OmJGSnoxTzu/PrclmHNh5iOw2h+fIIBdhfUUmgAcB2AAsV7u9AoGWEROXQBCY1nBltzKH8yGeFg/AFWCekp6MM4efzM+76kxA3ItaIB43qcHaF+j3iY5eArvd6EGQaMoN8tv3fqHfvlpOlWVVcHqn7g0/UL0aQBcAe9Rup0CgRbQ8UQkEarMOQFeEfp/UeZ7mDjC3JpnR9cQO/IYHruHewkQgUAj382+1IRmvCbeq6KFVMaIpAQK4gtJff/g92rp2B1VXVkc6UJ0DWAWgv9rtFAi0htYmJ4FAC1wAYD4AY6gf4C0siBEsFjOatGmE2/93vZSakSKEh8AXPMjPsUIEx8cfWhB83pt5LZwTAKAovwSzHnmPHdp7BNXVtkjHh9gBDAWwVO12CgRaQRM3vkCgIfIBZIf6Zl/Cw2g0onmbxhhz75VSoxa5gP5cOwSRQS1xIYLhBd6otfGPSR2QcDi05wjmPvsJO7DrMBwOZx0hEgG3rHwAjdVuo0CgBcQiJBC4uBbAOwhRHHgWEKz5GSazESlpSThv1BB+2gUnuRd8cc+58F7I9dw3arpBkZ9/CwRyiZW7lubcrwKx8LMl9POnS6myvBoOu8PTLStca4gTwAgAX6vdRoFATcSCJUh0jADy4MpeohhfwoMYITU9GQPO7sOHjzuPMwMDhNUj0OZDq33DZf4uWghxIYglnvdopB8I6Ep8uHHYHfh81ve08te1VFleCS7xWiHCwTl4WG0qANBIj/0iEEQCsagJEpm3AIxGKBtgAhHqJmx0FxJs1bE57n72Bqn2yMS8z+RsOLQqPJS0IRSEsBBomUhbJ3UpPuo0gHO8OHk22/ffQVRWVHm7ZYXjViYBeBXABLXbKBDEGrH4CRIRBuAoQqvpUS9TPBGBGRiyczNxxe0X8J4DurpXJ61vsCOJ3KJ+ehNkwTYXIr5CEK/4G/ty7uFoF/lUhX+WrKPPZ31HxwrLIDmlSLplCWuIIOEQC6Ug0XgDwA1QPvZ9lqhiBgZrshUnntqDj5owPFruC1pF6ZNNPQoyCcJiIUhcNB80rgbvPP0xrf9rC/mwhoRj7eEApgOYqnb7BIJYIBZTQSKRByBH6Zt81eogRjCbTWjcIhd3PzteSk5Lcr+kx022EkJZYOO9TwSCeEX37lPRovjoMbx6/zvsyIEC2Gz2SLplHQLQXO32CQTRRggQQSIwFsAsKNwIeweYuzEYGDKy03DFHRfz3oO6JYLVI9RNiBAeglBRMt7C2SAT6qaklZsRKl7vdW+EAAnCysVr6fM3vqOy4jLvaurhuGVJAK4B8Kna7RMIokWiTKKCxOUwgFylb/Jn9bAkWdChe2t+2+PXc88i54i/eymcJ3jx2B+C4HCFv08E9H4vCAEiA0mS8Mp9c9iOzXtgq7JF0i3rIIAWardPIIgGep4YBYJAhGr1YD5+B4ORIbtRNq6ddBnv2L2N52IST0/5w91s6H2zJaiLVqqy6x09zxEiBkQBW9b8R+9P/4IK84sjGaTuBDAKwhoiiDPEZkEQj2wD0BbKxrfPIHNXal0LBp3Tj4+45QLvBUTPGws3kXrCGQ99kSioWTgxUdHj/SHER4h88PKXtHLRGqqurI6UNYQD2Aygh9ptEwgihRAggngiBS6Xq2Qlb/Jn9TCajGjUPAd3PzteSstMqfMy9H3vRNKtQu99oXfULpYokIee7hPhdhUBivJL8NKU2awgrwgOu9PTGhJOkHoZXC7FNrXbJxCEi14mRIEgGD8BGIIIWT2SU63od0ZvftUdF3svxHraSHgSjU2FHp/q6glhqYgvtHK/uOcC7/TSQnhEgQ9e/pL+/W0tVZRFrIAhB/A9gIvVbptAEA563EgJBN6UAUhS8gb/Vg8DmrRsiNseHyNl5qR7H6KVDYRcorWh0Fs/aAkRV5HYaOHeEUIjxhQeKcZrD81jh/bkwemIWGxIOYD0EN8rEKiOECACPTMcrsA8RePYX4arpGQr+pzag197z2W+FgQtbBzkEi3fbb1af7SC8KkXAOrfR0KAqMTc5z6j1b9viGRsiARgKIDFardNIFCK2EwI9MovAM5Q8gZfdT3cGa6atGyIO54cK2U0qPdASe3NglyivamIhgDzdgNJBIQIEbhR66GGGIMqcvRwEWY+OJcd2Z8fSWvIdxAuWQKdkWiLvyA+KIJC07M/lytLsgX9Tu/JR03QpdXDU3RQgGPCIRoCzHMDpBeBF632CxKbWI9/Yf3QCHOf/ZRWL99I1RXV3gHqoV6jIgA5ardLIJBLoi38An3THsBGAEYF76kXaE5EYIyQkZ2GO54eJzVt1cjX+7QsPuRWa/Y8XumCFm3hEYvv0ypiE5h4kNffQN0xEKuxL8SvhtizdR9ef/hddqyoDJLEI2ENsQPoCGCv2m0TCIKRKAu+QP98AeAiKBizgaqZt+7UDHc/M17ylQRLyXfEmHBdluRuPiItvpRsuH1t1JR8T6jvjTViI5gYaGk+EcJXgzgcTrw0aTbb+98B2KrtkUjXywF8AGC02m0TCAKhlYlRIAjEIQANFRzv0+phMDKkZaTg+mkjeeee7fTochUJYmmFiPSGx50qVM5xWp/bxGYwvtHaGBTjTeOs/WszffTSF3SsuDxSVdT3A2ildrsEAn9oaYIUCLxpAFdhQdnCwF+gudFkQPM2TXDvzNv9bcATQXy48dUHkWy/2psdrW3+/CGsIPGJlsaf2veiQCFP3vIyO7gnz1fxwlCupRNAGoBqtdslEHhjUPsEBAI/zIArxa4S8cHgLT4YITktGX1P78Vve/x6f5O3ljYMscDb9zyS4kMrm2o9XE+xMYxPtDSfuM9FjDWdMPiCATxv/1EU5ReTw+6svXJUA5RdSwZgGlxxkyJVr0BTaGWSFAg82QWgpZI3eMd7EBGYgSE9MwVX3X0p73VS10CTdiJZP4C6lZAjNQeo+aRVSxs+JWhFrAkii5bHo7CI6IS/f11Dn77+LZWXVnq7ZIGDc3DF13EXXIlcBAJNoNVJUpCYEIASACmy3+DH5cpsMaFd99b8jifHcMYC6gstbxb0gBobmni5ZkKAxCd6GJ9CiOgAp8OJGfe+zXZv2VcvQB0IKUi9DECG2u0SCADtT5KCxKEZgN1Q7nLl+TMYI1hTLBg26iw+ZPgpchbYRLN+RIpYbmD0sKELBSFA4hO9jVcxDjXODx/9Sgs/XUbVFVXe6XpDESESXElditRulyCxETEgAi3wPIBPEKb4MJmNyGmSjSkv3Sp169tRzscI8aGcWAkPd2yK3jZzchFPn+MXvY1ZvZ1vwtGhRxv0Pa0nX7diK9mrbZCk49NHCLEhBGByzfFL1W6bIHERk45AbbZCgV8qEQion2LXZDaix6Au/Mb7r1EyCYvxL59YCI9EuibiqXP8ovdxLNyzNMzrD71Lm/7dRnabIxIuWVsAdFO7TYLERM+TpED/FAFIl3uwd7yHO9DcmmzFJWOH8lMvOElpdhCBPKK5WU7E6yDER3yjdwHiRggRjbL46+X0zdxffLpkQXndkAIoq7MlEESEeJgkBfojFUA+ALPcN/hyuTKaDMhpko1JL9wspWbIjlsH4meDEG2iuQFJROEBCPGRKMTT+BZCRIOUFpXh+XveYEcPF8LpkMK1hlQByAVQoXa7BImD2IQJYk1Egs1NZiOatWmMe1+9PZQNnRAggYn2hiOeNmdKEOIjcYjHMS6EiAZ56rZX2IFdh+sVLgQUFy8UwemCmCKC0AWx5GEAXyIc8cFc4uP0iwfxGx+UHe9R72MRnwJEikC7or1JjseNWTAk6HDjxjkH1YRbcc5htzngtDtABobio8dgsZrBwSE5JRwrLIPJbKxNFWowHF9aJEmq/ZwEI94aHa/zpq4ZPGwAL8ovwaE9eeQZnA4oDlB3B6eXAfhT7XYJ4h8xmQhixWcAhis43j1xun8ACEhJS8L51wyRm2LX72cj8mPfXdgv1kSqqGC0n24m4uZFNYuHJElw2B2oKK3C/l2HaPWS9ThWXIaqimoUHS1BdVU1VVfa4bDZXQ7jnBMA1/PTuu7krv93jzDu9QKBagqieW9yqM6/uDt1BHHUhnOBM0ZkMBq4NckMS7KV0rNSkZSShOyGmeg2oBPadmrJLclmmC0mvYmYRBjvwqKnIRZ8uJgWzV9K5aWVAEe4LlkfALhO7TYJ4pt4nyAF2uBvAH3kHuwz2JwRshtlY9rM26XktKRwzyfSmwO1xId7QQnHqhALt4pEsnpEvT+dDid2b92HwvwS2r/jIPZuO4jS4jJekFdEtiobdzqd5FYS3nsQtTsnVIiIQOAGgwEmi4lnN8yk7IaZaNOxBRq1yKHc5jm8RdsmMBg1ZdRPhHEvRIiGKCksxfMT3mAFhwt9BacrFSF/ABisdpsE8YsQIIJocxRAltyDfYkPg5GhfY/WmPDsjZFa7CIlQNyze6zvI3c/hNMOkVY3skS0PysrqlB4pBjb1u6gDSu28UP7jjjLisvIVmVnnNffWAhccwURwWwxOTNzMqhxi1zqPqAzderVFukN0pCUbI35KSExxr8QIRpj+sRZbOemPT6D02siQ+ROIPkAGqvdHkF8kgiTo0AdMgAcAmCR+wZf8R5mswm9B3fnY6ZeGekdV7ibAwmxf8LpudCHc/6x2jDE+wYsLNEhOSXk7T+KA7sP08pFa5C3/wgVHT0GR7UdTqekNJWmwD9EBE5E3Ggy8gaNslij5rnof1ZvatG2Cc9t1gCMRe1WTgQrCCBEiOZ458mPaM0fm8hms4NL9aYSJfNLJVwipEztNgnii3jeHAjUow1cBQZl+0N4iw+D0YDs3EycfeWp/DRl9T2UEMoGWQrxfeHgvbiHuqmJZRabeBUfIfWh5JSwb+ch/LXwX9q2dicdPVSI6ipbnaeTIRQRUwy5ojaO/1Tv5eO/5XX/7dVmj9gQHbt2gVy1Tc0WE2/YPEfq3Lu94aSz+/AW7ZpG7hvi8z7wRmTI0iC/fLGMfv18ORUXlMDprD+9KJhzHABaw/VQUSCICIkwMQpiSxsA26FgbHmKD3e8R26zBrj7mfFSVm5GLM6ZgrzmubjGckPhvajrweoRiXPVGor6TpJclo0fP1pMm1f9R2XFZf6KhQER3LS5I7vJ3e9q9f5xtRLxNsaKmnmIp2ak8G79OtF5V51BYVhK4uleCISwgmiQksJSPHfX66zgSBGk8ESIBJclpEDtNgnig0SYFAWx4x24MmeELD4sVjNatGuKSS/drMXFLFbuFL6eJobz3UJ8KEPR09yykgos/3El/bnwXyo6UlLPsnH8QzmHfN9rN7Wyoq71Qr+4eoH7sKpoGiIibraYpAaNsmjw+f3Q/6wTKS1TdgHURHDF0uKcLajh2TtfYwd2HfY5PymoF8IBvAHgdrXbI9A/cbCcCTTCBwCuRIjigxkYTCYjegzswsfff7XWNiax3FD7WsT14HIF6Ft4yOorzjmOFZXhi9kLaNM/26i0pNyXf7XH4criOGpyT8eF0JANd2cN5ZxqnKJkvUF9AUNExFPSk+y9BnUzXD5+GKVkJAezpsbzlRUCROO89tC7tPnfbeRwOOtZQxQ8IOEAXgZwj9rtEeibeJ4MBbFjNoAxCNXywQiWJAsuGXsOP+PiQWpvKuqdqpJ2hYGvDbAeXK70vKmSJTr+Xbaeln27gvb+tx8VpVWBMlCFIDhqDRuJJTqiiYc4iXUgPxFgsVrsnU5oR4PO62fsfXI3X4fFqzVExIHogIWfLaHv3ltEtipbvYcnCkXI8wDuVbs9Av0iljxBuHwIl+VDNm7xQUQgRkjNSMYDr98lZTRIV7st3sRio+Bv0dayy5WeRQcQZKNUVlKOL2f/QP8sW0/VFdURFRzA8VTT+qqrF0d4WFyi/VVEgMlscgwY0ptdfssFlJRsdV91vd9DvhACRCfkHyzAs3e9xkpLyusVLVToKvoWgJvUbo9An8TbBCiILcsADFLyBm/xkd0wE/c8f6PUoJHsUiGxIhbiw59Q0Kr40POT24Cbo79/W0tfv/0T+QvUdH9GuEHVWnCxIrgSPRgMBjBGyExLQlZ6CpKTLchKT+ZNc7PQsXUjVFTZkJuZiuQUCzLTk5Gbmc5bN2uAsspqFJVUIDnJhLIKGxpkpqCiwoakJBOSLWbsOniUjhYew7HyKpSWVqK4rArJVhO27zmC/XmFKDlWQeVVNhQWl6G4tBKSxOFwOMFDCpGJEB5eXQpqJCjuemIk5TTKdlxx24Ws18Cu7iyBer6vPBECREfk7T+KV+57hxUcKQL3nSRD7rX8AcAFardHoD+EABGEyl4AzZS8wVN8MANDbpNsTH7pVik1I1ntttQ5TcTmvvC1y41EbRK99ke08NknRfkl+G7ez7Tq9/VUWe7fyhFi4LhPIiE+PN/sKrwHGI0GcI4aUcFgNRnQukVDtG6Ww0/q0QYd2zbB4L4dudlshIExSDVuF4xp57J6npNTklBdbceyf7fRf7vysHzNDuzan097Dx6F3e6E3SnVHM/hdErg9Z/gRuakom8p4Rar2dH39BPsF11/tjUrN8MY3V6OOkKA6Izayul5rgcvYVRO3w2gndrtEegL7axAAr1gAJAHBdXNgbriw2gyom3Xlrj72RukKBYACwW9ptiN9MKvd9EBeAkPzjn+27CL3n/hC8o/VOhzsT1+aMQ3nESkLM7DfaDbUmE1G5Gelowmueno1r45P7VfBzRqkIE+3Vpxs8kIi8UEg7bupajiFiklxyqx4b8DlF9YioXL12Pn3nw6mF+C0vIqVFXb4XQ6a8VN2MIkulYSzhiTchpnO0bfe4WxQ7fWJnV6NixEELoOcTqcmD7pTbZ323447M5wRMgRAE3Ubo9AP+h9kyGIPWUAkpS8wVN8mMxG9B7cnY+9d6TWnpSpsXtzT+zhfHekxAd5/a1XahdLzjn+WbKOPnv9OzpWVOovW5U7IWxUxiORW3v4ed1dsoMIBgPBZDKiSU4GunVoxru1b46rLxjA27TMhSRxmIyy63omPDa7A0SEnXvz8eF3f9H6bfuwZechOnz0GJxOJxwO1zCRwqz9yHnULCQ8JS2pYtTEy1P7nNKddBIwJASIjnnzsfdp3V9byGF3hCNCygFoLphToE10MasJNEFrAOsBKPKXqhUfjGA2m9B7cHc+ZuqVQny48Cw2Her7IyU+9DwX1OmH5T/+Td/OXUjFBaV+rBycR8PPP5iLlWfshdVsRFpqEvp2b83P6NcZZwzswpvkZiAtVZG2F4RAWXkVDuWX4Iff1tKKDbvw15odVFZehSqbI7xYlOi5bPGshhnOy8cPM/U78wSt3qdCfMQBbz7xAW34cwvZbPb6GbLki5BSAJ3g8pQQCPyi1clMoD0UWz5cGf2J3Gl2z7p8ML/w2rOE+IgMkVrw9Sw+aoXH6j820ocvfkGlxeW+REfEN4WBxAaBauMzTCYjGmanISsjBQN7teOn9uuIQSd25I20l/Et4TlSWIqlKzfT4hVb8c+G3VRYUo78wmM1ogSKhUk0rCNEROnZqXTdxBHoMaCz2l1W21SI2I+44at3fqTFX/5B1dW2cESIsIQIgqLXjYcgthyFwpgPwGX9MBgYUjNTMf6Bq3iHHm21tEjpeeOd6OJDAoC1f22ij1760qelI5bB427BwZjLhSo3KxX9erblQwZ0xhXn9+cpyVa1+0sQIlXVNsz5fBn9vvo/rFi7kwqKy+BwOOGsyZQmd4i56kxzHsHiicQYowYNM3HNxOG8a5+Oat7HwvoRZ2xatY3mPPUJlR2rqF+wUL4IyQfQWO22CLSLHjcfgtiRAuAwFLpd1UAms5EyczIw6YWbpazcDLXbUufcoN+xH4nFXo/t5wB4QV4RXntwHju0J692E+h+PRJPm2tjxYOEixNcGaeSLCY0b5yNk0/swIed3gvnDu6hJZEtiDCcc/ywdB19v3gtlq/+j/bnFaG62u7KxqVEjETQDdD9oKdF+6a49X/X84zsNLUSaQjiiMK8Yky/5w1WVHAMToezzmsKREglgNyavwWCOuhtEyKIHe0BbAQQSmpIbjQaWIMmDejRt++RmEFTXk563Hy7SUTxwTnnfPb/PqDVyzeSx9O4CAmO4KlxPS0cRqMBDbPTMOLc/nz42Sfy3t1aioqCCQznHCvX7cK7Xy2nRX9uorwCl8uWVFNXIZjGqHHtiogFwV3g0mBgOPG0nnzctKuAyKT19vUZQngkAE6HEw+NeZ4V5ZfUyxyoYNza4YohPax2ewTaQqycAl+0BbAZoYoPk5EatchlU2bcIiVpy/1Eb5tvTxJNfEi7t+3HjKlvs8qySvdmLmy3Krm1ONwB42kpFjRtlI3BfTryqy8cyPv3aqN2vwg0zqoNe/D+N3/Qkn+20sG8QpSWV7sESVAxEiGriDv2jgjJacm45/nxUvO2TZTe+8K6IQAAlJVU4Lm7X2MFecXwzpClUIS0A3BA7fYItINeNiOC2NEIriKDoYoPtO3aynDX02Mlk1lTqew1ZYZRQCQ3AnoQINLrD71L6/7aTJIkhWXlcD8RlmOgcFs5rFYTcjJT0adba37XdUN5z07NkJxkUbtPBDqlqtqGfzfsoRfn/oT12/bTkcJS2O2OgILkuNYO+74nd/5eg4Gh/1l9+PWTR7g/01fabe71t0AAALBVVuOFSbPZvp0H4XSEbAmxweWOVaZ2ewTaQOubEUFsSQFQiNDEh2Qym9C2ayvjxOk3ai0oUYgPbYsPXl5WJT1w7TOoKK2gUDVHsJob3jBiIAJSkixo1jgbJ/dpz5+bcgW3Wsxq94cgTimvqMKEJz+i1Vv20Z79+aiosoFz//VIIpVJyzMdelpGCh5/b6pksYpxLlDG8xPeYHu3H4B3mt6aMSpnnDoANIAQIQJod0MiiD0dAGxAiJYPk9lIXfp0oNsev55ryCdey5vuYERaxGmuLwhwfPL6t4WL5v+exTkPucoeETG5Q84dPG42G9GnS0tcetaJfNyIU7nFoilrnSABcDideO29RfTlr6to7Zb9sNsd/oPZOSBFIFbELUQAwGgy4PxrhvBho4YIi4dAFpJTwswH59HWNTvIhzuWXBFiB9ARLk8LQQKjqQ2JQDVaA9gGIJRNILemWNlJQ/rg6rsu0dJCprkNtwIi7X+tqSrnjir7ygmXPdq4usrWLNRzUmLtcMdzpCRZ0KtzC1x1wUl8zGWDtTRWBQLMmb+MPvz+L1q3eR/KK/3HjUTCKuIpRIgRmrRqhAffuEtrCUMEGmXOM5/Q6uUbyVZpC1WEOOCKCdmvdlsE6qGJDYlAVXLgmgRCeQTMk1KT2BkXDsQlN5yrpQ2dnsVHNNzXtCBAijf+u/2GGVNmPw+gZUiNUCg6DAaG5CQLWjfLweiLB/EbrjyNm02hGPgEgthRXW3Hmx//RnO+Wk4HDheiosrm2zISAauIpxABgAaNszFt5h1SakYomdcFicTHr35Nf/68iqorqkMVITa49h/lardFoA563aQJIkMjAPsQmuVDsiZbjQPP7sOvulNYPiJEtGJnVBQgbPG70z/56vcFfz+B0OrJyBYeBILJZIDVYkab5jkYef4Aftfos7XkEigQKMIpSZgxdyF9tGAl7T1YgKpqG+x2Z10xwmtzUoc6D9cGq9f8AIvVjNufvF5rxWMFGmPuc5/R6qXr61VNV2gJaQJX7KkgwRArc+LSDcA/AEKJRORJqUmGbv078hvvv0ZLC5QQH/6JpQjhIP7WLWdP6+Z0OvsjhCQASqwdRoMBJpMRLZtkY/jZffldo8/iGWniCa4gvigsLsfL7/5MX/7yL+09VOiKGZG8q1SH557lbRFhBoaOvdpgwrOaSywi0AivP/webVnzny9LiNwxUwWgM1wPQwUJhF43a4LwSAFwBEAoRTq4Jcli6HVSV37DA1cJ8REZYrW4R1OEcAKcEtE3Nw+ZMpBz3lDp98it0eFqgMvFKiPViqGDe/IJo4fyHp2aR70DBQItsH7rfjz/9o+06M8NVFJWVc9FK9wCh95ChIiQlZOOpz6aJoSIoB6zHn2PNqzcSnZbyHVCKgBkwxWgLkgQ9LphE4ROA7iyTygXHwRYrRY2eNgAPuKWC7QkPvQaOalGsa9IixAJAIeERTcNndqFc95UyWcTuf+Tc+LHg8k7tGmMKTecx88d3EPEdQgSFrvDiR+WrqNnZi+g7bsOo7wmKLhWjHDAZRQJaZ6p45pV8ws0aJyFJ96bKoSIoA4fvPQFrfhlNdmq7aGKkHIAzQEcU7stgtggBEhikQHgMEJxu6oRH936deQ3PXytEB/ho3al4VCFiPd5b75l6H05TqczV8l3U72tjX8YMRiNBjTITMV5g7vzF6ZdzS1mIToEAk+qqm245ZH3aMmKzVRQUgGHw1mnvkg47lneFhEAyM7NEBYRQR1ee3AebVn9XzgipAKuwPRqtdsiiD5CgCQW+XCZORVBBJgtZtbvzBP4dRMvF+IjfNQWH94Ec1/zcb5UcccFD1RUV1bnyP4ShYUCjQYDkq1mdGjTGI/cfjE/a1A3LfWZQKBZvlu8hp6c9T3t2JOHiiobHE7n8RfDsIr4EiK5TRrg8femCCEiAADMfuJDWrt8k686IXLHSAGAhmq3QxB9hABJDBiAPIQgPkCA2WxiJwzqrrWYDyE+1Dl925QrnjxaXFDSBDLnD0bE5M40BILRyJCeYsWw03vzmY+M4kZDyDUKBYKExuF04sYH59HPv6+nkrJKOBz1YkVCsor4ihFp3bkF7n3lNiFEBHj9oXdp4z/bhAgRBEQIkMRgD1y+lYogIm4ymwyde7fntz9xvZY2zXoVH7pdnCWn5Jx29VNFhUdLGkDGvKHU2uFKoWtEi8ZZuGHEafzu64dqabwJBLrnudkLaO5Xv9P+w0U+U/lK8lOnuvEZI9K6cwtMfflWSaS/TmxevX8ubV61jZxOyTtFr9x1cBeA9mq3QxA9xAwR/6wB0COUN1qSLKy7tmI+RKarGEOAdP+1zxUfOZifBRl9r8Ta4TqeISnJjG7tm2HGtKukE7q2UrvJAkFc8+eqHZg6/RO2dedhlFVU14kTAUKwirgTSXj+ightu7bElBm36nLeE0QGPzEhSsbXPwAGqN0OQXTQ62ZOII/fAAwO5Y0ms5G16tAck2fcoqUnWcLyETv4q/fPPbbur03pCDJPKLV2AK74jvRUK07u04HPemwMzxKVlwWCmJJfVIZbHppLy1dto9Lyal81RRSl8q2xhtQTIqec35+PmjBcKw+xBDFEckp46o6Z7OCuQ3A6pFoRoqBQIQD8BOB8tdsiiDya2VkKIs5nAIYrfRMRwWBgrGX7Zpj66m1CfISP7sTHoi9+r/j0tW8tnHO/wRdKanZ4YjIakJGahJP7duTznrqBWywmtZsrECQ05RVVuHbKbFq5dgcdK6+C3eGs87prqyi/0rovIWIwGnDdxMv4SWefKIRIgiE5JTx9+6ts/85DkCTuKUKUrI2fArhK7bYIIotmdpeCiDIFwJNQXggOzMBYq07NMeXFWyRm0MyeXzMnohBdiY8Nf2/lrz0wV3I4nAGEh/y6HZ6YTUZYLWacd2p3/uSkEbxpTqbazRUIBB7s2pePaS/Op0V/bKRquwM2u6PuAQqzZ/nKmGW2mHDbU2N4557thBBJIBx2B56+/VV2YHceeGgihAO4BcBstdsiiBxCgMQf4wDMgtJrSyCDwUBZuZmYOP1GqUGjLLXbAYiYj5hQXlaB+0Y+xasqqyPqakUgWK1mNGqQht5dW/O5T48TRQPVxX3tOALfV0ruOV+fxYMcL9AwlVU23PTQPFq5biflFRxDdbUd3ppDQZyIz4o/yalJeOqj+yRrkkXt5gpixJGDBXhh0ixWUlAKyelZn0a2CJEAjALwidptEUQGvW7uBL4ZAuBHKLQYEBEZDIyycjJw17M3SA2byS7tEE2E+IgynHM8Mm46Du89gkBbCSJiSjzxCASz2YgWjbNx4Rkn8Ce1VTsmHol0dXstoPN01fHB5Gc+oR+WrqN9hwvrZ85CeEKEiNCiXRPc/8ZdupgvBeFzYPdhzJj6NistLgvVEuIEcAaA5Wq3RRA+8bRgJTodAawDoMipnoiIGRhlZKXinuk3CfERPrpYTN9+6iNauWgNAm0eQg0uz85MwTUXDOJPTrxMbCAjj57vjVDRxT0Vz0ybPp/e+/p3Ki6trFvUsAa5QsR/oHo/PmqCmC8Sgbx9+Xhx8puspKgsVEuIDa79zj612yIIj0RbyOIVC1yFe5IUvYtAjDFqkJuJm/83WmrRtona7XCdlX7HpeY3SsVHj+GB654hW7U94GKvVHyYjAbkZqfj4jN78xemaapgZTyh53sjXIRFRAPc/tj7tGDJOiooLq0fI4LwhIg1yYJnP3tAsljNajdTEGX27TiINx56lxUeLQlVhJQByIIO1lyBfxJ1MYs3tgNoq+QNbstHUkoSbnr0Gt6ph2aCAvUYcK75zZHklPDg9c9T/sGj7vP1i5IMVwbGkJGWhOFD+/JXHhyl6T7QOYksPtyIzYZGuPmhefTt4tVUUlpZL30vAEiSvI2kr0D1xi1z8eg7k8S1jnPW/LmJ5j3zKVVVVocqQrYC6Kp2OwShk+gLWjywDMAgRe8gECNGlmQLrrnzEt5/SG+tbByF+IgCbz7xAa36bT0kSZLxZFJelitGDKkpVpzUqy1/+YFRvFWzBmo3M54R4sOF5u+1RGLXvnzc+ui7bNXGPf4KGsrbTPoqZMgIA4b05mOmXimudxyz7PsV9PmbC6i6ojrUQoXLAJyudjsEoSEWNX3zLIB7oOA6Ug0WqxmnXzKQXzruPK1M8EJ8RJhDe4/g8ZtmkN1ml32OwQLO3ZXLe3Rshg+fu1lq0ihT7WYmAnq8N6KFeDKuMfYfLMQ1U95kG/87gIqK6pAD1X1ZQ0xmE/43b7KUlZuhdjMFUeKz17+jZd+vCLVaOgcwDa69kEBnCAGiX84A8DNCEB/MwHDCoK78xoc04zKjxw2WpsXHo+NfYAd353EuyX6SFND1ikCwWExo0zwXL947kp82oLNm2x5nCOtHXTR93yUyC3/fQFOf/5R2Hyion7qXA1Ko1hAiNG/XBA+IbFlxy+sPv0frV2wmySmFIkIkAH0BrFW7HQJliIVNn/QB8BcAg9w3uIP+DEYDOvduz+98aqwWFnG9bq40uwn646d/6N3pn5PklBSfo6/AcwLBZHIFmE8ddx4fP/J0TbY7cMOU9oRmiMf0uuGi2XtP4OLluQvppfd+oaNFx3xVVQ85SJ0ZGMZOvZL3O/MEcf3jkBenvMm2r9uNEEWIAy4Rsl7tdgjkIxY2/dEMwA4oSLdLtaYPQuOWDXH/63dKRqNs7RJN9Gj50ORTuIrSSjw89nl2rKhMif9sHbwtIEaDAclJFpx5Uhc+56mx3GoR2WmigBAZyhACRAeUlVdh7LS3acnKrVRRZaubuleuNQS+3bKyctLx2JxJklkUMYwrbNU2PHHzy+zIwYJQa4TY4NofFardFoE8xKKnL5IAHASQLvcN7idJxAjZOZl48K27paRkq9rtAIT4iBhLvv2TPn7lazidwYPMA+G2gBAIyckW9O3WGp/OuFVKT1WW3VmDBLK0xXpDq1ern1bQ5D0o8E1BUSlG3PUaW7dtf734kHCKGBqMBlw/eYSWEqgIIkBZSTkev+klVlxYCi55jhXZIqQIQGO4LCICjSMWQn2xHMBJCo4nxhgRIySlJGHqy7dKjZprotCgXPHBoZ0xqrmNjyRJeGDUs3T0SCHqRX4qhGoW+aQkM1KTrXhywnA+6uKT9by4K93oR0uICMERWTR3HwqC8+G3f9G9z39GpRVVqKq21f5egQjx6ZaV26QB/vfuZIlI3GLxwp7tB/DyvW+x8tJKwJVJDYAiEbIUrhhZgcbRhB+OQBYzAVyi5A1ExJiBwZpkwV1PjZWaa6PQoFzxISk4NtpobtPz9ZyfaMbUt6m8rCIim2ajwUDZmSk07rJT+XdvTuA9O7dUu4mhQnCNG6U7kmjsYIT4iCx6FsQJTY9OzTFhzDm8uKQCO/fnU3VNxiNXzJmiW4R7WkMqyiqx4MNfiQyEjj0UlcISaJTMBulo3bk5Vi3bQJJ0PB6k5rrLmQNawVWc+Ve12yIIjFgc9cFQAN9DwYbclU6VkJxmxZDLTuHDrjlLC4u3EB/hnowk4bEbXqRDe/PAw7R61MCtFhNO7N4KH71wKxo1SNfrnBCpzX4kLCHxHtfhq38i1fehvCbQEQeOFNPICa/Rhm0HjmfLqv3PFXUc7DN8WUNatG+K+1+/U1hD4oSv5iykJd/8SZVllZ5B6XItIU649k2/qd0OgX+EBUT79AKwBPI35OQWH+YkM0694CR+8fXnaGHxlnP+7s2fEB8+KMovweQRj1NJ4bGIXE/GyNEwO8352B3DHa88dK0pNdkSiuUgGOTjT6Q/P5LnLfcpm+f3egqOaLUzUnCvf4fyJ1CfyPl+pZ8riB9YeoqVxl42GMlWMzZuP4gqmx1SjTXkeCFUWbdPHWvIscJS/PzZUho8bAA3W0XCDL3TuXc7FOYV4+Duw+RZQ1emJYQBGAXgA7jiQgQaRKuLpMBFOlxB53KjgN35rsAMDCef25dfc/dwLSzscjZk7s2+EB8++P79n+mbub+EmuDKEzIYGJKtZpzQtRW+nzWBW8xGf33Ovf6W/R2QP7fE4juU4u/aa2VsehNqH0YSuddDU/eVIKbUGyOVVTace8ML2PzfQZRXelVT54ArRCTwuPa2hhAjXDruXH7OlTpMGS6ox9tPfUz//raWJI/MWIBsS0gZgCYAKtRuh6A+QoBom/1w3TxyqM0UYjAa0KhFLh6cdZfEmOp7pmAbE8+nn1p5cqyZTVJhXjGeuuMVlBSUhvU57iBzk8mApg2z8PYTY/nJJ3ZwB/mHu3GMxHWT+xQ8FmPE3Va1x6MWhIUSAk02wsqR2AS8lxYu34jbH3sXh/NLfNUOkbXZ9E7Zm5WTjmmv3SWlZ6eq3XZBGDjsDvzvppdY/oECOJ11hoHcBAZ7AbRRux2C+ggXLO3yPICzZR5bKz6IEZJTrZg641YpKUX1dLtKxEc03H9CQTPiY8GHi/HaQ/OoqqI6rM9hRMxgMFBqsgXnDO7JF82bwls1q82GJneTTUH+hIv7czzFqKeLUyxdm2L1XZ4CI15ckrz7TM9tEUSOgPdTu5YNcdPIM7Bi3U5++Ogxcjp5bWI/IreVI+jtyN3LIABUVVRj0Re/k9FkRPvurdVuvyBEmIGhx4Au/M+fV5HD7vCcTeS6y6bXHLdU7bYI6iIEiDY5BcDrkLkx9BQfSclWDL/xfN6xp+oZQYJt4CQFx8YKTYgPzjmmjnyS1vyxgcLxuSIiYoyY2WxEs0ZZeG7KFfzh2y/hrK5/tVb63vt8tHROoRKPAkMO7msX7+0UyCfoPW0wMFx9wUm8YXYaVm/eS9U2O5zS8SnZFSNCJCf5hntN5Jxjy6r/6K+f/qUhl50ixqJOSU5NgslixM6Ne8jhcNbOKjLjQQjAYADfAjisdlsEx4mHRT7eIADFAILbjT2i9YgIFqsZF40ZyocMV32iVVr4TXU/MWhks/TvsvX09uMfwuFwhiE8UFP4niE1xYohA7vy954bzw3+3fHUztrkuVEPR3x4X8NYjStNjB0N4e530S8CN0pqP3G7w4lrJ79Ji//aTGUVXrEhqPG9CR4bUuc7jSYDbn70Wt6jfxcxJnXKws+W0HfzfiFbTRpnNzLjQUoAZKvdBsFxhADRFgYAOwC0kHFsneqwRpMB/c7sza+fPELtyVWP4kMTlo95z39Gf/z4j6w0lP5wZUADLGYTGudk4LWHr+VnDuyqldgKTwJtTsMVIdFsR1xuqo8UlmLl2h00Z/7vWLVpN5VWVKO62g7PwE/ZWZ+564EI4PqbMYLZbER6ihUndGnJx1w2GCf3bs8bZKWp3WxB7FCSgr2W739bS3c/+REdKTgGm91e50A5sSG+AtTPGj6YX37zsLi7hxOFOc98Qn8vXkvOerFCskTIDgAd1W6DwIUQINriYwAjZBx33O2qZoFv3akFJs+4RQs50P0tNJKCY2OJ6uJDkiQ8desrfM/2A2FdPMaIEQjJyRacNagr//iFW0LJLOX5dySRs3HXsuuV7oWHU5LgdEpYsWYHzXj3Z/y9YRcVlZTD4ZDki4sgPcQ9AkMZEQt0NQkEo5EhJzMVfbq15ndeexZO6t2eGw0GMKbVYSAIkZAECOByo7r01lfo99XbqaKiut5YlSQe9N70toa069pKK+ulQCE16yXbv+sweN3MWHKD0ucAuEHtdgi0u9gnIgPhKppjDHagezJ1x+U1adUIk168SUpJTVa7Db4WGX+LgxY2m6pvKrdt2EUzJs922m2OkMVYTeZlMptMSEs24/l7R/KRw04KtV2RFCFaymwVCVQXq0opKa3AO58vo7c+X0J7DxbC6YyQ2PCEAxL3vQl0j025H0UgGAwMzRtnYfK48/jwoSfyzPQUtbtRED4hCxA3c7/4naa98BmVV9pgszvqvMZ58M2ntzXEkmzB5Ok3SS06NFO7bwQKKS0ux7N3vcbyDxWAS3VcseSsOQ4AvQFsUrsdiY4eFv1EYBCAxVAgPgBXdgiz1YzbHx/NO/Roq/bTWb2JD9U3k/8sWSvN/t+HxDkPuS9cceaE1GQLzhzUlX80/WYewad6oYgiJaJOCxawaLVNNb5etIoeffUb2rE3r95GLeIdImPjBxxPA630rndbSTq0bozH7x7Ozzu1p+b7X+ATJYVo/eJwOnHlXa/Tsn+2UpmXNUSeS5ZrKLp/NhgYbvnfdSIuRIes/mMjzX3mU6qurPYWIXLWdjuAkwCsUbsdiYzam0ABYAaQB1equIB4ig8igiXZgnNHnsbPu+pMtSdPX4uLpPD4WKK6+Hji5hnVe7YfMCOMe5AxYgbGkJudhjlPjuOnnxSVRTSYRURprQotiM9Q0aQA2bT9IJ588zta/NcmKiqpiLyFw1dHyBQevjhe7TqE94KQk5WGc07uxieMOZd37dA06m0VRAQ5c77seXnh7xto3LS3qbCkol6AulKXLCJC++6tMenFm1VfFwTK+Pa9X+iXT5dSdZUtlKD0IgCN4bKICFRArxuBeGI+gEuCHeRpPiYimC0m9B9yAh814TK1N0TeC0uwyT+hxUdJwTE8NG56ZWVppdzq9j5hjFiS1YLuHZpi/qt3SrlZmi+2pWfh4UYzAqS0rBK3PfY+ffPrarLZHOGLDl77V+2/amPPo0zNU+na/5P9PhAsFhMuH9qXP3/vlTwjTXUXVIF/gs37iu+tQ3nFuOT2V9jWXYdQbfMKUHf5BCpyycpplIV7Z94hpWUKlz89MeeZT2jV0vVktzlCESEfArhW7TYkKnrfEOidU+CK+wh2HeoGnRsYOp3Qjt/19Di1N0Pem0ohPgJQUlDqnDryiWpJkkLeKRGBGDFKTrbgsrP78ln/G632GAh6yvA7vuXWkdIMqlYmLygqxW3/e58W/r6RqqpsirJSuf+TU0NBCyi1khAISUlmDDutF59x/zU8K0OIEY0RaO4PWdhLEsf1975FC5auqxegLts90MMakpxqxWNzJktp2n+gI/Bg+sRZbMeG3XWy9tVEhAS7/hKAfhCuWKogBIh6ZAE4CJcLVkC84z6yG2biodkTJIs16FujiffGMtjmPqHFx57tB4qfvOXlVM550DgffxARmU0GykhNwqsPX8svHtJH65tJta95NImJNaSyyobPfvybHnn5Szp89FhA0eG2WISTxlmjuMJHZMoRRgyNcjLw5D3D+aVn9+UWc8i3nCByBLKAhj03v/fVH3Tv9E/pWFkVHM7j6VnlxIUAdddYo8mAR9+ZJOU0ESUj9IKtshoPj53OigqOhRIPUgGgGYBjarcj0RACRD32wjXoA+ItPho0zMJ1U0fwjt3bqLnJ8FxM9JBeVVXx8dnr3+X9/PnSXISxISciZjGb0L5VQ3z96p1S86aaXhzVvt6xJCpC5Jc/NtK0F+fTxm0H6vi4u6SFrCd7EWkXAbwm1TeZDQZuMRpgImJmowE2JyciEANgNhlhszvIycGrnQ6qdjhdTyMBSNyzlojn53Mfrl/BUWIdMTCGbh2a44kJw/lZg7rFmzDTG0oSlSjmv915GHH3TLZzX37d5AuuLG1yRMhxN2dGuPD6s/mwq4eIMaMTNvyzhT586Wsqyi+G5PScM2WJkD0A2qrdhkQjUTYJWuMjAFcEO8g7UM5oMuKcK0/jF44+W+1JkUE/KVZVEx+SU8KkEY/nl5WU5YTTB4wRJVktdFq/jvyLV++IZJarSKP2tVaLiGyiqm0OTHrmY3r3qz/Is+haOAHfwSC45hYiIhNjYIzQKC0ZTdLT0LNpLlpnpaNdThb6t2rKlQw7SeJYdSAP6w8eoYPHyrAtrwi7i4opr7QCAGBzOl1Pp31ID88gFBnChKhOSVb/WMwm3DLyDP7InZcKq4g6KHXZVYwkcVx628u07N/t9dwUJUnWRrROmvsmrRvhoTfvFvVCdMLnb35Pv331BznszlDiQd4AcJvabUgkxF0Ve3oDWIkgT8O9g86ZgaHvqT342GlXqSY+CJA4YANgVfA2Nd1wVAsarqyokiZd9r8Ku80eljOx0WigBhmp9OrDo/hFZ/ZWW3gGIp7dreQQ8lgrKCrF+Te+xDZs2+9t7YiY8HCnHyW4rALJZiOykq3o0TiXt8zOwCmtm6JNbiZvmh796uQHSkqx+2gxLd11ADvyi7G9oICOllWhyu6Ak0s+e/G44cd/H9cGswexjTBi6NGpOX586x5JhzVGHHA9rW0NwKD2yYSAv3mC+/l3SMz++Dd6ZOZXPlyy5FkPPR/+pWen4vF3p6rt8iyQyWsPzqMNf28NpVK6E6792Ua125AoCAESW8wA8gEE3JR6Z+dgBoasBhl4YNZdUnJaWMmTwoTbAFIyC6v5RFw1y8f+nYdsj988A5JTCmvFMhkN6NC6EVv2wTQpNUWJ5ospiWr18EaxAFm5dhdGTpjJfMV2yH1a6wv3/EHHf0aG1YIeTXNxfpc2/MJuHXiqxjZTnAPHqqrxw+Yd9O3GHbTx0FGUVFXDn/7iMmJdghVBJBCaNMzEh9Nvlgb00pX3hQOujbweRb+S+SKspA8lpRUYfPWTbPeBo7A76sSFKA5Ot1jNuP/1O6VGLXLV6zmBLEoKS/H0ba+w4sLSOq5YkBcfdwxALkRq3pggNg6x5W8AfYIcU8ehgBghKdmKEbdcwAed01ftuA8l35+Q4mPpdyv2f/DS/MacBy8qGQCeZDXTuaf2oA+ev4kbmGb3GUJ81EXWuPtx2Xq66aG5lF9Q6jOoXKnlo2bCqHMdDIyhYVoyhnRoxScN6c8zrZoVsH4prqrCc7+soF+376EjZZVwSvW7l0N+kLE/Lxq3EJn71Dg+uF8nLVsZ44VQJzTFgsRmd2DkhNdp8YotVF1tr73fFASn185xRpMBtzw2mncXY0TzLPnuL/pi9g+hFin8A8BgtduQCIjNQ+wYBuBrBOlz77gPZmC4ZNw5fOiI09Sc9JTEfHi+Rw1UEx8/fbr05/mzvhsSZtt5WoqV33TlGYYn7lG9xksgNKuKVCTg2Fu9cS8uvm0Gyy8MkGxFRsBsjZ9Rvf20gTE0SLJgSOc2/L6zTuLpVova/RExyqpseGbRX/Tj5l1UUFkJycsZS46Llrv7WAC7SMMG6fjprUlS53ZN1G5yvBPu/KFIjEx86iN67+s/6lRPlytC4E56AJc3ws2PXst7ndRVy3OzAMD3H/xC37/3K0lOSWk8CAdwDoBFarch3hECJDY0gCvrVcDHkN7iw2Bk6H1yD37DA+rFfeD4QqFkY59o4sP53ITXXt++bvetYbbdkZudZnjh3pHsivMHaHmBE+LDNz7HX3W1HScOf4Tt3JcfJI2uf/90n6KDAEaEphlpOK1tc/7oeYO50RD/l6ba4cTDPyyjJf/tpbyyCkhS3S7jMrOE+XPRIhDatWyIf754RBLB6lEjktZTWQ/H5ny+lB5+5WsqLCk7bk2TmSEL8AhOZ4TrJl6utkeCQAYzH5hLG//eSnXrg8gSIaUAWkKk5o0qQoDEhp0AWgU6wFN81PyMBo2z8Pi7U9TMwOFeJJRYP9Ryy1FLfOydfMUTP5QUlIwDwnK7qu7RoTnef/4mi8afvsb/Djd06oxBSeIYNPJxtm7LvqD1O3wtiP4sHUSEjCQLLuzajk84sx/PTlIzLkxdjpZX4Olf/qKFW3ZTabWt7iZDQU0URsS8Zy0CoV/Ptljy/r2qpvGOY6KxVgS8Vms27cH4h+axbbsO1abqlW0JwfF12mA0YNi1Z/Jh15wlRIiGcTicePDaZ1jR0WPe8WRy5oZtALqo3YZ4RgiQ6PMAgEcQuK/rxn0QwZJswa2PX8c79Win1gTnuTjIXYDVEB+qZbri4GvvPP+Bv6qr7TeG027GqPSiIb3TPpx+MzQc7wEI8RGI2nHocDox/oG59NkPK8lX3ILnO3w9ffUV0wECLAYDejdvhNtP6cNPaddCbHy8WPbfXnphyT+06fBRVDudnjVGFG0wvRWf0WDAZeecyOc8dYOWU2DrlWjNKX6vt8PpxCW3vsxWrt2J0ooq1y9DsYQQ4byrz+AXjzlH3IsaZv3KzfTOkx9TZXl1KK5YEwHMULsN8YqYTaNLY7hSJgZ8Ml4v7oMRzhpxKh9+w3l6Eh9A7DeoqokPgL64ccjkXACnIPT7iFstZvsjt19smaD9RUyIj8BwAHz8/XPow+/+omBJrHxluSIi5sva0TgtGQ+eM4if37W91seIZvhszRZ6ftEKOlJe6W0VkRUr4ss9ixHDtRcP4m88Nlpch8gSzbnF7434xOvf0cvv/UylZZW1FspQaoV07t0edz97g7CSaZjP3/iefv3yd3LWzYolR4TYATQBUKR2G+IRPeYR1xN/wCVC/OLtesUMDO26tca4+0ZqQXxoOehctQnfVmW/85Zz7h0CoD/CEB8ZqUns3vHnGyepJzSVoPeHFRKOC1Z3f0fMB/2luQtxzrjn2erNeyiQu5Uk1Y1PcBXnIMbqmEABq8mIAa2bYvZV50pThwzkHXKz1e4/XdGtcQ7GDzqBD+3chv+XX0RHyyvg5NxdeLFGXgS+/K7rdLyuCAfH2i176fm3f6S0JAv66yt1r5bhiN784ulGXIdT+3VEVZUdqzbvIYfdlaaXiEhO/BAA7r5ljx4qxIYVW+iU8/sLC5lG6dq3Izb+u51KCuq6YtVcw0DX2wDgLACz1W5DPCLulujxIoA7EKCPvet9ECMkp1rx2JzJUmqGagWyPIWEFl2vVLR6AJIdw24+d8p0AJ1CbTNjhCa5WeyVB6/hw07vpRfxoce5IthYCbtdS1ZuwfA7XkVFZXXgE5HqPnX35WZFRGicnoJbT+7Nr+nbjTOxmYkYEud468+1NGfFOjpcWqHYKuLLIpKekoQfZk+U+nQPGN4nkEcs5hif88E3v66mu5/4iPKOltQWAg2panrLXDz89kRhCdEoRfkleGz8i6yyoqpOal4EjwfhAJ4E8JDabYg3xAoXHdoD2ITAFqZ6cR9GkxHX3DOcDzyrj1qbUqXiI9KZTNyf6e81VTfrJfsLz5k8+uk5AJqG+BFkMhmpY6tG+PSlW6X2rRup2Rwl6Mn9Kibpoh1OJ4aNfwnL/tkaLMC8zuLmT3j0atYQ71x9npTIAeWx4mh5BcZ8sIBtOHy0XqHDYBm0vIUIgXD6gM745o27JKNBOBSESazmmXpr26btB3HF3TPZnoMFtZXTlYoQAGjQMAuPzZskGU0ie5oWWbZgBX3y6rfksDuUxoM4AbQGcFDtNsQTQoBEh70AmgU6wFe9j8692/M7nxqrB/ER6adVmn9qtH3tjiefu2fWeLiqpCqGETGT2Yh2LXLx23v3ShlpyWo3SdHpx+A7wnHDCEegKh7LDqcTXc6dhv15hf5PyCuzDnnUEjj+O5fwmHf1MCkjKX5qduiFwspKjHr3O7Y5r8CHEAm8KfEOVm/RuAE2LnhCMhmFCAkT1UTI4aPHMHTMs2zPwYLaDFmhiJCsnHTc++odUmZOeoyaIlDCC5PeZP+t34UQUvPug0uECCKEECCR53kAEwId4C0+QECTFrm4/4271Hpy4h33wWUcFyk0Lz7y9h/94sHRz54BIEvpewkgYkRWixmn9+/EP3v5Nq7DJ6XRdI/wHG9yNh/RsIbJbt/f63Zi6LjpqKq2+T65ehaP+sIDBHRvnIN3r7lAyk4RFg+1OVJWjuvf/55tOlJQb1QFEyKMHZ/LU5KtmD/jNn7agM56cKvUMrESIfXWuqpqGy659RW2cv0uVFa53Colicuyqnqu6ynpKXh83mQpOU3c31rDbrPj0RteYgV5heB1RYgcV6zHav4IIoAQIJGlCYAdAAI9zqznemVOMmPy9JukFh2aBf2CKOBr8+VrwY3GoqB58XF4/5GdD41+vhEAxUE55HpMSmkpVtw08gz+2F2X6nljkgji0+8YLyopw4i7XsOfq3eg3kNRHyk8/aXSbZ6Zji/GXiI1TFUtxkvgh/3FxzDy3W/Z/uJjioSIp1sWI4bBfTvi0xm3SumpYvMZBqpZQgBg6rOf0ttfLKOKmsrpoYgQa4oVj7x1j5SVmxGjpgjksnvLPrww6U1mq7YrtYJUwFWgUGTFigC6exSrcRYDaBHoAF8pd085vz8/+bx+apyvv02lZ2YIQoKKj/wDRw88OPq5bACpSt/LajIbpaVY8fTEy/k9Y8/Vs/jwJlwhomoigSDnVa+ND834Elfe/Tr2HDzqivfw+I9z1AsuZ650uuT5SbmpyfjuxsukiWf05ylms9rtFPgg3WrB2AE9+bld2vGftuyiCru99jV39iz4yZpTkzGLAI49B49ixryFZLdLOK1/J7WbpWdi8YDU5/U8++RuMBDD3+t3kt3uBBEUZ8dy2B34/ce/afD5/bnZKu55LZGZk4GCvGLs23HQ2y02WFYsE4A+AN5Xuw3xgLCARI4LAHyJAJv1etXOGaFJi1w89NY94VY7D3bT+EOt4GLNi4+iwtLye694XOKcpyl9L2PECITcBml4/9kb+eB+nbS42Q6XUMeO5q+9m4+//4umvfAFHcovquda5Y2vGh4AkGI2YdYV54jCgTrk56276K4vFlGFzV7vtUDB6p5uWU1yszDjgav4hWf0FtdfObFcn3zOS0tWbKFRk2dRQXG52xKiOCYkJT0Fj82ZJKVm6CruL+6RnBIevP45VpBX5J0VK5glxAlXat6lardB7wgBEhmSARwA4D/qzMsXnIhgMhvx6DuTpOxGmUq/L5g7jJwnzEJ8+MFWbZPuvOChI5IkNVbyvuPVBQhNG2Vh/ozbpV5dWyj5CL0QG/ERqqwOk/yiMlw3eRZb+vc2SFwKuOnwJzzMBoZxA0/gU4cMEBtPnfPQgmX04apN5HDWHwbcT/pezyB1RgxDBnbhH06/maemWNVujt5QXYT8uWoHrpn0Ojt89JgSEVLH1TqrYQYef3eqZBRJCjTFkQNH8dj4l5h3ViwEjwc5BpfLfZXabdAz4m6IDD/CVRfCL97WD4PRgNMvGsj7nt5T7ne4XaHk+OIHO0atug6a34wVHz3GJ172aKkk8Rwl7/MWH2/+bzQf2Lu92s2JBqGMHa26XNXjzY8W01X3vM427zwUcLPh4WpVB8YIp7RtgcW3Xy2d0ra52s0RRIAzOrTCHYP78tX787C3uLS+y4Zvt43aIoYcHDv35dPcL5dTdkYKTujSUu0m6YloFin0xucjjxZNstGxTWMsXbmFyitsIbljVZVXY+l3f9Hg8/pzk8UUu94TBCQlPRlHDhzFwd2HyUtvBHv8ZYHLFetDtdugZ4QFJHyuAvAuFLpeZedk4pE590hmiyzf0HCfAnlXf1brumve+nHXhQ8VVlZUKSo77X7ayYiha4dm+OqVO6RmTRQnzNILSsei5q854Eqte+ltr9CiPzaRO85D8mGGJ68nm560apCOn28eKZnFU864pcruwJCZH7EDJWX1XvMXqO7pkkUgnHdqT/7xS7dwkbJXEapbQnbuzcfld77Ktu46HNQyWouX50ODhll48sN7dTEnJgqVZZV49IYXWHFhqVJXLAnA5QC+VrsNekUIkPA5isDpWetnvbKYMHnGLVKLdrLq2UVq4nXfSML1ygecc0y58snSkoISRTEfnuKjV5eW+GH2BL3V+FDUXCibMzR9zd38+tcmunbym1RYUg6gxvZe/wknMT/Cw2oy4q97rpUyrcK9JlEorKzEoBffZ1U19SI8cRW9rzt+vAsY5mal44Pn9RMfxjmH9/CXJA67wwmL2QiH0wmnk8Nijloa+Vg+OPNrsc0vKsP5419gm7YfkC1Catb/2nNv2qYxHp49QRdzY6LgNyuWK71EoHs0D6EXJk54hAAJj0kAnkaAfvTOemU0GTDgzN782kmXB1t4ojHhxtKc7f29ml5oHxz9vC1v/xFFqUrcmwoDY+jQupEeCwwqRcmY1PwCa3c4cfU9b9D3v60l9xrja0MRKMD8hUvP5Od0bqvpsS2IHl+t20bTvl9aL1Cd+/Eh97aGXH5uPz7n6XHcwNR6LnScbbsOY/Wm3TT3y+X03958lJVXoKLKDknirvxerkaBc8BgIDgcrluFiMA5h8HAIEkcJpMBRIT0VCs4B7IzUtCySTZv16IhOrZuhNSUJDRrlInyqmoMPrEjr7I5wcHRJCdoulrVrSAAUFBUitNGPc12HzgKp1PyaSn1xluEtOrQDNNev1Pzc2Qi8dbjH9Hq5evJYXfW+X0QKwgHcDuAN9Q+fz0iBEjo9AbwFwC/j3y8Jx131qsHZ0+QWOAFR003qUijefHx/N2v27et36XIMdddYNBoMKBFk2z8NHui1KJZA7WbEm3kjEvNX28A+HTBCpr6/Gd0+GhJ7Vn7qOXhU3gYGMNF3dvzFy8dovl2CmLDHZ8vpO837yTJy4VDCuKSBQBNG2bhpftVyJRF4HPnL8MzsxcY9h0uguSUvNJMAzXPgF3/kP2x8LD1UK31xPV3zRG18JqjiMNlSZZMJgM3mYzISk+itJQk1rNTCzr75O58YO92vGWTbEMMxZrfjed/u/Nw/o0vsoNHipSIkDon3vOkLvy2x68Xc4hGcNgd+N9NL7G8/UeVumLZAfQCsFXtNuiNeNnkqsFGAJ0DHeBt/bAkWzDpxZulFm2bBPts9R+HRQ5NP+V5+vZX+c7NewGF9wIjYgYDQ7cOzfHrvMlSSnLCuN8EEiGavtZubnpwHr3/zR/kNnZwqW4mo4BxHtnpWHjLSMki/PcFXpRW23D+rM/YvqJjdX7vKzaEETHPu4gRw7gRp/KXH7gm6htSSeK49ZF3pXlfLXdIkqSrAhWMMTRrlMXuGT2U3zpqCBDdPUzAhynFx8px5nXPsm27D4ckQogIXU7swO96epwQIRohjAKF6wGcoPb56w2xiobGNQBugALXK4OR4dyrTud9T+sV6HOjVfRPLTS9IX31/rnYsva/kKxNBqOBundojmUf3iclJWaRKXefcejE6rFm0x6cOfpZtuTvLX5drmqK19cbD2YDw52nn8jfuOJcbtSAu4xKEOLLOhtRLEYDxg7oyaudEtYcyCOJu5/uuxStp8jlHlmyXD9zrNq4m7746V8a1LsDb5STHtpJBGH/wUJ0v+B+9uea/0iSuO7Wf845SsursPCPDfTUG9/TH6u345oLB0qon2glEgTMhGS1mHHtxYP4N4vXuOLHOOpcY39N8Jxfjh4qpPxDBeh9Snc1u1VQQ2ZOBqoqq7Fr8z7yvJIyChQ2BPAvgO1qt0FPiIVEOWYAhwBk+jvAn+vVw29PDLQhj7eFXdOb0vdfnE/Lvl8ZJNW3bwyMoW+P1uz7WROktNQktZsikMGkpz+mNz/9jeyO4/69nuKjxuRR//4joGujHHw3/nKJsXi6PWURNy53scbhlHDerE/Z9vyiOr/3jg3xDk4HAJPRgFtGnsmfmXJFRPt11YY9OP26p5jd4XSP/TpSW2ZqWU3gaUEym0yY+9RYfunQvp7nH8n1NOCDtMLiclx06wy2euMeSFJolpAzLz2ZX3Hrhbrp/3jnwdHPsfxDBd6uWMFqgxTAFZDugEAWunsCogHeA9A3wOv1sl4lpVhxx9PjpLTM1ECfG0+PVTW9Kfn9h5X07bu/hCQ+iEjq0bmF4ed3JkmpKUJ8aJ2Dh4sw8MrH2U/LN9T653tXNa+p51Fvs2IxGvDiJWfyx84/lfvxyIpXPGsOyTlWpZKR2oUxwnX9uvPG6SlYunM/OaVaawh5W0M8LSGAy0Vqxbqd9PmP/9BFZ/fmaRFw79y1Lx+Drnqc2ewOcO5al9yli+j4T7WA/I54Cg7coipqNw33sCQ4JQlfLFxF67ftx+Xn9vM6LPoP9ZKsZow4py9fsGw9FRSXgXMZ9wPVXPUadm/dRw2b56JZG0W1bwVRon2PNnzlr2vI6agTkB7suiYBaADgB7XPXy8IAaKM7gBmQGbNDyICMcKAs/rwk+tOjN7Ek/gANLwZyT9YgJfveweSU7l3GGMkndK3g2HZB9O42RS1dJOCCHHPkx/RuAfmsKNFpbW/87Z6MK/AUDftc7Pw98TRUqdGcZ9YwBMlwsPXewVedG+SiztOPZF/sX4blVRW1/6+vt0D9fb8BcVlePPjJVRUXI6zT+4W8jnYHU6ccvUTrKD4eO0SAgJKarfbmIdpkIiI1fgnBvlTX9DU+6wIjBfO67ozbd+dR+UV1RgyqGudwzyaFCpBBYXFbML4Eafyhcs3Ut7RElkihDwj8jmw7s9NNHDoiTwpJWHiCTVLRnYajh4owP5dh+oXHvV/XQmuOJDP4LKGCIIgBIgyfgTgN4K8nusVEdIyU3Dro6MDVT+NN/Gh2biPvH35ePzmGbB7pcyUA2MMPTu1ZAtmTeAWs6hkq2VWrt2Fs8c+x37+YyM5pZrh6JHlilw1PXxaPYwGhgln9OUzLx+qWREdJUIVHp4IEeKHMQN68gqHA2sPHvGIDfGqos7rixCH04kV63bSZz/8TYN6deCNc4Omqq3HAy/Mp59+31C70VVykajmPP1mZQj1s3yKE4JyYeIVR7NpL11+Tl/eoL63QdStIUSE4Wf34d8vWUdFJeWQY2D3FCFc4vhz4So68dQePCW+07nrgrZdW+H3H/4m7/1CkDvBAOAkALPVPn89IBYM+VwE4AsoDDyf8tItUqtOLfy9RYiPGFFaXI4Hrn2GKiuqFG8sDQaGnp1a0J+fPJBorji646YH59GH3/1JDudx07mny5U/iwcAZCZZ8c/E0ZLREG+3ZUCi0VhNu2CqSZXdgf4vvMuOVR23hnhlySLGfE8yRoMB4y47lb/0wNWy+9Zmd6D9WVNZvjszl06uSk2sjKwz9o6j6dmpJVZ89qC/tSic8S5rfbM7nDjpiv+xLTsOwSlJweIG6j24tKZY8eQHU6WUVCFC1GbLmu308r1zSHJKSrJiSQDOAfCr2uevdRJqpQ2TOZApPly/AFq0bwYhPtSnrKQcD4+dzkIRH4wRdWrThC1+d6oQHxpm34ECnDj8Efbu17/XER+SxCXOOQ/kbgUCruzTha+ZMiaRxAdD9OYgcaP4wWoyYt3UsdLwnh25u5cIdYQx91dd2+F0Ytani6n/iMdYXsExWd/33eI15OmCqBdqrJSyDC/eG/wN2/bjt782+3tfOBJM1v1iMhqw5L17pXYtc8F8JBkIdv5V5VV4aPRzrLKsMjKdKQiZzid04E1bNYQPd8lAY4EB+FTtc9cDCbPahsnTCJD1Cl7Dk4iQlGzFtfdcFo2nMFpEs+IDAJ66fSYrP1YegvhgrHvHFvTPFw8naqpdXTDxqY+o6wX3s03/Haj9HefHN3L+3K0AIDclGcvuGiU9c+HpOnk2HDaxSvUtREhd3E+5GQD2wqVD6PvxI3hW8vFEFp7j1J8IAYD1W/ehw9lT2LTp84P28Xtf/wF+vKag/JN1B2ow8v0nQBBIhDuNajZ7AT/Zs78kLmHC0x9FQ4DIJjXFin+/fFTq2KYxmKueaTARUud6l5VU4KnbZ8bbPkGXjJ56pZSUbA3meuVNFoApap+71hGLRHByAOwH4Nfx31sNG4wGDLtuCB929RBPv9N47WtNi48Z975Nm/7ZBqUprwyMsU5tG2Pxu1OlzPQUtZsh8MGxskpcePMMtnLdjjq/d29G/KbWBQACTmvbks8bNUzuuPD1OXoSLbFO8y3csI4TsO9Hvfctft+1v05vubNkBXp6TiCc3LcDvnr1Dr+FUBuedAcrraiq/VB/WC0mnNi2MYae0I53bpYDq9mArNRk3iQrFW6LYnm1Aw6HBKvZiIPFpTCAUFZlI8aA4vJqHCkqw/6iMuzLL6EquwP78o+hotqG8mo7Km0OOCUJVXYHGCN4Voz3npr9zdSueqGBx5S7yrzRYMDuX5+TGmSl+T00xGupaFwfOlqCs0Y/w3buy69X8NQX3nuJXoO68Vsfu07cRyrz+Zvf06/zfyenV/KaIK5YNrjqg+jPBBkj4nVTHEmWwxVU5BNfgect2zfFtNfvlBB/lg5vNL3J+PyN7+mX+Usp0NNEXzBGrHnjBvh65p1S1w5N1W6GwAevvb+I7ntxPtnsdQMEPa0e/t6bmWTF0juvltKtlmBfI3fTruX7QM36Qpp+OBFDgl6DgyWlOPv1T1FebfP/CX6wmE14adrV/Prhp9QZgza7A1l9b2O105+fEfrxxMv4kF5tIzd+CQRe94ydTgmVdgeSzCbsPFwIEMFiMqKq2o68Y+XYcbAQyzbvRXF5FQ4UlKKovAIVVQ7YnM46YiVYjQ3PeJCn7hnB774+YDKJUNdnReN6xdqduHriG+zgkSLIWYu8Y0mHjRrCLxx9tlbnl4Th0fEvskO787xjQYLN/b8BGKL2uWsVIUAC0wbANihIu2syG3HbE9fzzie0j/e+1fKmCyt+XU1znv6EpNo0SPJgjFiTnAx8/vIdUp/urdRuhsCLispqXHzLDLZ81X/wrJvmDjQnlxuLbwjo17IJPrv+kmgVBNXaPaH2AxAhQBSOp0vf/gKrD+T5HkUBPoVAOOOkzvjkxVul1Jo0rj8sXUfDb3/l+Lt8fKbRyHDonYmRvk4RGXd5xWW46+2f8Pd/B1BWaasVIq5b3f995i5S2LpZDjb/8FSwtsVEhCz/dztdO3kWHcovkVOosG4tMUa45bHreK+Tumppbkk41q3YRLMf+5DsNofSgPRWAA6qff5aRO0FSuusgEzxAbgmig4920KID3XJ25ePec9+FpL4yM1OxztPjuNCfGiPD775kzoMncp+X7W9jviQJC6Bc7cPvU9SLCbMvvIcHkB8hFMDw/sz1EYr55HoKBazX44bjpeHD0GKr1TfAWZdDo5f/9qMLufdxz7+/i8CgK9+Xh30+xoHLo6rKo0yU/HxxMvw3t3DkZVirY0vqc3Z6wd3F+09WIgCjQTgn3xiBz7zket4g8yUgNZZdxO4hyMalzhmP/YBFeWXqN2MhKbngK68deeWvgLSA93jDMA/ap+7VhF1QPzzCoDT/L3oy/UqKdmKu5+9AdakoK4dekbTTzUlScLDY59n1ZU2RQKJMWLZGSn4euad0qATO6jdDIEX46e9Q0/O+p4qquq6qEgSlyhQthwCejTJxe93jZLa5WT5OSIiNTC8P1MNgR6NtoSKZh9QxJCQrGmdGjbAbYP7YOHWXcj3lwnJz6dWVNnw7a9rad+hQhzML8LOffkBv79L8xxcfWqPyLpfRXj8tchJx+ndW+OjZRvgWVHeT8Q7sRonLA6Olo0boG+PNoE+PibV0gGgQ6tG6N+zLb5etJqq7Q5FhQolp4SVv66ioVecJu4rFel9clf+2zd/Ka2QngIgFcDPap+/1hACxDdWAB8A8Jv6yNv1ijHC2Zefil51q7DGG5qf/B4ZO50V5ZcoCjpnjFhykgXPTxnJzz2tp9pNEHhQVFKB82+czhYsXUcBXK58biCsJiOeHHYqf+KC0/w5tERzsx5rEaIV4eFG83NFDAjLCnVN325ItZqxYs/B2o13HfxcbQ6OtVv2Ul5BKdntjoDfcfnJ3fipXSNo7Y2CAAGAhpkp2LT/KLYfKqi1DZD72zy/3ivt7Z5DhXTTyKAZ7kIRISHd3y2bNkBOZgp++XMzyTHQez5YsVU78O+y9XT6RQPFvaUSJrMJxwpLsXfbfqUV0rsBeFbt89cawkzvmxfhUq0+8ZUDOrtRNoZdG9exRpp2uwKAL976gfL2Hw3mk1kLuYp+MbPJhDuuOYtfe8kgTbcv0fjm19XU9fx72V9r6mW54gFdrgjo2jgHW6aNl67o3YXXfzVmm/VYfYfW5nFNW0ljRESu/Q0n9cLW+29El0YN6n9ikBm5tKyyTgC3L7o1z1G5m+Tzv6vOQJKXaxoFSfy791CB3I8PZe4P6b4bc/mp/IbLB3Oz2Sinxonk8W8c2p2Hb9/7RUsPGhKOy248n2c2yPD1UqDrkgEhQOqhtYVLCzAA1/l91euZCxHBaDJi3H1XwmDUvEGJw7U5UDrZal58bF2/gxZ+uoQkSX7cBzEiRgy3XnUGf+TOSzTdvkRj0tMf01UT3qDi0rouKDUuV379bs1GA969ehhfcNMI73GghntStL9La1YPQOPzhF754eYrMGvEOdzsq1Cmnx533yKSxP2mtu3ULFc316tJdiq6Ns+pJzm85oI6r1ZX22V8MoAYj9vp913F7xx1NjcaWNA9mLcIWfD+Itq9bX8sT1fggdFkxKhJw7nRZKhTG0RG0cyb1T53rSEESH1mweWC5RPvJy5EQKcT2qFNl5Zqn3cgvIWHkk2L5sXH4X35eGXqO8SDPe7zgDFiBMLgvh3x1KQRmm5fojFywuv02oe/kmfGSndhwUAuVy2y0rHl/vH81PYtawu+efxRa6MejTlWi1YPILSHG/FKxMfbOV3a0pZpN0pNfdUlCtLr3OWzWPcECejQJAt64vYL+tcrCOc5H3h3utMpYevOw3I/PhTLXcj34eMThvNBvduDMRnV3j0kpOSUMH3CGyz/oGzrjiDCdO3T0RWQ7k3gqvfJAJ5R+9y1hBYXMTUxAbjK34u+XK+MJiOum3iZ2uftjVtwuP94rjxKr7mmNxS2ajueu/s15kqNJ+9c3cWq+nRvjQWz7xHuIhqhsLgcHYfey75etIq8s1zVxHv4XKmNBoYbBvbCsjuvAYt4LeaIQB5/PAVRKOeqVauHnPuI4LsvvIWi5x+BB4wR/THhOmlkny7c6G0NCSZCAEieIoQIpkhb7WXOwaFycucWYD4cL/09febg+HPNf5odRwvemih169Ccgj4953UfBNqq7XhuwhvMUTcYWhBDxk69UjKajHV+F8wlEC4riNh31yA6oi4vAkjy9YKvCYIxwgmDuiKjQbra5+2Nv0VA6fXW/Ob8iZtnsLKSCtlxH+4UiI1zMvDrvCkSY5pdm7REoA2j55+Q2bT9IDqeey/bd7juUz2PquY+LR8N05Ox4p7r8MDQQWr3kZz+Ix+/k2ul0brVQ84YkSMuAokUIUpq2v/0hafzZXdeI+V4V0DnAJc4d4t2Xx/gFiEWr82THshItiIzpb6DQu3c4GN0/PT7BiVfEcqaF/KYNBkN+PmdyVLDnHSiIJ/jfT1LCo7hqVtf0eKckBBkN8pE174duXckYhAxmQrgfrXPXSuIwXuc1gBuDPB6vdgPk9WM6yaPUPu8vQlU5yASn6MZvnhzAR3el69MfBCQlZ6Md58Zz806XIBjjGfchJzxE9J88tLchTTgisdYeUVV7e84ryc+6p3ZgNZNsXLCaDRITlLwbZrGX5yKFq0enucWK3HgKUq02h8xo0l6Kv6ZPEbq1axhnd6oeZweMEuTxDmaZUWpBghF1wrSNDvd53Nmfxu/9Vv3KR0rSs8/rLGYlZGMuU+O4+npwecx77XuwK7DmP/mgoS/F9Ri7NQrYbGYvd0Cg12P+wG0UPvctYAQIMf5Cn7SEtcrOEgEYoQ+g7vD5KtglDZRMklpXnwc2H0YCz9fKjsVolt8mIwGzLj/Gj64XydNu5apTDibPEVzyhsf/Er3vzifHM7jrgSuZ7f+xYfRwHD/2QPxyeiL1e6naOH95F9QHyFEavj6hsuku0/ryz3jmT1EiF925hXhvcVrddd/Z/Vo7fP3/tp76KjiAn4xXxvOHNiVPzPxCphNyjNjLZq/jI4eKoz1KSc6BIBZUyzUY0AnECMlAekmAJ+o3QAtIBY3F23gytNcD38DKTU9CddO0Fzshz/hoOQ6a158cM7xzJ2vMS5xWfU+qEZ8MGK48YrT+Yjz+gvx4Z+YublccddMuueZj+sEm0sSl3jNBsCXY3Sy2YTld12D8QNPULufBNpAq65p0W5zHe4+rR//+dYrJItHTEegTRCRy8o4ce5CuvmN7yJ7v0c5DuSCfh0RPOHQcUKMk4ipFQQAxlw2mI+6aCCYPL/g2vNzOiU8ccvLiXYPqEmdNfK6ySOQnGr1dUwg+gFoqHZD1EYMWhc/wn9f1BtIBiPDNXdfprW0u4GK4MhF8+IDAB4eM51VV1TLcr0iIkY1FavOGdydP3/vSCE+/BOTJ8pOScJpo55m3y5eUxts7ulyVUM9IdQqOx2b7rsBjdKi5Doi0DNas4bEfJ5p2yALW6bdKDXLOH5/+Nmnc4A44Lrv5v+xmS584iMmv3SrLKK2lrRplAW/e3QfbXA4QjqVmAsQAHj90dH8zJM6Bw1lrnnwVnuOFWWVeHT8i2I/pwJmixlX3HIhDMa63e8raZEHDKIyuhAgABoBaOvrBV8DiDFCbtMGOOHkbkE/OMaEK0B0IT4+efUbOnLgqFzLR+2Dsk5tG+OjF24R4sM/MZkLio+Vo/O509jKdceLC9YEzNYZf3X8Rwg4u3MbLLnjGrX7SKBttBSkrspcQwQsv/ta6eS2zWtLhXt0Sm06du/586+t+9F/8mxWXmWL4MlEpw9SrWZYjPLj9zjnqKoOqV2qXMP5r9zO2zQPXp/F+xoe2p2Hr+f8pJXxH8/U6+MBZ/VBg0bZ9YRxEBHSBUCa2o1REyFAAls/6kBEMFlMuPYezblehZv1Shcb85LCUiz+5g/yfvrjixrxQQDQJDcLv384TbKYRdC5H2IyD3z2w0pqfeZktt8j05WX1cMDl3RkjDDljAGYfeW5se4TXdwTgnpoaQOm2hj64NoLpdtP6cNrinbW/vFE8hL9u48Uo/PtM9kva3dGpg+j6IqVrHAu15MVxGoxY8VnD1F2RnLQk/aOB/nx49+osqwy2NsEoeP3Gl915yUwmU3169T4FyEGuPafCUuiC5CLAfTw9YKvQUME9Dv9BLTr1lrt85aDEvGhi83W4ze9JCvuw1N8WC1mfD/rbikl2SrvSxKLmPnPz/74Nxpz39tUbXNVJvbhclXnvAiAxWjA1+Muw62D+8SqPzzrWWhpIytQhlbWtWjNq7I+d9KZA/j8sZdK5hpXYfIRVuUtQqpsDlw740v6eNn6SI3/qFjWc3wVY/TbWbxu/RNlKHljxOaM9NQkfDNrAgyMOYKeoMc1lJwSHhOuWNHE7zXu0qc9uvXr6PtNLldwX+8dAGCI2o1Si0QfqG9CwaRhTbbiilsuVPucfeGdEUZum3QjPl6+7x06VlQmJ+6jVnwwYpg09jzepX1TtU9fi8TMXWXiUx/RXU9+SE7JdelcRZl9X0cCiBFRbmoS/p44Gj2a5sbiFD2FR6LPiYI4ok/zRvhzwigps+YBjC8R4v1Ax+GQcOfbP9GDHyyOzPwQBVesZg3SILeGE4FQZQu6j/eHautjv+5t2D3XnyP3HGqPKcwvwRuPvCseoKjA1XcNR1KKv4edxx+Mev4SwFy1z1stEnmxHQCggdyDGSN0H9AZlmSz2ucdCKWpKXUhPjb8s4U2/btNVspdxo4vrgNPaIv7b7lAF22MMdEUH3WExZRnPqHXP1pcG2weqEAa1dCtcQ7+nng9T7daotkHbtHhXUhPoH+0dM9H2gKguG0NkpOxZvIYqWPDbAA1IsRjrNfULqzzuVzimLXwH3roowiJkAjTIicdfg3h3PtHjoLC0nC+TrXx9Pg9lxl7dGpZEfQEvTpjzR+baOta7VaAj1fSMlPQNWCWNp8vNIGfLKzxTiILkM8hc8NBRLCmJGHETcPUPudIoougc8kp4c1HPiA5rlfMw22uVdMcfDnzTl20McbEbKM9bfp8euWDX+qID78nVeM2d3GPDvz7m0ZE87rVBuJ6/C6aGZQ8hU4s0dImPNbt1lrbI3k+IX/WwluulIZ0as09zCCeY55LnEueH8458MaP/9D0r/4I797gkb+3TuveWlEq3u1788I5ByV9HvE91Q9v3ZOcmmItDnqSnvEgEsfM++eRjFwtAvnIGkOX3zgMSSlWv+PTh3s/wVWHLuFIVAFyJlyqUxZEQJ+TuyE9O24SFuhmY/7o+BdYdZUtqOsVudO9AEhJtuLLV++Q0lLjpkJ2pIi2+Khd7W5+aB69NM+VkSVIvAeIiDEievz8U/mM4Wdxj8+K9MbNW3gAkZ0Duccfb+tKKN8TrA+8v8v7OxMNX9dXC0RqLIf9GW+PPI9POXNArQip9wX8eB0e18/AM18u15wlpH8HZW61x0qDGhE0S25WKi2aMzmViKqDHeu5TlZX2fDEzTMSdY+nGlm5Geh6YsdgqZS9X20DoK/a5x5rEnVwvoPAC3Sd15LTknD13Zeqfc6RQjfi4/v3F1HevqNwLYOBcS+mjBheum8k79K+qXuz7f0nUYlF+zkAjJzwOs376nfi4JA8qpr7PCkiZmQM74+6gI/q2437+LxwN2/+hEe0AvC9zzcU64rnOfsSGJLX697tSrRx7hnDo1U0Y5m59ZQ+/LXLz+bMVb253j1Qk6O3jgh5/Yd/6KbXI1ywMAwapCUrOt4phd31qo6vE7q2Mj498XKbzPOobez+nYex8LMlmrluicLoKSNgTfH/ANSH+CcA76l93rEmEQVIKwDNAx3gOTgYI5xyfn+tFR0MFU0sgHJZ8MEi4pyDB0nnyNjxRXTEeX0x6uKT/YkPpTEy8UIsNqUSAIy57236etEqAmqtHn6vHSNiFgPDgptGSCe3be7vOI7QhIjnJj1W/eH5XaEKnHCe4iea+PAnLrVKuEIpYtf2/K7t+fyxwyWTgYF8fC7nnHtnyPriz800ce5C5ecQhSB0u8MJs0H+mlxdZY/0KQRucRS4e8w5qaef1GVfsOM8XZU55/hmTgjXTBAWZosJJ53VO2CiBB8ipD2AbLXPPZYkogB5GwEmCO8sBclpSbh03Hlqn3Mk0MwTODk8Om46c9idMlyvjouPnp1aYO7T4+V8fCIJkZhtSsdPe4c+/v4vQhCXK8AlPqwmI1ZMHC11aihrzvXl2uTtriUn3iIW111pIgi14kT0it6EhzeaOPfezRri97uukZLMJr9j1Tsu5N1f19KUeT8ru3+iUA/ErKAQIQAkJUUkoYW614yDFrw5oYXFbNoV9FCPddNuc+Bx4YoVCRRd/ytvuyigFQT11wgG4A21GxlLEm1QJgE4NfAhda0ffQb3QJyg+oInlx8//o0O7c2XW+8DAJBkteCTl25V+lXxLkBiJT6kSU9/TO9/9ydxjnpPTr3PiRGxZLMJayePkbKSQq7P4rlxl2shieZ8J0G+1SOYG1UoxLv1w1t86p1Qr3tEr3HjtFSsmnS9lGQy+v1cV1zI8bl4zqI19L/Plqo61o6WlstOwwsASdaIFKGVe72i1jcGxthfnz6YAUBOPMhxV6wdh7Ds+xXxPD9oku79Oym1glwCQNOpViNJogmQH+GqPukTb39Ya0oSrrz9YrXPORLoJii1vKwC38xd6M7eEUSAuNpEIDw3+Qq0bpYTylfqol9CJCbiY8ozn9DMDxeRK8Fu0ExllGw2Yc3kMZLFFNPK9NEWH8GsHsLKoQzv2Jd4EB3+2qgqyWYT1k4Zy60B7kfvBwuvfLeCnvz8d/nzS4TdsHKDFSL0+rbySlskv15VurZvmj3h+qHrEPyeqBW5nHN8MvNbslXH1BUt4bn2nuGwBi6C7H0PGQB8o/Z5x4pEEiBZAAbKPZgYYcglJ8MYH7Ef3vEPmt10P3P7a8zpkOV6VduGay48CeNGnBr8w/33TTwSi3ub/2/mN/TqB4tIkupmz/F5QkQszWrGuilja6szx0FfuMWH3z5C/G6gI0GgTF6JguoixGoyYv3UcZKJsYBP1mtcsjjnwEvf/kkzvpP5VD3CblicQ1F187Kyqoh9dYSOCYunJ11xYlpK0g9BT8TjgZDdZsfzd7+eSHu+aKDo2potZgwcemIwa533i2cASFW7obEgkQbju5Bp/SAiNMjNxAWjz1L7nKOBZjNCbVnzHx05cFReI2qsH7nZ6Xjt0dFqn7rWiIn4mPT0x3hy1nfklKSg1ekZEctKTsKayWMkoyGm0040v4wH+PxYCw8txnj5itvxhjz+dj8k0fyDkiiguuiyGA1sy/03SSbGAlbtqwlQ55wDT3y2lJ6ZL9MSEkEriIISIACAiuqIWUC0co+xQ7+/1AxAYdAT9niYt/e/g8jbL2+NFfhE8fW/4tYLkZaVFqguiPcLRgCz1G5oLEgUAUIAhgZ5vc5P/c7qo5WJJlpEKw1pyLz2wLyarFdBAphrsl4xYpj/8m0wxYeVKlLE5Jre/Mg8zPxwEaQg4oNc4oNSLCasnny9ZGBxIz5qmlcPYfFw4RnfEizpg6+HIomYtU51EWkyUNKOh262G1jQmhOuwoUcmP7NnzT13V+CXyMOHkkRYlKQBetIQViV0Ou3JLzXI9N+s6HnAzdf8jJkWdB4rSvWk7e9oql1PxEYcGZvpaJ5uNrnHAsSZSC4jYDFAACAAElEQVR+BJeq9ImnAiUiZGan4ZIxQ1VfDGKEJsbA4ze95Co4GKTmh1t8EAh3jx6Kfj3bqn3qWiIm13LiMx/zuZ8vgxTEB8JdcDnNasbayWNj7WaixrhWW3hoZc7yVZskHBJJiKh+/QjI2nzfeGY2GoKaDSTOJYkD7/yyWp4lJIIiRIkhtbikPJJdpI37jIMevGPYfUYjeyXooR4ucFXlVXj6jpmaWPd1iuK17NLx5yI1I0VJdXQzgDfVbmi0SYRBaIArs4BPvM1fxAjnXHWGnGrM2piEIoOq42DV8g20f9dh1w8BfIWZx03avlUjPHHPZXHRfh21gd/y8Fzp1fd+CRrv4Sk+Vk+KK7crX2gpuFwL85J3PZRIkShuWapePw6Q1WQ0rZ08xphmMaMm2WCQLFng07/5k+6NoSXEoGBOqbCFFHwdLKkE9/P72MHJUrHmzeEAdgY91MOzYPfWfdi0alsi3EuagDGG0y8ZCFKQuQ3AKMT5fBcPG69gXA3AFOD1Ohc4IysVZ1w8yHMS8S6EFq9BkqoMdM455j39KbkSPfp3vWJEzH2GJqMB/3zxcFy0P0LE5D6eNv3zqnfm/w4E6Su3+EixmLBuyrhYio9YuxVqIouRj/arOZa9+yPS56KFNkYbHuJrESXFYmarJl2PFLOJavDb75xz7pS49M6i1fTC13/KEyFh3jtcQRC6w+GUe6h3HFKgeCR/tYhiCic0P7j85Y8BOGT0mcsVS+J46/EP4/ke0hzDrjkLqemKqqObAVyk9nlHk0QQIM/6e8Hb7EWMcNGYc/w91fA1ucSTCFFlMnr9oXepqrIaCNCXRHXLQ758/yiYI5/CVY+Tccw23CPvef3w9Dk/Bs1PTuQSH1aTEWsnj5WUBotGoD9ihRYeQnhulrSwKY+lGItXa4i7Xeo/XQdgMRmxetL1ktVkdA2240LEJ06JS0998Ts99NFiuddGCtUaIkny33b46DE55+NvTAVK3OJdiyj2cFCDjOTJXdo0eU7W0TXnWX6sEu88+VE83kOxIKS57pyRZwbKiEU+fp6pdkOjSbwLkGYAcuUenJxqxUnxH3yuGQqPFGPDyi0EIFDRwTryo1fnlrj+slPUPnUtELMNZ48L7v/yy4X/Ngz2fUSu/1IsZmy674Z4drtSw+rhnSVKC4IjWJ9E+/zixRriK026v81uzLGYjFg7eYyUbDbVniwLIEIkiUuv/fAPHv74t6heFyUuWPbgFhA5glbL48205tv/jQCwJdiBnmvtP0vXux8ACmLA6RedhKRURXVBGsNVQiIuiXcB8in8TBa+rB/d+nbiLLabJq0R04n12TtnMqdTAgIsrIwdf4ZutZix5P374qb9YRCzQdrqjImfb9udF7QaZ634qKlwzmJn+oi121WsxIfnRlTLaWm14Iam5Y2hnHOXe22Z15+YYTEZsarGElJ7MkTMX2wI55zPXPA3ZMeEhIDVZJJ9bM06Eym0msq+/d7fXvoJQNDkAW53Z6fDiSdvEVmxYoXRZESnXu38WkF8uGERXEmU4pJ4HnipAE6Ue7DZasbVd1+qdCLU2gSkGzb+u5WKjh4D4N/64c54BbiyXs3+3/WwmKNaPVsP1q9Y3bNSw5Pu+OhwfsmlwQ50Bam6As43xt7yEat7MNobbV/WDS1ucjwJ5oYW63PXen9F+nxjKrqsJiO2TBsvpZiPb/zdwSG+juec87d+Wc0nzlmo+jWx2SNeAVyT92ejnNTbs7JSJyp5z5EDR7Fr8161T12PhLRfuG7i5TBZ5ItnAKcASFLyBr0QzwLkNvgJPvdl/WjbuSWSkq2yPjgKaMGfPKbMevj9gK5X3ib+0wd0xuXn9lP7tNUmVvdrdUqvm74tKau8AkHdrlxPQTOTrFg3ZVy8ptqNpn+3Hp/ea8Hq4Q/NbQpj0N6YruPrp46TUjw2UO6kE76O5Zxj3uK1/IaZ30b8mjAFGYXKK4IaBUI9P62NNcPBZS+OBvB3sAPdVhDOOV6+7+143gtGi5DWhKTUJLRs1zRASt56YyoJwK1qNzYaxPOge1TugUajAWPuvTKUBTUSk09CCQ8A+P7DRVRdVbsg1Gu/d9C52WTEgtn3qH3aahOre7XY0v2Gjx1O5wWQJz6QYjFhzZQxsQ4417P48M60oxeUFllUa27Ti6iL5PnFrL2METbee0NtTEhNQ/wGp3PO8dWKLYi0JSTdagl8gMfoi/LcpKl9FAP1sW968wHIyIqFml6qKKvCz58v1fr9Ejdcf++VMBj9DRufo/V/ap9zNNDUjRNBboJc6wcROvZqxzOy00L5nkgssHJqjsSKqH+/w+7AD+//6rZ+1BN9rixKdRfSZydeoXa/qE1M7lMC7bZ0v2ERgGsRZDPD3OLDbMLqSWPi1fIRacukXjbGkeoLte/bmFsHEqm9f99zXZ2YkEDB6ZxzPm/xWhr36jd+HvsqHyvl1fLdqiqiH2itpXuaccnwAYAHgx3o6YHw9TsLSUG6YkEY5DTORptOLfxaQXxggasuSFwRr5PzdLkHGk0GXHXHxWotlN4bN9VyiceKp257ldltDndb6+Ftym/dLAc3XX1GLPpDi30eyw3FdnP3cRsABIv5IPcmI8Vixvqp4ySz0RDLPoml+IgUehceWnW3kotW17lozTkxaa/r/h9bJyYECChCpG9WbqWrps+vfx+EEIjeKDNZ9rEBknZFCk3d2xw8p3r97GQA+4MeWyNC7DY7np/whlbvFa0S8j181d2X+rWC+HFpfFXtxkaaeBxs3eEnYMeX9aN1xxbIbdpAjfPkCn+ve/b+dxAHdrsqnvuK/fC+PowY/vr0wVhtfrTW7zHzZS8sKt1n6X5DPoDzg5wQsZqJMcVswqpJ10tK/LAjgN7EhxAe2rmv4nGtU729JoMBf08cXccSAtSKkHrjXuJc+mXtTrrg8Q9ZWVXQuIzA363gwYfREBvvtFh8iWyI7n/z8TFXIfg9WPv67q37cOTAUbXPXE+EPL81a90YTds08WcF8fXLVABt1G5wJNHWDRMZvvTz+3oX1GBkGDXxsnAW2VAHXzArhx43LEF55b63GHcVj6ovPlD/Phw34lSekVb7lEsrG5lYEDPxUVBUfqjJ4AkcwEkBT4iOB5paTUb8dc91kkVYPvyhZ+ER6QBzLd23zMcfPV4jJe2NOslmE5bffU29+YC5Jox6/cs55yu2HcAZD8xlVTaPMAWFbljpSRbZx1bZIp4Fyx9aGk9s9MUnzwLwfrADawPSJY4XJs6Kx32hJhl11yVKrCAE4Fu1zzmSxNtAIwCtfL7gdTGJCI1bNETjFrLrFPpDyaQpJ4hTrWsS1Y3Cb9/8QceKyl1f5Mv64VU4IjMtCS8/cE2sNi9acjGJlfjgBw4W7ms6+C4zgOYBT4iIEY6Lj6V3Xi2lWYIWRY90n8SCcMeBnoWHu/3RuOe0JEK8UfOaxaJfYtK2BsnJ+OHmK+uJkJokvXW+nwOcA3z3kRL0njiLFZRWuF9Q1B9NslJlB5fbHBL817qNKNq69wmdqze9+R+AYzKO5gBQXFCKf5as01Y74pRWnVweOAqsIB3VPudIEm8C5DEAsh7LMka48s6IxH7IidlQmj0m7vjizR9cgefw6XpVVxyCsOT9ab7iY+KdWIkP6e35y462HTolC0GqrLozXQEun+8t08ZLDVNT4rJPdHKe0SDaaXX1ENcWzXgr76KSsba+xGRstm2Qgc3TxtdJ0ev6cqqXIYvXPIU6WlKBfpPeYt+s3Eo1B8seJ40zU2WfG+dcScBvuGhpX8UgsanZaUnnBzvQ/WCQc473nv9cr3NZLPCuARPW3DnilguVpJQ2AJigdgdECi3dKJHgTl+/9JUeMCU9GR27t4nUoui9wHoGkysRHmpej6htED5/4/vjaXd9POXyfkI27PRevGObxrFqt1asHzHbaM/65LeyWx+elw4gYBQn8xAfGUkWbLw35nU+hPiITdsTNcmDLyIpDMjHH+/XY0VMxigjV4reNGtdCymh/jrsdvsprazGLW98T5/+voHAweWKkKxUGbXZaj5JhexOWpoPkg/9MXMSgCXBDnSLkKrKaiz4cLGW2qAFPK2lhAhZT7v17YiUNN9j2UdNEAB4SO2OiBRRLSsdYzoCkPVolohw5mWDI70ghvuUL97EIABAckr49avlfosOemdMMRoM+Ozl2/SyWYkUMdtoP/jSF9XPvrUgGUHGm+d1SbOasXbKWDWEmh7Eh14JOl9VO5w4UFKGHUcLaV9RKdYdPIL9JWVkdzqRYbXwJhmpAAfKqm0ot9tQUmkjs8GAJukp/IRmDdGtSUPeIDUJzdJTUeOaI0Ef85z7fgw2NnyNT+71GVrCfT5Rn1/XTh4r9Xj2beaZKpcAgIh5pl/nnHMiIpvDiTve+pF2HC7CfZcP5nL6rkerXBCRLNcqzjkkiQd60izrOxVA0JLoJunC4nUfNMrsec0RBL4Ha/thwfuL6LyrTucxtBxpmUD3c9gddOrFg/D9u7/4GMtEqO81kgZXMPoutTslXOJJgHwGHwPBl/XDZDbi3CtP087kEMe8MOlN5jz+9KlOn9f3Dga+nHmHv+sSjVlQC5vPmImP2x97zzn70yXmQN/nXdU4NyUZf08arUY/xWKjGqmAc72t0D7bvbf4GH7ZspvmrFxP+WUVqHY4XQZL33dkoDbTV+u3u44h1/8lmYxokJKE8QN78SEdW1KzjHS1+0AOzE9fBduMaHltiYkIcRcrPPG5Oaygoqrul3uIkJrRRQRAkjhe/PYvOlxSjhnjzg0qVhtmpNa4VckRIEErp0dagAD+x48aGJKMlb8BGAtgbsCOqBGFdpsdr0ybQ3c+NVbL4zkuGHb1mfjpo8Ww2+TUjgQB+ARAf7XPO1ziSYB0kXMQEaFF+6ax9AeVg9pPBaMywdiq7fhv427XF/gpOuj5c252Os4a1C2WAkRtYiY+rp74hjT/p3+CmYvriI+2OVn49baRQnzED3WsHoXllbj/+yX0+64DVG6zQ5KiMA1wl9dlhc2OCpsdDy1YRg8tcG0G0yxmDGzdFM9edEbwqtbq4WsTGeye1fpcFTNLyL+Tx0gnv/QeO1BSVvfLPUUI55L7QSHnwEdL15PN7sDrN18ggUDgvvuzcXYqNzFGTmfwW1mGBSRaaEeQcnTjm2b9Ql1vKkLg2L9aMbZ51XZyOpzcENuMh1oj6us0MzA0b9sEu7fu92XR8zWGTlC7UyKB1idKuVwJ4MN6jfNh/TCaDPjf3ClSdqNMtc+59jSh/nWIymbs6Ttnsl2b9gLHYw6PN9pHdpT9S16QGmT5rEgfjT5SewMai+vOAfBhN74g/fLHpoDf52356N28Eb4cN1wtt6to90ukiwyqff/KgQPgaw/mY9Yfq2jR1j1U7XS6jPvHb87ae/T4/Rlu03jtfx5zQM1Ic/8FWI1GDO3UGjcOOgHdm4SdmTBq/Vfzb7UfGEWjTVFl2KzP2MbD9etLSDUixHv+IQKG9GzLP5p4mev8vG3lHLy82o6Ot7zCbDLiOxhjKFz5qmTxCpD3Ilr3stprjSfHepz/2Inb9u7dHuxA9/6pc+/2mPDceC21IdbEZI4/uCcPT9w8Aw57/fHs6wEugKEAFqndOeEQLxPpy3IPzG3aABoSH4A+Ni+KsVXbsXvLPgD+ig7WbfeQgV3hR3xEC7XrAcRSfARsX53Fn4DB7VoI8RFfSC/8thI9n3mHXfzW52zBxp1U5XBwSeIS51yqcYPhRESMEWOM+SvhEAJUW0Sm5oMZXA+kOedckmpkSZXdgW82/IcLZn+OXs++g5eX/uuZyEML6D3FcqA2RZ3vbxohDWjVtN7v3bFm3o5+nAO/rN15vGo69/ofXPVHmExPBiL4rbcQA7S0z0pf98OD7wBYLvcNW9fugDP2QfxaIib3fNNWjZCVm6XkLXPU6Y7IoaUbI1RyANQrZe7L+kGMcPktw7SyoAHa6P+o9MdTt75cU3RQXtrdL2feqfbGMFZPsmOx6EsOp5MPHTu9qkZ8BDwfT/FxaY+O/L1RFwjxEQcUlFXyke9+jfaPz2IzlvxLJVVVXJK4JHEu8ZpNXHRERwCIwFzfVvN9LiFSm56bAyWV1Xhh8Urq+Pgsuvrdr6mwstJdld39R805PJ4EiJuYrEOfXH+xdGG3dvUcqtxV0yUfT3l/WbuTrn/5K5J8BJoTBY3rqIVz4FhpVdDDoth8zYwbAp1yYOmMA8Ha61mc8Jk7Zmphr6IGMb1uF15/lu/wAN/ZsJoCyFCnWyJDPAyqWZA5SJJSktC9b2ctCRAtEPH+OLT3CA7tzXd9uIy0u/feeAE3acPHNNqTTUw22U5JwkU3vVS2ZOVma5CTIeYhPm4cdAJ/8dIhat0fehUfWnpKDwD4Z+8hDJg+D31fmEd/7DzAbQ6ny9LB67hYxU50+IRqxQ8BxDm4SxgdN5fanBL+2HUQfZ+fxwa8+C7bcNyFx53e3P1HDt7vUVvIaI2Y7AVeuXwov6ZPV18ihAggXykPvv9nO42e8ZXPQWqUadVgjJCeZpV1bJTQjAABB+Vkp1x+1YUDDwc/1HU77t1xEMVH5dQyFITDgDN7w5JcPx6OfJfcJADT1T7ncNC7AGFw+cF54ysbFk4bNkBLC47e+94vM6bMZpzLs36YjAY8dPtFwa6Ldibv0InZE/4ho58tXfTX5oBVumq8YghwLc6PnHMyn3bWQLXuj6hbhKL8+ZoQIR/+uwknPjcHl8/5ih8qLZecklRnk02Ap7VD7dOtPSvXSR13xalxzaq1ikgSR96xclzw5mes3/R57LPVW7xPXvLzhyOw2Aj2eqIRExezJy44jU84vW+99K4UYFD+uOo/GvHcZ/Vez0kLWMqoFknyVQI35mhpzWfznhqXZTQEMSHVPLTgEsfzE97Q0vnHLYPP668k9fFlap9vOOh9QA0BUK+Ci6+JzGQ24oLrz1Z/Cqo5RbVPoIaI90fevnwUF5S6PlyG9ePPTx6UszmM1XWL1vfEYmGXAODMa58t/nP1fwGDaYhq/oNLfMy56jx+/YCe8So+Yjl2VOnDBZv+Q49n3sa075bw/PJKSeK+hT8xtawdcnC5ZnnO3bVWEXe/ciC/rAKTv11MJzw3hy3csjNYY5RcDyFGXMTEFfWuU/vxN688p74IcVlBfPLb+t007tVv6rwhI1le9jQi18MuGSTMteeA9ec5kx2+3NXrHFcznxzNK0RJQcJZQWI+YV40Zig3mnyMVd9uWGkABsW+WyKD3gXIS/AaIP6eojRr1wRGbbj5ANrZBUR8sp354DzmjjCt12ivGygrPRndOjRTuw+iTUxSynLOMfCKx8uWr96WGejAmuRGBAAWowGLbrtaOq19q3gWH7FsWyy/j287UsD7PjcHt372M0oqq7nkpyLb8XiL0KYdIsBoNCArMx2tWjRC+7bN0Kl9C/Tq0QEd2jVHrx4d0LFDS3Ro1xxtWjZGVmY6jEYDQjGyuN2y6jTU5T8m1c4pHCiuqMKNn/5E/Z+fyw4eK41430KZe1e8ERMRcnanNvzbGy+XzIa600CgL/5m5VYa/vQnx4ukJllkjTPOAafk83K6Y/JilYxEU3uuQX06GFKTrQgiQmqtIK9Me0dT5x+PmC0mNG/TpN7vA7hhvaD2OYeKVjbCoZAO4CiAOqrC141kMDA8OmeSlNu0gdzPjiZaStsZ0QX2yMECPDT6ObcAqffZ3huLA0tfkrIz5RWvhz6rYsesnkXfyx4tXr91X2agAz0tH2YDw3c3XSF1VJZ1I5JE+5qq7RYV6fa528IlznH+G5+yrflFrvoGvlM01qTSVSYDiACzyYRGDbNx4Xmn8JHDz+I9e3SCxaK8ZFR1tQP/rtmE9z/5kX5Z/DflHSmEzW6X6QrDIUkB2uXRt0SEHk1y8M34y6MpGLQ0b8eKmNxDq/bn4Yq5XzGHjHoebgZ1boGvp42UHvjwV3rzp38p2JhijKFk1WuS0VDvIaQa11XtuakOh/KK0fbsycwjV7bPcyMiRozwzMf3SxnZMc1YqSZqCC7p0N4jeGz8i0zyuif8pON1wFXXpUKFcw0LPU+oEwA8790eXwtuTpNsPPHeVK08zdLKEwQe5GfFTBv1DCs4XOi2fgSs+9GqaQ62/PiUkmuitziBmMR8VNscOHH4w8e2784LWFrac9NmNRmx7K5rpNwUef7TUSKa11MrCzx5/e3vXD2P5x5/e7+Oj/7dSA8s+J2ckoSaEh71C3wCitytTEYDTujVEQ9NGctPPflEHorYkEtVtQ0Lf/mLpr/yIf27discQdJ7Sq7qiL6uJXkHspgNDA+dewof1bdbtK+9VubwWBH1tXN3UQnOee0TVq0g3euAjs1w7ek9+R1v/Ug8UBFNAhgxFP49U7KY641tta6lVvYjAIA2Z05ih4+WAByBHmgwAGjcIhePzpmkqfOPIrEWqLXz3b0jn2BFXoH/fgQIANwC4E01Oigc9CxA8gFk12mMa0HydsnCzY9dx08Y2FULGxKtL1whb9xKCo5h6sgn/Vs/iJj7yhAIRX/PDFYUyhd6KRQVE/GRV3AMJ414tOjgkZKAZgxP8ZFsNuG3O66SGqbKsjxFi0QQHxGlqLIKF86ez/YXH6stmuBTfBDJCjBnjNC5Y2t89M6jUqcOrVVr1+YtO3Hl2IfY9v/2+rGM+LeEoPa5hudvgHYNsvDF2EuljKSoVVfX+jweDaK+4dxXUoqzZ37MquwO2e/p1KwBth0qRDABEmDNUfNaamYTX11tR2a/W1194V+E1BpVp3/5kJSSquoDrFgRawFS2+/LFqygD178krw8azn37WqbD6CxOl0UOnqdSHPgMjl5U2+gJKVY0L1fp7jbkESJkIttvXL/HJf48L2NqBP90ad7a4QgPoDjm8tIXs9ouF1FXXwcK6tE1/PvL5UhPphbfKRZzVgzeYza4iMWBRjjivf+3kADps9j+4vc4oNzb/FRm9I2iPhIT0/BY9PG84I9C6VVy+apKj4AoEvntlj3x/tS4d6fpfvuuY6n1tvUUCD/dM49g9QBgAM7jhah3/S57Ot126I11jSzcYwhUd8rtMhIw5rJY6QUi1n2e7YeKIAkBbgcNSPAaGTg8Tc1RAyLxYQubWsKRZLfWFpXLAjnmPnAPL3uHZUS6xjCWgYM6c0t1nr3gr85LQdAZgzPNSLodRBNRT1Lh+8L0757G66R4HM99bWihTtvXz727zjk+sFn5qu6k9mS9+8NZwGP1ITgDjSNJDGJ+di0/SCaDp5QVFZeGSTbFdXmWEwxm7B28ljJrP69EE0BEncbwxs/+ZEe+uF3stX4AnPX8y8f7o3+Xa6IgB7d2mHX+vnSkR0/SFMmXMuTrFGzDoREktWCh++7gR/d9aO0bdUnUpeOrWtDLv2JKs9U0t5+6zanhAlf/0p3ffGLnq38WiPqD1esJiPWTh4jWU3y3QC564m9j98f/6XZbEKQZE9qoKkTWvH5Q7Xzp7/9lPvBx86Ne1B4pFjtU44n6j1YNVvMaN2ludz3E4A71G6EUjR1Ayjgxvq/qr9KESNcc/dw8dgjNGSPjXnPfebX9Qqoe2X6dGsNAwt72EViEYz0uIhFRidpw7b96Hf5o0V2u0OO5QOAK9vVH3dfK8mtGhxFotlHcSU+CisrcdHsz9nCrbtqTfCSV4Cou66Hv0Bzxghnnd6PF+/7Vfr7tzlSk8a5ajdLFi1bNMHq5e9KBXsWSkPP7M8Zo9qHGMcrt7va7Y4tI6qfpFKSOL7esJ2Gv/MFK6msjvRpxtV4U0DUXVKMBoald15dLztWMDxFCHfpktpfNMnJgI/4D4EHJqMBHVsf9+IJlMCCc473X/xC9QUlRsRiD+nzO0befomkoF7OXTHul7DRowBpCcC7yJrPC5KWkYLMnPTgnxh99NjPsqisqMLOLXsB/5kzjmerAWH5R/drYeHWm+WDA+C//bWZBoz43zGH06lIfCy+46po+sNroY/i6iHDxsNHMXjGh2zdwfzaR/s1PtmelcyJGPNp9WCMcOXwIbwib4n03WfToxpUHk2Sk6z45pPneUXeEuncs05yGAyelds998EeP3uvzRxYtS8Pp77yAdtZUBLpU4yrcaeAqIuQhqkp+ObGESGJkJr4qNqUzQBwzind/V0rtdcjTW3i137zP9lWkM2rtpPdZlf7lGNBNO/zgJ4YTVo2REp6/VJ3fg7PBKCPp0w16HFj/JL3L/wpwv5n9tbCAqGpCSbSzLx/LnPVLOZ+BMjx9l91oSYq0buzDEWKmIiPH5etp/NverHa4XQGy3ZVKz6sJiM2TxsvNU1XPWViOP0tZ8xoYVxFhAWb/qNL3/6ClVfbahvmbVlk5NvqQQQMO2cgr8hbIs2b9XA0+kS1VLRff/ycofLIUmnomf150Bh7H95oJZXVOO+NT9iv23dHIzVypI/VA1EfC50bZmPLtBsVu416L0VWixnPTrkyUP+rna5bU5xzco86Dzr8HSc5Jbz+8HuaO38dISuetf8ZsvexBOAptRulBD0KkLPkHGQwGnDhdZqofB63N6jD7sDOTXsAGTcRgfD2E+O0cj1CDrb3Ihapgfm3i1fTpbe9XO50SgGjMz3FR1ZyElZNul5ioVSDizyhnoQcsaj2E8yIMWfFOrpj/iKy1aQirUnLX1d8MGK+6lE1a5qLyiNLpfnvPxPJe8xXkTbv38Ui6UItbotI40bBajrVFyHVDidu/OQneuuvtZE8X7njj6Df4ob+xlTURQhjhBX3XOfXghtggmA1r/Orhw3gQdxP1V6XNLUP++r1Oz0ESGAryLa1O0hSUL9Fx0RyjChKpjPs2iGceRfr9C8Mh6vSOyGiqYEvg6YA6qRJ8ZchpWGzBrCmqO52oondX7TO/5t5P5PTKfm1fjCPa3PJ2SeqPcn7a1+oG6hYWD6wfus+XHHna5WSxAPmPPRMR5piMeGvCddKyeaQMo1FmlD7KaHExy2f/kiP/fQHuas18xrcrx+vEO7tDww8MGUM37F2fqT6wlNgyL0vIiXo5X0ZEXZv+FK65/aRQawh9UWIwynhiYV/0j1fLlJLhLiP19PYDbRZiroIyUqyYvmdo/zOZ9x/X7LUZOuRmY9cJ2ft0dP1iDqn9+9c+29/IgQA7DYHfv58qd73OXKI1P7F7Uor+/NSM1LQoGE9r2t/fZ4OoGHMeydE9CZApkPGZEdEGHHrBVrY8Or9xgzYh4u/XB64fR51Pz54/kYtXI8gZxq145XCAfCf/9iIfpc/Vi1xbg14Mh4pkDKTrNh47w2SRf1sV0Do84uE4H2s5fEkG86BGz76kX7YcjzY3Lsasb8sVyajAYu+fVV6YPKYSPRFJESEp3iJOk8+fCv/8oNngmQ5rB8XwjnHF+u30Z3zf461O5b3Zt0tRPQwloOJkKhe81SrGRvvvUFK8UrfTqh9Guzz3CqrqtN+/3eb3P5VU4Roaq/wzRt3H48FAQW0gix4/1dNnbuGCXl8XXnHhVxOfSe4xtFjajdULnoTIBd4/uDPDGWxmtG1T0e1J/W4vin/WbKObNX+A9A8r03f7q0h8+aRS7T82+UeF+1UsvzTH1bioptfquacBzTjER33eG+QbMWaKWO08iQv1D6SEHxeiotig9V2B8574xP2y/Zd5G6N5FXX4rj4qEuD7HQU718kDRrQMxKnEg3rRUwsIueePZAX7flZyswMEufkIzj9m43/0QVvfsbsTvnVtwMgd0z6mj/cgahaH9PB2hjV/QQRsPHeG6Sc5LrPY+i4Adjz6TIHIDmcknX4ba8Yvl28Wu5YjMR1COX9mtovmIyGOnVBArW1qrIaW9Zs19T5R4lwxkVYY6p7v87cJD+L21Ux65Ew0ZMAaQ8v9yv4uTXadGkZ6Q1vKKh+AtHkq7d+DOz84GG2XfLBfVrZFAc8ZZnHRPO6cgD44Jv/s3fV8VFc2/97ZzcbFwgQ3ClWKtRdXr2lLXX3V3d9v/ZVXt1dqFPHKYUCbSkUd3d3CQmBhOjK3N8fK5ndHbm7O3JnM9/PyyvZvZk518495x6bjZuf+tIvilrKByHh26ninCwsfIIb5QNJjhOL8hEZJztje+VBnDNoqLBmbwWkyoekiWKK3bNOP4buXDtOdCWYIUgGRt9cG34zDgAZHjf2rP9dPOm4fhrUxBiRKLBidznO/3y4UF5TqwcpqSgh4b/naQ+HaUqkj4bP94InbhULYurYhCwhAmT86w/W1uPGJ74kI/+Yz8qT9JiHZP6eK5lh9rBnJRmxFK0gFAB+fPdXrmg3CMmeOylfmBFC0KlH+9jPlPZaLoLZYrmHnRSQN2N+l13wRCA48/ITrRZQ0noz7t62F+WlFUxtj+jdyQhl0KobcMMtH6P/XEBue/prryhS1esOqU9Os5xs3pSPZPgKq/LBUz+Twtq9Fbj8y5HC1ooqAFFpdgGE4z3iU+wKAsG3n/2Xjhv+jh5rn9VCode7DMff4z4RP3vvcc24kNiihRvK9uPCQcOFdWX79SAjkYw1SpTyHiOi1UfD53vZU7fFBaZLlJBoYilog9eH257+lkycvjwRHp6qNSTRv+VKbsj0uNG9Y0mQMKJOW/mefThQXmU1ybxCF1nl1EtOSMQN6wWrO80CuyggAoDzpR8oaeTZOVk49OhejgKSOhTH8OcPRgtUpIrtpHMzzTjrB4XMbZeBMLyI3rAJ83DtY4PqAGhlu4ooH71LirH4iVt4ElaStXyw/B1P/UwKa/dW4JKvRgp7a+oAxGe6Ukqxm+F2oXT97+K1V5yT6lpnsUqEb4BZ54UFprhk3XrDxXTbql9FtbgQQggJubpFUFpdi4FfjRS27telVgir4KplUU1VEdGDLyZbP8Pw+V765G1ilxaFUZ9JYkIaOxC6pff6fLj+8c9JAu5Y4f4nOg805r+JgCvZYf7I56KssrKdpVSkIsUP747kinYOoKtFs//Jfakn28Pa/BqrO88CuygghwJgSulz2Am941KWOUgKsszT5/Vhw4otjY1kMmCFb0uK8rORYWwwdJS/r4HvMVz5GPP3InLzU1/5KIVWwHnkarx/hxJMuPsq3oTyRA+hsJCb9kHn41dtIJd8NVKo9/lDHYrOdKWUYre4eQEO7p4i5hfksb9MHlpCodGxCKbUEWnZojkObJ8kFhYqj5cgEIHSYAWj8Gc1Xh/O/WyY8NfazXrQmKo7lhTJKiKp8kUt+rWebfh8T7nvOvHQNi1iX0piLSGh+oSorWvAjU98SSbPXpXsRYlW4gAq8zeJgCshPivTg5yQpUnQuH5fvWg9UUiImU5g7aDuF6PuDDd6H9E96pkq6Xg9AHqYPzyJwS6S+vOQbEylQSeE4Kr7Bli9A+wypklh7OC/mPN+D3n3XjPnwqhxN1z5mL5gHbn20UFeURRVlWxpnY/TunWko267jDflI9GxCtPPonxYva9Twphl68jDo/4mEeUjqHpEKx8yw3Bon67YuXZcqvOsZfWQKh7SMuNGrH1TBCy324XSDePFHt3aK7QgIIQIlIKKEqmp3ufH/SP+IuNXbdBLCWEdE1YLYDIZnZJRYFj3nFYbw5WQcXdeKR7fpW38SyVyglTRb/D6cPmDn5CFyzen8tpYy4iZ1nhT8cWLNwf7pDKLlFIx4A9g4tCpXClQBkCroKWhlzg3PnZ5rBuW0ngTAM9YMUCJwC7C8ukxv8sOek5+FnLzcrSf5iBp/PPb7JgwzmiEa39kZ2XitONMc4UzSlgwXPlYsW4HLvj3u9WBALvycXyXtvjuhgt5O+iSsXwATSDo/O91W8hjv00h3pDiHpvpShAEWeWj/xE9sWDqYD2UD5a5iS02aKQgYdq5s3zOz2Kfnp3lB4aQSApXaQxOgz+Ah0f9TWZu3K7HGCRSI4Q1JkfpFl7LGswqGCUiSOtl5UkJQ266RDyyfUnsS6MsIVKFv77Bi0vu/UDYsKVUj9dr1XZIdA9zJZddfu4x1JMRDEkkGlaQib9MSXcFRAkJ1/dIBnmFucjMYa5vdz5rQ6vA1UJXQGsAEUdPtQ3Q/5R+Vgsq6bL5ZBnmyoVro1LvyhYgDI3AP989aebtvBEKiOHKx96Kgzjl+tcavD5/rmrnwsoHAU7v0YEOuekS3iwfIeoS6z+aQND58CVryL3D/yR+ifIh+ZoElY94HHdUH8z668tU+87qh28F3zLt7Fk043vxsEO7y3dckuZYGhfiDYi4bcgEMma5LulF9YoJiYVUGWEVgLRuaJMRorhQQkbffpl4cteYTEFoDEyPtTruq6zBmbe8KZTtrzaSrDBS28vE2kuY0Z88QAH1YHRKqdhQ24D1yzelixyUCEzr86HH9oxeC8pz0hxAkXVDog07KCB3InpyFd2vLrrxbEcBMRC/vD9G1cczfJC7XS4c1tu0LHBGjLnhyocoUhx3xf9qausaVK8zBInl47iObTH4Oi4KbMaRmWj/Gf+Gx74y471/5pH/jJ1KGvzBOhNizOYJZrqKx1UDz6RTJw7SQ/ngHabROG/KN+JF550ku56kQhWVKCEN/gCeGDOZfDYjoaBlJSQSE2IGYpWXVIoi6u1qljR+vHGAeFjblvEvjVZCIiirqMK5t70t+Py61ILRE9F7g8JnpRJy5vF9qBAyJmkoIfj5/dGJpLTXw+Kq13NYITcPpsl+l9xyTpQbllKhSATX0K1m0ZUM7HBI3cjSKDMnE0UtCqymNR0gy+QOlFehfE+FartwcPTrj15hJqPU203C6FS7EEWKIy55/uCuvQdULR+CxH3gmE5tMPSWtLF8JJKP35Z46c9Z5MNpi0hAjLJ8xMR8xOPaK86i33/xQir9NqX2ho4w7eAe8cNrdMD5J8uMLUG0q06ji5w3IOKtKXPJm5PnmKmE2Gn+EoXhQuJv/75CLjBdqoSIUiVk9cadOOe2t8wY81T4twcUuhSrSRb/vTt4+aUi8IJSKu7eXoaaakVSCcNPIhBk/j6d9w9atWsBTyZTTiYAuM1qetVgh4nqFP6HmvvVMacfZrWwki7WD9lxHDv4zyjrh5L7FQHBfTeeZafYj9jnGTWPkcPn2CtfrFu7eZdq6WapQNSrVXMMv+VSXpWPRCoMJ/I3PPaXCZ/NWEy+nbsssl/iLR/xAeeEAHffNpB++9lzqSofduNDptI7/PtX6a03XBhXKyRU0jMqaDmcIUsUKT6fuZR8OXupo4So94sVpgSmd2vRLP6lCkrInCUbcc6tpighiY6TFNkm0KeIp+66SDMYHQCoSPHbN3+qtVILnE5EgRA0vjNqjVkta+Kw4/uw0sB1JizemdypAKR5XBXdr869+nSrF4XdDv6EMHfyEo3K58Ej/djDu5hJlp7WD1OUjzNvfrNy+drtqgeJNOC8fbMCTLznal6F8USVD9a/sXovJ41fFq4ib06eS0QxSvlQzXZFCPDsk7fR9994pKkpH5FhMfNln733FH38gevllJCY+hGNwekBUcRrk2aTEUvWpKM7lh5Ipuieof37+75rxDYF0UZmaXaskBISoXvGwvW4/vHPjR7zVBQQwUo3LEEg6NezQ5Aw1WB0Smf/uVDu+0TGVosnJOLmZRZMe9f5158R7YalPB8ZAPqZOAYJgXcF5HmWRp7MDLRsW2w1rekAWea2fN5q4g+lD1VqF749/OH1O80Slo2wfhiByHhc/sDH1TMXritUayxVPlrlZmPGg9fzqnyw8g4xib+xpQLy6l+zyTPjp5FwpKu821W88vHNp/+lTz9+Syp9NqXIn8Ewlf6Xnr2Lvv3y/TQ2o6UgU0k7rISIIsVTY6eSD6bON0sJsZtSyZ0SMvuRm8QWOdGllUiklmt0YDoFxag/F5CbnvzS6DFPnqdTa9fDt6/eLgJacSCg3gYf1izbmKoSomUpSeUZRsC0d7Xr0hruUGYyhnczydFWgGcFhAA4OvKLisZ94nlH21Jg4RCy4xgbfE4VItEL8nLQoZ1piqCe1g+j9kHkoPn3M996x01ZopojWqp8FGZnYt7jXFU4jyI10f4jOYXFNrhv+J/ki9lLiCgGpRkane0KkuL1ks+Al5+5k6ZY3ZxnHp4ITBe277vzKjz1yE3RHu0kOh4kDKkl5P2pC8lTv/1jphJiFyRb+dvQNbzgiVvF/KzoCtIkuP0kSkjjmTbqzwXkwZd/stO4m4a+PdrBk6Edf0AppT+9GxWMnsz+Jgl+nuhzbI0jT+7Lut/OsJpWJfB8eHUAIC1lq1x88F7Liw+mLeprGlBRfkC1TVg5/Pa12+wY+2HEHojKxX/f/74PfD9mZobau6TKR26mB0ueuI1nQTzRGI5kFBbb4IERf5LxqzcRhCKX5ZSP2AsUQoBP33mMPvbQDam6XaUTzOpPWOglL/zfHXjxmbuilBBCCARBEGKtIWElhFKKYUvWkMfHTDZLCeH5nI5FsnvY0Llf+sRtYo4nWnAmklsBShGxhAREEV8Nm0r+99EYwxOS2BFvhJLMqF0KU0pp2a5yxHhOJIPYtZ/MnBgxj5bLnDc+chmrG1YhgDZW0ysHnhnb9SyNPJkZUEil70AH/PrtRNKYmFIe4fjNC0473E4KCIVxykdkHB5++Sfxq+HTVG9/opWPDCx/6jaR8CtaJlq7I5ECa7bDDT+MFcau2hh2u6KxygcQ764Qjvm49cZLmrrblVK/jEJE8ZB++MRD1+OR+66Nz+1DCASBCNKDPVwrhFKKEUvXkntH/OFYQuT7kygMtYQIAsHSJ2/VUEKi3bHe+no8eebdkVaOO5c88e7rz6QERNUNCwgGo4//MaKkpzKO0nWR7HPMvNwwBZ7sTFY3LALgGrPoSgQ8S+53h/+hpmkfecqhPGxSOx0OSpAdx7l/RwefK7lfXX7uMTzMQyIw6lYkMg6DR82gg4ZOUT1YpcpHptuF5U/eLgr8ah/JZK9K25S7N/wwVpixeQeClo/YCgOhzse4XhECfPXR/+kR85HOMGIDqCrCrz5/D9548X6ZBKPBaunStMmRWiEUGL9qE7njl4lmKCF2igdJpSK0YWs7w+XCsidvEz1uV9TnsUpImPKAKOL97/4k3/860/D4QAVwyxMHnHmEJm2UUjp9/Fy91m2qFy56zqFan0zdo32P6cm6Ru4zky5W8HqQ5QBoK/ld0f3q+ocH8rBJ7XIwqCFuHPdsL0NddZ1qu7By+P2bd5g1D7yu2ahD9+MfJtG7nx8coFTV8hGRdzxuF2Y8fIOoUJuOF2gRF3ugpm3cx0VfDBdmbAopHzEVlqWQ3hKGA86vv/p8R/lQhyXptR+8+yp8/NZjClUOCGSUEAoKTFq/mVz+zWg95iUVwZ03cKmEuF0CJt93jeh2Rb8i5CRJgEZXu+C/RTzw0o/k2xHTzFZCuF4H3795p6YbFgB68EANDpRX6fXaVOdAj3XF1UXATU9czrpOOgHIZGxrGng9zC5loc2d4YIn06P9NAdJYdinY1UrnwNBAasoPxuE31t7MxB12I6dvER8/M2hAUrhVvqDoNtakJEJAsHsR24QW+bmMLzKMmjtxyZh+QiIIgZ8MUJYsbs8SHzQ7KHZB7fbhcXTB4s2CziPimUyGXoxlIQEhttvvgT//P4pXC5B9lFSl6zI3FNg4fY9GPj1KEEUU17OaoK73Zgsl2u9fVEBJt9/bdxlD0GjJUQUG5UQr8+Ph1/7hUyatdJIJUQ6VtwropkeN3JzsrTdsCilv3zEVBndLKRKC2v6X1OQm5cDl8Sip6IQCgDONosuVvCqgNwc/oeaht2yXQu2pxkLXscwZaxbGptGT14bef/p6+wU+6E3og6LMX8vDlz50McipVRF+QiVPQv+G0NvvlQszkkr5QNIUwXkqu/GCMt3lwUJ11A+woez2+3Cstk/iL16dk3l1WbzGalQZIUSoqcCkhCOO+ZQzPn7K8hbI0lUUgEaLCZBAWDxjlJc+8NvRltCeOSBakhl7Ri25jsWFeDba8+nseKF1B0rVgm5/IFPyB8zlhtZ3E5EvDLCLd56/EomN6xVC9ZbTaoUZrhxmbpHW7ZpzvruG8ykiwW8Cs+nSf6tOKBX3nOh1RtV7/GjGj9GIe7ZS+esJn5fILoRjXe/IiC4+sLjm6oCEjUv46cuE6955DOfquVDkv4RBHjz4tPpMR1bW90PNSTqdgWkoeuVLxDAWZ8MFRZu2wOA1fJBkOF2Y+afg8Sundun8noz+bSS1cMKXmvGbaUs+vXtjr9+/RDumHiByIMlLjtAY8HCuVt24YJBw4SAmPLSVuL5hqetNQBcKiGnde9EXzz/5DgnWWUlxIfrH/+CzFmyyeDhsgduveLUUDC6uvuDz+vHplVbrSZXD/AmfwAALrn9XFbePMBqWmPBIyNriWD1RlUQgaBP/0OsVECMDGKW+zFy8ceN419DpzK5X/U/tLOBZHGNqJuqmQvX+y+7/6M6URSzlP5AWgALBHj+3JPolUf0slqJ1oLaumsSlo96nx+XfDlS2FBeEex0Am5Xc/7+Sjy8X89UXm8mj1a7fbXCLcQyBQQATjrhcPwz/hMFdyyABL2xojJkAcCq0n247JvRgtcfYHyTItTGnMezWw1cKiE3HnMoffi0o2WVkAjhEiWkprYel9z7gbB01XYDh8o+6NWtLZMb1tjvJllNaqrgUvkAgP4n96NEYq1VUQizEF3awnLwyMQi6cLUNOv8wlwraeQqEMkIbFq9LfYj2YNw6Dv32LXyeSqI6vOGbaXes259s4ZSqrYoo5SPf59wOL31uMN4F8ITVT60/iYM7n2cw/D6A7jgixHCqtJ9wU4HtXJV2gkhxOPJIJuXjxL79umWyuvNtnywtLGbEpISjj6yD1bM+UnDEhKvhCzduRcXfznCaHcsHs9vNXCphDx82jH02v594pQQaR0YaYa7qupaDLj3fWHn7v0GDpU9MPqj+5nmdP1yrqxGvNQS0Q05eVEu3Gq0XmY1rVLwyMDulfxbcSDPvPyUdLN+cPO+xTNXkIA/1v0q2hwiCETwZLjRrk2ztBwDFUQxXK/Pd6DvBc9UiyItVKNdkCgftx7bjz5z9om8C+BqSnaqAhHvfQcAHKivx9mfDRE2lQcFjZBwqUq7IBAhOzuTrFs0lLZq2Vyv3PdmQFojQzWzjQV0WYoundthxZyfkKWQ8CT2oiyshKzZW4HTP/5ZqE+9GJujhBjc19cuOo1ecXh8SlMSUkKkhQoBoKyiCidc+7LgD6Rs5bI1OrVvAbfLpVmU0Of1Y3P8paZdwL3CcuI5R7Hy5XvMpEsLvDGvDACdtRoRQvCvgZYJcFYciKa+c+TnE5jed8PF3AvReiPq8Kyr99blH3lPJYDman8kSJjz1Uf2ps+fd7Idxk1N+aAJtI+FLeI+6rw+XPPtGGFrRVUwKEKmwGBU5wmIIAhCTk42Vs37WWzbplUqr7eSL4cVELW8+3ZQQnTlmZ07tcWCad8iO0s+k2WwcDqiLCEUwJZ9lbhq8K96xYQoPYS3c1wLXCohb19yJr2gb9foOEdIlZDoKMiyiir0v/T5Jq+EXHrWUVTLDQsABr813GpSk4XllyBauOD6M1mroh8GwMX0UBPAG+NqA8ADqLtfZXjcVqbfNXIxWrHQoxgupRQVe2NNy9HWj/DcfPTsDU0p+Dzq0CzbX+MvOvrefQjm11aE1Ix/5iEd6RsDTreD8qHEF9SUj7Spdu4PiLjmu9+ENXsrEKp6ra58hOpJFhXlo2Lrn3ZWPmS6JjuvZrti8bD/0b1rB+zdOAH5+fIZ6wiJTpsVrhWybFcZrvn+N4HqM2JqlhAC+7gHc6mEfHrFufSkrtEJI6RKSOxFxPqtpTj0wv8KB6pqDBwqvvHVK7cyrezy3fusJtVMmLoHc/KzWauiZ0HjwtRM8HTYAcCDkn8rTmCPw7paJchYMV5GL+SosfxrxDQZ96vY7FcgzQtzwXnRPL0Qd/N4oKqGdjj14Z0AVFMbSZWPozu2wTfXWp61jQXJuN+kTeB5db0X5w4aJizdtZdJ+QAAIgikuHkBtq8ck4pQxWt2IzUlpMkhw+PGztVjaVFRvuz30mKFQGO2tPlbd+P8QUOFBmMD06UKSKqVo80Al0rITzcOEA9vF32JEKWEiNE8Yeuucpx4zStCbV2DgUPFLzI9buTnZGlmw/L7Apg1cYHV5KYtOh7SjrXpnVbTGgZvB95Alkb/uuIkq+k0E6YeIrP/XKT6vnB6wlceuaIpCCBxh311TT16n//MVkqpquWDSJSPQ9u0wIhbL7WD65GasJlK0DlgA9erep8fl307WthYvj9c4FyTZkEQhKKifOxcO07M8LhZXqMEnoVFHpQQbsbHk5lB9qz/XczLk7OEECUlBGv2VmDg16MEX+ouO6wWKDsoIlwqIWPuuFzs1Sr6olhNCdm8owxn3/a2UFNbb+BQ8Ysn77hAww0raP+bNm6O1aQC8vuBwF4WxDicPiCuHIJSP66zmtYweFNAOoT+q7gABJeAvkf1tEL45W2sDEHp9rLYj6KtH0LwluOWy0yNY7CCIcgGHB858LnKisrqzmp/KEh8MQ5v1wrj7rySe+E7hER9/tPG9Sogijj386HCuqDbFaVaOagRVD7y83OwZ/3v6Wj5kKMzFjzzAKNpE0o3jBdzcuSybssqISIF6Ko95Th/0Ag93LEScYPjXajiUgmZeM/VSkpIXI0QAFi0cgvOvu0dO+xl3fH4HeerrsWwF8X2jbusJjUWROFHD8Xd1D13zJlHsKbj7W4mXWrgabMUIxQco2bKy87NZH5gGsDUBbxg6jLN7FcA0Kq4wOJhMRTharRxOOHqlwPbdlWoZbuKsnwc3q4VxtxxuV2UDyVeoEZ/Wrhe1Xl9GPDlSGHrvirQoO6hkWY3GHCem5uN0g3jU51fngXDWMitEZ7n1lDaXC6B7Fjzm5iTLXcmkSgXTKDRHWtDeQUGfjPK6Doh8QTxdd7HglslpE9JcdRn0npOohjNKxav2oKzb3mT53E2DM0KcjTdsAJ+EZxVRgeUeXCqirupvJ0QguwcJvnYDSDbTNqUwNNGuZml0REnHWrHiryJvEcAWzpMPRA1lhN/nqz6vvCB+uzdF5s9B0a/L+xiJHsI+vwBnHTtK2TRyi2q2SOIxPLRq1VzOykfSvOuh/LB9RiIlOKGH8cJq/aUh1UPzbVGiECaN8vHtlVjREFImoXyLhCyoilbQUhOdhY2Lx8lygamk/gq0WHtdsmOUtz00zij64TIgec1l8p8Gdav8XdfJXYujr53kighcTxjxqL1OO2G1/XIfGYrPHH7BZRo7FFKKX4b/IfVpIbBImPZ6YIIvY9hLs59o9W0Anwxo2sAqFbVJITgX5dbksI0XVPvRo3l7m17Vb8PBoAQ3HH1aTzfeibaf83aDmff+qawYPlmreJzEeWjU/MCTLznajudPnJrTYv+tHC9OvezocLC7Xsit9Na7QVBEJoVFWDXut/F3JwsllfIgXeXmETRlLLhxdFUWJiPvRsnyMaExBYqBBoTG8zZsgsXfTHcKiWEx7FMNbuaYfLMP/dfJ7YrjC4iTQBCACJ3cTFv2Uacd9vbPMlXhuPhW86hGgYQCgA7Nu2xmlQg/XgwAODsy6Lr46lYpK5heJzh4GmD9A3+R3kFE4GgXefWZtOVdotUDkvnrCIBf7TMKXVFCS/kjm2LE3yyBghzBWY9ED7gwtYOzeeed/s7wuzFGzVqQDQqH11aFGLqA9enu/LBwje4rnZe5/VhwBcjhPVl+yEmoHzk5+dg9/pxTcntigVN2QoSJIoQlG+eKBsTIicEhNO5rthdjoFfm+6OBfC7BlOdL8P6NfPhG8X2zaLdj0PaJZGznc5YtB6X3f8Rr+OsOwghaNE8X/ESOSxO+H1+HmJBzPRqMQ1dendETDZwpfcfZSZdSuBFAckAoOm8lleYw/AoB8lg3OC/iJrre5ipvPOfa/Q90GlCrjws7xZVfhI6pM+5/W3hn3lrtCwfRKp8TLnvOrspH7Hjr4flA+BY+WjwB3DOoGHC8t1lYSWbSfkoKsrXI+aDF56rN3i1gpi6DneuHSvrjhUblA40XvAs3lGKsz8bYmZ2rAhZZo5NAuA2qcOMB6+Pt4QEjwAiV6x0wrRl5IJ/v8vrOOuO/951ESXKl8gUCCoiv3w0xmpS0xbZuUzhHbngYP9bTkAIF4LBJHb+tWc0FfcrMxA1luV7KpQHIBT7QUBw4emHWylYUoUfqZKhC0674XVh2ry1qgHJ4dsvAOjQrMBuygeQuPIh9zdy4HYcNldU4dQPfhS2769KyPKRnZWJJTO+SyXmA+CH3yYLmuR36Yyo/ZCdlYl5U74WMz0Zcc3iXLEk2da2VlTh9I9+FvYcrE6VnnRRQlJdT4b1a+bDN4ptCnKjX6aQGQsApsxdjbNve4vXcdYVd157BtOVYumOMu1G6QHT5cfTBhzHmqL7TPOHIxq8bIr7gKAJTwmEEJx43jFmH3LpqnxEoa66DnW10UWUot2vgv9tzocFSk4B0RU3PfklmbdsEzSUDyGsfLTMzcH0B23ldgXE731WpqUFbgXRiro6XPb1KKG0ujbsAsOU7SonOxM71o4VW5e0SOX1vPDaVKA1t44VBECXTu2weflIMSvTE020XDxIMEMpBYCdldW4aNBw4UB9yrUkEu0vj2tTjzkzrF+zH7lJLIpxtxMaa4TE0T5zwXrc9ex3TUKeKMjNVos9oABQe7AOgdTdDh3I4MxL4+KklebiIatp5YXxHBf6r2r9j6xs01PwpjPDiCzS4Z//TqhIZb+XMpK3nrqaW+FSL9z93HdkxMT5RBSVU5hIYz5a5uVg/uM32035iF3XiRQ20wKXa2R16T5cOGi4sL+2DiJDjY+gqBiscL5+ybBUAs4BfvhsKjAzVksLPCkgss9u3rwIy2b/IBbE3JTLCWaUNlpCymvrccFnw4RNFZWp0pUoT+JxjerBVw3r15InbhVb5kZfyoWUkDjLOQXFD2Nmkgde+jGdZQoAwEsPDqSAYhwIBQAxIGL0NxOtJjUtkVOQDcHVuOxVLvYtr+jNC9PRvFovbt2c5Tm2rmRpFdYs3qiSeaxxLK+58HguhUu98OQbQ8n3v84kAXXlI7Kdi3KyMP8x2ykfQPT+0NOKxOVYzN+2B1cPHiPsrqphtHwEUVSUj03LfhWLmzdL5fW88NhUwdve557Hd+zQBltWjI5TQmTjQYKloikA7KqqwZVfjxJW7ClPlYR0UEK4toTMfewmMT8rztIlBJXK2I5QfDNiOnn+w1+5X7up4I6rT6csHVw6c5XVpJoFU+fb7XahWXTaaKX3W17QjQeG0x0ME9T7yO5a1ZiltTP0qKeR1kwiDEopDpQdiP0sbqyzMj3QSLFna7z91QTyyc+TtZSPiNtVcU4WljxxK5cCtwaScb0CtPcDbwIqAGBt2T7cOXSiUFXfALkg0bhOhlDcvAA714wVMzPdqbyeB/6qBxJZ51yuAwPpUn1uTnYWdq4eKxYV5Us+JYpB6eGH7autx20/jhM2V1SlSp/dlRC9LkgM6ZdACJY/dbtYKPHOCFdLpzL8RqQi3v56Avnkh0lpe5gKAkGGR5tv7o+ROxzoh979u7N6NLSykk4emM0DADQraJ5wTn85vzYWBSNZq0jaMggpVi/aQAKBOD4Zdr+KrI8zj+vNq2CRMoaNn0v+98kYEhADWjEfAICCrEwstKfykUzQudLfxoK79TFtwzZy9be/hd2umJWPgoJc7FgzVnS5mnTAeRiJzmtTcsNiemaGx43tK8fEpOglCu5Yjc6we2vqcMXXI4W5W3alehYlyqt4O/v0mjvD9uSix28RcyWJB0KFCgW5oHSRivjPuyPI6D8X8DbOuuHYQztDpSghBQCf14892/dyd24YANPn+cjTD2VtepfZtEnBwyF5fei/qvEfnQ5pD0m7ZAopWbnZedtkEXrGqdzESI/Hn9+5i7c+6IJRfy4g/352MPH5A4pVsKXKh43droDoPaCn8sHdeIxbuZ7cM+IvcqCuPmHLx96NE8QUrX22Gy8FcF3LBYnzdL3HnXlsMjxuVGz9Uyxu3uj1IBeUDjQWKgSClpA7h00kUzdsNVMJ4VEw1mvuDJF5XIKAuY9Eu2OFLSFySog/EMCtT39D/pq5ksexThljP39EVMrGK/WwGPbpOKtJTUt069OZxtQDUcI9VtLJgwJSqNXAk+WRBtWksmHDiosQ8xP7TD2ZAo8HeISmnRt3y34nPRgz3C5kZmawPdlGmL1oI25/5lvi9foVM14RSVLzTLcLo26/TMx0u6wmPRkkq3zE/m0suFvfk9dvIU/+NpXUNHhZlQ+BEEKaFRVg7aJhehQZ1OIfPPBdLaSifPBqBdGTtqSes3Luz1ExIUqWf+m6raxrwL0j/iIzN+0wUwnhcY1ybQnJy/LgxxsvFj3SAOBItfR42hu8Plz72CCyZNVWY0bLQmRneeByaUvAm1dvS0sFzGpk52TBI7XIKd+opZTaMVVYzWTywGDN6NKzg570EoXPwsqIUptkoZgRwmoc3F+NhgZvNLEhQVwafH5svy5Wk6o7DlTV4IqHPhLqVYRUItE/3C4Bsx+9UezaXFNf5hXh+dTzFpi7G/KpG7aSB0ZOIrVeH2u2K4EQgoKCXGxfPUbMy00p1XS6JMBIdV65WhMG0ZbUc4qKCrBz9VgxV1IsTC4eBIhWQmoafLh7+B9k9uYmrYToua4M2aeHt22JyfdfKwoS2TsUDwI5blRTW4+L7/lQaPD6jSDHUvTt0U5zvurrGuCta7CLRdhWaN+tjfRXpfXuAuDRfpoxsJrBHAdAM7j5qNP6mSnEGzEmXB7I436YJJd+Nw6D/ndLWjEInz+Aoy9/UaiorJEtHBVCxD3C4xLw573XiM2zmSqM8gjpmk5USFbbD1yt6y37K3HviEmkpiGifKjSJwhB5aNd25bYu3GC6E7NsuUoH/HPMQNWWEFS4ocZHjfKNk0QW5cUR7ogjbeLepFECTlY78U9w/8iOhQrtLMSotdZZNh+bV9UgN/vvFJ0SywhgkJQOgCU7a/CUQOfF0SGs9hOeOepazQLl4oBEROHTE0HvqkF0/t4KHvcbi+zaQvDaubyWOi/KnEIBIed0IdbK4IGuBbcV8xdI1cPIlJQCQhWP+/eucRqUnWDKFL86+Y3hJ2lFWrKR6SyrSAQ/HDDAGpjy0csYrPEabVVAldre9GOUlz65ShB4nallWpXAAhKWjXHxqUjzXC7sgO4s2gxwGwFRJfxEQQBm5aNFFu2CKZ4JkFbq5I7VuSdB+rqceGg4cKavRWpkmDnaul6rVHD9m3vkmJ8csXZVHq5KigEpQPAxu17cd7tb/M2zinhlKMPUbxclro8z528mMB+fCdRmH4+HHvG4ZQxlvER84cjCKsX/AlaDTI8bhQ0y7OYzPTE/n3RKR4jTEGyZgvzUyrAxhUopbj4nveF+cs3QyngHJAoYAT48fqL6HGd29qZOWrtcSUXSLXDmavxWLG7DHf+Ml5gDTgXQm5XXTu1wdaVv+qhSDnKh/zzeEYy9Ok6RoIgYPvqMWL7di0BAEQ5ajSqsN2+2nrc/MNYYW3ZvlT7n0hfeFrj3LtiAcC5vbrST688m0rfQFSUkOkL1+GSez7gaZxTRnaWtndPZVAO4Z1f2A7NWhbC5WYS8S+2ikarFZB8rQat2rVQNE9zDqrwb6tBAWBf6X6I8el344KVjjo0feI/LrnnA/L37FXBil8K8QFS5ePek4+kJ3Ztz9PcGQU5ZcMWged7Dlbj9p/HC+W1zNmuBBCC9u1aYtWCoVxXWjYRRlk+eHTDSjaLomH92bBkZMQdSykehIYKpod/L62uxW0/jRcqaupSeXUi886blU9PC6xhe/j83t3oTUcfGlFCQpmxBKULsD9nriBXP/wpT+OcEo7s01Gzjd8XQHVlrdWkph1cbhdasBXwtqwgoZWHZwaiC0vLok3HEm6EnQRBZX5XUkpMd32YOmY2iZHB44LPAeCLNIn/uPuF78ikWatI8CRXCDqXKB/X9u9DnzzT9pXfExXMwu3V+AI362FvdQ0u+WqUUFpdm0iqXXTp2BoblqTsdpUuMJL38KSApKJ4AAav+y0rRovt2rQEQKJcYKWIjWPeWVmNC78Y3pSVED3Xl2Gy0IsXnEIv7ttYGC48gEopMsZOXkIefPknnsY5aXz03xvUvqbBcaCYPmFeU3DDMh1tOzfKzyqytgAgpYq7ycJKBeTU0H9VN1rfYw+xkMSkQRU+owgeZKLMv83afBQAls9fGzXucgYBAoK2rZuZNmhG4banvyHfj5pJKKhyxiuJ/8PFfbvT1y46LR2YYTK1cmwRdL63ugYDvhwplFbVJFTno3VJMVYvTDnVbhh2t37YMeZDCWprPRXFAzBJ6d64bGSwTgghisJC7OXJ7qoaDPhyhHCgvj6VVzuuWEEYtp8/vPxseuYhnaVKCIGCFZ6C4qthU8ldz37H01gnhb492kEQFNdypP/LZ61qCgqI6fN5yBHdWN9viaBt5QH6nFYDQgi6MpjwOAT3G6lsZ3kczbGHXotmmh5y3OPJN4aSIePmBJUPUVv5OLpjG3x4+dnczx8D9GZ23AirK/eU4/zPhiWsfLRr0xJbVox2lI8gzJpPq60gqc6TqZaynWvHiS1bNAu7BmjWCAGClpCzPx6aakyIXTNj6T0/hgmJ31x7Pj28XavGFykUKQSCSsiPv80iL3z4q+2VkPycLE0esGNTpB5ZOlumTZ/L7od2Zg1Ef8v84bCWkfTTauDJzEBJ+5Z224DJbiDT+un3+eH3BeIJiHG/uuea07kQOJPFf98bRT79ZTKhoGCpct6ndQuMuPXSdGGARigglmPr/krc9MNYYR97zAchhJAuHVtj4zLd3K7sxpOU+iBAviirXQux6l1Q1hJeEA5MJ4JyIbfYtV9WU4sbvxsrpJii165KiC2C0gFgzB2Xi91bNnoVhDJjydIvUhFvfzOBvP75OFvzm5suPUmzjbfBh4A/wPA0B4mgfdc2cGcweVcdZQV9VjKRfK34j1btilmfxQu4ENK0MG3cnKj4D6WA7Mf/fYEt+iOHb0dMI+9/9wcJiGIogjO+j1Llo2PzAoy/60pH+ZAHF+Oy40AVLvlqVMLKR6uWzfR0uwLSQwFR61uq8RJW0q72eyKwdM1vWDJSbFZUoBiUDsQrIXtr6nDhoOHCvtqUAnrtqITYxhULACbde43YprAxs6dACKEKSkhAFPHKoHHkxzEz7bYXI/jvvRdprilKKRb8s9SIYrlNGoQQFJcUsTS1RNi2koFoHnDtu5ma/jTVd3HjoqLVx5Xz18d9HqsMCkRARmqF2SzDr38tJA+9+nNQ+QBkhVVBony0zM3BtAeud5iePLgYl7V7KzDgy1HCgaDywVLh3Ai3K8B+QnmqfWWpF6MFK/hisvMUjs2zHFtW/Cq2KG6mqoTEXqzsq63HOZ8MFTbtq0zl1akoISTmxyzoPWeGykazH75RbJEjSXFPiKKV3h8I4L4XfyR/zVxpS95TVJCn5gYU6fPKBeukn3OxB9MB7bu2lq4rpYmwZG1ZpYC0YmnUpjNTszBSUQBSXex6KB+mLYANK7fEvSvW/aprh5ZmkaMrZixYR27+z9fEFzLnyvnYStM6F+VkYf7jN6cbs9NrLXGhUG+qqMTV340R9tfWMVU4lwacb1w2UhQEXdmcLYUAHZCKRcRsN6xUhF+tRAymITPTjR1rfhObNytQTEVPY2qEAEEl5KpvRgllNSlZQhINTFf6McKtTw+aWftlGBY8catYkJUZflHQK0GhB16fH1c+9AlZsGyLkSQZBTHT45atnClduivmrZMtjOwgNbTu3DrybxVFkAAwXeizitHeq9WAEILufTsn8kyKxBQBaVaqVGAHy4eUVjTUNcR9Fosrzj3GLn2KYPvOfbjkvg+J1+cDoKx8hLdgricDcx++0VE+5MHFut60bz8u+ypi+WCpcB5xu9LZ8uEgNUHS6mD0RMGFEgIAu9b9LrYoLlTOjBXM6Bo1vuW19Tj/06HC9sqDyb42mfS8RON7o8fUCAXEUCVk9sM3iFkhH32BEKLmWtrg9eHCu98TSmMKCNsBOVmeSQpfReasLj6ddFg+s/wc0hEWBKJ3kioeau+/zGzarGKyN2g1cGe40blnh2SLRVGG71MVsGy5Obau3wkqasd/PHPvRbbqlyhSnHrja0JtSLmS86mVFp3J9WRg+X9uFzPZArTsBD0YHDfKx6VfjWaucB5WPtq0boFtq8Y4yocxSFYoszIYPVlwo4SEsmORWEt1GFSGkZfX1mPAFyOEvdU1yb7WCD5gRyXEMORmerD0ydvEHE8GgEhQuiLvqqquxUnXvMLNumQCgfu047o9pNVMDIgo3VEu95W0ZEH4x64wXQHp2rsTZayIfofZtFm1kDtAYyKKigvgSj4GgSr8qNXc0FoYcs+xHaaNmS3jfhVt3icgcLvsE//h8wdw8nWvCnvKg37PoYJdUfNDgEhaS7dLwJxHbxIFtvR0TQ1cKB8rdpfh0q9GC1X1DWwxHyH9o13blti8fJSdDyg7wA5KiF7gRtjbseY3sVVL5crGcgVWD9TW45zPhqUSE2LEnBk5pnajF5luF6Y/dJ3oCrmKBiulK/O8naUVOO2G1wVRtMl2oiBD332kExjmZtrYOc6hrDMyszzILchlaaqZmVZvWMVcXVq5iYtaFibyPLXCf8laO6jKj94wbdOtXxEV/xGufh6FooJss8jRBQPuel9YvGpLY6fimXfE+OESBMx+5EYxP9NjNdlGINV1xIXysavqIG75cVxY+WBwuwIhgkDatW2JjUsNrXDuHI6NaCoKCMCRErJ99W+0pFUxc3peIKiEXPPtaGF/XdLFCo3YU0ZmWTOCXkP3fnFODmY8dL0oCEETFw361Snul3nLNuLyBz6yDT+iQuAMAJpBSWuXbDC6T7EXyU3isqp5CyZ52nR3EKsYq+YNWusOLRI5rIw62IxUOixB+Z7GWDClW5YjeneymkxmPPbaL2Tq/DWR3+XM14JE+fjsyrNpy9wcq8nmEVys8+2VB3H516OFcsZUuwiF9bRvZ7jyER4jB43gRjBvSn3dvnoMbV3SQvF7uX2zt6YOA74cmUpgulFCvVHjapsChWG0KcjDmwNOp4JAgql5NSy/E6cvJ0+8MdQWSggVMQDASqWvw//Ys73MFHIQzcvTnq+3alfM0kfT15IVTPUKlkYl1mdhMjuNoCmILfYjF9j40oMDbXEr8PnPU8hnv0yJ0K+gfAgAIAgEQ2+5RDynV9d0ZjapBAhbPi57Dlbjim9GC7uDFc6Z6BEEgXTqUIINSwxXPsKwfJw4Q6Jrzs7jx40Ssm3Vr2jbuoVi5Ta5/bNjfxUu/XKkUBEf7MsKo/aYUeNqt/gVcsURvfD5VedSQohmPAgAfPrzZPLtiGlmyCkpyUMEOKygIPd/ct9Jl6pcgWSdQRk/Syu06VLC2lS7aqSOsIKhXqTVgAgEvY7szoPwbxYNpqQoXLNkvZz7Vdy7j+rXxaRuJ4+J05eTJ98ZRsJWaqVCg8F/AK9deBo9ukPrxF7SNMCF8lHn9eHa738TSoPKB5PblSAQoUe39li7aLiZCjMX42Vj2H3suFFCtqz81dW2TUslv6pQKFw0dlZW4+rvxgi+QNKCnp2UELu4S0elLj67Zxfyf2cdT8OBbWqWEJGKePi1IWT6gnVG0RWuA0RifhdU/kbu09zK+W8vV/ibSP8opdi+cZcBXdGgz1yYTkOfo3tGarEoJbII4RIz6bKCmZ6nMQBwu91o0zGhGiCpQo0ebg6cVLF4+qrIv5WYmh2Cz3fu3o+bn/ySeH3+UF/i/WWJJLTltuMOo1f37213wccIcJFMYc/Bapz16RBhc3kls+WDEEK6dm6H5XN+tsJaZ0ZcmF2Q6GGaDvyUmz5sWTE6q0VxoWyu3aAGEr+f1pftx78+HZKKO5ZR690IwYx3VywS818AwJ0nHkGu7d8H4cQpavEgXp8P1zzyKdlfmVLdl1iwxOgIMj9E9jMK4vVnnAZAU/NdOGWZFUqCLbw+kkVJ+xZozISlGoB9lZl0WcFIm2mt62atiuBmT4/alA//hLB89uqogZdTBDu3a8H+QAtAKcVlD34sVEncCOSyv4Rdyw5v2wrPnXuSs0aiwU2154qaOgz8apSws7KayfIBAIJAhA7tWmPV/CFW9sHMJBXpAm4E93Tqy651v+dmZ2ftl/tOVgMBsK2iCgO/Hi00hC5xEoSRCogRwievrliyykcYr110Gvq0LgYJlUlX60VFZQ0uufd9vejSe20TAAKheBDAbq3GS2dbVvHdbrWKmJGVnYmCojyWpsy+WnrACibqgsYEFLcqsoAsVfBgtksV9EBjKsag+5WMJnzJv/pzLUANuPt9YdnabZHf1eI+urZohjH/vpwLQdsEsK5RLqweQDDg/OKvRwm7q2qgFXAZhiAQ4dA+3bB+ialuVyxwFBB1cCOwp2GfhModk/IJIevkvqSUyiZs3bG/CmcPGppsTIhR+88IJYRnVyzV54y/6yp0CRWh1ErKMX/5ZlzxwMep0mWYrEOBY087tqdmlHnZ7gqWxxlEYvqiWUkzlmYZZtJkBQPVXOCtEruF12PRaNFkewWEUorGvOFUsVdP/vt8bjfhM++OJJNnr478rlTpHAByMzMw+b5reBNSrQQ3Vg8AqKxrwPXf/ybs2F8VLqLGZPnoeUgnLJg6mJt+OGACL4J6OvfN7S2fXiAIZKvcl0pKyLaKKlwxeIxQn5wlxEglRG/w7oqliCn3X4ccTwYEQgQ1VywAGD91GXlt0Dhe5RXy7at39JN3wW+8gDI4EJ2l3ltaolVb/jJhmc08mQqdtGrPtxuQHbFne1kk2wSloEpxOAV5fNYAGfP3IvLB939Kgs7jGUW42IfbJWDR47c6QmoQ3BXObPD5cfXgX4VtFVWgYFc++vTsgqUzf+R9Xnk9/K2AkWlWeQIXfaRA6/qyaTUA1sp+H1RC4vbapvL9uGrwr0JATGprNeWg9FRoTMjSM/fRmxAqVEjUekFB8doX48g/c1Yny4cM5V/tWjdzy2XelNq/KaXYX6ZZONPo0gtph1btmTPLmpaFyGzGeS00FjghBD0OtU8dCrtg/t9LYsY9fhp4DUDfXXoAtz39DYkckDQ+iD5S6ZwA7w88k2a6+eyLieBO8QAArz+AS78eJazZWxG0fFA25aNTh9ZYNON73pUPwFFAwrAqjblVa4STeSd9GvbN2Axgu9y3lFIqylhDlu0qw8CvRwkimydk3GMN6oze8glXvDAR5Gd68PKFp4CQ4PGn1tbnD+Cqh5MKSjclna9ABLn406g+zf9niZX7yQwlxPT+devXEVoFwEM43yyazFZATtcaAMEloOMh7VmfZ1uGYjYWTgtnloicMHET0bwo12oy4+DzB3Dp/R8JtXUNkc9ElaDzs3t2oRf17dEU14W0sit3igcA+AMiLvxiuLC6dF9CbleH9OhkdqrdZMHFTbjJkJtDI6tcq9Fh5Rrhpm4UAc5tKJvyHwDrldpQSkWRUpGGgaASculXIwVRTJh1GCmw8a6EJDPnSa2Va/v3wSldO4AAROvi5mBtPa566GPBy+5aZ9b6JXm5WZqvmm9NJiwpuLzASwXdenemgsA0rJeaRZPZB2YvaKy8rBwPq5YGmLs4jNoQpmy0faXBJClhxiX30pP6H8LdZrv3+e+JVtB5OO6jV6vm+PLq87jrg4Mgrv9hrLC+bD+z8kEIIe3atMKyWdy7XQFNU/kA4ufRCsEhTINafQIzwIsSQoiQ8b2vYsYdAErVGtJwFvOQMrJsVxlu+PG3ZMbQSL6r55gaoYCYNu8/3HARurQoDKbn1ejJjEXr8ehrQ3hYj1E4qm+nSHphJezZWqr1GLuf86bPi9vtQma2h+X9h5lFk9nMWvOKvXkrpkh9BwkiLrBLZvndddVpVpMZhRc//o38NHZ2hFK1uI9WudmYeM/VdhBUmxwoBW74Yawwd+su5pgPQgjp2L41Ni4zrcJ5KuDukLcIVgngvAj+YVosQNw2cVGKCbRiQW8wpD4FgsqISCmdtXkX7h3xB0nCG8sumbGMCEgPxzsZPv9T7rsOxTlZTG2/GTGNvPftH7zsDQDA9QNO0FxZvuSSIjjQQGFxAQBoXfIXmkWP2QqIpmN+PluuYivA1SZOBPU1DeEAdNWNf8oxPbm5VZi5cD156+vxkaBztbiPHE8G5jx2sx0E1SaJW376nczYvCOofDDEfABAm9YtyPolw7lZjxqwLW9IEdL54UkJsBomn6ui0itz/LR+JaVTOgMoZ3wYFSkVx6/cRO4YOiGZ+bSLEmJkLRPD53/eYzcjK8Ot2QsKiuc/Gk2Wr9nO9mATcPWFx1KFmaTSf/kdJUR35OTnhP+ptpdMS8VrJqNkYiDtu7QxkSQuYPihvXtb0JwZFuDlslAQEDD6BxoOfyCAO/77DfEHGq02SnEfgkAw++EbRYHdbc+Bibjjl4lk6qZthAZNHwyWD5DWJcXClhWj7aJQ8ux6ZbQPszSezNmA0eBiXVCgjW+/+2tKaWsAmjUYwhApFf9eu4U8OOKvZObVDpXSjQ40Vpv/lPvhEgRMuf+a4E22Ri98/gBu+s+XycT2GAKlZDfSC0ZKKUp3surMtoXpPLNtp1ZcpeI1k0l2ANHuWKsOxazP42M32QAr5sVlZYybh4wMfrJGDbzvI7JFwnwUiw0S4NULT6WF2ZlWk+xABjf9NI5MWr+ZSOJcVUEISHHzQmxbNcZRPpKHNBkBYFJgqcn9swvvN2F9KFo/GkHJDf59M14H0AbAAeYnUyqOWbme3j5kQqL70SrBPlEYvY6UaNXlvW0K8vHMOScw7b41m3bjmkc+5eaSgCXj5oblm7mh1yCY3r8ESlw0N4MeMw/QC7T0D0IIShIrQuiAAQunLYv6Xc5Y0Kkts+JnKAb9NJn8PWtVhEK1oPPTu3eg1/TvYxdhpEnhkdF/k+kbdzBbPgCgdUkL7Fr3u13mk8fDMdbiYSSN0sBvs6CYwY9jGDw+bI+nhDxSv3dqdwDFSMASQinw15rNeHzM5OoECTPyEkHPMTX6ssPQ+b/j+MNxYue2TCrNuClLyQ+/zuJi77Ropu1qP3viQh5o5YEG3dCibTFrkqd/mUGPmYfHadCqASIQtGrHXCzFASP2l1eBNrowyc7BmcdZL8jvr6zFf94bQSgoKFVUPggB0LF5AQZfd5HlNDuIx39/n0Z+Xb6eiIyWDwAoaVVMtq781U7zydvBJCdIGa2AmG0Bsqurl0HjlJDs7HIJwsyGfTP6AmgNYF8i9A9fvCb3xT9mJiqs20UJMcMSYti6/fmmS9C2IJcpHuShV38m0pT2Jo5B1HuOO6Kb5vvKSitMIslSmMrPOnZrRxnfeKIZ9Jh5gByi1SAjw42iFgWsz7OTsGIpvPXeyL+V1t4tl51k+Xiee8fbQoPXh+CtOZUVqAhA8rM8mHr/9XZx02lSeHzMZPLjwpUJKR/NmxWS7avHWL7+EgCPQjDR+F1PUE7HgGdY7q5HCSkmwO9085QsAK0AaJabjvwtQL6es4w8+/u0ROfdDul5zeA9UuVZ9/dNuf86kSUova6+ARfd9b7la/GWy06hRNYlpvHMqDtYZzWZaYfikiJkZLhZmh5hBj3mLUSCHlpNsnLZUss5SAyiNPpMwfzWr1cHS2kc9NNksmLtDohiMB+9XBsSBIbfOlB0Ys75w39/n0ZGLl0XcrtiUz6KCvOxZ4Nt3K7C4HH1mamA8DoGvEPH85Yh9kMeHbwFGZto2YyjEfTzPsD6h5RS8v2ClfT5CdMTmXsjY3b0tIiZcaFlmBKSmeHGTzcOEFlGY86Sjfhu9Ayr9i8FgJOP7A65qZO66/ISNG8wTJ0HQgiycphqgRxqBj3mKSAUmtpF85ampR9uMqjcVwUqUk2/cJdg3aVIxYEaPPH2MBJQ4TiEEIEAuOLwnrRXK1PioxwkgCd/m0J+WriKiKLIrHzk5eZg9/rfrSY9UfAseJOY/xoBx/qRGrSyIwkxP7q7nRGgxCdgsr9i1kUA2gGoZf1bSim+m7cCz45PWAkxCjzXB1Gil8CAMTmqQ2uc36uLZsQdBcWDL/9EKg8yT7teiFCWl5ulWYyQUoqaKtNpTHvkFQbjbzRiQfLNoMVMqVMz7UFRiyLWZ1mlGtvu4F23fHNs7Yw4CMRai+yAe94XfP6A4k1ZqN4HSvJy8NYlZzSJaxE74bnx08nwJWuDygfj3szNzUbphvFwuSz3BkgEvMcgmFGVmef+2wWxYyhVNuTaShUTEqwQmPK+yRWpODywd/pjANoCYA4yFymlPy5YiVcnzU5kLTjxII0wYo8SAPjsqvNos5xszV54fX5c+eAnZieQiJZFGNwYtm/Z7fAbnVHYPBLmoDa2TH5aqcKsBegmDKutV/+uJpHTdLBg8tL6qA9kZiEvx7o0tjMWrCOLV26F2q05IYS4BAF/3nuNE/fBGd6fOp/8sGAlCSSmfJDV84fQDI8pPE5P2OEwNCPzlYPUIFUUEz2DCQ1mAdRhnkVPwEVe8O6beQWAo5GAJSQgivTLWUvJpzMWpZsSYlaaZ0OsIADwxz1Xiiw1vWYsXA8rCxRmZSnWu4uMy4K/l1pGX7qiR79O3NQCMUsBacbSqGUb5hS8zkHIiA0rN2uWE21VzBz4rzsG3PMBEdVdrwgA3HJcP6feB2d4e/Jc8vH0ReH509qThBBCcnKyhLULh9DWJcV2EOaj6LeaAA7gjIF+SPIWXJT+fYqKiBD6P/plw74Zdy6d/v1vngw3DYXaaT43IIriu//MJ5/MSChdqpFKiB7r00wrp57viTyrVV4uBvY7hMkV64xb3jRDBpQ9H5oV5Mo3llxGbly5RW2MHDkwCbRs34q1qeFuWGYpIH2glYKXEOQ3y2V8nGWw2wFMG+q8kTlWskKdfWJfSzby0++MJPUNXlB11yvStiAXz55zosNsOML/Js4gg2YtIV5/QNXyEapWLwiCQLKzMsnu9b+LrVryUXPGQUJw9h8XiDuyU1VkgCCffbR3n64D96z9XfR4MgghAhEEImh5Lnj9AfGDfxaQ1/+ew0NMSKrKA+8uliz0AwDeufRM2jI3R3Oka2rr8e43Ew3LzoX42kQRHB9Mxas63jVOJizd0axFPmstkO5G02KKAuLO8pys1YYIBMWtmQwlDthB/b6A1M4pu+qevPNCS4SLj378i8jV+mikNngPN+L2gY7rFUf4as5S8t38FcTrDygeLmHFIyjAEHgy3Fgw7RsxO8u2Viw7CyapwlE+uIAiG0zClUu2eWZeYa5r6u+fihluFwAS2cdqT2rwB+iXs5aS7+YtZ90jPAal2135iOv7z7cMYDo3n//o11T7HWvhCP+u+v4nbz+far24vqYeDvRFyzYtWGuBHGE0LaYoIIJIu2m1IYQgNy/HDHKaCkQAEEUx4mivtOZKik1JeBCFU697VfD7A4rfhwsOHt+pLdoWmE+fA3l8PH0heX3SHPgDorI0FM6XHFpxbrcLE0e/L3bv2tFq8h0kByfzFRfQPK4Zz3N1ubT/kb0w+qc3aGOCCAJBEBStIRSgflGkr/w5i3w1ZynrOrFDPIgdERn/Hi2a4/C2rTTVPX8ggLNveyuVMZMqHCIY42gO6dJazXpOAcDr9Wm9Nx1gKm8tLM6H0JQsIF6vT7OqYgLZcIxYdOmykOX6o9k3RnOcbthdXokFK7aoB54DxO0S8N31FznWD04wZ/NO8t4/C+ANZiyTBSHRbhsul4C5k78STzzuMKvJd5AcnP3HBZinQeMgZasfctaZx9Kpv38SFczceLEQD0opbQiIeOvvuWTJrr26dyoJJCLbpIP1Qxa/3Hyx6BIETSlg5oL1qKquM1UOys7yKMYaRWSDdJPMOIHAJm+fbzgdZnSWENJSq01GloflUQ7UQSU/2FdaoXlzyRBrqDvOuOF1gYIqx36EDrlHTzuGZro1szc7MAFzt+wkN/38e70voKl8RH4XBIJV834W+/bWNIA64BPhuU5L4cxeSOioFpL6KgZHH9UXi6Z9m4gSIjb4A7j5x3HC0l1lrK/hwR0rndZ3VF9yPBm4/YTDNMeYguLU619LVh5MYfzU/5RSiurKGv1HyfB+cfme4MsIgStD0zEGAEqMpsUkUyXV9KHJL2B2v3J0YnlEKR8AsHPLnugWMkvNdOtH6QFs27VPdRYJQPKzPLj3lP7OXHOAFXvKcd0P48rrfX7FAI5YucTlErBo2rdip45trSbfQfJw9h8XSMpQEMfYCVt90Cj06tkVf/76IWVVQkRKxcq6Btw9dIKwuaKK5RVGV0q3AlxZDZ8+6wSa48mA1vSv27wHFQeSEvaTHmcWV6CKskqDR6jpISdUekFD/jM8W4wpCgil2u8pLLa0CrpdD1qp72VcH+b/vVSzX5mZGVpNdMWJ174sUFCICu5XJGSUeevi0+06J2mFBn8A13//2x5fIKDIjGIFEkEg+PHLF2ivnmlT1yedbkhZ4ew/bpDUMR3nVkSTvGw6+YTD6Zcf/ichJWR3VQ3uGjpBCOap0ISRa01r8PTe2+G+cKWEvHTBKcGAb5WRpqA44eoXTaXLreLhEHbDmjl+XlPkv4aikK30guHuJ2YoIEz+lUUtrKtFYQNQjR9ZlO2ukKTglZ+D1iaO+/7KWpSWR27FFN2vSvJzcV7vbo4AxAHOGTRky/7a+tZqbWKVj/dff4gOHJBWCmRTOwCVsto4MB0pybGSdZuaPHz91efTF//v31E6jFqKXpFSum5vBW79ZTyrjMF7fRBWJBR/aRYuP7wnLc7J0iRo++79qGvwJvOKpMa4qCBHbd4pAOx3LCC6I78oj4tihGYoIPksHSnpwGTt4WFDWyWMMCseYVTsPdD4xwplibp1bGXamJ58XdD6oURLuPzVr7dfxtXtUVPF7b9M2Lm5vLKzWhtpik5BIHjnlQfonbdexsM+1QtG7HfeBXqq8BnPNKcpUj6iBZ2eg8cfvoG+/OydUUqISopeSiml0zdtxzPjplqdnldaeV7uO70Qe25ZsV8U3zn01oEiIcqyQPCPKU665hXTiO3cVlvu2729rKldABmOlo3jrja2BIChefPNUECYgju69OxkAilNCw21DZHFpXRbdeIRhmdaAwBU19Rj8/ZyAFDMfkUA0jY/F20K8swfLAdReH7C9AN/rd2sGsARFD4al9Wj919L77njinQTUo1SQHiF1o2ko4iYBr3uYUTdzvnHHriB3n3bQMn8E0UlhIaUkJ8WrSLv/cPkRmN0PEi4Xor0Ry+ICX5uFBTHr3uLIrTMyQE0woHWbNwNn0qKfD3Ru1sb1RdRSmlNVbUptMggbRWfzr2ZU+JnG0mHGQqIZgYsQgjad23N8qymevAltRF86jm0AQADzz7KlDE9/aY3BJWLl0gQ83c3Oml3rcaLE2c2fDt3eQFU1p1U+SAEuGzA6fTlZ+9Ot/1ppPLBoyDPQg+PdKcp9DqeBT0fhvdef4Se+6/j2JQQCkop8OG0ReStKXNZlRC7QYtmbs60b6+/IGQFoapWkLNuecsUem685CQtIYV667XlmDSAqcpOp+5tWfdZcyPpMEMB6czSyJOpmYbXjozJUoii9pC1YgtGShmrN+wCoGz+JQBpnZ+DHi0MXe8ONPDl7CX4as5SF1R4AyHRlo/jjz4UP3/zYjruT6OtH7yNGSs9TbnQmylIJmMVy2P1etCYIW/Ro47sFfVotfS8IqX4fOYS8uOClSw0cCOw6wgz9rrmuB3apiVaZGdBIISIIlVsv3DFZlP617plkWabgD8dl4O18GR5WDOgtjOSDjMOkn5abI8QQHBrksLbYc01aPDqSXOFNS/KNZyWW//vaxLmdXI3L+EA+Y+uOMfhNBZizPL1eOmPWQEAbqU2sclv+h/RE1PGf5qO82aW6xUvY8dKR9q6JfCEZDNWRSNuSnWdu5l/fiH269tY40erRogvIOKFiTPIX2s3paslxMr+MD//g8vPpkDw0k/pQjAginjijaGGD0rHdsWagp9IRTWDTbrAVL6anZPF2rSvkXSYoYB01BxZQuDOsE3BOVscwN4GHyBhSsRCusf8vTj4bpUSdlkZbhzdgckNz4EBGDx3GXlw1CQ/NFLvSbOptW/XErP++pIXAVpvmBn7YfXpmsj7bcH/DIQJc6XXlpI93nWdv/n/fCu2ad2i8eEaSog/IOKe4X+RYYtXa9Fh9Z4wAkbySubxOqlre+pxuwBCCKXKIenfjp6h+7tj4XEzlOSmQMCkmJSmgoxMNysnMLSKsBkKyHFaq1MQCARBlRSjmVHaHao1lbVc9HD52h2orw+m9VOsfA7g0dOPSccDxxYYsmgVeX7iDD+l1K3WThr30alDCTYsGZmuyocRfJEluJt3pB2fTAImzJUey09xuek+h5uXjxJblzRmM9JIzyv6AyKe/n0a+XXZunRRQhKhU+8+heuAJYRbju1HQ1H5RKTyrli1tQ1Ytna7oX0iAJNm0VCXVGpgBwpwuV0RmZuo+2KdYCQdZiggLbSWp4byARjLiJjqlBj4bkOwd7d26jpiQrdv/s9XkeBzefer4IXZLcf2s8thk1YYv2oDeWbcND+lWpYPEjGitSguwtpFw9NV+TACrMHdVoGVETgKSHAMDFRCDLV+SPugKzYtGyk2K2qMJ1RJzxulhExev0WNFjucCYnSmEx7pbTYIpIco8fPOJYGJZ+g8Cl3NlNQ3Pu/H/TuT+wfCyzPKN+9L5XX2B1qaaSThrSwqApasDRKmgYjHx5CNjQWmCdLtRq30QWK0vJQra6s02zjYrB+pgJ/IID1W/aotiEAaZOfA4/bNi54aYMlu/bi0dGTAz5R1FQ+wrckrUuKsWPNb+msfBixKVgPaSsFLrMrRtsdBikhhlo/wtB9LgVBwM61v4nFzcNKCNFSQmit14cHRv5N1u6t0Jscs5DsGkiUf4aVDelPSmvP43ahVU52ZCFQimCmgBgsW7PNiP5LIWiNBwWF1+sjil8nDjvxMiLzowtcGRGHB7Vn5hvZOTMUkHB6KzvcZqQN6qqjFBDZBZaR4WZ7WJL44pd/iD8QtLCqFT966+IznLVhMspqanHnz+P9tT6/Jg8IKx8FBbnYvHxUOisfRiBR9wxelRA7HdpmQdf50ifzlQirkpQJgoCtK8eIeXnh0l9EvVAhKK1p8OKOIROEijrtCzMOYcZeNewdL1xwcjAYnUTmiNIYJcTnD2DY+PlKdOlFm1/tSwKguqqW8VFM4I2XKY2jIEOrbkoImwEEzNHqSdFg5MNDyASCWZmU0Kq9YqkQR9hJEhtWbNFsk59raJFLfDG8sQKuUvYrQSA4qVsHRwExESKluOG7cYE91bWaGmhYgMjPz8H2VWNFxtR9dgUPRQd5VELSetITROxY6DZf+mS+Yj7SDZlTt9uFrSt/jVJClIPSg//bvr8K//5loqKiYgSdOiBV2YTl7w3t+wV9ulNCoh2xKUBFMVoNeXfwRDm69KKtAUC9ehOCrat3GDkUPMLwy6DmrZo1PlD5YLd9IcKIdq3UIOCVVYCNVj7S1v0KAMp27Wusgq7QpjDPuLXV0ODDpu17NVoR0r7IUAufAxnc/NPvZPXeck2ft3DQeVFRPso2TRQzM421mHEAvfkBr8KTFmLPhbTlkzpBB4FMj+OOj/u63JwslG+eKObnB5WQkHCjooQAC7fvwe1DJsi14W0PJRX0rQBR4zvD+94qNygDxAqgVBKYvmbjbnh9/vAa15UuEsy6eFCr3baNu/TuOk88LXY8TaFNDETF/yu909BD3wwFRPUWHAAysuKKEPLBSW2MWqkLlsLSyss1TgGZMG0Z8YcLCCmwKwLgrQGn83bApDUeHf03mbphm+aYh4POszI9WLtgSFPYjzxYP4ykJVGEzwYeaLEDUlRC9DiK+aoPuXj6YNETcvMVVCJeKaUiBfD3ui3ksV8n87redBe+QwjHdMR+Zgr+F3LDgso+9/r8mLFwXXgMdAUF3AIhmv53tdV1eq8LXtcZK20p0++KdcGXz0pkKFMxVQGBApN2NwYg63m7YAcksogSWnA1UT6T8n9aXJSbCkNRDY765JfJJJL9Sp5xERDgyPatHQXEJDw7fjoZuWwtg/IRjDvP9GRg0YzBYmEhV1Yqo9YLL9YPng5GOR9kB8pIcs5TP/IMqpyeEtq3a43Zk74QM0Lnu1pQOqVUBAVGLltLXps0h6c1p0vQdwLvMVX+Ob17J6pVJIyCYtAvU4wiwd2zW5uWWo0OVmgaSZIBSfI7I2HaLYLHE538icB8/2qjOxsnuYSsIFGbuWXb5oBJJsemAr9fBNUYzkO7t0vm0QSNgomiErJCkj9cIf0ucjIynOxXJuGtKXPJD/NXgEVOIYSQDLcLy2b/IHbt3N5q0qWohzE8wrF+OEgEanNkwQWamEz8iClnbd8+3THzr8/F4CUj0awRAgp8MWsJ+WzG4tiLSwcGICvDjSx38CZcTQ+Zu4ypen1S6NOtXaFWG1E0ZFvxxmsNu5CWQ2FxPsu+ItAoTpwKjFZAcuU+pEFEFI6s7CwrGAxvi09/NI6qbF97dC5J9IlacTMEADZsKUWNRuEgAjjxHyZh8vot5NPpiyFSbfVDEIjgdrsxb8rXYqeOba0mPRYeGMOzeLF+8OVDYx/wJqAmcJlmXdYqs3DYoYdg6u+fii6XoBoPAgTT81JK8daUudIaIbwlZUgrlIRidaCiHB6oqsXu8kpD3t+7axtBoxge/OlfCZ3CZJk0mz0GuMgoGozeXDUa3xMAaNe9jcFkpAUSWpx+r0/zL3p3bZcoY2eiYfLsVZH4DzWR98K+XXkTHNIO41auJ3cMmYiAKDLFfbhcLvw+/B3au1dXq0mXgx2UDyD9c9PzBCss5yxzxUQToaku6aQUGNP57lH9e2Poty9RQSBx8SAkGuFMTLhz6B/k95XrnX1hMM7tFTyH1Qba7xcxfd4aQ+aib4+2Wl5gTiV0A1DSQbbGoNw8VBtFg9EKiIelUXauoamG5RCuZpu2CATESA+Vdnbzolzm5yEBAWnEnwu0zecEuLZ/n7SeA6sxdNFq8vCoycQf0FY+ABCXSyA/fPE8Pe3k/k1pXvQ+VJP1FXAErcRBFf5tFcLuqeEf7Q5YM+uWjNVF559CP3jj4bASIggCCf6/DADAHxDxyK9TyNgVGwisjQ1N6715xRG95NeD5FNKKb4dNcOQcWjTshnVGmGDXLDUYIc5T4nG/MI81qYZrA0ThdEKCJMDeafuCd/EWw07LM5GKhWo7SKvAafc5/VbSyPxJ0r1PwgIWuUlpAA5SACT128hz06YTryBAAvnJm6Xi7zy3F30sqZVFJKXfZz2bh4GIDaW0Ox1K8j8JLSeUg8ct4f1Q4p/3zKQ/veJW0MhKyrDFfLI8foDeHzMZDJ78w4r92pa88RDWjaLTIWSJYKCYu3mUkPef2gPbVdfFe/hdJgbS0pCdO4lU39NnoqEffVZYbkFhBCC7BzTLSBAahPO/aKnVPNSAS6X/kWrAqKIyupQXSHFUSIkg/3dDhLE9A3byD3D/iQNwdztmnC5BPLK83fRR+67jvt1rQFDXAoTQDLXdM5GSBxKKW9ttX5TLzyYlPJh+Rg9/fgt9P8evVm7+6HvG/wB3D5kIlm8bbdVtPNyUWEYPEJoLUliMWIHu7Ja12rkEbDkReEwyZueSNYjJ6V1mZuXHRf2I5+J17haIEYffjksjTzZhll4jAL3DCl4Y6BOps/nZ3tYAthbcTDyXIX0uyAACjy2m3NbYHNFFe4e/iep9/spZWBqLkEQnv/P7emgfIgAEolU5H4PO5AFF0J06jCjkHYUuBq35/5zO33kvms0lJDG+/harw83/Dye7DhQZQW53IybUcjxBO+KpdMROzVerx8HqrTCehNHfagQtUogOmVK3+ggISQQhJ5pFA1GKyAFLI0ok4u6A1b4ff6Q9K8+ri4Xc3Y1ZmFt0oyVJBzvTFXspk76Xf2xqnQfLvpimFDt9VGqNfkIFgd79YW76X8evTkdNiBBYjc1jvXDftASorkSso1Dwq5XXI7Lq8/fS596+EZmJaSmwYsLvxiBzRUHrCY97eCRqRMZu2AopZi+cJ3uFzc5mZqXkUSkFAxJHB0kBObxLDaKAi4sIAEDbuIZkLar2eV2MYlXGQYoASvW7WBq53YUEF2xv64eN33/m1Dd4FNV/MIQBEIeue8apIHlIwxTc6ibTK+DtKsTZZruyaXyEcYLT/+b3nP7ZcxKSGVdA6769ldU1TdYTXpaQcH4ELVuKAWWrmY73xNBdjZTriIQ8+vkmQnT92hDnU/uY7lBNixY12guyGS68WQbZuFJNzDtQCoGnW8s2K50f1UNKKVQuoEPHyUH632JPdmBIrz+AC74fLhQVluPUH0dVRBC8Nx/7qCvvXAvt4KJweCh7kdan6Y6IxHrkg3WdCruVwlZP7hWPsJ497WH6ev/u4dZCSmrrsPFX41EwJzMSNyPnx6oDzR6rxKF9DWUUlQd1D8ORGiceNUVYGImLDvx5qRpzWfPgmqYtm+0AtLP4OcnA43cUPZHeKPqxDkTGqcdpfuDudw1LuEb/JZYvdIO5TW1OOWjn4TdldVMygcA+n+P3Rx4+rGbrSbdKvBQ98NxvWJHMlJHGguNzEvHVhajh+65lt5/55UMSkiwwZZ9lTj1w58cS4hOqJd6oYTGOHYqCCHYvLNc93cThfdFgdrOAmJl2mgm+Nk9j04wigajD0I1dTmy6izw7bPVSk4Ugr4ZphIZKxoMQKeA0uEXepo/kPaVTQ1HTYMX5346VCitqoHIpnzguf/cXvPC/93h+L/ph0QPmrTmPTojmbFNOB2u+V1Klj8zDQdlbcgb3nr5AfrEgzdoCwMhQXRnZTXO+2woGox14baNEpd0BykQiJLBlLvs8+l/bvsYq5wboIAYNbc05r9W0aEKwSWwcsoDhtFgcB+V8+uG804TYjfN1kowu2CF0/ASovw3DMWxE0azwlwNfTI42V5RRHmNMWn9mgJqGrw47cOfhH219azKB33w7qtW/feJW5mrD6UprGY2Rr0/3QQlViFaWvzP6rnVJjbJyoPBPKSax7WtrB5yePG/d9JnHmdJ0RtssKuqBid/+CMaGIXYBGFLRS5R7Kg6CD+je1PrloW6v5/1AtpvzBzLwWw+Yo0CIjCL/4bpCZa5AhBrz4pUfWO5Pui8Xh+TUicI+nejeWEeCGEYWwq8+tdsrseRV5TV1OLY934QyhNQPi658JQhb7/yYC+rabcYVme+MorfUtjE358RWuNqK6VDimRrf2j8nQh9hWVL19GzT91OX33+bjYlhARjQo599ztU1NXpSUaTUD4A4JU/ZrKc2CAEKGRP3coMT0YoeaHGfFP9Y0CMXueJbnZe+bdtFZBWmgQYIAQngLRUQryhAG8LstYJR/XtBJYUsAAwfaOl1W1tiUnrNpNTPvhJqGnwKiofJAhBEIjgcgnCq8/fS4d//9q1cGIP0nW9SU3+vB5irFCSMmyrdGh3Lam/C7ta6SGVxa4Zy8f3kfuuo08/xmAJAYFIqXigrgEnv/8TZmzervUHLFaiJqN8AMCCrbtjgs1D4xMz9oQQHH9EV+MI0ZgVX4PurnZGWqNZn20pv2a0gnQz7P0G92+/VgOL3a8sZ7RGwONxB82axPwunnVSX+LxuImgMLHSD8tr6vS+tUprjFiyhtw77E9S7/PLKh9BrYMIIZ8qpKsAAIAASURBVAUEgiDgu0HP0ccfvK6pKx6A9ZmvjJqD2HVgZyUkti8CbK90pArZmBG9Xa0COj9PFzz71O100HtPaCohgkAESqlY0+Clt/88AWNXrpdrJo2NkSpvNOanSSkfu6oOoryuXrMdAYHb7ULfHu0tWyeuDN1DF43si1n8yoz52G3Ug40WTFprNbCwuAwPB5ohnc/KzQoqdqk/PeExys7KhMsVlIEFQlTXF6UU/x4y0RGOGfDiHzPJE7/9Q7wBMU75IAQRxSM8ZYJAMG7YO/Sqy87iTrCwCFYqIGbHfdhVCSGItnQ4aBwGPS0esXCDj/MwDjdfP4CO/ukNqu4pEfyOArTe56cPjfobb06eIx0vNYUtVgFpUrhryB8Ca68FgRgSA8KKzCy2eiE2Q6przox928KoBxvN5HnMkZdohgL7woIjpVXzfDQvzIu8XxDUlZDlO/diX60TjK6G236ZQL6Zu4xQSmWUj6CqJ51sQSAY88ub9MzTjk7/Nc4Gq60fVgSe2/E2N6yApCkSPm5jb+qbJM47+wT6wxfPqyohJGRxpwD1B0T66fTF5O7hf6TxWkodZTW1WFW6L+oztUVWUlyAgugYkHTcr6n2x+x9mtr72AwANUYRb7QCoqYup9vCNQua4xYIWCd3CAKhJx7RnUo9sIiKJcQbEPHMuGnOWpABpcD5g4YJk9dtIaBQUD6iHRQy3C6snPezePaZxzVZgUUGViogZrlepdrObDSx9ck8DRSASIJ7vYmNkTIuv+RMunj6YNHtlnfDicn2SEVKxYmrNpGBX49yLGkKeGz0ZBJXzFHBJUUQCE49umf4O2m6a6nFUvpZwjyXaqx30UK5JkEkG/9hfj0Kthjslka93+jNuUdzAIjp/EFaiNBq06sh7w0zaRLMNWZ6SrmL/3U43G5XJNMZIY0HhFyH/1izhfjtw1xMQa3Xh2Pe/lZYXbovKJEwKB/FzQtwYMffYpdO7awmnydYbf0wAonSwOPmCvPfJgGN9LtxrkLJZstKZ/Q8pAsObJ8kFhTIVXCOHy+RUnHxjlIc9973gsG1QmyHmgYvpm3aHjdockpAOP5j4Nn9Ae14LIIElRBWN3yd65vxALvwvwqjHmz0jGrWejcgsIgV0sm3ktsb485BAArGdFSpvisGl597DG3TsjAqwxlRyTZAKcWJ732fdtwlWeytrsEx734vlNfWB7XjoPIRuXWSUz66d2mLnWvHia70Y9KpIh2tH8lsax4PuyYjZccoFLHxCQ4Y4Xa7sHfjBLFj+5K470I8MaoYpUipWFpVg/7vfCfsZwi2bgoQKcXJH/4cF/sRIxBFFqwgEHRo3RznntIv0f3KpISw6B+MN/V6QA8XLNvwNZeLSf7OMer9Rksrq7UaUOtvvq1eLIYIBiRkclDrnBGFCMM4/oiu1OUSouq9hA4I2Zfura3DO1PmWj0XlmPull3k5Pd/FGoavLHKh9RyFzVO/Y/oiRXzhli+kZoAeBDik6WBB9qbMhjjOZxtzIJ1i4eLfXp2jv1Ylk+KlIrVDV4c9+73wpJde60m3XK8/Ocssl8m+ySVWtnDhaJB4HIJOO3Ynsm+LqwQOogGF/yYUQbcYNT7jV4YHQ1+fqpIazcArY5V1xp3I/T+09fRgtysGCuIij5EgS9nL2vSCsjgecvJtT/8RrwBERSUSg6EmDztoTTtBHjthbvprL++dKQWeTSlzFdW0eMgHjEWDpEpnoOx2rmDEBbN+F585L5rIsYlGVeeyJqnlIoN/gAu/3q0MGzx6ia9F35csJKoWT+CCA6R2y2gMC8Hrz92ZaqvVRzzyoPaqfgNKNeQtnKfAWhv1ION5naa6Y38/oDBJMRBr6JLemaAMGYzaDy1pt6r9nUyayPyxqKCXFx69lFUGgsCQDUmpd7vx4t/zGySh8Ntv0wgL0ycQUQxpHo0es/JzoMgEIz+6Q36yH3XOYxUGVauJSPenYry0ST3lUlgTfmqAjGZuI8m71P02gv30iHfvKSWIasxjzGlol8M0KfGTiX3jmiaGbIe/fVv4g3Ey1w0vq4UCVo/XLjq/GOQl5uV6qsVx3t/ZU2YCOW/tq5cQyJIhEg9OpTyM8QAk/xdrgOtsjBaAVHzHbNyRYU3Q6o0cLsrWLhr6d4Dqfy5HKLG443Hr6StmhfA7ZYsM6L+19/PX0F8bJsiLVDr9eGMT34WJq9vzHSllQ0EAL744Cl63tkncLv+OIAT+9E4Dk1S2DIQOigcUsgWG2RBZurvtj8uueg0+toLdzONA6WgAVEUx6/aRM7+dEiTCk6v8/owZvkGOeuHrOnI5RLQqjgfrzx6haF0bdlZppigppEgh4UZAUbmkW/U+41WQAyLnk8RegUKcWsBEVwCiIbo4fUpeu7o0q+c7Ez8310X0owMNwjjI/0BEZd8ObJJ+CFM3bCV9H97sLC5vBJUJs2uEgRBQGkZr1uLG6Rb9ivW98emxnRO7tShs8IRi6TZXVq7ECeCvWUHIAjs4yiKVFxXth+Hv/WtMG/rriaxRy78cqQQm3Y3FGcYr4AQgszMDHzx4i3I9LgNpau6LlIuTm4tEyCoDOkMxXel+ExbrSVGYm1rAak0+PnJQM76wQMTN8C/XL3ZguWbSMJ/lCBuGngS7dyuBYQEslis2rsP68vTW8B+cORf5JafJ5B6nz/kciWrfMQNWviQbWhoOjd3SUDvQyCRGBujYz+kKS4FmR/H4pE6DFY4dEWTuKzRQtXBoBuPwjkj+yGlVKzz+XH1d7+R/4z9J633zPLdZdi0b7/sGMR+RgghLpeAHp1KcMrRSQefM2Phiq2abQyIATEKtiE0AWgH6SQJo5mXSgXFxkBaDsADFbrWI2G5DVIoWKiL+1UYLkHAK49cHh0LovUGClw/+Le0PFir6htw1FvfCr+t2EDEUGVzFZerqOJa0jnNysqwuisO5GEUL0m50JcDRdhJ4XAgg5zscIxCMPFVzNdxe4UQhFOZU5FSOmTRanLM298J1epxkbbFTT/+Hpd2V5RVPkAEQojb7cIHT1+b0MVhslAtKhISEIk56eXN4ql68Rez+NRBox5sWRB62OhHDUwFywjLCYihhYUezY3i9mgLqDtK92u2SZB2WZx3Sj96Uv/uCTGzvTV1eHPynLQSsp6fMJ0c8da3wr7a+tgsV1qIG9v8PMNSc6cD9Fw3PPEHB/rAAoUjtuSHk7hOTxQV5sV+JDuvhBAiECKEKilFfgCgrKYWh7/1rfDG5Dlpdfn139+nkf21jZfYcoVtw2NDCCGCQHDm8b1x7OHdTKFvy64yzTbZ2R7zBqwJgZHx2dYCotk/Dk73VIUVLn3NWQrML167zTQB/+d37hYL8rKYY0EA4NMZi8nq0n1mkWgYNldU4ci3BgvfzVtBAmLI6sFeIzJ8kEa179enOwdbh0ukY+pdB6mDsQ6HERBAKAlVQxcjnznQDz17dJL7ODznAMICtsIRFLIpBkQRn01fjGPeGSyUVh60/X6eu2Un+XHhykiQd/Dskbd8EBLMfNWsIAc/vn2nEeTIxqSt2bSHqOxIEqSP+6kwOwOWPkTHh//I0WZYEJDlQejU/PRq3Ey+kRCCG1Z115btqzKNnsL8HJx7ymHU7Q4VJ2ThJxS46IsRQoP5qZp1w+XfjBbO/PhnYX9tnSzzD7sCSBH66gCir0mjRqx16+ZWd41XONYPBwBnblWUEFDi1PkwCl07tVGbXzEnOzNAWG6/QopIWU0djv/gJ3L14DG2nbBarw/X/jCWhBOcKFnciUQ3c7sFXHzmkcjONMziEFWpHgAqDtSAauxPyr3+YT9QypJvEwCwxygaLIwBaey6KFpmjo7NIpI2Akdmtnbe7n37axiexASmcXvg+rNoQW5WQrcZAVFEn9e+st0h8M2cZeSQV74QFm7fA5GKVGryDpm5BUGIdwUgBOTsk/qKV513tDfmwIwa4wy3sZlJbAqrrZHOMWktLLRysMB2bMw2cLtdkX+TmAOGEELuufYMcvLRhyS0Jigo5m7dhZ6vfGG74oWiSHHoG18Lokg1b3lJ+LaSEOTnZuGe6880Y+9E4tgqq+s063zk5RvucqxHBixbwef1sTa1rQuWtnMfBcSAZQoIjfmvrZiMGpq1LNBsczC+ErquAeix6H9oJ5xxfN/ErCAIKiFdXxok1NsgZ/uG8gM46f0fhBf/mEka/AEqdbciJKx0yPdcIAImfPEoHff5I8LqzaWtwy65kBmpjAxHAZFB2uxfBwmDU6XDgRnIzlG+cCMEZMbCda6/vnmCfv3K7VRg8U+O/DHQ4A/gid/+ISe+94Ow52C11V3VRGVdA7q/8nlQ+QBUrQtCaDCC1g8XLjztcHpoD8MKX8eCACB19V5NC0hhcWG67G1uAtADPpmClPKP3WvUYBitgLBJSfz799kOLpdLs00gvuCf4RPx1cu30JLiwsa83gxvpAACIkWv174UPp+52GgSk0JFXR1O//hn4axPfxF2VFaHTd4hxQMkpHgoIjcnC7tmvCeefnxvCgAbtpYi9LdxN3oA0LxZkdVd5g1Wpt514MCBhWhd0lJWjAjzzpUbgrU+rhtwPN09830xKxEXIxJMV7uj8iA9/t0fhDM/GcJttqy3pswlh7/1jVT5UIQg0cRcLgHtSorwyQs3mV3LggQCAU1hOsOjLc+kSkcKf2vLC2xXhsyYymsgmUbRYLQCwhRkkIApyEjomgbXBKgu9hZtmmn2JWbfG2r9CCMzMwPvPX0tzc/NRIT/aablDWWMosBrk+YIJ773vcBLtXR/QMRpH/0k9H9rsLB5XyUVRbk4D3UN+7Jzjqblcz4SC0NmZq/PD78k7iVWCSEk2uXAAQCbMX8HDhzoh9wcdZfjhgZfxBOpIC8b++d/Ig444wjms0sIWqKpSKm4sXw/7ffmN8JZnw4RRPNjWGVR5/Xh2LcHC59MWxQT0C1PYJTyIQjIyfLg0+dupBkWnCssY1jSoaWer+Rj0izug7ee2aNEN1/9WBjtx8FUiDAzy/IUa2lXUbawRaFmG4lraCp1BRIetwtPP5we268b/pm/hni9NKh0x5aHlFBDQAgNmRMIgF1VNejxyhfCEe1KMPj6C8SiLO14F72xu6oa13w/RthaUQVKlQs6qQU+ejLcWDjyBbF755Koz2vrGiDGpKeOdVgLBEQjqsM6CCKteIEDB+kOhcKsJMw3RZGiprYBebmNZ8WwD+6jazbupsde+T/Bp5XohEjOIUppgFK6vmy/0O2lz4Vuxc0w7JaLxea52ab3u6KmDjf+OE5YWVouy7Visy3GnkkEBBkZbpxxQm8atr6bD0K0gkAKi7Vdyi1EIhYQbs4WT5abNQmUYdmKjJZgNAuYUEpRvtvyqtfJmtCsvHVVfXf3QztpPkDCm0xTPsIY8v7dtGv7lojEg0gpiaUmbAGQ7hYKLNlRiiPe/FY45p3vhFmbdhg+F/6AiBf/mEn6vfG1cMJ7Pwhb9lXJWjwAdeWDgKB/386oXPhZnPIBALMWbyBxllAS9WxH+YiG1cHnDhw4sBCZmfF3qYQ0XttQUCxftzOuTa9ubVC1aJB46CEdNN8Ry88ppWJAFOmG8gr0f2ewcNgb3wivTZpDAiYk1Zm2YRs55u3vhP7vDBZW7lFSPiiD8uFCj84l+OWdu63ieVQrAB0ADjmsq5H0NUnr+Z7t5SzNKIB6lobJwGgLiC/UAdUJ9nktDy6W3r+nxWJsF0xLyNIXPXwfE0ZWpgfTf/4/8cRrXhE2bS+DX8OlihAQCkLjOkWBsupaXPfDWOJ2CaRzsyLcc/IR9IxDOtJmWdkphxdV1NXh42mLyPAla8jBBm8woo+qJ7BTUz6yszKxavyrYusWyjc6/8xZo0oTS5X7JgZeUu+mDf+wGRyF0QEa76hoML15zF6csXAtOeHIbrJrZf6I58TtO/fhsEufE+oblOM7BEKEmCJ+VKSUEgpSVd9APp+5mHw+azEpzMrEVUf2oo+dfizNSjFhCKVAeW0tpqzbSj6btZhsqzgILSUn5E/eeMNI4mMQ3W4B3TqWYMbPT4sW1tlg4pkt2jhp5/WGnz30wTB/d6MVEKargPLSCtKuS2szDxG5RZ9WwkNOfjjdrfqwNnj9JNOT1DJIeb5yc7Lw45t3iuf/+x3hwME6iCKFWn0+QkIaiAL8AREbyivw2K+Tg3YUArgFAc2ys9AsJwtHti+hJ3Vui16tW9KibA9a5eViV9VBFGdnwxcQURfwY8G23WTM8vWYu3UPOdjQAL8oNnLyFBQPgQj4790X0f+7Z4DmuE1dsC5t1qEJcKwfDhw4iIBSUDlOPGHacvLEHRco7u8O7Yqxf/4n4rPvjybvfjuRiHJlMySuWFHvDN1LEUIIoSCVdQ34ctZS8uXspcQtCCjM9OC4Lm3p5Yf1xJHtSmim24VsTwb2VtegdX4e9tfVY19NPdaWlpFpm3Zi4bZSUllXj/319ZEziLn/iHYJFmLSfhEQCAJBYV42hr13j+iJVpDMPHvogaoaza4RQvR20499pVmXsFydLfv2HrBczrA6lycFQPbvPWAlDWEpPZXJ4C6GhPVGY+O2UvTp3i6ZV+jS3369OmDIe/fSG5/8gpTvr0YgIGopIaCUcbJoUCkpq65FWXUt1u2tIEMXrQakf64xc40GD2WSBKJe4qpfzw6YN/w5Zrv8/kr1mC+XYwGRghfrR/jvLWfqTRBc8V4H1kAQBIhi5LI2bh8eOMhWzuClhwfSlx4eSI+89Dlhzabdcd+HLsJk11zYOh6qKEvCZ9C+2nqMX7mJjF+5KZo2nSWHGOWDCDF2D4Kg+27rlkUY9t69si7AJoKu3rAnTLYcHF5qIPZuZ8quayhvNUOSUexAJCtF83wTyEicvgTbmE2TKlxuF4hANJ80a9GGZB6vq5PryUcfQpePfVns3qkVU2xDojybhrKXyGoSVLY9KKVUmkpXlo5gQUFF5aMgLwebJ78jJqJ8AEDlwVp9BtZBotBjnzvCsLlw0iU7AKAtre4tP5DQ8xb/+qK44Y83RbkMW1qZDSPnhxY/0Ff5oGHlI1RzKo5Gt1tAr25tsXzsi+KRfTsaTJEqRACYNHulppAiuAS1C1WrlRQrLCC6PMeTzZRd1/YKiNoBQQFgd6jmgYXQqohudCxFKnQrQhC0SVq2bkei7zRkQeblZmHR6P+JJ/XvgUxPBlSLRYWce8MKhbSapOQnGB0uUSJo5FwI3lJJ24YtHaH2qgeHpK6H7ABnZXow4YtHaemsD1RjPZRQr+ibGSQpO8f8rF+cwurDRw6OAmIenLF2EEFmVqNAJccYauoTT/ffrk0zlM/5SBz6/r1RKWoJCXncEhIXayIFy0VWqqBApO6UUs0pgQjIyvTgtGN70fkjnkusDoqBWLlxJ1WyJoWVDpvEPPJ4FqmifBdT8idD6x2YMbOau37nxj0mkKGKWBlW7jvbwZXh1iR+xXo+FBAgyHAmfv2YOHbQw7Rj2+Zwu1xQNC+EMmOFFApRpBGItJHhy5vJw5VFJG21AsvDEAgRlG6/BCLgqvOOo/vnfyImm9KwvsGLQEBGZ5c8jUGvbCrgyf3KqGc5kIfd6jY5MBgxSRLj4PP549Kbs+LiM4+kVYsGiReednikknpQCQEhAiGCQIRQrRB52kJW+LBVRC9TqxiukQWgUR9qBAFBhtuFrh1aYsKXwbNV73FPApEDbsMW1ctnAgTTxRoIS5Lw8IDSHeUsfTe04qYZCsh+rQYHK2t5SmcrV5GC14WmOm75hbnSfshiwxYmP8AwTHF3OOXoQ+jqCa+Jj9xyLi0uyoVLEOQVERIpEBXup5HKkSAIRJAjI8PtwnUDjqc1Sz8Xv3vzjpRo8GRkyB6SUuUoO9uxgIDv4HNHODYWzvg6iEPQVUp5WYgiZfIKUMOIj+6nNUs/FweefTR1u2KK9pFgwHfQAhFVOJZEI3S5nyApMpZ9MdzhWIs8AYFLENCieT6evONCunzcy+LxR3RN5FWmYPvuCs135RfmGUmCWbIndxdc9TVM2XUTEhAThRkKiGYvD+wzrM4JC5QsHiTm37ZDTqiyttpyraxmjjcw3df6xYcG0g1/vSledOYRtGVxPoLyf8xUBC0hhq3jUJyHQBQUj7uvPoNWLRokfv3K7bowhaWrt8t+LjXhO0HousOIA5ciuGccQVlfOMqHAxbIrpG1m/Txtvj5nbvowcWDxNsuP1W2enjYFSqsjESsJbEHGJH5ie9Io2twjGU/cjEWeVxQ8ShpUYCL/9Wfbpz0pvjfe7UzL7KMnU6IkiMO1moLwRbHCKtBOk5aMiJ3POvAvrg64XI0GlYFHTAnC9Z6AKqqd+1BQ/uYCqxSPHTJplPYLD8S+6Dkp+rzabr4WXrgZ2ZmYMi799ADVTX09c/Hk9GTFpI95VXw+wMIp0kMKgfxqRFThSATiCIQASXF+fji5VvpWSf21X1cVm7YTqjGcLcpKdb7tXZDEveHqjByfYf3T5heW15mcAJH+XCgiBbNC7F3b9CvPZwSV/o9BcWqDTtIz676pfz/5Pkb6SfP30hH/7mAPP7mMLKnrBKy6XsTgcwdW+h8izw4NuW7QAS43QLatCzCjZecRO+7/gxaVJCbChVGXL7GDowoilTzNq19lzbcWQ/SAQ31TN5Vq4ykwQwFZJdWA7+fq0QmplcFNwqderXH8rmrQ4yLhFKYxxKtSjY3E1NUkIvXn7iSvvb4FXTztjI8+fYwsmTNdrJ3X2Vw/ZCgjpWAEqLoWifH3Fu3LMRDN5xF77/pbJqqGV8Nv05arNmmefNC7taajWHWWNKY/0oXkaOUaIMbXuSAT7QoLoxyVZXD+H+WYeA5R+v+7oHnHE0HnnM09fkD+PC7v8gnP00ipfsOpq6MhBCMdCcCRaNiRUDgdgsoaVGEww5pT198aCDt2yOplPpyoCqfJ2qCV47HZDium7cu0qtPsbAj39XtvAqwyd2a8nsqMEMBWabxPQ34/FYshFgrA2FoYyu069KY45tSSoNFNCTFwUP/qK6pR15uVri/0v9yB0IIunZqhREf3U9FkdK6+gb8OWMFGfnXIixauQVbdpbXBQKiG0EmGTFsS27Dwty78f9pY6cFEsyT7nIJOPSQ9rj54hPpv6853bTx2LwzPjAslke3LC40c8h5hF2sH6zvDf/b8a2Lh6N4OGBCs5DFXw3rt5caGtOZ4XbhsdvPo4/dfh4FgE9+mER+HDeHrNm0Gz6fH5QiIaUkfA8mCMHigVmeDNK6ZSEO79WJXnb2kTj3lH40K9OTcmyLCuTGSgQbr1K1WO4q3U9CiWRU56PDIbopVUaPi63g90d7vyhcRmvfiKYAMxQQ1VxflFKIAS7OmGRvJonMM8yEIkPteUQ3GtrgQeJC/qM0lOGOhGTxhSu20NOO62W7DSUIBLk5WeHbp/DHbp+f3nHJXR/89fkrN51eX+97ZPm67b2Xr92Zt2FbKdm+Zx/q6v2orq1DVqYHudketCtpTk89qge6dSrBiUd2pyFlzBLU1jXIfUwj/0+afBB6OigfcnCUj0Y4rlYOEkZ2VqbmjfqBKrZihHrhvhvPovfdeFaEqKrqOsxavIFs37kP0xaux9ZdZaSuwY/aunrk5mQhJysD7VsX00M6tcaRfTvgiEM60pYt8kmD108KwzGdfCjlSpezzJeYc5ZuFAgJxuiLVF4rI4SgyyEdjHLBarIB6ICM9Un+ybaPAdEy4VCRUhK8oLfc2BCrTMRWSVeziEj90nlgEMjJzVb6iga1kCC9k2avxmnH9bKaXL2QkZFBBo//+mERBAIoSI/OJbgsqKBwL9hUHIjf75EbotDq6nVIx0Qe6UAZvKwFR/kIggu+6cCe6Nmjk2abvfGBt6aiIC8b553SjwLAv685HVDnQQQh3hBTt4OHzJyxsW0J0zNh6vJIb4hSDCcBMrP4qFki038j2poCv88PGp9tU47O7QyPSxpmHHwHNVtQoLbG3JuJxjfH/U4V2iXijmWmQKFcIpQQJtPsnCXrLdf8dAUFAeAK/ddWqGtQCQwLrczCQm6zgpgB282pBpqy8hHOFBb+ceAgabQIuqaqCns1dYaWNdATeifaMApJX+otXbdd6g0uWw7B5TIuwaUZg8Mr6muZ94GhKWrNOPw0895RSiH6uVESpbcLqZjrUh1bXQbEFUwRKE976A0btxma6tlBAlAtlBWaxVYtmllNplVIN/erpngISpUOHubAQZqgIF/7YibZQoQmIxy/qARbdEILO3bva/wlNvNX6He32wwnnYQRO/624+N1NXVMCQAAHDCSDjMUkF1g2DD79jCVhTcDcrQmu8Asv93Mys3UdG0rP1BtNZkOQmDhCcUMwZYONGH1GNrlhjNVxFo5rB53B2mK4uYF0R/IrDSdM7UbActlBrNwsKZB5dsga8wryGF7GDtUKq5wD90W765te1n6TwGUGdkhMxZ7AAwDt2trKa8LIlW6LE3rW9KupSYNnKVBbrKob/CqH5ChrzIyuLwVMgN68QgepJBk+2KHzepYORyYDo/HE73W5Ir6UcDr81tNqhKajPIBAAH15EMEAEo6ttLiH4nyUT2Uj0QsIFzyvz1bS5Ppp+4wa8GrVrujoHTb+p0mkcIEPbVkSxWrbod20lxEFNQON0Npj/WbS2VT4cVWz+3cmcu0hEYjndyvkuW7PKcFd5QOB5aib68umsq5SEVs2VFuNalyYN3XabG3/IGAVg0yAECv/t2sJjVVcDlfW9fuYGlmuKZulgKi3hEKumXtDl4OVl7o0IXmY844gmkD7NlnaKyRAwZs2lmmMI8k8h9CgJymnYY3VVh5IESy2qTw9zzxJ0fpcMANcnOzmayDe8oO8LSHwuCRJsOwZuNupnZHnXoYb3yFN3qSwm42F6x6o+kwSwGp1WpQc9CSLFhAdBYHo5iAZcylXZfWqh0PY8I/S5sUA+QRZeWKCeOi5oaDdNVWwO7uV7wpD8nAiedwwC1cGURTzgCA3WUHrCY1FonIYWmx54b8Pi+aF8r0ihCC4pImm3BFDrrNvTc+G5zcsw0PzDZLAVmj1aB6v3a2XgMhzWVtRDVwo+NAVFPxEuVUvJHnD5kwz+7Cke1RpZCKOjIxodkK8FG400w4yod1cKwcDmwBrzfghXSNKqzW2nqf1aRKkQhfSJv9N3HGcu1+88kx02IODlbG1huT7dYyo+kwSwFZr9WgocFSpqBn5ivuIAgCQNT7s3S1ofVmHDBg3orN6g0iqQldVpNqV1hxeNhN+XCsHA5sidzsLKaqzbMWbUj00UZmTmqSCsjmHdHJlahM32xyztkuAB0AfDGJGKh8QM5mtqclD7MUkJlaDajI1a0u9xWzE0FufpaW/oGaWsPd/RxoYPfeStlJijBn2mTdr/SAo3wow7FyOEgHMAUybt9TobUnw7Fa4R+pAhL+zGyk1b6sj7FCyVVBNyAFb6pIdA64nTPGpEOacnuqMGsjaYbcU2vTMJkhJCTzDl3GpDBYITb+4ZIxD/ClADZJlFWon58UoILQpDI1hqHH/rRKAeERjpXDgd7gYR1VstBQpu7urVUEUNouVWacSOYrq8dWV4hUWd4goVu25q2bW00mT9Bt/imlrE8zPDWtWdLMcq0GlAJ1fN3C6y08GC2MKD7/sON6M6Xv3MpnesImgwavfLI4iaJI3C5bmKV5g9mHd6rZrowaA0fhcGAU/LB4XRGgHAypQ6trFOWMZPZsqlntWJBW+3XeUk3PHgIAR57cl7d+p4Wrfk0VcxX0lUbTYtYhuV+rAaWUrl26iafJ5G3xJ41jzmRLxTt49Eyexr/JQeVgBBCSaoUmN0V2tH7wMEmOlcOBWaA0mOnSm/KTUoAI5EBSqFPpnreqWjZZlhmKRJLdSi98M3qaZgYsAOh/Sj+HZzVCt7FYOnslaxV0w1PTmqWA1INhI61dmHBwmF4wa6FbIpi06dRKOROWpOdjJi/mQXBqsvD6A5pt3E23CnqyMPsQs9Ly4Vg5HFgBQgAXLFa8BSr4wCBneP1xTVKlO5m/Z+ETaad8AMA/c9ZEjZecokgEphS8Zq63tIn/WDFXMyltmP60KUQIaFRDB4BNq7aaSI4qeMh4oeuzMxQEV+nm37it1EDyHGghNjNFLCiA3Jxsq8m0G8w8CMzkp2G/cMfK4YAXZFj5cirQLWCoOSbDZ/U4l/U+2xNVPnzEhBtrPbCzNNohRs4dyOOxdCmlNbZt2MWyVhvMoMXMA1MzQ0X53v1W3qDQmH/zEvilCw0ZmR7Nx/t82jfwDoyB1+cHi1tmcfMCq0k1G6nwhHRUPqTKBg/8yYEDCsADi+OeiIhaAJIIc/ntEQhQiGLkO71kjkSeo7ec4yMChlCA+9spSqlcHSvpRBEAyMz2MD/TLNKtJkAv1NUw6allLI1ShZkMY5dWg/oaLoLQLQsWNxKt2jSXrQUizf9MQZ10vBZCNjAs5qP91hbstBvMOjTMVD4cOOARlkuMAqE1ACI3NAq1DUAptTqWTteXE4JdVMQ1VnaIFXv2VYGqs2UKACUdWllNKgvMWkS6nmP1NUzGDcNrgADmKiALtBqIAZEHLTNOG9cZiT5TlzHpd0JvqlULBAB+GjPbiQOxABWVtbI1PmIXY129oyAywixh3az94igfDngFF/VuAhTbwKAICQLB/sqIp5aedOv1rMTOfIocWOz+xoqvhk5VDUAPp+A96rRDeZAFFag07G9MgciWAWuRGbSYqYBM1mogipQ1PZhRoDK/c7uQZKDIAE++4FhKGDSQL0dOt/wgaYrYtnMfFGoMUuk/6uosTTRjF5iZVMKM/eIoHw4caEAggToAmVEfynACQgh27KkwggRLFBBK0MKIzhiBIePnaAWgE0IIjv3XkSxjYLUFwur3J4yAP8D6tLVmdMxMBWSbVgNKKfbu3GciSaqwLGDcCOTkZYEQ+emW6nwbt+01mzQHAFo0y9OMAXGKoDPDDAXEUT4cNCVwfxEnEuEiFqIppWiWnwNY4+Gg/zup9dYnVuzYc0CzjSAQZGZlaj+MX3C7V3ZtLWW95F9mBj1m5vRk0ajo7u17SUn7FlZNoHQjG0kDSfD5TIUE1Z6b4clARlYGAjWygeaR59fXOzfsVqBrx5bIyspAbZ26f2YgEIAoimiiFdFZkE6uV9wqHxs3bcWBA9Vo0aIZqqtrkZ2Thc4d2zrrMn0R9gbgdoIDDYGrBEFwiWLUtok7O7OyPGjftjlgnAKSiuzArfCqB7w+X3RnZYThzJwsuN3cFNxNq/lYv3wz65pnytWbKsxUQMoQPFBVGdiMcfNwxAl9TCSLCawKANdo06ElNq/ZrtFRil3lB9C2RZHV5DYpBN0Ptdu53S7ZWJE0RTLxUkqWCT2FeTOEMMsPvvqGBqxbshq/jflb+GL4ZJRXHpRmD2oEif6HIBC0bNEM991xOb3kwpNpt64deRIoHCQOSijdTwnRLMxgJYhbyPBkuEl9g1d173CrQQVh+b43Cms37WHqb7tOJVaTmrZYOku2CGHsHIgAKs2gx+yqZgFo7P9dm/cwPsoQmKlopHpTkjDadCqhm9dsj3svpZQSiVQ76Kcp5MWHBqYtI+QRtXUNCnVAaNQ/KUVTUkAS3Y9qbQXoE9Nllvxi+v6rrDyIoaP+Ij8P+4usXLMZtbV1bHF50iglAogiULq3As+9+iV5/rUviSAIyMvLwaG9uuDBu6+i/zrjGJqXm2N29xwkD0oJygHwrYAQEg5iblywQYYZ1a7B50d9gxdZmYYl7lI729V4VFqfuW9/PYGJl3fo3pancTCTFhblICXs2ixX6y3uFaZlujFbATkIoLlag9pqzTpCRkNO6OHRVJsw/jXwJDrnr4WCqJEGYej4uY4CYjK27CyXy48eBQpQwWVt/kibI9U9Z7ugQ9WXUIrtO/bg5rteEpYsX4/6hoaQFY4mT0H47wkAEFAKBAIiKiurMXPucsycu5wQApKdnYVjjuyFrz95WmzXtqQpKdU2BekEzo0HhBAIggBCiEApFYHgSiYx+9bnC2BPeZXQuZ1hsdvJ8pm0PnMnzY6+fY9LkxzSH0+/9EQ7jIMtFcn6WqYUvKZYPwDzFZDFAP6l1qCeryw/YWXEahcsXd7ftktrEEEAoSKhMdea0oui3WUHLOxq08SmHWVELj96rKroybBFtsV0hJmpRg09wA5WVeOSa58UFi5ZiwavL+bbFJSP2B4QebZFKVBbW4+pM5eg+xFXCVmZHhx9ZC+MGfq2mJuTZWTXHSQPW0QFCy4BhMTwzZhlSEGxaVsZDFRAkgG38V56oawiuoZVrAxCQCAIBK3aFVtNaoREqwnQmwafN97LQqZezmKzOmf2jYZmbmFKKcQAN3vRjtdyijS73C5k52Zr9svndyqim43la3fKfh47UZQLntgkYft6Hz8NnUBKul8gtOp+gTBr3grjlA/J41gCm+obvJgxZxladD5HaN3jQmHEr3/bke+mM7io88FEKAmSKnUpllvVy9ZtT+i5SSAR2SrtmTqlFAFRk7WR3IJsnqyhavPCDZGs8Db4WDNgzTCLJrMVkKlaDSgotqzfYTJZTDCiJojpi7hD99bBF8fv8qi+rVjH5RykLfaUH5D/gkT9k+TlNrkbYh4OZ9vGfYiiiHsffZMUtvuXcPv9r5HKymplncCwkWZ7MKXAgQMHccO//0eK2p8lPPb0B8TiulAOgrCNsJUXvGDTxN59VWaQI0B77OxWaywpTJu3lmkNde7Z0e5jwS39qxevZ93H/5hFk9kKyEzNFhR02ew1VjM8MwuZ6U2T6jOPPv1wKt8u+vHPfjDK6jloUlAqjBVlHiVAq5bNWR/pIB7J7Gsz94GufOfhp94jRe3PEr75YRyJtnbQmB/dXy3TKzWtJ5RdIfwDivqGBnzy5UhS1P4s4en/ferwImvBrVAVi+bNCgAA0qK7ckrs7jLT3NwJlBWRJqF8AMDLn/0WG/8RB0IIjju7v9WkRki0mgC9sWr+etamS82iyWwFpAoME7tm4TqTyYoDYfzMdjjixEMpCcUxR5mpY3x7psy1XAlsUijdd5BpvHOzm5wFBFCoJ6bTc7RgO9erCX/OIq17XCgM+mY08UZlVgsL+4j50dn1Sg5U4UM5EUxCV4PXi3c/HkLa9LhImDJtocOTzIetBLGsLNnMVnF92L7H9ILHsW5sTUb5AIC5yzbFfhTXdyIQHHZsT10uWi2EnklOdF0f65ZtYk3Bm7ZZsADAC42AttKdZRaQpQnpVaGei1+AiQFo+UW58GR50BDMhhCTsrCxZ/H+4Q6MxP7KatXvg8oiQU5OVpM5tEKQJoKIGhIT3s111p9YbNi0DQOufFzYsn2PzA1j6koGIUCm2432LQsw8Lhe9KGLjqOZGW7U1Hvx8e/zyIi5q8mu8oPwKsaQSVknIz2hYPb9B6pwwRWPkG6d25IJo94XO7RvbeFINylYnYAlIeRFkhjEsIyYXpSWm+KCFQvbjKPeiI0rjQtAJ4RkZWfCk81NroO0iv8AgIq9B+I7GX9QMKXJ0gtWKCBbARyi1qChznLhl0emqxtNxS0LsWvrXs0XbN1Rjk7tucoUkrZoaFBe84QQEnYp6NihSRZpipFck9oHiYrfZiofKV9AXHHj/5E/Js0h8gkkklc+CAHysz249Pje9MVrTqe5MjfMuVkePHX5yfSpy0+mAHCgph7/GzqVjJ67htTWexuVIQqEym0mFmYacuGiINiweRf6HHOtcPklp9PBg55vasq4mZBeuNlGES9p1VyWP8Sm4/XK1lxyYAQWLNvC0oy0aJ1QmRkj5TNe+IqudHjrZTPMxr5jrZkdtEIBmQENBSTgD8Db4IMnk9uUo3orKKbWBOlzdE+6a+veYKZ+QqQpeaP6ddfz3wkTv36Mm5Rk6YwGlQORhP8HICuTmxsisyHdH0YrIGZePqS0v3buKsVpF9wr7NxVpltwuSAQ9GjTHO/dcZ54RKcSZCRYxbwoNwvv3XYufe+2c2mDz4+Fm3aRR7/+k2zeeyCcCYcmqoME+xGsL+LzBzB01N9k3oJVZMr4T8SSVs4lic4Ir5gAgjeiOeDvQk4WORIXVUJAGl2Lo4/s+gbLLzmbDB589acoBZYqpHI87KS+vAj+WrDFXpCivqYBVGQa3r/NpMuKm40JWg0oKDav2Wq7SU4BevdV9XnHn9M/EgcibRtrFp2zdKPV49Jk4PeryKESWY01y4uDlGAL3vPr2H9IvxNuFHbsVFM+2M50t1vACT3bY+5b/xZLBz8uznjtNvGYbm0TVj5ikZnhxok9O9I5b94hlg5+XJzzxr9rj+7ars7lSvLoCVtDKLBp6270OfZ6YdyE6baYLxtAGhkUCKUgs1VO9oKCPMlvjcsiVuj1W59q3i7CdspYGZPVlMr4/RCB4Lgzj+BlTFIqw5oEwokKDMPa5RtZMwpOMpKOWFhhAZml2YKCThs3j/Q8vLsF5EmosIkgkijad20Dt9sNX2Och6wFxokDMQ/1XnkLSGy65NYlCZmp0xFGWz9s4W7y+TcjyaNPf0QCijWTtLtMCNC9TXP88tgVYqeWhabQ3b1Ns+w/XrhepEBg3a4KcsuHo4UNuytY9aTGroVWQU1NHa657Tny9cfP4OrLz+JFgLErKAAfABcAQoOsJws2OgcLCnKZ2tXWO2ebGfAHAkzubhkZbrTiqzCkWTClxs7UMXNYm84zs/NWHLZ7wOB2sG3dTl6ZXnjB8FwTRPVZhBDk5GdLf5dmw4rC0lWGF2xygGC9BgVEzWXnjm2tJtVqGKmAWMFzEn7nFTf+H3nk/z6UUT6k6WyVe00IcFLvDtj8+UPirNdvN035kFApACCHtG2OWa/fLm4c9KB4XI/2iTllSRiV3x/Abfe9TK677Tlezww7QEQwQUw45kNA8ILSk8pDzUb7to1CrDQVbywCAcstIE0CsfU/FC4aSH5hHtPzTEAqcl0ycYZKa1RX+XL3lj0svFEEcEDP97IMgBXwajXYV7rfItJUYeQBx/Js3RZlzyO6KTwrmkXc/b/vbHEjbHeIcv6ZMp7yhQV5TfGW1yzB0ioFhPm9t937Evn9j5kkfr2wBZqXFOZi1Uf3ir/+3zVibhYfsmV+dibGPXutuPyDe8QWhTkJ/GVjhwMBEaPH/UPueeQNRwlJHGGbUiaCFg+WAnpcol2bVuq9DEFk84c3ErYc30Tx6OtDYhQQGnfTRgghfY89hJcYPS069Hq3qXJVZcVBlr7WmEmT6YMggWahD5UbYTMRG/gaW73Ltjj1omMhiQMJ9y/OV3b5WscCYjSqqutki2XF5Z0lgCeD28QMeiEskAuSH+nvRr7Xyj5rYsBVj5NfRvxFkkmx63IJ+O2Za+mKj+4VWzC6qZiNkqI8rP7oPnHEU1dSphiRmAKHlAKDf/qdXHvrs01CuNMRBCa5ghiN7OwsyaVNdHekW0QUKerqNe9BHaSI9VtKNdsQgeDkC4+zvUyVAEy9bAbkFW4ZmWOR2QNhlQKyTKsBFSmtqqhmeZbRkCsVbJUblm7v69q7E3W7G0OAokINJG8JiCIPt0VpjaqqOpVvowIp0xnSisF6CkI8u18x46IrHyN/TZmXlPJxXI/22PPtY+IJPdvbYgWd1rcz3fPtY+LhXRhSTssoIb/+PpVcceP/cT2fDowBpZSZT9bW6VLyQAR7RRsublXNgs8fgCgxeChlv/J4MtCuCxd1fVjmUQ+XKVN50/6ySigEoMd+uNJMugDrFJDPtBpQSrFw+lIeDhGl6pFGHOam9dfldqGgeb7su2M79sbn43iYh7RFkbLbSUyxJqBb13ZWk2sEjLx9ZdmnPLgZKvb/7IsfEP6eOl/me3Xlw+USMPmlm8Vxz15rS8Fn0v9uEv94/gZRENSXRlCwiVZCfv9jJrng8kd4mFcHJqJHt/ZUJZYoardkelK2JksvJ8OKSOyPCHYlJa3wxOtDY92vZMegqEUh3Clm29MJZsyR6Txp6pjZrGfr+2bTZhWDXsrQhs6dtMQi8tICmouu+6GdmCoHfDl8qqOAGIi9+w4ytaMU2FteYTW5esNq1w9ehFTZMbjpzhfIjDlLZSubq930tm9RgF3fPCr266TiE28D9O/WBju+ekQsKVR2GyMAEUUap4RMmb4Qt937ksO7mhDKyvczW0Cq61JywZK7hJRTQNT+Pq0x8s/5LHuP9D6qR6JjweOe5nY+l85ZxTpeW82mzarDtw4M+cV3bWaK3Lcaei88rTnR7X3HnHk4BImvdTgbVuxNxZ7yKp276EAK1nTHhAAuFxc3RXrCDnvcEjz57EdkxJgpcW5XlFJQkVKlgTuxVwcsfvcuUUii1h+PyHC7sOKje8WjuytngCMA5JSQISMnkWdf+jw9BsKBJjIzPWrZ1KK+SdEFyygPCLkfW2LfgcaYZiX3K8El4OTzjuZBeDeDBkvmsmyX7KVlbH99ALTzJesMK2//yrQa+Lymj0c6QXOx9+l/CM3IcGv+DQXFpm2a0+UgSfgVajnIWaxbl6RVrnSj+Y/WocKL9SMOb773A/nsq1Fx2a5oEGJsfZgwrjypLx3z9DW2dLnSwoTnrhcvOlo+W05oPGisO5YoUnzw2VDyyedDbSvIOWBH82YFsR8pzruWa58K9Nxf0gQbSgqI7bKSLV+zHTTqMkDeLpWZ6UH77lyklk8l/oMVrH+vqzLk98fL0TLTsU3Pd7LCygN4lVYDSkXUVdexPMtqmBmMrtu7XG4XWrYtln9JzFueeNM5wI1CdW0DFC6I4j70+9KmgJYZvEdtr/C4ngkALF6yGm988CPxRVVrphBFUaSUUiJDOyHAgwOOo5/edQEPt4mG4dsHL6G3nXWkkp8/Cepn0UqI1+fHC298S1av2WQ1+Q4MRmyWQKmeLl0yFBR7yiqTeYWeykciioWtFJGHXv05wt/VXOI69eoAYh9LrSk1O/R8XuW+KlCRSbbQTAxlBKxUQL7RakAp6Lx/uAhENxum9bn/6f1oFJNu/CVqgf41a0VTnAdTsHEbm6shIQR19bpkbrEaPKwlHmiIQ32DF5fd+IxQUyO9eKEQJelkYq0fhABPX34KffbKU9Na+QjjjZvOoo9eckKcEiJIXEhjlZCDB2tx6XVPCQ0NjlU9nXGwmr2UQSCQkC6hdxarZGUvLvlWLOYv39z4C1VUQWjfY3rw0P+0DD4HgGnj57GOl6Y8bgSsVEBmazWglGLun4us3nB2PtQ1x+7U84+jQnTOfdk4EJ8/gOqaeqv7k5bYsYe96GZBQT5zW45h9Z62+v2KuPSaJ4Tde8ojv1NKaZTyEUM7IcDFx/aiD198vJ35VML4z2Un038d1lXOEqKohGzbUYqB1z3Brdudg9RRkB+XrEBxr6/euEvrcdJMVjztL67X8L79B+GXVJpXytUnuITA6RefyNO4Jgtu+7B05krWs26hFfRZuZC3QftGge7YssdCEhvpgPYis6UbVn6zPGRmZzK95a2vJ3IruNkZWZnsFakTacspzFpDdnO/wqtvDybTZi2J/B52uYoiPMb6cUqfTvjqvgHcHoBG4pfHLqfHxPiPS8enUQkJ/w78M2MRPvjsFy7n30HqyM7KZnbpycp0y2WtilU6muTeSgVPvzsqag8qtcvOzSaZWVycZ2bEf+hJCzNKtzPF7ooAtCtGGgArFRARgGZ6JV+9j5eq6ETjO70XqCkKCAB07d1RVsiJvbn4+KdJzsFtAPKUFEAZ1DfYvnqv1YzcKJ6X0p5cvHQd3v1kSKjoZzDeQ+tverdviZFPXcUFc7QKvz97vdi9bfPI77GLKxS0H/ldFClee/dHsmGTJTGXDgxGTW1t1O9RukjM4ijIzwGUFRDewe1ZPGT8XIkCojyWPQ/v4mZ7oqH9Tlv3q4A/AJ9PJgA9PirHEuUDsN6UN0WrgSiKtPYg964/vDItps161pUng8UNq7auQcWd00Gy2FHK5oJFCLFTwJ4cjOA3PCzIlJWAR55+H9XVtYiN95BCertfUpiLaa/e0qSVjzBmv367WFyQHfmdkGi+RykVpcvkwIGDuPeRt6w++xwYgAwP+426k9lRf/j8AXhDiVI0RIXAededyQPvZqXBdgHoB5QC0OM/+kvnPjDDaiY8SKsBpZROHDqFF6lLbnEQje9TgSn97n1kD+phNIV+NdQpSqg3tpfuY2pHCAGxfMtyh0T2nJEKUNL74t2Pf8Hc+SugoHyQEIRw/IfLJWDp+3c7yocES9+7W3SFLlGITCWI2HGdPnspPnJS86YdaCCgfEkTwyl2Ml78OGDHS5/8JnW/UuRR2TlZpPMh7a0mN60x9vtJrEqTphxuFKyWZmaxNFo6k7mSo5GQTpqRSocUprlhtevSOvrFkYwy0e1e/HQMD3ORVqirZ8vMQwBkZiZjtbYEsW6JRvEaq3lYSvuwrr4Bb3/0IyiVt3yQ4EaMiFREIBh094XU5bK623whM8ON1284k6oZCKUWXUqBtz/8hSSYCckB58jLz1VWQGI+rmcsAKsj0v7s/HzoP7JyQyw69+rAQ0VdPWQorWdYNuerFqxjffcCq2i0+hSrBYP7wj5+bipkU9TKfG87nHP1aZREF2aS7Wv5gWqrSW0aYLKccge5olrh340ATeBzI2iQ8q6kpuehJ99FRcVBNeUjCsf1aIdLj+tlg6VgPm7515H0sM6Ri5Q4XhxUQBqHrnRvBR588h3b8mwH8oh2E1aeXlF0tpGeoJSiqrq28RclEIjnX3+G1eQmglR4hGX8pZpNVguEfiyB1QoIAJRrNQgEArSh3vbBt8lCaY505Z59+vegHk9G3OdyWSx++HWWc2jriANVNfHCkkJbn5e7OgaxSofZ75aDLSSLeQtX4efhf8qSG7Z8SD/LzfZg7DPXOlf2Kpj0vxvFnMwMxVvwoKLXON7f/zyerFnrFChMF6jWSYrZZpX2KHLM2Bvr8cYXvze6X6nQl5npEQ7p1zUZ+q0KQLc6cUrCqD1Yp6Rgx3641aS+yYIHBWSyVgMqUjrrj/lWC71Wv99Quj2ZGXFV0SMXsDFL9rUvxtl1LLhEVmYGE+MRCEGGhysXrFSyv5l5gBqxXmMVgYQTUdz98Ovw+wMQxdhUu4hTPohAMPeN2x3lgwF//e8mUSDKcy7NzOPzB3DzPa/wcA460AFZmR5mF6zcLPbsgw60IXG/UuWDrTuVECE5F1I9+bgZ7leWYcrYWUTOCCXz2Z9W0skD4/2FpdGsCZa5qbHCSKHcFIH/XAU3rNjbjC07NI1WDhJAQV6W3MdxnMLlciVavddIGJF6OhEk4n7FXerGLwaPpqvXbgk/KloBkQmiPqV3R5QU5encjfTEIW2b46iubSlRUEJiU/MuW7Eeg392LlXSAT5vAAJjEHqhPN81Emm9xvaUVwJQr/1BCOgFN5xpNalmIdH51k2hmTdpMat3wFemjkgMeFBApoFh4Hdt3Ws1nVbCFFeTY/91JM0tyIl7dyxDoaD4/GduMpPZHjW1bO6FhAQzIHECq5UP1vebmfqXyQpCKaVvvv8joTT+tlBOaM7N9jT5eh+JYtyz19EsTwaIwnW4NDUvpcDb7//o8LM0gCfTzZyq/MDBWqZ2HIK7m/dw9ist60dOXo7vyBP78kB/Wgegl++uYKV/rVU0AnwoIFUAGrQa+X1+6vdx5/8uhRWbSvd3tmwT54Yl2+65j0Y7B7ZOOFBdKzOW8VPr42f968E3Ulk/NMnv9ICWIqCmhFAA4m+/T8POXcEaBHGVzmOsH4QAL197Bg8Htq3gEgieuORESoKepAKRWW/SeJCNW3Zh0pR5Dk9LAwQUanjGbqKy/QetJjVt8O7gP2Rrh8WAtuvahofS54nwU9vxBG+DFwG/7B6I7Xc1gomgLAMPCggAbNdqQCnF1nU7rKbTSiQ7VwltoGPPPDw2xadsHEhVja0D+LhCQ0N8Oki5mySXi4fMhVwwZFYarKJVrrKyGPovHn3mw5D1I3qK5W7rm+Vl44bTD3MUkCTw0IDjUJDjCfoKBqP6ZTJjhXzgKPDgE05GrHSAwGgBafD67Trf3PGD+gavpvUDQODk849Odsytiv+wXQHCpTNXEcaC0Rt07kPC4EUBGc7SaPTXE63ceNxteiNwwrlHU3dmXDYsQmUyez/xhlPISw/4/GzeNZxUoedhzlkPBb1pTcQNKlYBAQD8OGQ82bU7Yv2Iel5c4DkBRj7puF6lgu8fujRSG4QgPrMYlQSEbN62GyPHTOZhfTtIAax80mt+HZC0xM1PfsVi/UBWThbtf2q/ZA8xu+1Ly+j9e9QMxdi3mI+Y4q+NBC8KyCcsjbas2W5ZvuIQrJYA5RaWrjRl52ShuKRZ9EsJIXK3G18Mc6qi64FMj5plo3HYXW7LLSC88AslsBUAsBCfDx5DaHzcuSzatyjEoZ1aWU2yrXFS7060dbOCyO9yVqZwfRBKgS8HO4VW7Q4lS3HsxObmZFl9nqcFRv21gDBYP2irtsVuT6blHlh6zbne8R+6rcWdm/ewNv1Gr3cmC14Eij1gKIbibfC5OI8DMRqGKyAAcN61pzNVWvb6fDho71zqXKBaNQidG3mIG0IsojdlS8TiJauxaEkw5k8r+NyxfuiHrx8YIErVDkJIHHOjYlAJmTF7GTZu1vQIdpAGKNtfbSZP0+tdXClNe8qr4A8ENK0fAPyX3H4OD/JmIuPHA70JoaHey1orzA/A8grfPA3wGoY2ZPOq7VYfylYGwCaLhJjfYcf3plm50TnSlawg59z+Dk9ryJaorVPLwdA45IJg6VDbSQHhktYvvx9LgmmUqcyBHX0z3yI/B11KiqwmOS1wTLe2KMptTLkayh8d7YoV8sbyB/z45IuRXK4fB2xQSpwSe3ip811uwZWMcc6tbwoM1g9k52TR3v0P4Yr2FMBtP9Yu3aAU/xH74TKraQX4UkC+Zmk0adS0Jm0CQXJzltCBmp2TheYti2IZuezCXrp6m9XjYXvExYAosDcLY0DsJpBxZ/0IBEQMGz1ZMVVlLMFv33I2t4ecHfHC1afHRfzHtqEUlFLQn4b9SSmlTf2csS1k+KQsP2ANVnegjA1b97JYP2ibTq0y3cm7ENvNemSZ+9XkkbPYiuAA75s0FqrgSQH5iaXRinnrLHeERxJVj02gR1dcee9FsUUJg++h8R+s3cTsc+hABnJZsOQgCIYdmOGigkLMD5F8zzt42o9xGPTVcFJdHcx4qHVg52dn4oKj0+a2kAtcd1o/mpXhjvyumMWAUnqg8iBefvOb1SLAlEzfAV+IrbKtZBE5WGtLCwg3WLxyG0SWSzEC8doHLkmFn/GmgHAb/7FhxRb5F8Rfev2m1ztTAU8KSDkY4kB8Xp/L52SviF3gugsr3ft2odnxbliC3IvOvPl1ntaR7SCKysteyjgMcMEKKx1KVc3D39sJetOri8vnZ1+H6uYwHNg3nuGk3TUCFx/XMybuRrFIIV5+a7BLoPQlMJxJDviCSiHCqPn3+x0jVyo4+/a3BDDIHjk52YEOPdpZTW6iPNUOl25RqKuuA2OMtB8AF0VweBMuNrI0mj95qdV0Aublh07k3WpIaK5dbhc6dm8v66kQ+0FFZY0JXU5feCQ3s0DQH12unUtfC4jUwpEO4FZoX7hoNTZt3Q0AEGNS7wLRAeiCQPDM5adw2xc747Ub/hVl1SUq659S2nvRkrU3Ib32SJOAK84CIj+HmZ4MpufphLRaRwFRRE1tPRjYLu15RLdMi+MXk4GV8l1SmDZ+Lmv9Dy4EaIA/BeQLlkbjh0xxbqVMwOkDT6Qud/QSUVrgtz/zdVoxWDNRz2jRI/r5LPO273mFLtaPT74aQURR2WtTWv28S6sieDJ48DJNPxTkZKJd8/yoz5SEU0KI8M1PYw9HmgmOTQGssXK19V6mdnqRZclgGISB937ItC+IQAKnDzzBanIBft2vdMO0sXNZlSamshdmgDdB5CuWRuW79gmcFGWzErFzxzIgCW2OI07oQwslOfSBkNuCzJuGjJvnHNRJwh9XiLBxgKXxAm63m/WRauBtz+uB8BhxtwYbGvwYOeYfxeBzKQgBHh5wXJNnbEbijrP6R7thgSgoICA/DfvTTSnlbk05UEcGY7CzDV2wuOENf89ezcTTils2E3sf2YOH+A+z3mlJ/IcoiqjYe0D+BfGy8lA93qkHeBNGDgLQjAwTAyLZvJbrXO1WMArdFRAAOPbs/nHB6HIuQiIVMXPheuewTgLuOCuTfDsdLCBGzY/VB6MRCogufRo26g/SELJwaQWfZ3oycM0pSVcKdsCA+y44hmbGWJiUXLHq6xvw9z/zHZ5mM8TzSfkp1OlChxV67GsueMNvkxcTkTIZh8UzBp6UauVBPfafXvEfRoy/Ls9ctWgdEQOKcyJ9Ry2AegP6kRR4U0AAYAlLoyljZllNJw8w/HA876rTaHZOZsyn8nvmhic+dw7rJMASZwMAeZJaBsm+yqAucHEw8tinL777TTX4XCr8nta3UzqOI3c4pntMQKxiMDrw1gc/OjzNZsjOzmRqp3NMHQvSYn/f/dxgJuuHy+2qPf2S460mFzDP/coyTB7JLA/Pt5pWKXhUQD5kabRk2gqrCxLygGSyYSXEdbNyM1HSrmXMGS3vhrWnvNLq8bAltCckONjBOAIDX5M8UuUjqXQs/Lfc8bI9peVYumx9mEjZPoYzMRGB4LO7LuD2gEsnfHb3BdGV0WVbBT+dt3A19lVYXjDYQQJQtjNGfxFIjZ82WeyvqmVpRtt3aU0yzA30l6UjwfZmul/phg3LN7Nabd6wikY5cHdoAxgDhkXjbfAJjCnHrELauGFdcse5NDa3upJA9fDLPzs3hgnCF2BbKinWAUnXeTFin+lyuTFl+iLiDfEoLferopxM5DPe3DpIDa2b5SMvKy7FuOz+qKtvwKw5K9J176QllD1VY74w/4RmrR9GGT8zHTc/+VVkEDV4mu/GRy7LSfF1TvwHAxrqvfAq1BKLmSMK4E893qkXeFRA6gBopgWilGL7hl1W0skFQ4AJc9j7yB60WcvC2I9lN9tXI6Y6h3WCyJe6VsmsqrCp25Nh+W2SUUh2zYgp/r2h+OTLESFXBe2MGRcclVKgpoMEcUa/zjHB6MpraNA3o7lcXw7kkeFSCkKP3mJ5uZYo/FTlRwz9cMsLRvwxn8n9ypOZsbdjzw7J7Bsi+dEDPLtf6fLMNUs2sKbfZcqbbCZ4VEAAYAFLo8HvDLfaDYuryTQS3Xp3jLOCyPU+IIqYsWCdc2AnAOnlK1VbU8kHoafjfEjHibvgc78/gGXLNwQfqHA6hFPAEoHgiUtPajK8hAc8fumJcck1lJSQGbOXMqd2dWA9YuuARBAzhYJ+ac0ThZICEiFNm3rzMW7KkkjwucalSqD/yf2aMT42rGwIiC6Kq4cSoueYWT7+Shg5aDzrOE22mtZY8KqA/B9Lo9KtZWqR/zzArEUrXYCGuGFddd/FNCMz+gZe6UUD7vkgHQVew5Cb3ZgoRJ6xBz+qqWHyvZVDus0HqytDss9OGbPmLiM+v1/jcUEJqEVeNtoV57M92IEu6N2+BZrFJnWIuglonDevz4eFi1ZZTbIDRlTXyifSjL3cKW7m7LlEcP3jn4etH6ogBLU3PDIwV+NxYaVDT2tHLNI+/kMMiNi7q1yh83Ez9bIVNKqBVwVkBhgWjyiKRCn3sYlQotPIjSX3Li16lNozIa8wF207lzClgq1v8GL52h0mdd3+CMcJKM9ccMwbvFzHPJmBsJuCUdYP3fDl4F9BqbqrQpjwc4/qzu3tWjrjtL5xblgRSIVVSoHvh07kcp05iEeA8VLS5EKErOBync1evBGSeDa1AabturZp8KjHs4UVD96QSvpdS+I/dm/fC6qUTCH67BEBzNPjnXqCVwUEALayNPrlw195WMixK4BA3rRqJAwfh2vuv0R0Z0TnTle6Dbnknvd5XltcIewKIOd+RQhI2FUnPy9b71fzLviquSkY9T5d8Nc/C5jiPwgBnrvyVN7nIS3xwjWnUaX7lNh5G/P7dB7OGQcM8GSw1fcI+ANWkyoHLtfZlQ9+FDzPtTlV3V3P3qB0UIWtHmaAd/crXZ7503ujWMdzrQF9SBk8C4nfsTRav2IzL4e3tBiaFTQlagVJeO47H9Iexa2LmNrudlLyMiMzUzm4PJidJzi1rDd7sY9Q+c5MBTkRSOnSUj64i/9YvWYTqqvV3eXCk9osLxvN9FcsHTCgbXOtbFiNy2H//ips277bapIdMIAwnmx5OU7WOVbsq6wBAIjq1g9k52WXlnRoKed+ZaZHCGCu+5VlSCAR0+dW0yoHnhWQl1gaNdR5SVVFtdW0SsGDQGcYDUefenh8Sl5FK4gTC8ICyfhFjZdU+QCAcEVtHSG11PEEXuliwpjx04nfH1C3foTk3KO6tbFlH9MFR3QpifpduuGks+f1+TFs5N8OP7MBvIyuqkTgTvxRIshSHnHGTa+zWj/8Z156opJWx/vesV363X2l++FTXuux6Xc/0uOdeoO7HSgBBUPJeEopRn3FnAXAyr6YAel8GhILcsENZ9Ls+PSFsu/6c6aTP58FNbXBZR47WGHXqzA8bhfrI1kRNonzKASzrB0u19ffDO5XYUH3ljOOsJrcJo0bTuunXLYu5rZ35rzlVpPrgAEscYoAUHkw6aQeZsNS/jxnyUYA2tYPwSVUD7j57DZyX5lMstnuV5acQ8M/G6uYfjfm7DloBX0s4FkBAdiCZuii6ct5EER4oMFwml1uFw4/sW+sFYQoBdve9ex3dhwXU5HpCfksS6szx1g/AMDrM8xn2Sq3QS2a9GjDCt3S6S1ZsZ6pncsl4OgebXkb9yaFk3p3pAJjOt65C5wLFTtAwVU1bu48HrZYEZPA5doaeN+HkQBFDQQOP6HvHiG+Wq4V/WoS8R+rFqxnHdt/DOiDLuBdAXmApZG33ou6Wk1jSVNBeFEaJtjc8PBlNCcvOoUlpZTKKSE/jJnJJWPlCW6ZwllyQpBarIgKEhHkHWE4RWzYtC0U/6E9lLlZGWjuxH9YipKiPGR7YvaVUhzIgYNOHIgNIMcn5awiGfpblFMBl+fkH9ODSreW9YMQsv/uF27ozEG/kjnDuBx7NVRX1qBBMYtbnFnkSavpVQLvCsgKMNxMUgr6+4/c++fymg0rKStISYdWUUydECJQSqkoRi9+Cor3B//J+9xYCtlgSGfEAP75Uxx+/2Mm0Uq/G0bvdi2sJtcBgO5tomumRWXzkLgyUAr8NXmuszPTBPk5Wak/RB9wuaaefmckoXLVJOIhZuZkbSaExA6oFfxbTwWE2/S7wweNU3xvzNkTAMBmkrcAdjjgV2s1oJTSaeOcg0GCRG60kxq3K+6+UMzM8sh9FSd6PfPeSGduVJCZxWbZqK1rYGqXJMzOUqIHvXpBv/S7kxcEH8gQ//H0FSc7FicO8OCFx6nEgUSvjQmT5lpNrgMN1NWxeUPk52bxsv+45Lvvf/dHOJZN6xK4+rG3bm8Z85kdZEstcKuALJ7O7A46X9cR0Rl2WCQPsTTy1nnh91laqI0XZgaY4FLTtVdHlLRvEWsFCZtro94rUhEjJs7jksnyi/jhEkXdwhTsBDN4lG77ZOGStUTzcYQQIhD07+rEf/CAM/p1pupxy43TNHfBKoeP2REM1/icwhLCvx4xNWz90Hq/mOHJ2NipZ8dOks+s2iNNwv2qrroO3gbmjJj3WE2vGuyggPwDhoVFKaUjv7B1Niy9GY3hY3HBTWfRGCtIo+IT05tb/vM173NjGfKyM5nmPoOxwFYTAXfraeeuUlQdrNaUdQiAHE8GsvgKgm2yyM/ORGbM3pLWA5EKYfsPVGFfxX6rSXagArdbZl/JaJg5WVzUAdHiY5YoIA++9DNTIVUANf9+5joa0490UEC4tX788vEYojItsdXPl+nxTqNgBwWEAtin2YhSzJm02GqhhKdrlkSsIEmtgyNO6EPzinJjA/xkg9YCoojla7ZbPSZcQmCsnOVPrnKv3hlBeFrjXGHLtj0kmIFH+7q1a0kzhic6MAudWhVF/R5dD6RxPv3+APbs0TyOHFgIn1q2QP64l9UySxwmz1lFRCqCipp8jALYfeTJfY+QfGYHmTIMrSK9qfx9ss/UxNKZq1TiP6LmbKce7zMSdlksbzG0oXXVdckKaXqCZdPKwahUqIay3DMGnhiVxjLm5jAKJ1zzsl3Wm6nw+tlcB/2M7QwARfA2xSoFxMh1o1t/ps1cHHwgQwD6af068ScKNWEco5kOufHrqTMtv+hyoAJRNmQhfnpdbsuPIy7X0YC7PiCgCP1PFf4Tzzv6L9rIn63sT5Nwv/I2+FSyX8XhWavp1YLlO5ARb4PRDWv673N4XVQsdOktlBg+v2dddgotKi6UTXNIZawg85ZuNpok2yE3O8oVQHGdEEZLSQySXVNhZUOUeUasMiJtK9deb3AagD5PO/4jlBH04YuOcxQQjvCfgSfJxYHIumH9OZnruM4mD3mLcvzk5mZ7tB9mLLiTVSZOX05EKmqm3UWQ0e265YmrbuakP7zX/tAFf/zyj3LxwegrXwrgB6vp1YJdFBCAzQ2LjucjHS9V+Ixn38ik18IpA45ltoKccdPrdlpzpqBFs/zIv9WCYVkr/MqAlaHGKh1aMUtKbY1k4Fxm6xJFEctWbdKO/yCAIAjIz+bC/9xBCMX5OXH7S/q71LVh/iInEJ1nMBggAQBF+blWk8odLr//Y8JiwQUQ6H1Y94kA8kK/2+1ct6X71eQxs5TfGz1vtihYZKdFM4il0cEDtaivMTRdKSuki0EqNKktXCPcsAyvcn3u1afT3IKoA1zqPx11kyJSEYtWbDWSHNuheaH0IFThL8lncmFVJvR0sTIqqQKXwt/adVuC6T81J4kgN9MNIXll0oEBcLsEeOKTPMhO0oHKamzdtstqkh0oQGDcWh1bWxqHxZ3sNWnWymDsh/ZBQwGUPvLeneeEfreamSWTHjJVmk1XQA7ur0ZddR1r8zdTfZ8Z4G4TqOBlMEyiSEU6/LOxVm8IIDmBySgFBIzPFUI/CY2fIAg48byjqeCSX06xNyqnXP+qndad4XAJcsMRP13ZqWVtiVUwErF2JPs+PcGl5SOMdRu2E1EUWfymSdviAqvJdSCD1s2ib8RjF1tYLhNFEes37uB2LTZ1ZGQo11WKShEkcutpYwkuuedDIoqarlcA4CvpUDIGQOfQ7+m0F7iNw/35w9Gs2a8ogE8M6IfusJMg6ANQodmKgs77Z6nVG4IgNYHJaitIrMWGoFExke3XpbedR3MLshsfIAlYoDJ1QYaNdwpHhuFysW3Dli2LUn2V0UpHLPQuXKL3mtGt/0tXbGAqNUAAHNKm2JF8OESXlkWq8xK25lIKLF+1wWpyHSiguJmcgh8/tRYaIVnfbBqf+HbkdJJAnam9L3/3eHc0ygVWQu/gc2558/K5a1izX+2C/mevIbB68SSKb1gaeeu92F9WaRWNqd7UWm0Fkf6NVOmQ9i2O8RBCcPSph9MMT0bsM4IvjrGC3Pp/3zgKSAismdtKWjbnljnaFLqN56o1m5keRwjw9OWnOPPIIZ658lTKKpSuWu0k0+AVzWUVECL5/yAavJZlFeTu7Lvvfz8QhsBzAKgD8D0oPYuTfliR/cp096vSHeXwsa/Xj1J9n1mwmwLyLNgmk47+0pKihHq4iRhJt6FZtq6+/2KaneuJxIJEB6PHW0He+XoiDwzMcvgDbJcVNi1E2CSE7XUbtrEFbxKC9i3yGZ7owGx0b9M87jMSy49DbGzDpp0O7+IUHg+bC5af/cbfKpjCO59+ZyQR2QIMKYCKL/56o4gm4aptA7COdyL91mUOR37+O6vVhgJ4V+dxMQx2U0B8ADTL0FJK6aLpK8zeHHr7qOvNHY2a66jnHnpcb0oUogBjBbRnPxiVbgwsKVTX1DO16961ndWkJoO0V0D8/gC2bN/D0pRkZrjjqm474AO5mRnIjK2iHWMSCcf4rFizCQm4rDgwEe3atNBKuAEAOHCQOaBXT3Anc73/3R+EIfAcAAKuzIzfiUDu5qQfTcb9asX8tazuV3sBWF4MjxU8LKJE8TxLI5/Pj6qKarNo4jpANgZGnJqR25CbH7+S5hflSa0girEgFBQ3P/mVXcbNMOTnZUt/VRyPTI/leeuTBbeMXQ9UV9egvr5BM3sMIUCL/GzWxzqwAIU5cYkeovZjeI5ra+vR4PVZTa4DGeTm5sR9Ft6aUotWhttlNamW47zb3yYBNk2aAtj72YSXm1OAlxsUPRUQI6wfydIYhZ2b9yDAXmD7yVTfZybsqIB8CsaihB/991uz+qe3EJ1MzIYVdMo++9h/HUGVqszGWkGGTXSC0WvrGi0gaoPRsX1Lq0lNFjwqILrRNHfBSsKWUYeQds0d9yueUdI8L+p3BVsuRFHE/IVOPRAe0aGtLJ+M26ABRtfXdIUoUvwzby1rc29OXs5gQsllVtNtEIxSQFLGFy/+qCjHyhQf/NFs+lKBHRUQADjA0IZuX7/TajqThdEKiFECoQAAV9x5IS1sVtBYF4RAMRYEAE69rmmn5W3fujlTuzatW1lNqgMZTJ62EEwB6AAO79KaR2XMQQiHdSphuNwKXqhPnrrAanKTQTgLXtqiQ4fWap2PzG9xYQ7T83REIuec4XzisIv/SxldryiA7e/99kKPNLV+GIWU91nAH0DpjnK1UZCOQ6nJ/UsZdhX8HmVpRCnF2B8m2f2Witu81AoQAOC8606n7oygiZvEOFLHWkHmr9iMyoO1BpLEN6JiAlRWa1t7p2/ljXbd6Kk6WMP0NEKA28/qz9s4OJDgljOP0MyEFRbaDlbblmfZ/UxURcsWbAUGmzdrutbInXv20/VbSlnXQUNhYf7bhOIqq+mWwA7uVylj2KdjSQIFiG81m75UYVcF5AcwBNpQSulfw6fZndkamrnKIJBTLzqeNm/VTKk6elyfep33H7uuxZRR1yDxJU9f8TRte7Zm7VbCUIAQhBB0LSmymlwHKji0YyvGAhEUq9dusePZYqd4xaTg97OlK61hTP5hEQzll70veJr1dp4C2PT26GdPQ/quG24veWf9sYA1+NwP4E8D+mEo7Cr0UQDzWNp567yoq+Wa0SjB6LkxksERALjwhjOpJzOYElGakheIV0IOHKzDVjVTYxpj3wFJsgQVFr9tO/ONlQOTEAiI2LiFzdXT43KCXnmHSyDIEOJYb9y+oxRYu2EbEriddGAS9pZp1ysGgPIDpiWp4QrTF6xraPD6WJlRdXGr4ucpxfVW0y1BMptOD3nK1PS71ZU1WrU/pO+YokP/TIddFRAAuIalEaWUDn5juN0FNyOsIEafnMJxZ/Wn7bu2gVxaXrmaCX0ufMbO6zFp1NV7mdrl5Ng+g5IZ0hpLhXfd6HC5BFRV1TAJojIZlhxwiLzs6GxzcgYRSql4oLIaxMJy2g7kkaFSB0SKmjo2vptWIKBn3fImazrFAIDFr//y1FsmUJZIvISe5wi3NwiD3xyWiPvVdVbTmwzsLPDtQNDspApKKV0xb7XdTwkjNokZY0KuuPtCMTs3KDhLU/ICgChGV14VqYgHXvrR7nOVMOoZK5y2bW37SuhG009jfgyno7LyYLiSvdYzSXGB6UGvDpJAs9ysmE/ktQyf14fqGtvGgaQtunZso7IXG7+q4dczwjA+edZNb5aB/eyvGnjTWT9QoKtJ/RUN6rsetT9MTyCwcsE6NfcrqezkA8Bm9uMMdlZAAOAflkZ+XwDL7amESGm2U0reyDu69umEw0/sQwWXwlKL6dVXw6cSr49NIE8XsN5ypIEFxGiYrqAtX7WJBETtHO2EAIe00zeJwKw128izP00hdw8aRz4YN5ccrGswu/tpiQ4tC6PmSYlR+vwBbNy03WpyHcTArVbfQzKzTc16Vd/grZ2+cB1rKkU/gKHn33zOFyaQFptKVk0RsUP2q5T5/Kw/FhCRPU30eJP7pxvsroDcBsaaID+9a2jVbaMEHyMVELMgXHP/xTQnX8EKEq3JAwB6nPOU3ddlQnA3rYJYRsceSX8Mf//cBcvBpj8S9O/aRpd3/rF4Azn68S+Ega8PI5//uYCMnLWavDJ8Gun30CDh76WbmpZUZQCO6sY2T6Io0nlOLRBbQZosIjuL28Ku+vNIAtrsmPsS8Tkr/2Tiq+cAMPpwUpKyw4qIKPN5Yj1P/N2WY8Tn41mtNhTAzVbTmyzsLujtBFDJ0I4e2HcwkWqSicLwgG4T3mMYsrIzSbc+nanLpVicMAp791XxbB7XHdW1dUztbJz20yxoKR+Aznto565y1keS0w/tnPK7P/9jAbnj47Fk695KiGJjGSpKgZp6L275cAxZuHm3nl1scjj78K5M80QpxfadZf/P3lnHS1G1cfz3zNYtbtGNgIVYYHd3d2G3vnaCrYiFImJ3t6JiK3YhiAiCdPcNbm/Oef/Yu5eNmdkzuzM7M7vn+/EK3J2dec6ZmXOe5zxxrBZXkERza4DLKGwtII/hinUbfpRlVsl5eKjvoF6LPR73IJPF4nnPstVRjVgg0HOOrI2aYCCEVo1tCZIK+NQAaDKgjZbgdAMEAMbwHCQzmb38wDtOX61ypAECgC645VRWWl4CIkrxgjAFL0j33a7Mh2eTi2CIb8ySOUJ9HICVz7Dh1/5v3lKuMYUI6Ne1IqtrTVu4Cre/9QP5NUIU/aEwzn/sYynCtTO7QIle1eV8lXgBNmv2QtuuohYqkQjfONnqD3EdlwfUD9r3uj05j2VEVDfyif/tAvNDl/QOUkZ6P/ScK6d64/Oj39STfH57LmUzmnxQ8h4Cj9XJwKb9NNOJYVhWXcdQPF6PtPP+wzrK8qY0KqkqVkSW8ciLXzrdYORCebBJbXpFeeFunGUAPNWxdONyuRjPWSUilPr4qvOoccpD70kRjrjgFTWNGP3eTwXx7phB98pSHfkBVFgJaw6gR7cqR86RJiFXDr/sLfDreq2HnbF/hcvtMnv84DHck2WwygDhxZBzzvxjDu/eHxEAT5vQjpyRDwYIAPzDc1A4FGazp80368XKRR6ImdcxnRMuPpyVlZeCJEUvSEq7Rj7yXkEoUbwrdrW1G6wW1Shy/QybYnwAwNr1dVybEHpc2Q210xauQkMrf8jIu7/+WxDvjhlIRHBLfPdrxap1BVjL1d6sXlvP9ewHQjm/dTxjkKHjFCO6pi0QuITzcLm0vDRy9NkHFcFc3dDqncfN8n5kfe+mfDeD0iwyxV/jD4P7JefkiwFyAs9BjIE9e88bYmK2DunIsw9kPp9y8p/S3iCbHpT/O6QXKfZH6ljm9dk2aVIvuTRAzCrtCACoreNJQQN8XndW17nxlW8kPXvera1vRm2jyBnKFI8nJfdWcd5Yt74+78cnp6Fw7xTxeXI+nubaAFlXtNV5I3kPJqLWs244Mbs4UeP6IdvvaL2Xtg2/en2crmJJx+RSNjPIl8FzMQCurOXW5lamo7yZXkQYVhp2PWg4+m/eB5JL4vKCrFhTi7W1jVaLbSqrazYoDDqpv+rZvbPVojqJWBUV0wgGwqjfwJX/RyWcm6Op8e9yfcnOjAF/LlgpFlsypChJiVXryLr6Rq6wOEHuGDigF9f8WFPv2Nzd9BDYWSOfOgwAd9ndITtsWrrdrkMYzNULeV+WZBnsrvNkPQgE/EEENLzcSbmyLQBqrW50tuSLAQIAT/AcxGTGHrrmaTu49vSQN2FYAOjsG06Sq7tVKsZZK3lBBu1/fT49pymEUpOKUzqGCCgrLbNaVCPJxaaEpjJ3wSIEAkFFwzkeAlBdlvkeLqFwBOGw/vntoY9+EwZIhnTulLRppEpOSCAQdC1dvspqcQVxdOpUynVcKGxJ+k5O5m6J6Oa3Pp46hVembr27RC685fR0FQQd0XY41Psx9uqnJB3J5/fnUjazyCfF7npwWqGLZi8xUw7hBUlDdbdK2mGfbZjH6+bygkRkGcdfPiFvlalwJLHJSroO40k0cBZmNicnS9KtLUHIMt+lNu2V+SaE6zMMpVpWwxceJkilf9JmhGqPK2NMCvhFGoidCHNuZMtbrtdgcjGMN3qGnHcIOPU7SaLgrocMLyqOLpLYwQBJlsHI8dwMA8SQe7psgdZCRoJeJAMYbWCfWEY+GSAAMIvnIFlm7Ot3fjRLBjMGGKUXwcn6KB173qGsR//uIEnBCyKnGiGf/TiD6hvyM6Y9FEpOQk/tEyKgptbxHte84r+FS7gn6y6dMveA/D53eUZKQZtfFGjKlLIiH++hNHf+MivruZq9au041tXUJ/3GVlOl6fdq5FPv7ApgH87D5QGb9S06/LT9mcmy6TEispHDKO+HHrI+74fPf65ZejcpMmSqSe3IOflmgJzGe+DEF7+0Wla95JsRIp157fFycWlxqhcEUCxt2n/fa/LteQUA+AOJK6hqA1F5GV9ogYMww1ORs3eioaGZbxd0Ihy0XeZ7en3y5/wMO8LJw4O1HL7D4KTfqOpENG/hsuU5Fo8QnbslbDRA4v9d0HSuLuc6ri1gid1odmnYSWMnfMVVFRQASstL6fxbT49d12mh6WbKwatrGNK2r9/9Sc9zcbKRnWIl+abQzUE0OSctoWAI61bWmCWHGYpVvhkg6DuoF201fDPmcrtS2icrbE4YCkdw8lVPFMIEq3hf3VkmMhcIOXsnps+Yx3WcRMC2m3TPWK7GtsxCRfj3shAks+Pg3iyp+1Q788XXP+NW+LIkZmhQmmMK+sb7fHzeK0myXTdlO3aFfEPPLwPAVQbM5XKxYXsOlbr0qALMNT6yCXsyymiwrfdj6fyViITVS/EnhaU3AFhmUltyTr4ZIAAwlvfAMf973GkKvO1GzGzbc+7Ik1lldTkkpbr7Cnfn48nTqam5zWq5DSUU5tsHREeCWqGS0w5atnwt8V2SUpOadeBxSRm1SxIGSMZ0r+D3Ni5ctKIU5j97egyLgjZCQsEQ1072jU05n0dM1bdeePsb/tArAuvcvco14prj7eb9MKvgjm0nz3HXP6vnuXD0zufJ5KMBcic4PRAtDS0UTs4ANo5ceUEcXQNSkiTpmAsOZV6fJ6VtSl4QAOi5x1V59dz6A4mx+qSydF1SXGS1qGZgVYJh1rQF+JKPPa7sllo7l2dmvHjdefWa5BSXS0pYFElzA0sBmFkrPBODomANkNISPuMxyJmsbhDm3g+i1y+5+y3eqlcoKilynXT5EXYzPrL5vpFtyFn4lb8lgFaNBdWk0rsRAI8Z2E7LydcZ6gfeA0dfMt7KBMJMyLuJZad9t6V+m/aG25OqMSmV5Y3IMg446/68eXa9nBtnCQ+IJjnvnFWr+UI4KctQj90378u1opvM1v2757pL8go3/33rCc4CKBmSd2O+mUiupO5SGRmKfDkNaTXzHkZ8W523JTj1ObfHLfUb3Bvb7DzEbgZINt4PrTaYtUib9Zwz5vLH9OgxX5nUDsvIGyUuiUPB+XCsXLTazO1Qc+WdcLxmetFtZ7DSTkUpcetqeyz8Mn0BZNnxzQYABEMFH4JlRMNy3jmtbX6uqxZzGphq7D20H/N59O+kfucp+zjaO2o1bjf3fetExMwqUZevc7RpyElBDWoVzHPoATH1HtbWB3cFMIznWJKIyipKcdldZ8bGBrOMj0zGnkxlMbINvOcyZGxdu0JzEYsl/f1oA9tpC/J1cAsBWMl78PNj3mo2URajFaO8S0YHgE5VZXTIqfsxt0IoFlMp51M+7OK8eH7dLr5mKObJ5AfZPL+m73iuRHNLKwL+oKpyEwd1q8xuA8nenSvQpwtfZZ+Oi0qErQcID0g2dOUvnVwaDkS2M/jyBZ3HkQ1eH5+xnqMkdFP3kiBgfa89L/2d93Cfz0tHnnkAK964MaoZnZDrBSUjvR85e+cev+WlNKV3Ez5chGgIVl6RtxoNgCt5D5zy7fQS2LhKgs2uYxr7H7cH9RnQnYgooS2MKZsgEVnGjifc5fhnuFMZX25HmDNZ3aFkYkTorbBiGK2t3AmsrFt5adYyjr/gUFlPKNcJuw5x/HhgNRWlfO+lJJGrobW1p0GXja90JQyQDGhp9XMd17kiu4UBTkw1QHxbX9AC3tArt4t69e+OPQ/f2W6hV1BoQ6abFuYCQxa8Zv05V4/s51rQTtNxvPKmwUQAXDvXMcaknz79w0nbBivdNzMUjpwrMf+79zxW1aVcSr62WkL6rHnLsXylszfoa25JnjALVnfU03DLjA8AaGhsRjiS3iAkgHpWd8r6ejsO6oVeVXzncbslPHjWAQX7EBlF98oyrj4kIo+/LZhdnB1fiV0BBz6NcuXxBT7qG03f2NZU/erb3+dMYowN4BJEkqTKzhW48sHz4+dRM541I5Rzo7wfesfAnOnDX737A8kR9a5KSj5vAvBzrmTLJflsgADAvbwHvvbIB2Z6QZwai53z8JayihLa+cBhcLldKQG6aqFYmx96s6Of43DSQKTWTh0x6U6Fx6iIPZOWKtirVte2u8/TiEFAn876wqfUuOSQ4cyVJlyPCJh811lyaZGZqW2FQW9uw5Gk1avXZzMGCW+HgSSPk/GhLBTXz7zlzzPE7Dkpctj5Y4/gOZCIJF+RF7seugMrLunw6pkVepW8MWbyj9J1M00+T9fHtl2Unfj8l3r6/xYT2mELHK24cTAGAFemGWPMO/WHGU7aYCIXuSCWTIrHnnco9R/c24Oke6eWkM7A0GdP55bm5cktL6BN5dS0egaLvR7x1NY1RIsCpJWGsMMgY6JzLjp4Bza0XzfNqlqf33a6vGWfLlZ3T14wnP++UWNza6YvaCF4PXL6zmoW6yDO47JD71ykW5CSbS7kct8QEblcEvpt1gdHjkjwiprxzBHSG9NKn8f/26p9P0wNlYvnu49+pTQbD8avSIYATDCoT2yHY5U2HXCXLntu9JtOqoiVSwMk5x6cKx88X/L6vMHkNsmycihWbUMLJn49zZETeUTmCOUpHAME2OjliP+xjfEBALLc/himuS0EoF+3SsPk/uK20+XdN++bkkDrdbvwy33nycMH9bK6a/KGgT2rGe9r19KSUTiPmS+1bd4VAG25lodnvDSpiGIm91SXJLc9OnFpRJa53HNERKXlxbhizDlmh17pId4IydT7ka4NZhgghjwx7z01SU//f2TENe1KIRggx4HzwZEjsnvZwlVm1uZzckWsnE4gxSVFOOa8Q0qgkMejFqJ06rVPUX2D6XG9OSKplGT+luB1JD5vdK0i7W0hUEWJz7Drul0SPrz5ZPmao3Zju2/ZFwN7VOH8g4axhU9dIW/Wq9rqbskrOpfxbQDJGEORL6N7bLUimAsYop7snLWVd7HGhDHV9FC61esb5PufndSfsx8kX5EXR551EPMk5sXY6bnL1PthRendrB+Y2dPmU1i77H5y6d3TDGyn7dBfXN55hAD8C2Aoz8H3XTaBnviCO3VEL7EYSaMgpL4UZl3D6POm5YDj95B+/3pa07L5K70AOkbQaCgWgShVnj57XS21zHjaUTk3EseEWWAeENvT5g8g+hRqz0oEoKzI+A3PbjxuNwbsJqxSE+nEfd9seRvsJFT2VRhMgGfc1Ynp3o9N9ruO6xpEJLncLmy+/WC21xG7mB16lQlqugsP6RbOzSi9a4hO8cStL2leKynM/C/kYendeArBAwIAF/AeGA6FXWtWrDdTgXWaF8SM+Exubnrssp4grEDSAMDaST5eZjKGHXO7o57rYpEw7DhWrl4HQH2Tsw6I8nn/lrzGk1r0QVF5YAxsXW293tMXykNhcYL9xtczecGqjLPMMieZ3k/uOXXT/W+MMMbS9iURkeSSUN21EpfcOSL5/HYxQJJlscpgzlno1X//LKRQUFeAzZmW9EgOKZRBcAqAOt6D7714vJmyOM0Aib9GzgcJt8dNZ15zvAvR+5e0PwgUdwiZs2gVxr30lZ0GWk0C+gYlgQ2or4/uXarkhYuDAMCdmw3PBAYjJ61vaN3F9TXc04sgp5DK36NeTAOIVXfKBO6FzhseeIeWra3lKYNIREQlZUU48bIjWJLn3G76XrxeYVTuhxneD0P0nidGpvV+xMu+GsB/RlzXztjtgTSTk3kP9LcFXAF/0EwvSC4S0s06f86NkD0O23lASWnR5wBSdqxX9oMANz/8Ljklb6IjoVngGDzeWPSq9pwCxhBxyHMoSCQlREfjVns9xofZCYwgzgOSdAfDkazey1ip2ewFS4MsM4x/9Ws+oYjIV+LDrgfuwLbdxVGbkVLSj9ZxjqO5oQUBf1DPVw61WuZcUEgGyGQALZzHsptPu9dJL69iGxx2Xk3GfXzXqUS0ENGcnkSBGJOVpOq0/cWOeL69HqVUrMRxVuSA2ItAIP1kQu2JSi5x7xwJz0aTMZqadFVwFw+EySiOl0m/Ksk8NyunpZPLh10sMY7VNCKS3B4XevTpghMuPjz5+FzMhXr2Z0rOS1H6Scbo3A+ePjFkdfDWsx7UvFbS/W0EMNOI69odRyhoBsK9nX1zQ6vL3xZwSi6I0gtrtKEQ/6xYsWTvfeTD29cBqFdqm6xghERkGYMPvDEvnnHhJbEXYZ5NzNqVIE/+byCZl5QVJVe2UtY5iUB+DoM0hzh98Sz7DuDwOmboITdqPuHKjem399VSOJLeVUNEEhGhpFMxrn/0UismCxb3Z3zZ9OSfWFl1Q/rHCdSt3YDW5rQLFPH3+BirZc4VeaGc6eA9KKygq3HDifeYOZDnYpJwuvwJlHQqOXjnA4b9DqBJ6XOZpe4RsnJtHS4Y+YKtBzJlD0giIpHZXkg68jpMqLYjyAFej6vDiGxH5UaSXmU23x4IW+3RA/B5jD0c424SRg/CmkKefNUTtK6umamVnY9rKxERfCU+HHX2QcyduuCRi8lDqaKV0g9X2xXg2fVcj9GSM+/HHeeN1eP9CAL4wYjrOoFC1Gqe4D3Q3xZwNdQ1OckLYub5k69hxYRD5918yuFFxUX/Irq5VWqDFTSB1yb9RouXr7dAXD6UQz34E2AFucfj7lBeVG9NLOY8HBHeKycSDKX3cklEEgB06lRstbjxWDI2W93oGLIscxkgEX3vpVm6kqKgv/41P/TRt9PBE3oFgLw+DwZvNYDtedjOVtx7swY4tc0K1Y7lySHJKWuWr+fJ/Yi/Z3dYLXMuKUQD5Bro8ILcetYDZsriNC9I8otthWblGj/prh3cbmmZ0vUZg+J60VaHj7Lts15dWZb2GFstLwpQXBwNz0k307kkss9sKNANR81TEAE+/avp+ULO94dKhyRJSiGrKTJWV5TynjLX7WvY76wHPLx5H5JLQuee1fjfvecoHW/2vJfJ1KRXJr39n84IyZn3495LxvN4bmIEAdxvxHWdgm2VMpN5ifdAf2tAamn2OyWUKddeEDPOz3N9z01PXNEdwFqo5YOkCMlQteNltnzeZTm1C5OnHqdU9CoUevbsHP1LmqmRsdRyrgJnEElThpfal9kZA7p27Wy1uFqi5su1uFDygCh5RGTGrWOa2cbkc4eKt7mwlGe8j+V9dKoswyV3jJA5zm0GZg9umc7Z2XhCDGlT/fqGtN6PJCPzYSOu6yRsqZDlgIsBcG++cPOpo82UxWwDxOxrWGGAoN+gXpVHjDhARrRiRIoMSnGz/kAQgw64wXbPvM+rmKQstFYb428LIE2UR8enIgfEmXgkSXuX+3bnFhHQ6vdbLW6CaCjcuV0tXy7lJSxJKTKgfLocii6XbHthoyzLad1pMePDV+LDgSfuybr17sLVZqPlzeA7VhvHPPfTkLn39nMe0uP9CAEYlaN+sQ0FO0gBeJv3QH9rQFowe4mZCqHTg8Qtkf+osw/qtckW/dYCSNlRSs19vWpdPUaOfc9WGmGXyk4KBlSi/MIDYi9KiougdUtiK66MMbhchTzMOhc91cvKy7jDeXKJlPRjq/h4s2DtO9TGo9ToqorSdINqTvuq525XvheJyGldaTHPm9fnwXa7DWEHnrCXUjvMlj3TCcnuz58hE+3MKXNIp/fjWasbbgWFPDOeCX7FmT189dN2f3FiWBGGZcY1uOS4+fHLB7o97vlQyOuRVXzsj7z8JX39y7+2uZ9VnUrSHiMMEHvRKb3C2b46bpvHTGA4G+9tXFECOxMzQPLeMEkZLxVa17WyU7rT5KxPjrliwpi6xpaT0h4Y9bqR2+NCj75dcc6NJzPVI80lkwnJimcs/po58348edur6doaf50IgP/luF9sQSEbIADwLu+B4XAEP332hxMqYlkRhmX0+fXgHvfh7QMArINCWJ1aCcOjLhlHLa32CJvo26uLyieJouus2iIwEYb2Cq0qT33sBZEZg7AdnYmevXeK+cJ57IqSYaJmlNiu5G4ywSDfBpK9e1RqfawnfCYbWENjy+LPJ/99M8/BBCKXS0JldTluGK+634cdE8+j4tsbQ+7pl+98T5E0+0QleT+etrrhVlHoBshpiFYe4OKNcR+aKYvTDASla1iiIXuLfZ2OOvPgNijkg2hVEum265W2eP57da2AUq2kZOOpubnFalEF7bja48x5Xio9O2oL7EMoIkPDekx4Ybt3r7S1Up4BakZJStvtRm1dHUfjCL27V1stKgho67bblf25jm3P+yjuVIwjzjmIua2pvJapAWr1M5Mz78dHz3+p2dakJakACtT7AQgDBABe4z0wEpGlHyf9zl3CNwOMUuC1Vq+MIheeFm6OOGv/wTvuvc1XABrAaYTITLZFZaySErXV041iMwZEhCJrG2rr6mN/1X7eGUNEzjfdtDDwh9TrlCQPfvMXrrRawcoFBMCFRGPEdrT5A1xex2KfqgKfsznBO/T8WH9qsnGn8xIcdfZBbNcDhqm1UHg/MsMQ3evzNydT2kiFxIXFCVY33EosV75swAWIxuBx8cajE81ednBKyV+rrqF6/gtuO+PkisrSv5C0SaFCTmIH/kAQ/fe91tL3YIehA5hSrkDUA7JR8HXr06/sCXJDZWUF34FEhbxHhKPpVORV/YwljUNlpbo2Ikw3RjrBYrVtpa3lK9YrDKaJ/5Qkws7DBluRvN1Bl50vbwPgSXcctW926fV5MHSHTdneR+xi1fORqZJupfHBkMPn9OOXvuYozN5BCMANlvSKTbDlAGIB3BUIZFmm95761EwvSC68FGaf36pkBXrw/dv3liSaDyAhwYMx9aLv62obcdA5D1r2LvTsWgG3SsWd+DCs36fNtvsqUsEweGAvFt30MvV1pfh4OsZECJZD0fKAxENEGNC/p5HjthMMkBi20yGmTP035XfJBqPX60G1cvEP3jE2q3u0y0l3y00t/rSJQzHjw+P1oNeA7jh35Kla1zXzXmTTXrvPW4boK2+On0hyGu9HUlj1eKsbbjW2Gzws4jLo2Bfk6/d+dIIXxKpkdDOuowfXYx/fvSlcNBtJlbFkjZ2nfpo2D79NX2iJwJ3KitG5QrkSVnz42G+/z7REPkEqkbCMdl+6wnOe+FroKecqsA9FXvXFaTJ3g3u7K2y2lvevGXNTfpcchtulsgxFvhQPl552ZNzmr36exf6esyzt92Pldl1uF3oO6I4bHr1US7u1Y9WrXMiVTuZcFRPAD5N+1879SFwEDaLAvR+AMEDieZL3QMYY3X7+WCdUxAKs2zjQrOukPa+n2Ftyy4Qr+gBYg6TwOsbU09L3O+s+6eep8ywZMKsqy9Qb3C7wn9P/s9VEX8i0tAVIrcIakt65Fj93nQuBjWj2B1Q/ix9DGGMIBAIcZ+TGae+5rcr4zp63JK0snasUx1s9bcgoGfvLn2ayoy99lFiauurtxge5XBKqOpfjvJtPkSXt/YTM7P9sdB3bPBcqGKKn3HLmgxLTl+s3xuqG2wFhgGzkKijsJaHGmiXrNIpwGoJTDRwz28Atd7/Nenc7+fKjNiBanrfje9F8ECZHw2dSv3fQuQ9Fy/NSbj0422zeV/V60ZUThpraDbkUSaABgRipPCPJL4RXeEAciduVet9o4+3tuPculwuyKDRgG0Vz/foNG/+hcluGbzUg+RPTdaHG5jZ2zGXjtRYuYhAAIolQWl6Mo88/lPXo21XreLuGXlmtX+rZiyMralbXal8o0fsRAHCXdd1iH6x+QOzGKN4DGWN07fF32n1jBqvDsHJ9rQT2P3aPrXfcb7tpUCnPK8cMkQRhGbrteqUkRxi1X5HlwhjZe8fNNT9nDKy5pY3zbAKzKSn2gvdxlMRmhI7EIylMjxvvZcJNdUm6ptJ8tVZs8aDHe6PUOnrP4YONkJvbCxKORFiP3a4kMO3S8EDU+0FEKC7x4ZBT92M77butlc9Lvj6rgEGeu2uOu0tKc0uTP7zU6obbBWGAJDIWQBPvwU0bWlwtDa1mZpgaYeAwnb/PhFzmgugaMC4YddrhPft1m4WkpPQO4aIhWQkyykxG5Q6XSABkMMhIv2KVNcO27MeSwsoT6u8zxlhbmx+BAHeqksBEPNHKVlzPYkAkoTuS5oB66Fx81TpZllFcUqT39Pmo2FlugDS3tKK1LWqAsI3lD2PjKABAIgm7bJtQAUuv3Czp75r3UpaZXDn8UorWrEhrfEgA4CvyYtgeW7P9j9sj3XNipg6Xz6FX8XJmLGvN6jq0NGrvz5V0zzcAeMnqRtsFYYCkchh0TA43njraqfEVuZwAjfQU6R0w6M4Xr9vN7XHPQ1J53o6OaDdCOsKyGBAKR1C1w6Wu9u9EzPaCbL1FX3Qq7VBikt9LAkCyzNiLr39sphgCTvz+EIjzmRDhOc5EWVdM/Z0kSQhzVswSmMu4J94mIMH46CD2HlaWF6N/ny6xX2eiAzGFfys+LLLM5KodL5MisgzGUqtxxRNfbrf3wB4Ycd0JTvZ8OMUAyYo7zhur+fwkhV4xAHtbLbOdEAZIKr8C4N5wIRgI4dM3vjUzFCvbc+fCO8Ez2BhthOg6/pEP7thUkqQFUKl2xtqtEDlmizCwtkAIVTteVgQw07cgJ6L4SVHxEMYYHhz3mlhOtwHdulUBoJTxkxQ2dHHrC88R2ASt/Vviq2AxxtC5c6Xe02e6o7TdsVTxfPalj4hpbfwEYECfjnwKI2VliM5xsT9lAKzLLv+TgqFoaqlWKfiY8eFyu9Cjf3dc89CFPPOlXXM/nGZ8ZCTv2xM+plBQc+EhuQ/XAphldWPthJgZldkBOl7Aj1/8yq4l8ABtj0Gu8zOMvJ6uZ9dX4i2ZMOnu3kS0Euollxk6Fs+itPkDnn77XFcBZv6gevnp+6dNTly+cp0rEAyJskoWU1Feyn1skVdsROhEir1ae8TFb/XCUFpakv6EqeSrEWIJrW1+rFlbizRRTrjm7INiB5gxpndcvM+eV0lt/lg4WHrPh8slobpbFW4af6nsTr95qV2rXpktm2347uNf05XdTQ7V29Zqme2GMECUWQZgNu/BTGZ061kP2n0H81wYIbloRzy6nl+3z1P90Hu3tyC6EsHlSWAMbH1to2vrI24x/V058ZAdGUcyqzRgq6PElugWEwiGIJFidnnK72QmdEwnIstKeljqLZckCaFgxmsC+WaEWKZ8brfbiHTJwPC4XThq/2Gm7469+cE3SbUN7Y5zjcTzeOOjvHMn3PbsVbKLr2qeWf2crfHhVJ1SV3+OPON+zbK7CjvUTgdQY3Uj7YZTH5ZcMAw6XsZ1K2uopaHV7kaImfC+wEaHq+kaODpVlgy54KbT3kN0jxBuWRYsW4sdT7jL1PeluMiLwf27pz2utq6p1wX/u/8vM2URaNPa6lesTaD0MAZDImrOibSphFckh9kxxtDmVOiFdwAAgABJREFUz2ofkPiwHUEGXDvyUVqybHXa4wb07sI8blc2ynvaezTksJHSsriyrLJK6FXM+CCJUNm1Ev8bfa7s9XnSnR4wT2+zu45hC+rWbkDd2nrtgxInBxnATlbLbUeEAaJOGMD3vAczxjDyzPvN7M9sBk3SOIcVZXKtTErHjgdud8XBp+/7IqIVKdLKEuugWfOWY/CBN5r6zjx397kycZRtffmNT7a7f9yrYkXFIurrG0FEXDtih0QVLEcSkZWHBqV7Xl/faNRlY3kEAk7uf/gVeuK597lCgF8ac0EIJnppNtnvOmnxivUbL6gSehVvfJSWl+Dsm05ivTfpkeOeS+wbZP/cFYQ+ecd5YzU9bQq5Pp9CvNOKFMQDkwUHQsfmhG3NbVgwa7ETHzQrZLZsfxAAdPy5h95y9HkHLwfQnFaWuNFm5do6bHvUraa9NztsMwAeD5cL3nXr3U9Xv/vBt61mySJQp6jI2/5YpH/0Srxcq5oCm+FRDoVJueGMMXDE7OuBwbmhWTmV+dU3P6U773+eeCrNuVxSaNjQ/l6z2rbpQTdJa2oaEo5WCr3qMD7a9/o49X/HsM2GbsLbb8L7YWH7p/00kwL+oJ7zBAAcY3Xj7IowQNLzlI5j2cPXPmP3PjXTC6LHEDB6gtXd74eftv+2R59zYJHH6w5oycKSHKrzlqzBXqfda9p9vnLEQTweIgIgnX7B7UWPPvmO6VW6BIkEgtF1CT4PiIiscSIqq5xMaZgzodSyU42QnMn70LjX6MIr7ydZZmkTzwFg9NXHZyOf5r3Y+cS7pRVrEnfDVgq9SjA+yopx+JkHsB323sZq48OIAcrueo8hPH/PG3oSzwHgPqtltjMF8dBkyVWIrpJzEQ5H2ANXPGG1zOkwOxSLF6MnWf1GyBkHevc/fs9ir8+jKUfyZPLnrMU48uJxprjy77n6OBBxTwrS9beML7n65nHCCMkhG4sFpH8ERBUsZ1JapLhYrnjDPcZ6QOKJL+9qd3JmaV927YN0673PEG99B5dLwtVnH5zpTdKcGw4890Hpn7nLEr+gEHoVb3z4Snw44MQ92AHH7cl7X80KGzOzwI1T4OqDey8ZL0U0FpMUQq82ALjL6sbZGWGA8HEadLyoC2cvpXDYdnHf6QYJq1bbGIw1RHQPhsedfyjb47CdXO1GiLqgSasb3/z6Lx12wcOmvENH7Lu9rs0WH3/mvdL+Wx3LHS4oyI7Kyk5cq64AEBYeEEfi17G5YGV5mdni2N0QydlDvsnWx0nPv/IJt/EBAKccvkvsaL3zjObx+4wYI/08dV7KN5Lninjjw1vsxd6H78wOPy1t2fWEU5jQlZbNuTYjbR+0NLZi2YJVes95pNUNszvCAOHjUwBzeA9mjLFrj73T6S9lpmTa7thgmO0kqzspHQBOufxotu3uW7ncHrfqRNqxW3oc3/0xB4dfaLwR8sbYi5jbxZUL0sHqNes9xd32orfe/cpocQRJyDKD1O4FoTRVAwp1IHA6LoXbqlh3mUg1Yd0EEja6gz0Mklw0nj3x7LtU0n1vafUafbU3PG4XnrvnnOQ9GXj6TfO4vU6/V/pjxqLUzkhaCY8ZHwDg8bqx3W5D2HEXHqbnvtk578PpOiRXH9x82hi9ieezEN3UWqCB0x+eXHIadAy0ba1+fPP+j1bLrBe7rIZkK0dGRsgFo05jQ4Zv6vL6vKrfbd8wPUG+yb/Pwe6njjb0XfJ63Ljl4iN090MkIrOzLrmbOvXcV7rxtglC9zUJr9fT4QFJlwciiZ3QHYmHbz8GAPEheTnFqEWbbK5vuvFxydX3U1mPfV3XjHyMK9k8mXuvOp5Jkq6hMK1Hftixd0h/zlyc+sWkuSHe+PAVeTF0p83ZuTedUihGY14w8bkvNBPPFfI+wgCOs1puJyBmRn5mAvhBx/Hsvac/M1IBzJVxYIfBETBmN1bd/X/56HPYgM36kNfnUX03Uk0Q4K9/lxheHevmS45kvbpVah2ieD3GGAuGwuzRJ9+h4m57SZtud6L00aQfhDFiIFWVlXGGhXbXclRVFtgQxgCeMB+JCGWlpZaLi42ekVx4R0w9/8RPvqdB2x4vFXfbS3rxtU8pHAmjPbapXeHbaCPIGt6nvj0744qNO58r9Vd8O7jCgbc6fKQ0Z+HK1BNGRev4Xrzx4fV50H/zPrjo9hF6+8yM0cMo4yMf9Me09+OLd77nCV9P+AqARRCkRUyN+mkF4FP4fawvEx7Grr060+hXb7QsyTqJWN3Q+AFXiYyU9ziMXF0xos26+3/cDc9JC2YuRjAYUm2LJFGKbF2ry7H0u4e49vLgQZYZqna8VPIHVNM7VOUjAkXDgyj2bxQX+XDkoXuwu2+5kPXr29MQGQuR5pZW9NvyaKm1LboBHWt3jSXvjk4ErH7xOtmlbwVWYAPCERk9zxmb+I5Tx/86KC0txuq5n8pen+2LDZDK3/VgiuGxaMkK3HXf8zRx0k8UCAbjDD/W8Ud7agWLehw3is8YU2xLkc+LhmlPGDYXhSMR9N/nWqmuQaHeB0sMvUoOu9ps20HsijHnZtJvRiv5RuZ95MOgpvl83HTKaKm+Rn2PH4XQqzYApieE5Qv5YMHmmquT/k2I9iPF/b2DmtV1WLsi4/3i4s9pxMseb3xoYUQIlFFYIstVD5wv99u8D9o9IYrnkOXUMovr6xrRa48rDXuvJInw3D3nsCKf/vL1jIHJMpNji3KMAa1tAbz9wbe02bCTpeJue0nV/Q+S9jj4QunuB16gVavXGSV23lNWWgIpLkdHLQyLMSBkv4IUAg5aA3w1HbweDxxgfACJq/tK3hKm8b34Y7Ni6bJVuHPMc7TbgRdIVX0PlIq77SUN2fE06a33vyV/IGZ8RN0Jshy17GXG5Jh3IeZpiKF0jZJiH94bf5mhhlKv3a9SNj6gbHwQETxeNwZs3hcZGh9mYEXJfbu2V9P4+O+fhZRsfLBYIijrKP0c3w8MwAirG+wknPIQ2Y1lAHq3/11N2ex4uD1eDz3++Wi9FS9yWXZP6XfZyGD0KpkR/ZHRStjYa5+RFs9ZilAwrDrZKXlCystKsPjbB+SSYl/6i3Bw+nVP02c//EOBQAiRaCB0zJjk6meK+kKIJ1zI43ajX9/uOOPkQ9iNV5/JjPLm5Bu9Nz9Cqq2LTVAMTGaMFDwgy5+7WvaZV6ZVYBINrX4MvvixtB6QHt07Y8msD0VMvQKyLOPu+1+gdyd+S8uWr0UoHOYKa4saINFoq41vVNI4FI2EZQRIsYMkIhQVeXH8gcPZs6PPMWQOam0LoN++10ktrX5lSePyAg30fMQwcpFYhF4lotkflx4yUorELR5pJKHHzrMcwACrG+UkhGaRGQMBzEX0RVR7GeOVQ9pi+8G45qELeQYis19upuP32chi9IRsRL9kJNPD1z0jLZq9DKFgkCnVdweUjRCf14Mlkx+UK8uNiQ8/b9Tz9N4XUykUikDWWP3TgtcQSfwOUOTzobqqHDsNH8IOPnBnHHv4PnJFRVkIQAhAMfJnUuJm6M6nSgsWbYwFZ9FYkJSOXfLMlbLKnhICG5NsgHTse59kkA/ZYhP89dPLBW2A1NVtwCef/0Sfff0b/pg6hzZsaEJiKJVe9H+RQPB43DjtiF3Yk3eeaYjxsa6uCYMPuF5S82LG530klNr1eTBo6AB25X3nZSuHUeOqpfttWYQMPv0shfv+97i0eE7y3i6aBkgEwCYAVkLAjViWy4xFACYDOEDjmIRci7kzFvJofLl4sXnDsIC4OdcGaA0mvEjIwAi55qEL5cdveYkWzFpCrc1tSlUvwBhYchhOIBhCn72ukeZ8eq/ct3fnrDvg+dHnsfmL19KsBasQCoUpFI7otkFiq3XR/BA+Q4QxoM0fwMrV6/HhpB/ow0k/4OIrH3ARwQXAwxiadt91W+mwg3YpvvDMY6TikiJy66gg5FR6du+CeANEtf+sFlSQEQr7t7D2ATHhpenZPft32wmEwxG0trbihdc+oS+/mUJ/Tv8Pfn8AkUgkC0MjewgEl0uC1+vGsC37wSjjY+mKGgw5fJSkEGkLQN34KC4twpbDBrMLbzvDTq9+oYVepdMXVPuDMYYl/y1P+V0aPoEwPnTjlIfJrjQhfcJRx+hV2qmEHpl4h9qTnMtVBT1ekEzDn8xaEbQkKR0Anh/zFv398ywKBkJKyWdx3oWk34Pwxzu3yltv0deQDrj4jpfpo6+nUXNrEKFwRM7AEaIgs95b3J4VioTwAyKASCK4XS5UVpZj6yEDseOwLdlJx+3PenbvjOrqSkP6wA6cdu5t9MEn38dnwyoe98+jl8g9q0ReotNYuKYeu9zwXLwHhDHGWNTbufG2nzviCPbEwzfYSdnMGMYYaus2YP36erzy1hf09z/zaObsRWhoaEI4p4YG34VixkenUh9OPXwXNvbmUw2RcMqMxdhnxBiJqckRl3SenPOx437bsTOvPcFIhd+S8GMV7O79iJ/fM/J+XHHUbVKgNbDx4PQPfROAcqsb7kSEByQ7LgDwGgCt5d6OVffW5jZ8/d6PdOAJeyU/0bk2BPV4Qex2jWw9IYrVyng47+ZT2CPXP0uL5yxDMBCUkpPQo6thqdvSMTDsfNLd0uirj2dXn3Nw1n3y1B1nsZsvOIKddt1T0qJla6UNTX5Z3pgXotZoioaOsJgSwWIyRz0iLKFiFg8MiRszslh9zAgjxhitr6nD5B/rMfnHaXT/uNc6oldcLhd8Pi86V5Wje/dqbD6oHzvpuP3RtXMFG7LlpmhsakRFp3J4vC7YOf9kyJab4INPvk/oZKWnKiJ2Qnck/mDyTugdxRw6vJ1EwGaD+1gtqiaMMYSCETQ0NaKsrBTzFyzF0mVraeKnP2D23CVUU9OA2voGBIMhy70Z7RKnPYJAkCRCaUkRNt+kO9569FK5V5dKQ65+14SPacwzn2gOPErGh9fnwRbDNjXS+IjvjEwHwnwdfBJC3JH60GTk/fjkpa8p2LZxzw8O4yMC4GSrO8Op2Hd2dw5zAWyW5piOl8Xr82DCZ6PjP7OynB1L8+9sZTRr8DOizzL2hLw+/kP646u/KBgIQVYoQk9EkprefP6Je7PHbjXONf/iez/SmGc+ozU1DZFAtGRwQtWudnOIFHJno52QVLs+9p1ET05yoQ/l7ykQPVEGOSdAdAM/iQiSJMHj9cDtdsHjdqNTaREAoFvXaviDQZQU+eByueDxuNGzR2fmdrvRrUsVZCajuqoTBg7og+7dqlkgEKJ+fbsxn9eDUDiCyvIylJWWwuPNbB3mo0k/0Cnn3krxJUMZS23pHw9eIA/sXpnhHRZYxayl67DvrS93KDLxlY6k9k1giIAvPhjH9t5jWEbvdCgYRktrK+o2NMLn9aCl1Y9Vq2upyOdhq9bU0LwFy9DS4kc4EkFdXQNC4TBWr6mlQHu1qFZ/AGUlRaip3YA2fxDBUBj+QBChUBjhUBiyLENOqNxjda8C2axLxQwPj8eN7p3LcdtlR7PTjtzFsFZdMOpFeu2TX7WNj+jCE8WWmmLGx+6H7shOvuwos3o4kznPjPnXDuV3eebutMWBlLj8sFFSKG7hgcMA+RfAUIv7w7FY/SDlA10Rjf3zpDmu46XZbNtBdN3DF8Vb73YxQNR+l6mcZq6+GOEKztgIefH+t2n6T7O0jBBSK8263y5b4tNnrjG0byZ+PY0eeP6L4N9zlgYiEdkHwEVErqjng7MzWGJd8zjDgVIO1R/3RbRxyjay6RkRbyASRUPG3G4XPF4PulaXo3N1Jfr26ca8Xg9KS4tRUV6GztXl6N+3J7p2qUJjYzM+/uwnvPLW54m7MytYIIcO25Rtv0kP1LW0obzYh2KPG3UtflSWFqFzWTGqy4rgcknoUl7Celd3Qos/DJeLUF7ig1uSUFbsBcUcWBkQkRmcuA+JHN1XJaPvRl1xDG2BENqCIYQiDK2BEIq9bqxuaMaK9Q0kEWFDsx+1zW2oaWpF9/JSRGSGtY0t6FTkw9+LV2PyzMVRAWIRh+3EnmSXS8K5I45gxx+1H0KhEBqbWrB85VrU1zdjfW09AoEg2tqCWL5qLdXVNmB9XQPCoQjC4TAispyg4NjDODCbzJLLiQguF6FTaRE226QHrj3nEHbEvtsZ2mP7nnmf9PvfCzWPkWUmR1/FOOOj2Iud9t2WnXH18bm4gzzzntmbUFoZhsXTNi1dRXXeHX3pY9KyeSs2Xij9CxkEUIno3h+CDHDerGRPxgG4Aun7M+a2pVuevpL1HdTLLqsJSn9XIpOBx+5GSMbyff/xr/TBM59TMBiCHJFTBkYtT0i/np3x3xdjDNuwMEYgGMYV97wWmPbvYs+SlXUUDIVdckSGLDMwPXNS3MZfhgqIOK+MTYyRbNDahTlGpkp08tdiz4okEdwkQZKoXYndeJ1wu/0oywwel4QIY3DHUhbag/S8HhciMkMkIsPlkjaGiDHA5ZbgaveZed0uMMYQM7BKi7wIhSIo9rkRCDO4JCAYisDrcYExwO0iBMIRuEhCiz8QrXJA0RXrYCgMxggyGCJhueO2x67vkiR4XAR/WAbkjUZcWJbhIkIoIkOSCBIIEhFYu7dJaj9/RJYRam8HEaXcl0yfYpnji+3OEBtjl1oi/DchZnS43S6UFnvQvUsF9tlxC/bAjSczj8EFLgKBEIYcPkpata5eU3SZMbl9USY6ckkEn8+L0685nu2077ZWmI9KNzVXcljx0PMaVrq9H3NnLqSHr36moz85pj0G4M72H0GG2GFUyhfWAOjOcZwMAKVlxfTIR3cC9rgHvEZIJgaTE1ZjMjZCfvtqGr33zKfU0tgKOaLPE1JeVoL5X90nl5cVm9EvJMuMfpo2D2988htmzluJZSvXo6k1gEhEjnk7+I0S8w2SuM380j1iCavGsd2g4no5d6+UmQaIQJ12b4TpPZvOAIkZWfZkY7hku6wWCqrejzFjI5ofJqFTiQ/9+3TFFgN7sPNP2Iftst1A0/q4oakVgw68UXWPj5joUeODOuY/kgidKktx8mVHsx323qYgfFcKUNKfZsKrR6jpKKrfZ4zhyiNvkwL+YMe/OVgBwJiqMgWMXUdOJ9ID0VCsdApx7EWg3Q/dEWddd6Jd7oGZRoiZXhCjvEgZyzhv1mJ64d43qaG2CRGF2p1aRojH7cKPr90sbzekv+l9EpFlzF20Gp99P4N99dtsWry8BrUbmhEKhaMeEh0GSfseYGC63Cqcwm/UNhT1jtg11YwhpZyT9KFomYb6sLQTVq4MkFwp5TrkMWWCiTeEdVdO0AmHB4RlkudkLkmGh0XGebI8GyXY6Bnzet3oUlmGgX27Yq/hm7HjDt6RDR7QDa4ceJWm/rME+5w5RopoLCLEct3iNxiUXBKqu1TgwttOl/tvLnRQ5CaMnGd+zij06tm7X6OpP8zU4/0II7rYXGdym/Meu4yY+cIHAI7lOE4GAMklSfe8cgO69Ki2Wm6APyEd0O91cIIXBMjCCFm9dB3G3/SctKFO2QgBtMv0vv3oJezIfbfPeenG2vom9vG30/HeV1Np2ao6rK1pQDAcQSgU6RiIeWyM2KFmeEiMRHkVeGM6ViaKpJYXJC7WLC0buxCMiLizNuJLIbe30fKMD4aN+URGGgnJbY2ef2NMvsFt6LBzNA6L3XySJFNtofTS6sIIOTmqVcXtUO5ySSjyetC9SzkG9unGTjhkOI49cDgrLSnKeW+9+/kUOuvG50hrbFMzPqo6V+C6Ry6Wq0VhiRhmWot6dAfdZXdXLl6Duy8cJ7GNExjPdV4DMMLENhcMVs9T+UgzAJ6tr2UQqLi0mB79yDZhhGYaIWaXA7Q0KR0Amja04MGrnpRqVtciHI6onktp13QAOO+EvdkEYzavyrQvGAC2YMlavPLRr/T9lDm0Zn0jajY0IxKREQ5HEpNmtbrKxJAts4mVLObfqFHTC9KhhEPBOxFvdKiJk5Qso+n9if+SlUvyMmPqRrhOueIMAe02R+9b1paIwvW4Y8olIik3Pigr9pXTDqPq+Ht77obbLaG6ogx9e1Rhn522ZOcdvyfr3bMqB32jTdpKV9GQK4aod6vj3rtcErr16YLrH7lELi0vsboZdsIsA8QI4wNx50g5V/yeH5xTVSOACpPaW3AIA8R49kV0l/R0dAxwB5+yD447/1Cr5Y6XS+nvyeh1u5rtBQFsYIQE/EGMuewxad3KWoRDYVWjS80bMrhfd8ycdE+2xpqh/RAKR9DS6seHX/9Fk76bgcUr1tPq9fUIhmUEAqGOfJLolzRXFNvPa07olhlEQ/xJU1lpV1h1xR3nRHYdCnm7kMwIoyWmvHHKpyhN/F41mTafdBgjaYwcpbFOfYGBSFIuHpcJuXp8+POZY8NWLG/D5/PA53GhR5dKDOjThR17wHAcvs+2rKK8OCehVHrY7KCbpOVralU/V9rdHADcHhd6D+iBG8ZfKrs9Yvu0JMy4yXrHTt7qYB1/vjl+In3/8W96Qq+AaMndf01ob0EiDBBz+APAThzHyUQkSRLhnldvQmd7uXRVVw3i0GuE5GJTJMuNkHA4gnHXPSstmbccwUBItxFS5PPiz3dvkwcP4KlpYFofpO2P5hY/vv5lFn3y/T9YvGIdLVlRg6bWAPz+IOJL06azNczMJzGQJHWWxf3XgZR4gH3aE++BiS8arNDvuhT3eOzu8UrIhYglzGz8a6K7KylnItnAJIqzuRUupb/ktD27LX54kiRCSZEXpSU+9O1ZjS026ckO3WtrHLTHUEvCqPTw38LV2Pmku6VgKKR8AEv02iXvbj546Ca4fPTZssvgClx5gBn5H3rHTj0yMABYvWwdu/P8hyUm6wq9+hbAAQa3taARBoh5hKG9QzoAgIgYACqvKsOD795qtczx8BgggD5lN1dKmeVGCAC8Pu4D+v2b6RT0B2W1AU5thZ1AuPXSo9jNFx+RSXC3ZQmBLa1+fD9lLv3171JMn7MUC5eto5r6JrQFwohEIh3J7rLMQHFaHJBoqMTllEQ/cg4q+6E7D55wqbh4sGy9FdqfA4lBaBbNXIxlm+Vvj8cjOWSKMRYtcyzF9txwocjrQrfOFRjUtxvbfkh/bLtlH+y/yxBWUuyzWnxdjBz7Po17+UvVfA/GEkIgUzcYPGRHdvLlpm0w6HSMnm8yWaTUHY1x9TF3UGtzdPsOTuMjjPR7vQl0IgwQ8zgOwPscx7HYgHfEiANw5FkHWi13gmxJfyphRy+IUYNi1kbIF299T5+9MZkCrYGISpgOAPW8kP13HYJJT1+tt89yFffA3T8RWUbthhbMmrecmlr8qKtvxrTZyxAORzBrwUoKhsJoaGxFU0sb2gLhjnwTxqIrr7FE7w5zhDaqvSxuJX+jV4lIcVty1vFHx99s7nmxhFTP3MaEmAR3ScoXrZY8fyBQh1GebjfReCOiY18YidoN/ejfXS4XSos8KC0pQllpEYp8Hgwd3Ie5XYQdhg5Aj26V8Hnc2GqzPqxrVSdIlpcyyJ5Dzx8rfT/lP8XPUjdeTSyz6yv24fAz9mMHnbi3GB+0sboIjK7rv/vkJHzz/k8d/+Y0QPYD8J1B7RS04/wRxt6sBdAt3UHxG4yN+/gu+Iq8VssdT7Y7j2ZyPiOwvDxvjCnfzaAPn/mU6tY3hBljqoPlxtjxRKrKSzBr0r1ydSVPbYPoqQxod877KYY/EMSGJj9q6hoRDkdQs6GZGAPCkQiIopva1dY3o6auCcGwDJ/HBZdbYnOXrCFihJa2AFpaA5CZjOYWPwVCYbS0BdHU7IfLRQiGIh0GTVNrAIwxhMMygOjmfDFlzuWSOjw2QGzfFEAi6vDMtH8ky+1pD4whEtf/sWc99u/4uxu3NWAHSmv7Hev+RLHzKD7WlPi/wiZeeY/9W/XY9vsd74WJKvIbFfrY50QdimuHgp9MzGiOfUeSJETan93YcwUQPJ6og7yirBjhSAQetxs+rwuRCENZaRHKS4vgckso9npYSYkPPrcHncqKwGQZQwb1QktbAE2tQVR2KkZVRQkqy0tQXV4KfygMlxTNha8uL2NerwvV5aXoXFUGn68wFnHrG1ox5LCbpA1NCptUM+XKcbG/u9wuVHUux8lXHMW22XmIMD7Sk+1cm61OwD3f+VsCuPLo2zZemM/4WAmgT3ZdJFBCTFXmI4Ojn4kIJBGG7TEUF952htUyx5PtBkBqfZILbGOELF+0Gi/f/7a0cvGaSCQiq8qklhfikiR8/ty1bM8dNjP6XhhNru6tIYQjEQSDYQDRZPu1NY1obQtg8Yr11LmyDD6fl5WXFsHn9aCoxAMCYcOGFvg8blRXlcIlSWgLhtG5shTr6pogh2VWUuxh/mCESorcrMjnY/5gCCvX1LPWtiDCERnBYCiwaPk6efnausa2QCg4b/GampVr6xoiEVq5dFWN5HbB0+oP9+/euVNJWUnxwC5VpSWBUFgCIBX7vGhobqOKsmK0+gNwSxL8oQh6dC5n/mCItt28H1u+pg4+twudyoqxobkN5SVFCMsympr9YGBoamlDQ1MbVXQqZpGIjLLSYvTpVhmNd/e4sbamAT6fB+tqG1BWWgyfxw2JgJJiH9bXN6LI60V5aRE8HjeCoXD7xpYMwVAYoXAEVeWlaG7f2C0UjqDFH0R1RSla/QH07FIFWY4aeSvW1KOusRmMMWppC6BTSRGrKi+D5CJ43W54PC40NftRXVGChhY/GGPo0bkcf/+3jMpKitjqmgZyuwgSSSgr8bHahhbqVt2JNbf4yeVyIRwOIxiKoLK8hIXCEerbo5r5fB706FKJ2vom+LxudO9SAa/bhcqKUvTtWQ2fx8MkIhQVudG3ZzVKin0IBEJoagug2OtGQ5MfXp8b1eWlaGkNwO2WEAqF0dDkRzAURnVVGRhjaGpqQ6jdeA4EQ6hvaEH/Xl1Z986d0KW6DJIkweNxQWrf0V5gHF//8i8dc+l4khUKscUnmcdQSjY/b+Spcve+Xa1uipPIdM4xYr7gvvbjt7yEmX/8x7V/UzvxC0gCgxEjn/ncAOB+ngOJCJJLwv1vjkR5dSer5Y5hVCm8ZArOCGGMYcKol+i/6fPlUFTpVV7K1tgv5N5rTmBXnX2QkR4pM7BVArajoPhEGDE+CwR6uGP8RHrguc9S8z2Ycmno+GRzr8+DzbYdyC4ffY4YuzLDykiItLpH3boNGHXGfR1eS04D5FwALxrbTYIYYoLLDQEAaeOqYiEA2+46BJfcdSb3BmY5QM9gwTsI5XKl3OoY1QSeuuMVmjN9IWtrbpM1ZGvf2CyVrTfviynv3pZOFquNEMBh3hCBQOBchh4+Slq4fF3K75W8HojbvJIkQklZEbYcvhm7YNRpwvjIHkr6Mx4zF6dU53nGGMbf9AJmT5vX8W8OWsG3p5sgQ4RrKTdsyXNQ7KX45/c5WDZvhVmyZPryG73nRy6fPaMUYUNkvviOM9kJFx5GlV0qCEBE5TAmy0xW6sWZc5ejcodLpR+n/Kd1T+wwkUaD3QUCgcAkPvthBpUPuzjV+GAAk5lSyFWH8SG5JHSqLMUJFx0hjA/jiM3/ssKPmX2sOs8vmLlYr/EBAAPM76rCRigHueNfAEPSHRTzepRVlOCBt2+BCXXHMy1imcnKRTqFPdehOrYozxtj4b9L8MKYt1Gzpi7MGFPd3UotJAsAdtpmEH547SYtA8sOiwwiJEsgEBjOXqfdK/05a3HK7xW9HkjN96jsUoGLbh8h9xvcy+qmCIwjwQMTDoVx7Ql3w98SzUvjNEB+B7Cr1Q3Jd+ygnBQKW0F9tbuD2MvR0tSGL9753gw5Mi1En0lID0+uQi7JacJbOgZtNQDXj7sEm2zZzyO5pBBU+iupTn0CU/5ZiIrhl0praxvNbLMRfSYQCASGsGJVHSqGX5JqfLBoSTot4yOW79F/0z64ecLlwvjIPxI8MJ++9i0LtAWiH/AZHxEI4yMniG09c0sIwP68By+ctQR7H7ELvOaU5TVLKYwp6HYNvzFiGzPD2lVU4sMeh+2EdStr3DVr64PhaLUjxfNHN0FLzQuJyDLGv/INVXUqwY7bDFRrs6FyZ9hnwgsiEAiy4r6nJ9EJVz4uReTEtRU1rweiw2aH8VFaXowd9tmOXXLXmcykuVVgExpqG/H0na9J8eXUObgYwF9Wy14I2FFBzHfqAVSmOyimZ2614+bsf/eek26nYL1ko5BqhdNYWYpPL0Z4/wyV+7uPfqWJL3wZaWtuY9BYHFDbLwQABvfrjr8m3il7tEP3rPJ8ilAsgUCQEYFgGDscd4e0YNnahN8nbygYT/zmgi6XhKLSYhx73sFsz8N3FuNQnsMYw9hrn5Hm/7Oo498c1AAQ9ZdzhAjByj1DwKG4xl6Wf/+cS9N+nGm0DNkMvqTx+0ytJKdunGeo3PsevRu7/dmrpR59uxGi3jJlwRmT1UKyFixbi6odLpU+njxd616YnQyohljwEAgEunl14q9UveNlicYHi4WnqhofHd5kt8eFnv274/bnrpaF8VEY/PbVNNJpfMgABvIcKDAGoRBYwwwA2/AcSETweN148J1bUFxWbNT14zdHNMJjYURehFW5CrbzhADAc2PexN8/zfIHAyGvloySRKqfbT9kAH58/SbZ7UobaZnLkr12yEkRCAQOIByJYPdT7pX+mbts4y8VdjJPpiPkqr3E7rA9t2ZnXH28MDwKhOaGVtx4yj1SOBTRs+HgbwB2t1r2QkIYINYRBOBJd1As9GroTlvg8tFnG7E3SCwMJhsDBEhUJG21z0YG2NIIWbuiBg9f/zQ11TUjHI4AKl4LrSpZPq8Hbz1yCTtkz63tsoO6CMMSCARp+fCrqXT2zc9TMBTu+J1GngeApJArd7TK1f/uPUfu2a+b1c0R5AjGGB6+7llp3oyFHf/mIACgyGrZCw2RhG4dYQD7gkPhIyKsW1mDLYYNYp27VxmpIGajcMaSiu2w4V22GJGYbjhl5SXY9cDhmDt9odTS1EqxHVzVUExQj8h4+7M/6Oep8+mMo3fjGYntkLAuEAgKFMYY9jvrfunRV76mWKJ5OsMD2Gh8xKIG+g7shRseu1Su6lJhdZMEOeTfaXPp89cnE6Ar9OoaAFOslr3QEEqGtdQDqACnEVJeVYoxb4xkbo87m/sWvwKdrfFghuJuZYhOtp4QU2RnjOHJ21+l//6aT8FgCHJEVvUiaHlD3C4XHrv1DHb2cXvwlEc2a2wQHhCBQKDIk69/S9c/+E6H4QEWzXlL9734kCuv14Otd96cXXDrGWKcKTCCgRBuOnWM1NLYoif0qg5AF6tlL0SEAWItlQDWA3CnOzC2uL3jPtux8285lSEzZVlJ+cs2FMtorFZQbWmEAMCfk/+mD1/4kjbUNCASjqhWfgG0K2X169kZXz1/ndy/j+aYa1ZhAKvvr0AgsBmz5q3A0ZeOl1atq4/+giPPox2KeX5dbhequ1bixMuOYNvuMkSMMQXI47e8RP/8PkeP9yMMoBMAv9WyFyIiBMta/IhuUDgEnF6QmtW1NHjbTdC5W5WR3gc7GSFW7xdhy3AsAOi9SQ/sfeQubN3KGqxfVUtMZqQWlhCdv5XDshqa2/D465PJ63Zh9+Gbal3SjH6w+v4KBAIbMXLse3TeqBekppY2AHzhVkDM20tEEsHn82L43tuwq+4/n/Xs193qJgks4N9pc+nzN74jOSLrCb16FsBHVsteqNhS0SpAWgH4wLHqTETo0rMad754neyO7vWgZ6VabcXcTgYIYI9V8mw8AKaHkU3+8Gf6+p0fqaGuCZGInDYxUy0sq6q8BN+9crO8+cAeRveBGna4twKBwGJmz1+Ffc+8T2rUaXgAG0OuXG4XKqrKcPiIA9geh+0kxpUCJRQMYdSIB6SG2kY9xkcbgDKrZS9khAfEHkwFcBo4Y+/bmv2oXVOH7fcYCvCv2Gu9lXYzQOywSm5bTwgAbLJlP+x15C5s4ewl1FTfQrIsk1a4AmMAIdUM8QdCePqt72nRinU4ev9hSl81ug+svq8CgcBiTr7qCbru/rekQCiky/AAosZHzOsxeOgmuOnxy+UBm/e1ukkCC3nunjdoyX/LSUfeBwOwH4DlVsteyAgDxB4sBHAegPL2f2sqfUSEdStqaODWA9ClezWQqNQpfZdn1VkYIalkaoTkRHaX24VdDxzOSspLsGz+KgqHIiRrlMpigIoZAsyct4LGvvAlVXcqwfCtN1FqjxFYfT8FAoGFPP/eD7TviAek2QtXUgaGBxGR5Pa4UFndCcddeBg76ZIjmSSJ/ZQLmZlT5tCnr32btkpkOzFdaCGAG62WvdCxi7IpAIoBNCBqFHKFYvmKvHjo/Vtlr8+b8nHSv3kHebuV1LVLuE4mM1xOq3nVrd2Alx58R1o+fyVaW/w8JSsltS1lenatwlfPXysPHtARS53NDM+S/hQIBAXGv/NX4tDzH5LW1zeDRXcw1zU+Rscrgq/EhwGb98a5N54iV3Qu13MKQR7ibwvguuPvlkLBkJ7Qq1jiedBq+QsdOymbAuBebLTKuYyQfoN7YdRTVxql7NrNCwLYZ+dsvUq4JcbTjN9n0/tPfUbrV9WwSCT9kpDaTuoEwh7DN8Wnz14je/TlGtnlfgkEAosJhsI44JwH6M9/Fuv2eMQgIsnlktC9b1ccf/FhbOgOW4jFDAEA4M7zH5ZWLVmrx/gAgJsAPGi17AIRgmU3vgVwFTbuyJk2FKu5sRWbbbsJOnevMkoGu3lB7IIjNujr0acrdjpgO7Zw5lKptdWPSCiiGUYWzRtRDstatroW9z/zWaxaFk/7hWIgEAgAAHc+9hEddfE4acWaemRoeJDkkqSikiJsskU/XPvwRbKocCWIMWvqf/T9xN+I8YdeAUANgGOtll0QxdbKVIFSiehLQuAwBmKhWOM+ulOWXIbEwtrRALHTqjpv/1gePvbbN3/RRy98QQ21TZFIOMJT5lk1LKu4yIdxI09lZx6ze6wPbNlmgUBgLU+89i2NHPc+BaJhMTx7eSRDREQerwdllSU4+txD2K4HDBPjiqCDcDiCq466nTf0KjYvyRB7ftgK4QGxH34A2wPYvP3faRXHSEQGEWHz7QYZLYtdDBE7JKQny2N7+g7sif2P24OtXb5eqlvfwMLBsAztUKo4ZSHaxJhnJByOYNJ3f9NTb36HIYN7yYP7d48/j8jzEAgKnA+/mkoHnfOgNPHbvygSkdurW+kbE4iIXG4XlXQqwfZ7bMWuHXsR6zuol9VNE9iMD577nOb/s1hP1SsAeBvAO1bLLtiIIxSpAoQAtCC6NwiQJv6eiOByu/DA26PksopSI2WI/9Nq7OQFAdJ7QmzlDVi3sgYv3f82Fs1ZHpJl2Q0d9zVqhGzc0ZAB6N29yv/z66Pknt0riu3UToFAkFsWLV2Hgy94WFqxprbjd5nke0gSSW6PBwM264OzbzxJ7tKz2uqmCWzIhppG3Hz6GIlzw8GY3uAHYJhyJDAGuyiXglQOBfAJNt6jtEbIJlv0xU0TLjdSUbdbOJaTjBBbGSAxpn3/D3trwsTWhvpmLwBPlqdjO283sGXyyzeVul2SnZ4TgUBgMo3NbTj5qiek76f8l/D7DMKuyOv1UHX3Kpx46eFs6522tN24KbAHjDGMvvhRafnC1XqMDwZgDwC/Wy2/IBGhNNibmQCGtP89rTHgcrtw4W2ns+13H2rUAG43A8QOSj2vZ8hsWeMdEroIBoJ47ZEP/H98Mz3CGCvhaIsmkkQ49sDh9OKY85nP6zaxyQKBwGoCgRBG3PAMffr9PyTHV9NlgKyzvK4kSeQr8dFO+2/HTrzoCOb1ZbsmIshn/vjmL3rxgXdIjqR9zOIP+BPALlbLLkjFTsqlQJk2ALGNPjQNAiJCeXUZxrwxUna7DUvvsZsRYqUXJNMsfyOMESMMn4RzzJ46H28+NpHVr99A4VAktqKUWalMgNxuF511zO7ssdtGMEk4RASCvIIxhgtveYnemPR7iuERjbjSNcYxr88jVXWrotOvOZZtsc0gqxeWBDYnGAjh5tPulZobWtN5P+LnwDYAZVbLLlBGaAn25zAAH0NHKNYRIw5gR551oJEDup2MkNjgotcDkOmu5ka3P1NjJBPjJ/5aqt//5v2f2bfv/UgNdU2IJK0s6d0wTCKS3G4Xjj94OHv6rnOER0QgcDj+QBDnjXqRPvrmL4rIyeOD/jHC5ZJQ2blcOvjUfdg+R+0mDA8BF+8/8xl99c4PPInn8aFXewL4zWrZBcrYRakUaPMfgE3j/q2pjEouCQ+9e5tcVlFi1PXtZIAAqQq8mUaImW3nNUYMqa+cTpZXxr6Hmb/PoebGVsiphgi34URERARySRLOOX5P9vDNpzKPcR45gUCQAwLBMK64+3V67eNfEz0eQEZeDyJiFZ3LXTvusy1OvOQItcNERT1BCg21jbjh5NGSDuMDiIawb2e17AJ17KRUCtRxA2hGYtKwqlJKRNhi2CBc/cCF+ZyQHg+vchxCauK1VhI5kNkO6Jn0k9q9ymW/s5o19ey5e9+QVi9dh0BbAKmbPPErHbFd1gmEYw4czl578EIRmiUQ2JxYjsek72aQ0quu1+shSRIVl/qo94AeOOfmU9G5e2WmomW68CRwMIwxPHj1U9LCWUvShV7FP5NBRKte2a1wjSAOoQ04h2sAPBj3b03F1O1x47pxF8sDt+hnpAy5WInPFD4jhGgeGNsM5ir2chbnT25Hrg0/GQCWLViFF8e8KdWsqUcoFFYwRPhyRWLekGhDCNtu2Q/vPnKp3KeXKLEpENiJeYvX4KybnpNmzFkGtTUGHeV1SXJJ5PG40aVHNc6/9TT0HtDDDLGFxyTPmTtzIT163XMUDke0Dks2NEYAeMNq2QXaCAPEWawEED+KayqnQ4ZvhivvP08mMuw229kLAvB7QloQ3RHVTGIDYjZGWzZ5K0bIjplT5tDbEyZR/fp6RMLKddd5VkMlIinWEgKhf+/O+HDCFfIWg3pa0DyBQBDj79lLcfLVT0rLVteqHsPr9SACEUnk9rjQuXsVTr3iaGyx/abpvmYEwhDJQ2RZxsPXPCPNm7lI87Ckfy8HMMBq2QXpsbMyKUilK6JGSHxAvapR4Ha7cPmYc9iQYZvla0K6GloTpYTcKPbxxpAT+iyZhD78/M3J9N3E36i1qRWhYFityZrhWfHekBg9ulTg7Ucuk3fadhOr2ysQFBQ/T51HI254htbUNGgex+P1oOgqF/mKvCgrL8UBJ+2J/Y7ZPddNEkZInvH3b7Ppqdtf0Sq7m7zoGAFQhegio8DmOE0pEgDPAzg76XeqCu7AIf1xw7hLZMllaPSUnUOxYih5Q+L7yQojJP5PJ5Ay6n/17g80+f2fqblR3RBhYAw6DZHSkiI8d/fZ7JgDhwvlQSAwkRfe+5Guf/Adam0LaB6nZHhE39tUl7rH60GnihIceNJe2O/YPaxsnh32ihIYQCQcwZjLJ0jL5q9UO0TpXo8FcIPVsgv4cJIyJIgiAVgPoFLh9ykQEc4feSrbcb/tCs0LAqQOUMl9JMN8Y0oruTxeTjv2qaLsoWAIP3/+J332+rfU0tiGiGpsblqPiJSsyrgkCcceuAN76KaTWffO5Va3XyDIC1aurseND79LH341LbWiVRLJ4VYx74bSsS63C2UVpTjq7APZrgcOJ5c9qt2JxOM84KfP/qDXHv5Aq+xu8n2uQzRKROAQ7KbwCPjYBcDPSL1/isp0ddcK3PXidbK32GfU9e2oLGsRM0SU+sdKIyQZO/arquzhUBiTXptMv3/5JzXWN6fsIRKHZghHfH5IPL27V+OZu89i++0yRKxoCgQZ8MFXU+na+95KG2YFpHo81AwPIoIkEcoqy7Dz/tvjmHMPhk0MD0B4QPICf0sAt579gNRQ16R2iKzw720BzLZadgE/dlN2BPz8DmBHhd8rKtPHXXAYO+SUfQrRC5IOLePESPSsytkpxC3thC5HZHz57o/0w8e/UvOGFsTtqp56Mo1EVjVDxON24ZgDhrNn7xEbGwoE6fAHgjj75ufp0+9mUDgSSf8FBsicHg+P14OKqjLsfcyu7IDj9iSDQ3uNQBggecAnL31Nn7z6tZp+oTSH/ABgP6vlFugjHxTIQsUHoAGp+1oACgpsRXUZ7njxOrm0zLDNCRWv41CyKZvLSyYTo136l8t4CofC+P7j32nyh7/QhvUbtDwiGRkiBMKAPl0w4dYz2H67Cq+IQBDPlz/PpGvGvEmLl9eAZ6uelBwPihaxUjo2unt5BQ45bR+25+E7x4wUOyIMEIfT3NCCW89+SGppVMwjV5o3/ADKEU1AFzgIuw4iAj7OBPCiwu9TlGkiwh6H7MjOuPZ4VkBlefVgp1CseOzQx7on9e8++pW+fPt7aqxr1sgR0d5hXSlHJIZLknDcQTuwCbedwcrLii3uHoHAGhqaWnHR7S/TpMl/U0TmG16Uk8spZewjIrg9LlR2rsBhZ+zHdjt4h1x4irNF5H84GMYYnr33DZo6eYbSyK90bxmAowF8arXsAv1YrdgIsucvRGMfk0lRXN1uF256/H9yv8G9jLy+3SckXozYt0PPdfRidT9nJPfnb31Pv3w6hTbUNiIcCquHZmlUzlKqmhVPSbEPt1x8JLvsjP2Z1yNCtAT5TSAQwmOvfkNjnv00bSWreBQMD1LyZMQMj6quldjvuN3YvkfvbtciGSlNhPB+OJrFc5bh/iuekORUY1rt3v4BYDer5RZkht0HFEF6qgGsgnIoVsqk0XuTHhj11JWy27ikQSdMTLzkwgjJZoXOylK+Wa0szpu1mN5/chKtWbYeAX8QGjnpqgnrsdh0Na8IgdCvV2e8cv+FYl8RQV7BGMPvfy/CmTc+K61cU8cVYrXxu6khj2oeD6/Pg16b9MBJlx0pD9yiH+Cs8V14PxxMKBjCXRc+Kq1dvi75IzXjIwCgC4BWq2UXZIZTBhaBNrcBuF3ls5QJ5MgRB7Ijzz7Q6IT0+D+dSvxAZ5YRYtQqXa4VA0Pkrl1bj4kvfEn//jmP2lraIGeYJ9K+dKvqFyEQthjUC8/dfY48bGj/HHaTQGAcf81aivNueV6au2iNLqMD4Dc8JJeE4lIfthy+GTvhwsNZVdeKjo+sbr+e5kJ4PxzNu09Ooq/f+zF5RFe7rwzASAAPWC23IHOcrjAKohCAJQD6aHzeca+LS4ow6qkr5G69u5ghh9OfqfgJ24wJ2OiJMldKgqGri3JExtfv/0jfvv8LtTa1IRQMqR6rZYgA6Y0RiSTsNnww7rv6BHn41sIzIrAvjDH8NWsJrr7vTWnarKVIt2eH8kkSq1pBJdQqtnngwafuw/Y+ctf43EAnGR6A8Hw4nlVL1+K+yyZI/sSQQq25ciGAzayWW5AdTlcWBRvpBmAFALXYqoRJpffAnrj16StlSTJ8rsknI8SMtpixUpcLhcGUSV6OyJj2wz/06evfUt3aDQgGQ2Cy/hK+8WgZJBJJ2HW7gXj89rPkzQf2yEG3CQTp+Xv2Ulx292vS37OXZWZ0oMPjsXF8UahqRRLB6/Wgc89qHHn2gWz73baKNzycOHZnOy7F8lsEFiFHZNx+7lhp7Yr1KR+pfCWM6EbMbVbLLsgO8eLlF68AOF3j844Jxu124YSLD2f7HbuHGW5rO6ygZTOxmBmKZWaogF1zV7hYuXgNPnj2c1r831JqawmohmdpVc5SQi2JnUDo0bUSIy88nJ174l5MksRwKMgNoXAEL7zzI9333Ke0tqZRd3hVAskeDwXDw+WSUFpRgoFb9GfHnHcI69m/W/zHTjQ82lue1VjqB1BkdSMKnc/fnEwfv/Q1xaolEgGMac43jwK4xmq5BdnjxEFHoE0DgDKNzzuUVI/XjfveHCV3qiw1Qw6nGyFmhWKZHatsljKRszAHOSJj1tT/6JOXv6U1S9ciFFSunqXXEAG0K2qVlhThzKN2Y9ddeCjr1aUyV80VFAgrV9fjvuc+pdc/+Z3a/PzVq1SJGh4d70DyBoJEBI/Xjd4De+Kosw9im287kCnsWF5wxgcBskxYTQy9rW5EobOhphEjTx8jhRNLtWvNNfWIJp4L8gAnDjwCbQ4HMBHaSnPHZ5tvNwjXPHShbMK+UnaY2LJ1r5thhOQiWdLovrcswbOhrglvT/iI5kxfSIFWv9rmhqqVszQ7ScMYkUjC5gN74u4rj2UH7zmUuV2GVY0TFAjBUBgTv55Gdz3+MS1eUZNxaFUKrOOBjxkeCWOTy+1CcakPm20zkJ125XFMZYHJDuNzNmTamSEms4dIoputbkChwxjD/Vc+IS36d2n8r7XuqwxgfwA/Wi27wBicPAAJ1PkcwEGqnxIILHrvJZeEi+4Ywbbfbat8DcXKZoPBZMXbiPbkUpk3qjqZLSrMzJwyhz5/7TtasWi1Wq5IRoYIkH6vEZ/Xg0P32oZdMeJAtuv2g6zuCoFN+XnqPBr38lf4+tfZFAyFsj9hHEn7eCQklsdyO3pt0gNHnLU/G7rDFuneAzuMzZmQzWauMqIl65M9H5aPbYXIH5On0wv3vkWxR5oIjGnHIn4C4Bir5RYYhzBA8pNKRBPSVbeIJiIp9uJLLgnjPrpTLir2GS2HHVbZOibsDL+fPOFlO3FbrczrlZ8l/Wk5/pYAvnjnB/r3jzm0aulaRMJyQoiW1qaGPKQzRgiE4mIvDth1CLvnquPZJn27QHhICo+ILGPuwjW4bfwH9N2U/3RtCqiH+OTy+DArIoLLLaFX/+7Ybq+hbL+jdmPFZcU8p3Si8aHX8EhuY7p5wOpxuaBoaW7FNcfcKW00PihdkZEmRA3HFqtlFxiH1cqhwDyuAPAwNO5xvBEyeOgAXD/uEjNCseww2cnIzhhKHhiz8SzYYaLT0xd2kFeVgD+I95/+jP7+9V9q3tAMWWbxxkjGHpGOjkpT4jeGRBJ6dqvEA9efyA7fe1vm83n4LiBwDKFwBK9//Bvd9fjHtLamwbiQKhXiPR6xMCsigiQRKqo7Ybvdh7LjLjyUeby6njU7LArpQU8nq7VNzwazth7v8gHGGO69bIK0dO5yAFzGhwzgAgAvWS27wFicNBAJ9PMjgN01PiciIsYYvD4PLr/vXLbFNoPyMRTLiB3O1QZIPee02+SWTnbbeT+0qFldhy/e+o5m/TmXGmub4vNFsjZEYqTzjnQcB0LnylIcuMfW7JaLj2QD+3W1unsEOlm6ogajHv2Avvt9NtU3tGZXqUoHMcMj3tvhcrtQ1bkc2++5Ndv/+D3iNwvUi9VjMVcXgH/M0TKoMq1maLdxOq+YOWUOPXnrKxQOR3iMDwD4AcB+VsstMB5hgOQ3lYjGvKrGVkWVqagRUt21Ave8dpPsdhseTmL1qpsRZXW1JiXe9tlxYiOVvzvK+Eimdm09Pn3tW/pv2gLaUNeIWIlH3r1EeOH1kADRgzqVFuHYg4ezq0YcxAYP6CZCt2xAKBzBgiVr8dCLn9PEb6ZTW1swZ8ZGPHGGhwREqxSWV3bCVrtszg47db9sjI4Ydjc+eN9NnvE22wIidhyrHU8oGMJNp42RmuqbEbWvWbq8jzYAvQA0Wi27wHiEAZL/3ATgHqQJxWr/E0efdwg79JR9hBdE+xxKxCZFtcpbYkKziKYNLfjj2+n0+1dTad3KWgQDQSbLxnhEkomtWvNGMhIIbreEvj2rsc9OW7ILT9yHbTukr9VdlpcwxvD37OV4+u3v6Mepc2n56jpEIrIlxsZGmaJ/oP3R8Xjd6NKrM/Y8bEe2477bMwNKpFu9+MMDj+GR6SKPGQtOggyZ+OJX9Pnr33bcxzQLQgzA/wA8abXcAnOw+8AkMIbPABysdUDMCJFcEu5/c5RcXl3GdWIdWD0RZlMNK/k8PG2NN0TERGYTWhpb8ddPM+mHT37HmmXr5GAgBJj4XMY8jHpTqwgEj8eFrtXl2GvHzdmph++MA3YbEssHsLILbY8/EMQffy+i1z7+DZP/mEPr6xoRDltraCTAYv9FHwyvz4Mefbtin2N2Y9vvOZQVlxiyN57VCz4cvZD2huhtg5EFQ4QBYjB16zZg5On3deSdcnijJwI43mq5BeYhZrLCoDuAJQC8Gsd0lHUctudQduFtZ7A8S0jPdk+Q+POIiSkPCAVD+PO7Gfj1y2kt8/9Z1MoYq0b0GTXbIAFv2JbiOdq9Jt06V6Bvzyrsuu2mbMTRu7Ly0mJ06dwJPq/bmg7NAYFACCvXbkBNfTM++e5v+vmvubR8dT3W1TbYy8hIZqPFAZIIZeUl6Du4N9tx/+2w497bMLfHkHtm9SIPZ09kHcqqRL5VK8wrGGN4/JaXaeYfc6j93+mMjwCiekuT1bILzMPug5XAOMYCuErrgI7VWolww/hL5YFb9DNDDruvzPGQs13BBbljQ01j+NPXvlk65du/i/1tgWrGmBc5eF715JFwnxPRakk+nwelxT50KvVhQO8uOHC3oWy37TdlfXtXo6pTMbyeaAUlScr9VBCRZcgyQygUxoaGVixYtpZ+nDofU/5ZiIXL11FTcwAt/gACgRAissNeuXgvR/seHVXdKrDT/tuxvQ7f1YjQqnicangYIbfSeXPl6RZwMnfGAnrkuueItSc6Ib1x9wAAsVlknmP3QUtgLH8A2EHrgFgoVr/N+uDmxy6TJZfh+pcTJksexASV56xdUYPvJv7KZvw2G411TQiHwrHwAdNXRs0wSriuG3fBWMlXl0tCchExIoLP64FLiv69pS0IWZZjVW2iK/1EiESiRgaA9l3G8nRRmW18KGJhVRWdy7Hd7luxPQ7biXXv08WMq9p9MSdZ0TR67Fcag522WWzeEwlHcM9F46RVS9cBfBUJfwKwj9VyC8wnHxRBAT/7AfgCgGbpHSKSXG4XTrvyGLbHoTvlY0K6EYhJqsBYtmAVvv/oV5o3YzE11DYgFAwn7jkS1UJNeyZ4SwALzCdeherwcHStwBbbD2Z7H70r69W/u1mXdsICTmxsNFNWJePDqOuJsd1Avv3gZ3r/6U8pEpF5Qq/CAHYDMM1quQXmY/eBTGA8LwEYke4gIpKqulXgjmevlYtK83KHdCMQXpACpmZ1HX785HeaN3MxrV2+Hm2tfjBZVW8xy0CJWiXCMDEHlrSEH/VLobikCN37dsUW2w9iex2xC6vuVmmmFE4ZL43Ks0t3DbV3SHg/bEZLYyvuOG+s1FjfzFsC/XkAF1ottyA3OGFQExiLBGA2gE21DoqVE912t63YpXedKbwg6ggjRAAAkGUZKxatwW9fTqVpP86k5oYWyNFVP56vG26gWBXG5UTiblFHJBUQNThcbgmdKkqxywHD2fC9t2Z9BvfKVSWyfBkjjUJrrBXGh81gjGHcjc9K//21kNf4mA1ga6vlFuQOMTUVJtcAuB9pBm0ikogIV9x/LhsybDNhhKgjjBCBIs0Nrfjv7wX025fTsHzhKmppbEEkzG2UxGOUgRKL47LMMInX8FnyB5T09xyqg/HGxoAt+rLdDt0Bm261CSsuK85l9zjF25FrhPHhMP7+bTY9eevLxGl8yIju+fGU1XILcocY6AqXzwEclO4gIpKqupTjrhevk73FIhRLBTF5CXQxc8oc+vvHf7F84SqqWVuHQFsQkYgcDfnJbo9ElvjXlNdLa7PMvCcWQuV2u+DxedGlZzX6DurJhu+zNbYavrlV73C+jINmkU6BFSV3bUZbcxtuO/chqbGumSfpHAA+BnCs1XILcosY9AqXKgCLAJSnOY6IiHbaf3t23s2nCC+IOsILIsiKgD+IlUvWYO70BTTjl9m0fk0dQv4QQqEwmMyyNUwKith+G16vB26fG917dcGwvbdhmw7tz3oO6A6vz5v9RbIUEWL+TYcZmxUqIcZuA2GM4ek7X6XpP/8LTuNjA4ABEHt+FBxiACxsrgcwBmmeg1g+yFnXn8h2O3gHw5No010/CxLiuXOAmMgEphBsC6B2XQNWL19L03+chSXzVlJzQwtCgRDC4bARnhNHsdGT4YbH50FZRSn6bdqL7bDPNujVvwer6twJJnhsjSBfFlzMhmcsNWsfEUEWTJ74C7094WPe0CsG4AoAT1gttyD3CANE8BmAg9MdRESSx+vB3S9fL1d1rTBaBrMm5dgAmKtJX0xmAkuQZRlNG1qwaukaIpeE3z6fipWL11Bbix/+tgCCbUFEwhHILLGskx2MloSEbgIkSYLb7YKv2AOPz4fS8hL0HdST7bDvNnB5XOjWowur6NwJkuQIXT6fPB1yDtqjZwzNVhYxXhvMulW1uPO8sVIoGOZdjPsQwAlWyy2whnwZGAWZMwzRjX+K0h1IRFKPvl1xxwvXyiZUgTFDm8i1ARJ/TYHAtoTDEciRCCRJQtOGFqxbtZ7WraxFKBhG3boNIBBWLl4Df6ufQqEIWptaIUkSIhEZxBggEULBMCKRCDxuF1weN1gk+nuXSwKTGYpKfSgqKUJRsY/1HdwTkVAEPQd0hyzL6DmgO6vuUomyihLIsgyXywWX25V9w+xBPhkdQOqYZtZ4qtcgMCL3Q+nvggyQZRmjTr+Patdt4O3LVkQ3Rp5rtewCa8inQVKQOeMBXMZzIBFJ+x+3Bzvp0iOdEoqVi1U7pWvGtysZMdkJBPlFvhkdZu+3kUwmCzdG9zlL+lOgg1fGvkc/fzYF4Os/BmAcgOuslltgHY7wYQtM52oA83kP/uGT32j5wlVGy5BPg37svSKVHwn5pawIBIWIFPeTL+8zQ9QYYGmOMQoZ9vEai/E5Qxb9uxS/fjE1Av5nYy6E8VHwCANEAAARAKcCCKc7kDEmh0MRPHL9c1I4lPZwvZhVZcsK4ybdJBab6AQCgTOIvbOxn3yCx/CIPzbbMTV2vWzPYdbYnm8eLdMIBkIYd+NzYVmWed+JEIDjrZZbYD15E3QryJo1AHoA2JHjWBYKhmj5gtXYaf/tjJbDjEE/19WwrG6vUXKJSVhQyMSvhufru8BrdKiRSZ8YbTiYdV/y8X4bzsPXPxtYt7JGT13rRwG8abXcAusRBoggns8AnAiga7oDiQjrVtZQVdcK9Nu0t9FyGD3w233zNTvJlaxwKf0IBPlIcghOvj7rDMYZAXoWd8z2WAhyzOQPf2E/fvK7W8dX/kJUxxAI8s6NLMieK8AXisUA4NWx71PNmnojr59PuSB6yEbhSQ4NyVSB4h0P4q8nJn6Bk0l+lvP5eY7lWxg9xmqFbzHoC+/K9PqCHLN66Tq8NeEjPTpkEJzFbgSFgTBABMl8B+ATcAzqsY2Gxlz+mCTLhuYRmpGUKJl0XiPJ1GggjXPxvuOZjgXCGBE4jUJ6ZmPKfy7GvvhrxRs7ZhsIQo/JMZFwBGP+N0FP0jkD8A6AKVbLLrAP+T74CjKDAPwHYDDXwURS38G9cMtTVxo5yZlV6lHpvHYLz+KdtPX0kdY5zVj5FZt8CewAJf1ZKNh9scUozDY+xDimwMgR90dqVtXqCeH/F8A2VsstsBciB0SgxiIAp4Bj4iYiNNY1UeOGZmyz85ZGXd9Mo4AU/m3W9WKKgJ5zx+TRQu/ESxq/N6Pd8TkjYgIX5JJCSB5XwsjcDieQC89HofQlN8+Mfh0L/lmsp+8jAE4CsMxq2QX2QhggAjXmAxgAYDueg4mIls1fSV17VqPPwJ5GymGk8sBjaJjhCYj9aZQRkqlSpWQQxJ8rXnkxut8LRQkU5J5CNThiFJLREUMYHxYweeIv9NXbP+idy54H8ITVsgvsR6EN1AJ9SABmABjCczARSR6vGw9/eLvs9empypdWBiPRUrDN2DVdSTnQ0yalUIps+yRepuRzJV9PhGcJ7Eihx/0X8juUq3tfyH2cQlN9M244+R4Wich65oMZAIZZLbvAnhT6IC7QRgZwOaLVK9LCGJNDwTDGXP64nZ8rLc9CbNNCsycdPRVhkvvSCGNAy6hI/r0ZFWzik4AFAh7iiyoU6nMTn+RdqIqxMD4sYsz/HodO48MP4Byr5RbYFxGCJUjHUgDVAHYGZz5Ic0MLLZ23Ajvtt50R1zcjNyPdOY0MQ2Icn+kNzTLKCFG6tpaBFpuURXiWIFcUwr4cWrCkPwsZYXxYxMPXP0vL5q/Q8/4xAI8AeN1q2QX2pVBXkgT6uBbAHzwHsiiYOeU/WjzHsJwzoycDgnqVGKV8CDPh8TDEK19GK/96fh/DjFXYeEVTICj05yF+XBDKcO6eA9HfScz+ax7N+3shoK9fvgdws9WyC+xNoQ7uAv1UI1rFopjnYCKSfCU+jP/4LqPKQRptLKuV5AVSJ6FMV18zmcy02ikjd8mXeuUWuSICIyhUTwcgnnc1rFgoFfcCAGMMVx11O7W1+vX0RTOAHgDarJZfYG9ECJaAlzZEFeD9wKMgEBAJReivH/6hfY7ezaiB3IzkcLVN/JiO440knVx2xugqWslVjezefkF2FKLHo9BK5+rFKoO0kA3hDm4580FqqGvU82wyADcC+MVq2QX2RxggAj38DGB/AP14DiYiam5sRVuLH1vtuJkR1zfaANE6p1ouBK+Cna1SkSuDxyyMlp+QapAI8oNYuJVTyPa5FkYHH3Z4162+vmW8+MA7NG/GQr1f+wHAZVbLLnAGThr0BfbgKgD1PAcyxmTGGCZP/IWWL1pttdxqaIWIqU0+yfHZaj9GyefkXY3Nkj++IlIhJyk7HSd5PWLvfSbIEBWs9CDeZwuZO3MhTfnmLzDG9DyrtQAutVp2gXMQBohAL9MB3ALOiZgxJssRGQ9d+aQRz1quFXFeL4dZxkdy251siJitdCWXaY03TAT2xGnzj57E+PiSuU5+b63CTu+tnWTJCRNuepEiEVnPmC0DuALAXKtlFzgHEYIlyISpALYEMJT3C5FwhP76aRbtc9SuRiiiZpTH1RuKZRVm7VaefA2zyPVkTlAO3yo4pcJmOM344EGEVhmDHZ+Ngrmnt5/zkLRBX94HALwM4F6rZRc4C2GACDLlIwBnAajgOZiIqLmhBeFwGFtsP1jXhVoaW+HxukHUoTPm0gBROtYuGG2I5KKddlD8SeNHYC5Oy/dIhyiVayx2fTYcdX8ZY2hpbIO3yKPre6+P/5D+nToPYLrauwjAQU7rI4H12PVlF9ifMICzAQR4Do7lg3z19g+0oaZR14VKy0vQVN+Cpvrm2K/MCGnQGjzt/J4YsTuy2eFjydeyMyK3xDzyJSROhFaZg53HWcc8tw21jWhuaEVZRYmu79Wt3YCfJ00hJuvK+2gBcBrEuyDIAOEBEWTDUgBuAHuBMy6aMdDPn/9Jh566ry5F1FfsBUlAzZp6lJWXANmt/qtd2zGTTJq26clNscogcEpfC++IMdhZudSD3Q1op5Ivz4elrF66DuXVZSgp49quK4GbTr1XCgZDegwJBmAUgPetbrfAmYhJVWAE3wDYl/dgIpJ69OuKO1+4LqNVk0g4Apc7wXbWqyCqKePpziNWeYzFyUqHCLvhI9+MN3HfjccJ44Dt77vCvMjNLSMekNavrmU6q15NAnC01e0WOBfhAREYwXsAjgDQnedgIkJzQystnLWUdjlwmO5BXZIU5yuj9uegNJ/ZehJyGLlIqDcLp8lrFflmgAiMxQnGB+CAcV9lXkzLA1c+Ia1YtFpvyd2/ABwKIGJ1uwXORRggAiMIIVqe9yQAPp4vEBHVrqmHr8SLQUP6mylbvPLDM8A6efM/J+NEY0RU10qP3QwQlvSnEZ5TQWY4xfjIW8/3Ry9+SX9OnkGMMT1trANwIoCVVssvcDZOGQAE9mcKgJugY38Qxhg+fvEriksuN4LkfAej9+iwkzKVjyTvn+AkpU9tL5L4ZPZCe37iN+20WoZsnyenPIdOwCnvQd7e8zXL1+Ord34gnZ6PCKLz/N9Wyy9wPk4ZBATO4WkA5/McSNG6ulTSqQSPfHi73VaZ0hnndpO3kCCVvzsZlubf+YSZhpgeA0OPHE4yhO2OUwzxvL3njDFcc+wdUmuzHzq9H48CuMZq+QX5gQjBEhjNpwAOBtCH52AiolAwhH+nzqM9Dt3JToO9EyZIgbJny4n3jjh+nNo2JbQ8kzx5XGrn0QOvIiwWG4zDKcYHkKfGBwDcf8UT0vpVtXqNj18BnGK17IL8QRggAjP4BsDpAHgKkTMiooaaRpBE2GybgVbL3iEXREK6U1FTbp2i+KhhtZHCc/2Y5zD+T165k6/FkP49SyeL3uvGEx86lty/YgPLzHBS2Hdeju8TX/yKpn43Q2/o1WoAByC674dAYAjCABGYQQOAZgCHgG/CYQBo/szF1H/z3ujeu6vV8scjjJD8IdMVdyfBo2zrUdD1/kDhz0zkTj5PprKY1ZfZ9E0+PW96cJLxkZf8MXk6vffUJGq3PXjnrjCAKxH1gAgEhiEGBIFZPAXgFfAPckyOyHj2rjcoFAxZLXuHTBzHFKoykQ/EDJFC2dk62egQ5JZk70xykQK7wyj6joQz+K7QNSympbEVrz70PjGZ6Qm9Yojmdb5qtfyC/MMJg57AuUgAfgcwnOdgIpIAoGuvLrjnlevtogzyhmoI8gOhKAnsgB0ToGPGul6DyanvlB3vQcbcdNq9Uv26hth+H7zt+gXAXlbLLshPnDowCJyBjGguSB3PwbFVmfWravDQNU/b5dnkGajtIqsgO8SCjMAuxHtJ7PJcEqJh24VgfAB5ZHzc97/Hpfp1DbE28bZrPaLzt0BgCiIHRGA2dQCWATgaHJNRtDIvqH7dBniK3Bi81QCr5e8QzWoBBKZiJ0VPIIjHqcnudjY+eDaczQsD5KMXv6Sp380gAHp2Ow8BOAfAH1bLL8hfhAEiyAX/AigGsDs4JtH2/UEw7+9FtOn2g9C5W5XV8oNDbpGQ7lzsrCgJBPE4pSSzXQ2mWLhsQRgfs6b+R2+N/4hk/XkfoxHN4xQITMOOA4Qgf/kM0T1C0hLLB/F4PRg/6S5ZkizXEcWeAfmJXRUlgYAXu405dn2nYv3EM5nYrU91Ew6FcdXRt0uhYBiIOj94japPABxjtfyC/MdyrU5QUJwNYAnPgbHVmlAwhDvOfdjq51RPeI4dJ16BOuJ+CZyO3cIH7SRLjJjybfVckjNuO2dszPjQE3q1ANF5WiAwHRGCJcglLYjmgxwKwJfu4FgoVktjKxbPWY6dD9jeCpn1ruaJUCxnYUdlSSDQi128DnZU8PV4PmI4egx/+LpnpOULVkUbwh96VQ/gIgCzrJZfUBgIA0SQa/4D4AGwN9JNmAQQokZIzeo6Ijdhs61zulN6ppO6MEKcgx2UNoHAKKw0ROxsfOjtF8eO3+8/8xn9OfnvWFv1bDZ4D4CXrZZfUDjYccAQ5D/3AHgJ6QZHtvFzxhg+ffkbqlnNVdHXKLKZyO3+bjl2ghUIBGnJtRFix/EufuW/IIyPZQtW4Zv3f+rY6Zwz9IoBuB/AA1bLLygsxOqfwEq+B7BnmmMoFooFAEXFPjz6yV25SBA0YiXRzhtZxeQq5DHALmErAoFZ5GKstLvxoVc+Ryagy7KMq466XQr4gwB0hV59DeAQq+UXFB52HDgEhcMpiG52pEWCAu9vC+Cm0+51ynNrZ+WWyL7GkZ0QfSRwMmaPQXYc4zL1fCR/11HcdOqYTIyP1QBOtVp2QWEickAEVtIMYD6imxS6NY5j8V4Qf0sAq5esxfC9tzFTNqcYOdlAADYAKLJaEIv7QAum8sPzXYHAasx8Ru3oQUw2Pgoi9OqxkS/S8gUro5sNgrviVSuimw3+Y7X8gsJEGCACq5kLoAnAQdCeLBKMkDXL11P3vl3Re0APs+QyamK1e0J6ERj+AaG71YJYiOZzl+YzJcMk3TkFglxi1rNot0WabIwPwN7jtCo/fz6Fvn3/541tZVztiAC4BsAbVssvKFzsNoAICpPHwDEQxifUMZnhtbHvUzgU1nut2MQkxf0kT1aFpTwStkbUEyJIJRMlhiGqDCn9KBkrAoHZGO2tsJvukBxyVBChV/6WAN6e8HEs6VxP6NULEDudCyymsBQtgZ1xIeoK3kLroHYvSMdz27lHNe597UbeQZdnEjYjvMYBCie1ElgRs59ikQu02myFYlK4xrDAbPSMlfHEj192GyOS21QQSecAcMPJo6WG2kYA7aFXfN6PfwAMd3K7BfmBCMES2AWGaFWssxHdJ0SV9kgsAoC25jYsm7cSO+23Xbrz864A2jGuORd4GDCDANNi2myO2j232nBk0M5D0ZJdkAqL+9Pon3jsek+UQkJjHmHi/LET2Rofet5vo/ohub+BDM439tqnpVWL12xsB5/x0QRgP0Q3HRQILEUYIAI7sR7AcgCHI82zGZ8Psm5lLVV1q0C/wb1VD4e1E6fd80BiQvYAsAJAudWyWNN8RWx/32B+krzePrCDkspjJFhxfTsUM4hdVyn81Cko3c9MjA+tZyLe2FAz0PQQfx6l63Dz+Vvf069fTO34Dud+H34A5wH4RafcAoEp2M2VKhC8BuAtpFEW4mNdGWN4fdyH1NzQonSoUydYq+hptQAWoRaO4NRnRy0PJV1Sfbq8Fa0fK9+1ZNmdYDgqyZ2LXKFY7ptTMcLjpNW3SgYHNI5Nh5rhkRF16zbgkxe/1Jv3wQA8B+BdI2QQCIzAqZOrIP/5EcDu6Q4ioo6JtKJzOR54e1S2LnmzcFK8bQCAz2ohLEBJ2XBA/o7hbQb0Pa9WGR75fm+0KNQ8IbV7blTeRybzhdZzaLRXBteecJfUvCG62KYj6fxHAPtm0DaBwDTsopwJBMkcD2Atx3Edg3VDbSPG3fBc/DNdSBOzkfhQeIqdmhKd7/0QvwIfT3yFODUMXdnNQN58vzfp+kGr4lo+GmdGGR9K56AMzhP/XSUM168euOrJDuMD/Pd3JYDjjJZFIMgWYYAI7Mp6RI2QkNZBybGv/01fgJ8++yPjxD5BB4XUd4VqfCSjpNgrGRk8xonRxBTtQrsnmZLOOHEaanJnosNknYPBgdHGDL5+70da9O/Sjn9z5n0EEd3oVySdC2yHMEAEduY3AOMR3TRJleR8kLce+4haGlutll3gDLSUDycqakagpOzH752TS5ysNNsVrX1q7Og9MTs/y4jzJBvohspTv74BHz73hd68jwiACQCmG9RPAoGhFNIqp8C5/AJgl3QHxeeDlFeX4cF3brVa7hh2m9AFUdIZH+KeRcm10SH63h7YoYCHlqKdzXMpG3COeIwsxJDy/F9/4l1SY73uvI8fEC25KxDYEuEBETiBgxCNY01Hx6DdWNeMZ0en3VxdULikUxSEAryRXHkgRJiVIB6zjA9mwDnUMMJgS3j+J4x6keKMD953YzGAI0xon0BgGGIfEIETCAH4GcAIAG6tA+P3B1m9dB3Kq8vQf7M+VsouVnPtiZbyIe6XOmatiDupSlyhYNfqZtkaDmaVjDbSmwIA+PLt7+mHj3+nuN/zjE1tAA4A36KdQGAZ7uxPIRDkhD8BPArgOmgM9IwxORaKxRjDO098gmF7bI2yylKz5WOcv3MqsUk7H0inKFh+38LhCAL+AJbMXU6LZi7DqqVrEAqG0dzQQiWdSpjH40ZpRQk696xCrwE9sOX2g5nX64HkMtWpbcbGeboNj0g4An9rAIvnLqelc1egdm09WhpaEQyGEPAHqaS0iHlLvOjRqys23W4T9B/ch/mKvXC5xXqbA+DZHDDb8xtxHtOpX9+Aj178Su9mgzKABwDMslp+gSAdtn8JBYIkPgFwWLqD4vNBqrqU4763RuVCNrGKa394jI+cGiBtrX4s/Hcp/fTJH1g2fwU11DdDjkQfJd6Ii5jjT5IIbp8HvQZ0xwHH78l22HsbM9pi1Opx2vdFlmVM/WEmffPOD7R2RQ1CwRBkmXH3S3zfuNwSKqrKMXibAWynA7bD4K02YUXFhbjdjS5yGaad7nkwKr/C7nqPDADXHn+n1NwQLaaiI+/jPQAnW90AgYAHu7+IAkEyXgDzAPTVPIpAhI3hWDvsuy0uGHWa2bKJcCv7wqu8mG5EhoIhTPvhH/r8ze9o/ao6yBFZl0Ktq9ESobJLOc4deSrbbOgmRl8kG4VQs59nTf2PXnnwfWqsbwKTTeobIkguCd16d8ZhZxzAhu2xFXN7RFBAErkwQHjHzULJWWVP3PYKZvz6LwG6jI8FAIYiTel6gcAuCANE4ES2RzQnpEjroHgvCBHh8tHnYOhOm5stm/CC2BMe5cXUezdn+nx6/ZGJVLu2rsPDkSuICKXlxTjhoiPYrgcNN8srEiM+zEVtfxVFGSZP/IU+efkbamtuUzPKGMAQq0aq0tTYZXXNb5JLQpce1TjjmmPZ5tsOFgsJUczOA+F9EQrF+MCU72aw50e/odf4aAUwDMB8q+UXCHgRBojAqdwN4GakeYbjjRCXS8KD79+K0rISM+USBoj94FVeTLl3337wM330wpcU8Aet7gcQEXxFXhx86r7ssNP2NVvJVup3ReNj4nNf0OSJv1AwEIo3PBhrtzdU29Pu69z4z/jrxP8X3wXpjRNfiQ+nX3EM2/mAYcIQMccI0eMttkM54JzQWNeEG0+9N+YV5e0jGcCtAO6zWn6BQA8F8VIL8pbPES3Rq0q7ttHxnJdXluLB924zUyYRhmUs2cZs8yovht+32dPm05O3vUzBgHpEhA4lI9oYAqFd4072EMQVgOOiqNiHM284kQ3fc2sznlcu4+PXL6fSW4991GGcqfRH7B4yam9oJg8E23iBlPOrndJX5MVV958vD9yqvwld5CiMMgIyec8Kxvtx9bF3orWpNerjY9z9NBHA8VbLLhDoRRggAidTgmg+SE+tg+K9IACw6dab4LpHLjZLJmGAGAQBMovu5uvJ/BTcY5yh3o/Rlz4mLZ+/UjW3I52C0a4Rq8rONoYhqX2fr4OI0LN/N4x68grZwPwHtX7v6ONgWwCjL31MWruiBqwdheNTFE8pI9Mjue/SGn4JBgkRYeBW/XHDuEsK3buZrRGSSf8VjPFx7yXjsXT+SiD6ePLOIcsBbAbAeveqQKATUZdQ4GRCAP4BcBK0S0qzeIWibt0GlHYqxiZb9jNDJoIwQAyBov2YqVasR1ky9H5dccStUt3aevWLKcR1E0ASkUQx0oUWgriE5jFEmja04Kt3fqCqrhXoO7iXEV2gpjQyAPjuo1/okeuflRrqm9QULYJJxkfs5ERRX5IGDNFxAwCoft0GfP3eT3ToqaaHrTkBvTcim80lC2KR9NPXJ2PKt9MBfcaHH8AxAJZYLb9AkAkF8XIL8p7b2n9Un+fkUCyX24UH37vFrHyQQl8pNQJGAGOZr4Dq+Z4h90uWZfzv8FukcCii2qZ45aI9fyErtTqdJ6TjWhxXISIMHjoA1z1ycTb9odbvMgCMuewxWjJ3hdaeBqqGo1EGSDzt3pC07Y2NHx6vBxM+u0e837kp6mCX3I94b5nhHpn69Q0YecZ9sbwP3j6TAdwC4H6rO0cgyBQ7vNwCgRH8BGA3rQOSQ7FKyoox9oPbIEmGzylCQcmebAwQPd8xJGSOMYbLDh0lRcJcxgdJWhZB1DKBz+1CudeDTbpWYef+PVm/ynL0reyEytIiVlVchLZQGHPW1NAfS1fj9yWr6L91dYjI2o8ejyFS3bUCY94cqecZpqQ/lVofvuLo2wP+Fn+xxnlU75vU7hPyShLKfV5s0aMLhvTownbr3wu9qspZiceFpkAIjW1+WlLXiJWNTZiybDUtWFuH5lAYgXAEDEzxTrOO25P2OSAiIpfbhSe+uFe841HU7rkRniKrw6+UxgZDZYqEI7jm+Lvgb/HrMT4A4BcAe1ncPwJBVggDRJAvVABYBKBS66BkI6T/pr0x8skrjJRD5IAYQxjREFG9Y5TeVVNDFMkrj7xN8rcF1D7uMD6ISEoRLs7g6FFein0G9WPX7bsTKyvy6pbjz2VrMHLS99L89fWQVZwMHEWgUFpejPveHCV7fVzpN5pKWTAQki8/bFQjgPJMzlHi9eD0HbZiF+++HetampnHcoPfj4cn/0k/LlpOaxpb4A+Hox/EdVH7X9OGwBCRVFJWhEcm3imMkETi76ER46AVBoiW3IbLc89Fj2L5wlXRC/MbIDUANkG09K5A4FiEASLIJ7YGMA0auU3JBggA7HXELjj9qmONlEMoJtmTafUrvUpC1vdq1On3STXqOR+MMcZIqdISAT6XC30qy/HkSQfLg7tUGhZmVN/mx/EvTJQW1dZDltUMEe1rlVeX4d7XbpI93rRGiGrOR8AfZDedPFpuaW6T9H6/xOvBMycdzPYa3M9Qg16WGebX1OPid7+QVm1oRiASSTFE0imDRERde3Wme165QbzrUZLvoREGSC5DsNLJa7jx8fy9b2LK5L+jF+c3PsKIbjYo9vsQOB5hgAjyjdcBnAztfBAp6d+47J6zsfXOWxglg1BKrCOn4Vd3XzhOWrFotfoFGJNTvB7thsfO/Xux0UfuzfpWdDKtM6avXIfTX/lYag2G1DwiTCsNpUvPaox+9UYZicpg/POtpCR29OuNp46m+nUNuvM9Xj3jcLb34P6mexJXbGjEtR99J01fsRbBOEOEMzeEBm7Vn24af1mhv+9K99GoPrHDTuyGy/Dn9zPw/Og3wRjTu9/HywDOz0GfCASmI6pgCfKNDwAcCe3SvClK118/zcQhp+xjRD6ICL+yDr0rplndq09e/Yam/fCPeqlcxliy8SFJhC4lJbj7sD3ZzQfuyiqKfKZ2SM/yUly25zC2oKYe82vqlWTtqNqmZIi0NrdhzdK1GL73NpT0ndifsb8zJClyE0a9SMvmrdQSL+Vl6+TzYsGtF8kDqitN7ZcY5UU+nLjdFqxrWTGmLl9LwUgEjPHvo95Q20SeIjcGbzUgJ/LaFLU9X4zA7EXSdIaSpPKdjOUK+IO47/LHIUfztfQsgvwC4DiT+0MgyBnCAyLIR3yIhmJtqXZAclUsAKjqUo773hqV7bVFDoh15Cz8KuAP4uqjb5cikTRJ33F/8UoSBnWpwofnHScXGbfnBjdL6xtw6FPvqnlDOp7b5HeDiHDSpUdgv2P3UDqt4vP+xVvf08TnvyBZVs2KT7lXW/fsik8vOtEyb0JLIIhjnv9AWlzXgHD7fZXTh2JJLrcLEz69R5ZcVudMW4Kagm4UZoVh8YzTmt49ZOYZYdeecBc1b2iJ/oM/9OovRIushDiPFwhsj/CACPKRCICfAZwH7XyQhMnF3xrAykWrscM+22Z6XWF8WEvOvB8PXfOUVLduA58wBLglCd3Ly/DWWUfJFcVFlnROZXERLttzGPtvfR0W1TZQUheoKVqMgWHBzCW095G7Mk80KT3F2xFPQ20jnr7rNSkcCnMZH0TAIVsOZG+ddbSl747X7cIeA3uzr/5bTG3hMORoGpLmvj5EBCYzWjR7Ge1y4LBCfPeV3jkz+sFII4RH6VczfJjC37n3G3r0puexctEaAnQZH0EA+yGafC4Q5A0FuWQjKAj+ATAaGpOh0gQw/ed/8f3Hv2ZyPWF8FAjLF63Gkv+WA0AshjvlmGSNpHNpMT46/1i5W1mp1eLjqRMPZtOuPUsu9XqTk94VNwAEAwv4gxh77dNcm2w+csOzUtAf5KokJBHhsC0HsmdOPsQW787AzlV455xj5Eqft6NDoKFgxu793BkLsW5lwemHZoZeJZ/TiPPK4PfOkMr3lWRLt9EiAyB//tb3mD11XnzIIm/bbwKw0ID2CwS2QhgggnzmbgC/aR2gVHLz7Qkfo3btBqtlF+hD7wppxgrN6w+/LzFZ2fBIFoSIUOr14PaDd2OdS3SVkI0ZA/E/hoWjVJcWY/bN58v9qsuVKm8pzgsrF6/BVI2cFwD4+fMptGbZOrVStinGx16D+7InT7KH8RGjd0Un3HLw7qzU4wFR2r0iiTEGOSLjlbHvF9J8aub+H2rnzfTcMSOBl0wMq3hDJPb32A9bvWwdPnrhi44+07Hb+WQAj2bdewKBDSmkAVNQmBwNYLXG5ykTgSwzjL5kPGRZVyizrZSoAiRn+WzLF64Cl/5A0VKy5+y0NTtsyGCe5yPZ2FBqI6U5Rhc//u90eYtu1UpGSMIvGGMyYwxvT5ioec13n/qUyQoJJqRgfAzv2wOvnH6ELd+bY7bZjB237easxOsGT2VkxhiW/LfMarEzJRPDNpNnL1sDOhMjJJ13IhnVktKZyhgJR3Df/x6XmNyx5SXvxLIcIulckMcIA0SQ79QBOAXROFpFlCaElsYWPHDFE7zXsKUSJVAl4/s1d+ZCiiSlNsQvkMfnfbhIwna9u+G6/XZOd72YQaEXyuK7HXxxycnypl2rlMKxUpTFpg2tmDzxF0Ul8ovXv4O/xZ8qJJEU3wESETqXFOH9c4+1dfnauw/bkw3t0RUukiBxbCEfCoY7NpVzEPGeNV6jVu15k9N8h2CMERLvadA6Ru/zlUm70jLmssckpfciDX4AxwNozubaAoGdEQaIoBD4GcBD0JhIlIyQxf8tx+vjP0y36iZyP5xJvLeBmwX/LOb2jHUrK8brI47MpMxnpu3JWLH78pKT5S4lRUjdKjEBxhjD569PVrzO1x/+RMmeISJK+B0R4HVJmHrdObY2PmK8ffbRcnVJUXSr+jQwxjDnr/lOqiyp9OyZIb9SgYNsUQp16gh5MkBGQ2R98f63afnCjQ54Tu+HDOAeRCs5CgR5izBABIXCrQA+1zqAITV05KdP/qC5MxYAyhNdppOdwFqSlQ3ucXDOnwsS3QRK3g9ENxq8bM/hPJ4Po9uV0TklIky9/hzZLaUUjes4XyxuvWlDCxb+uyThoMVzlqG5oSVRGCIpugl8/HUk/Hjl6bJBG77nhHN33oa51fcHSrjHf/04yykty/TZyyREKb5P7Gh4anllMh7fZ/w+h/74ZvrGvA9w5X0wABMBjLG6UwQCsxEGiKCQOAHRuFplWOpkwxjDuBuep6YNLRDkNVwehEU8cf4ElHi9OG34kJzurmzEuT86/zhZktTzQWK5IG+On5hwjRfvf4dYXO4HEZLL/EIiwh2H7M56dCozsenGc+7OW7Myn1ctGT2hkUvnrcilaMlFCnjJdNdyrWvwVD2z62KN2nufsbHUUNuIJ297OdEjyLjavwDAyVZ3iECQC4QBIigkggD2ArBB7QAlF7kckXHXBQ+LdyX/0YxPDwaCCIfCHCchbNu7C5PUl/lzsUqeUUjW0J5dcczQTZlCPkgHDIytWLQGAX80raq1qQ3rVq6PT38hAlG87iURYVCXKpy109Z2VUJV8Xnc2DyaqJ+2PyPhCORIThb5ifN36b6bTWWpXHzHbLJNOlfkjvMe7kg6B7hDr+oA7AJ7eokEAsMRSpWg0FgG4AoAGppkqqu8sb4ZD1/3jHhf8h9VJS7QmljHQE0flYhwzk5bZ3QNE9qi+1rjjjuAdU7NB9n47LNoNNb7T39GAPDGoxMTjA0iovjFXqJoX319ycmOVazO3mko4y1X3LQhJ3nDmT5DyTLzKtrx35PBF1YlcRxjJZl4dNJy3xWPS63NbXrPFQZwFjQWxwSCfEMoVIJC5HUAD0JlYmAqrvK5fy/ExOe+cEqMtyBzFMfFDfVN6b9JQJHHhT0G9mXqR+SUjPJCfr1qhCxRytcSwml+/nwKAWB//bRxbxCJol9KMEhAOHPHrZhCaJdj2G/TAazInZAfoxpaNOW7v81uqNr9THddo0KveNpn95ut9U5kbCy99sj7tHh2Ypgmx54fDMAoAJ9Z3SkCQS4RBoigULkFgOqW52ou8y/e/p7++3uB3SdXQfak3ONXHnqPa7ysKimGS7Ld0KpLIJ/Hjcv22F41jIwxxiLhCJvy/fRfw+EIY4zJFDM+4vRxiQiSRLj94D3sGH7D3x9uF8qLvEpeLwlJBsi37/1k1/Ehk9ArJaOF5zx2TjzXuj8ZP6d//zabfv7sz+T9c3jO9x2iVRoFgoLCdrOkQJBDDgCwRu1DpcmDMYbxNz5P4XDEatkFiRit4KYoKWuWrk17MIHQu0IzydpK5VTXta/bb2dW6vOohmIxxthzd7+5AwBGRB3+jdhbE/veDfvt7GjvR4zu5WUgjj5sqDcvBIsyV+YzLYWbzpBgab5jN9KFJWY0jgQDITx9x6ukNGWk+epSAIda3SkCgRUIA0RQyAQR3Sk9pPK54h4fkYiM60+8R7w79sKMFfaEexwMhNJ+gQjYY2Bvu4RfKV1flwzfXnaKTKmbg0hEJLVXhfLRRlsD8ZugEwhetwsX7769o70fMXYZ0Iu1N1SzD+WIjFAw/bNiEEYZEkoohZnpDb9ykvcjY1mvO/FuKbn4AEfieRDAkdDMRxQI8hehRAkKnakAroTK5KPmQm9tasWEUS9ZrVAKbMheg/obYYCYpbTremZ7dCrDkO5dEnZJZ+iwZEjaaIgkEDv+0eP2zwvjAwD2HdQPEvh2MImETNG7GQPiE1GMKJ/L+x0lA0Tp+nYeE03J+3jkhmekQGsg4XccoVcygEsB/Gt1pwgEViEMEIEAeBrAi2ofqq1kzfxjDn384ld2nnALDTOUXQKiJXgTfqmih7qJMKi6QvU8aUje4NKs1WNd4/5nF50oE1GC6q1UpyHe+8HAUOrz4tAtB+WNAbJp1yrWHmiW9l62tfrNEMHFc+008DxTksp3nOz9MKXi1btPTqL//lqodL5053wMGnOOQFAICANEIIhyIYD5Gp8rTiifvTGZ/vt7vjBC7IFpBghkvlN7XC6U+rxW9wMPusb+w4cMZBSnW6Zb3yUi/HTlaXZSQLOmsrgIXpdL7eOEHmmobTT68kpjDM89zHYjwPh7mC753Ij9RcwgnfGRkazTf5lF337wc8p94fB+/AvgGqs7RSCwGmGACAQbORCAYgap2qTCGMOjN75AbYl13wX5BUU4N5dzu1SDdNIZqVYo69yG84QTDmKSpO4FkZNej10G9EJ1cbEFTTKPaPv5umz9mjqjFyUyOZ+exHOlz2Sdx9vRAEmn42QkZ0tjK5656/WUpHMO46MBwMFWd4pAYAeEASIQbGQ5gEMQTQ5MQS0US47IGHXm/eJdsgemeEFkztOS8SHwZipyuoTdvk93JHtBZMZSjA8i4K0zj84r70cM3mJeLY0tuRIp+fkglb/z7EUR/5N8/9KNb3Y0Pkwx+hljuPmM+1KTzqN+Qa22BwDsB2C11R0jENgBoTQJBIn8BuBGqG5SqLzC1dLYhgeufEK8T9ZjivLj8bi5jvMaX27WbGWO+5l996xj5PYSWJrH3bT/rnZRQA3Hx7m/S0ujoR5RPQ9V7NhMdjyPN0C0SJd8bpf7b8p+H2MufSwl6bz9jFrnlAFcAeBvqztFILALQmESCFIZD+ATlc9UJ+iF/y7FH5Oni3wQ6zFcASLO2BuXy5FDKlfbJInQtaSkvT+Uj/G6Xbhkj/wou6vYB5whWM0NOfOA8JCtN0rPDut2ufem5H38MOl3Wjp/ZeoJtUvuMgBvAnjO6k4RCOyEI2dLgSAHHAtgttIHWnG+L455m9auqLFa9kLHcCUoGAxxaZ4mWZ9mK3XcYj963P5MzRaTJMK1++xkFwXUFCJcG1sDLo+L6zhO1O4PS/ozRraJ51rXd0LuhynGx5J5K/DmoxOVks7TGXgzAJxpdacIBHZDGCACgTrHA1CMpVCbdBhjuOuCh6X69Q1Wy17oGKoIJe/roGaDeoxVPE1piwpcRshuA/uw04cPYa64UCSiqPGxc79eee39AICm1A0GFTfo69W/ey7E4Q2rMvOaTjI+MpZx/apaPHDFE1IGO503I7rZrUAgSEIYIAKBOvMAnAcgovShmickHIrg3kvHS+kLoghMxNDO9xZ5uI5rDZi2qbFtvCD3HL4Xm3nDufJeg/qixOtBmdeLo4duyt4+Oz8Tz+MJhlOGAsX7svVOW+Ty5Ve7lhH3I503xU4GSDp9JqP+kGUZYy5/TIqk3vt0Va/CAE4DsMLifhEIbAlfZqVAULi8DWArACOhXtYyRXlrrG/GI9c/K13z0IV5r5TZmNim3VnjK1Lf2yNh5zXZtNttWFs0IHAqkaU+L14bcWTBPdsyx6ICEcHtM2xqTRd+1SFa3LFmGQJa3g+rMcX4AID7//e4pFRUIE3olYzonPGp1R0jENgV4QERCNJzG4CflT7QWgGb+/dC/PbNX3aapAsNwxSxYCDEtQdES8g0D4ih7VFBPKtGQIDPuM0oeQ2Q2O+MfEb0JJ9baYyatsfOj5N+pyVzFR0Y6fZU+Q7AWAv7RCCwPcIAEQj4OAgqrnStlbCXH3iHmuqbIbAMQxQy3nC6EOeGhVa2JQ3CCFGhKRDkOs7lkiA5sxpaMloGhl2eE0ojS8YvZP36BryhkHQOpA29WgrgUKs7RiCwO3kxSgoEOSAIYDsArUofqu6ULjOMVNi0SuAs3O37gKTzgsisfTuyVKyOj+fFLoql7Xj6l+lqIZgdEBF8xUVGXlYG//4cucQO3o90xkfG/SVHZNx61gOKeXxpQq+aAGwPlbxBgUCwEWGACAT81APYB8oTrqqCEAyEcPu5Y8W7Zg2GKG1ut0tx7wsl7UfFRjFKecyFsieMEAUmzlrAlQNWUV1m9KWtMD60ks/t8nykMz4y7rORI+6TQsHUcMo0no8IgJ0BNFrdMQKBExBKkUCgj2kARkNhctOanNatrMGrD79vl4lbkAHEsQs2YwyN/gDH2bJC5IJYwLpGvlDKYXtsbSdPhRFoGSBWeT9MKbcLAM/c9RrVr1Mso65l1DAAtwKYa1F/CASOQxggAoF+7gAwVekDLff8z59Nob9+nimUO/MhRMe22I8hFJXyhdb8uHCZnsThTBC5IBYQiKhG1ST01Q77bpurKlRmQRl+litMq3j165dTadqPMzPJ+/gJwP1Wd4xA4CSEASIQZMbeAFYpfaCaBQDgmbtep5rVdVbLnq8Q0seFx9CtzG261QCuc3wxZ7Fh1zRSfp3YQdG0Dasbm8FTh4CI0LlHldXiZgtv8rkV3g/TjI+VS9bglbHvqRkfWuddDuBAC/pCIHA0wgARCDIjAGBHRJMOE2HqyiGTGe664BHx3hmPHuMDiCrwMlKTfON/H/+ZfNwFhyZvh654rWkr1maivOv9jvCC5JBnfv2bqy8klwS322WmKIVseJpmfDDGMObSCRKTdSed1wPYAdFNBwUCgQ6EIiQQZM4aABdAOR9EddIK+IO456Jx4t0zlmwUp2QDROkzdKqMJhfHKmGpaYKNbZo5IGpfy0T+QlZGc8qkfxeq9UXH74kIviKv2SV4zU5I19rZPL5hufZ+mGZ8AMBt54yVQsGQ0kdafS0DOBtATY77QiDIC4QSJBBkx7sAnoROI2T5wtX48PnPhYJnDLnwOKCkUzHXZoStobBWuI6TwrAE7dS0pOyErdj3AzbvmwtxcnXf7fJ8mWp8vD7+Q1q3Yr1i+zXyPhiiOR+TrO4cgcCpCANEIMie/wH4XeUz1Un8y7d+oDnT5wsjJHtyYoAAgLc4cYdrpWg7xhhWNDZpncZIxc7sleiCfz43+P1KG1EqluA95tyDnLzhj8T5WS4NE1ONj2k/zaQfP/49k6TzXwDcksN+EAjyDmGACATGcDCi8cAJaE1ijDE8dtML1NzQYrXsTianCvLm2wzkUr6+nbskkw3SMm1LrkJyCpLZq2qIcXQxEaFnv25Wi2sUWop9rgwQU42PhromPHfPG5kkndcCOChHfSAQ5C3CABEIjKEFUSMkJQFAazKLRGSRD+IgTvnf0QnKl5p5+efS1elOpfRNOxog2ciVF7z45yyuClhujxueIm/6A+2J1j22wvuR7pnL2tN014WPSHIk9TRpPB9+ALtDYZwXCAT6EIqPQGAc0wDcBZ35IPU1jZgw6qWCVvKyIJt+0/3dzt2rQERpc0GmrliT7txGK3Jmhv4U9LP566IVau3vmD+JCIOHDuDKEbIpvOV1c1V9Tasjs37Wx177tNS8QdHzrJXkLyO62eD8HPSBQJD3CANEIDCW+wDMUPlMdfKe+cccmvH7HMdqLw4lszwQnyfh30rhObWpSctKKD0Pdh2TC/LZDEdktIRCXMeOuPZ4J+d/qKFVFcus65lqfPwxeTrNm7FI8bM03o8pAB7OQR8IBAWBXSc7gcDJ7AggpaxKmskNT93+CjVtEPkgdmfrXbdMG4YVlmXMr0m74aTwgticv1et00pA74CIUN2t0mpxM0UrxCqXBojpxseGmka8eN/bmeR9rAawh8ntFwgKCmGACATGIwPYGTrzQeSIjDvOHyveSZtz4kVHpFfEGPCp+t4R8Sg9D9k8A3YpnZoXvPf3f6RgYDIkKcrFpUVODr9KblsMK7wfahhiXN95wSOZbDboB7BTjvpAICgYhLIjEJjDUgAXQTkfRHUia97QgjvPE0ZIDtGtNZZVloKk9Hkgk/gMEMA5e4PkhYath0847iER4aBT9slH5TSXBojWmGeI8XHrWQ9KrU2tKb9PY3zIAEYAWGVy+wWCgkMoOgKBebwK4FOF32vuZrxq6TpMfPGrglP2LEJ3P7vdLviKfQm/U8oDWbGhifeURlbEAswLxSqoZ9IfCqMlGOTqi90P2sGpBoha+FVeGR9vPDqR1q1M3bCcadc3YwDeAvCBye0XCAoSYYAIBOZyPICUjMd0+SBfvDGZZk8TmxRyYInit8OeW6fNA/GHwvht8YpMvSDZ3nuz+qVgnskZK9cST/6Hy+1CeXWZ1eIagRUGiOnGx1+/zKIfJyluNsigvcHLfABnmdh2gaCgEQaIQGAuYQDbAkhZDtdy/TPG8NjIF6h+fYPV8tsdI5Qj3Ur14SMOYADShmF9M3+ZnnYkt8WOuSAFY4A89P2fafM/iAi9+jt280Hi+L2jjY/1q2rxzJ2vKRmS6RaBGgFsb5QcAoEgFWGACATm0wpgNwAp9TzTJaXfft5YifHsgibIBt1KdVW3CkiuxOFTaTH1nem6Sis7JRSrIPhzmepmkgn35KoHLnRqP6vt/ZELA8R040OOyLj7wnGZJJ0HEK1k6Dep7QKBAMIAEQhyxWwA10DnJoWB1gDuuuAR8Z5qk3MLjYjQo1/iyreSndgUCGJ1Y3M2bUlXmtSKvsl7L8gfS1aSLPOFX5VVlFgtrpHkhfEBALedM1YK+FNzeDiSzi8GsMCktgsEgnaEYiMQ5I4nEE1qTEErGXLVkrV454lP8l7pywJLXEQX3np6emWJAXd/9YteL4iRRogwQDLg+T9mKv06Jfxqi+0HO9U9aVXyeU6Mj5cfepfWr6pR+ihdmyYAeMWEdgsEgiSEASIQ5JYzACxJ+a12MiS+/eBnWrl4jdWy25lslSXdSnXPft3gckkJeSBKt/GHBdyJ6FptsZsXJK/5au5invwInHntCfnQt7E25IXxMXfGAvr1i6mKSedp8j7mA7jahHYLBAIFhAEiEOSeoYjmhSSQJjQAoy9+VGppboVAkZwbIAAweOtNEoVQkKIlGMQfS1YZYYTYabzOWy/IlKWr1MKvEtrsK/Kisku51eIaiZkGSE6Mj+aGVjxy/XNqO51rtakZwNYGt1kgEGhgpwlNICgU2gCcDYWJV8sIiURk3HrmA+KdVSfnq9HnjTxVTrsDNgNunPR9JgaIUUaICMPSwZ1f/KJcsjUp/Or6Ry7Oh+TzXHg/cmJ8AMDIEfdlknQeAXAKFIqECAQC8xDKjEBgDe8D+AI6k9JbGttw7yXjxXurTM4NkIrqTigu9SWEYckKC63L6huNbE8myr8wQjhgDJi1Zn3atrrcLvTdtLfV4mZKLg2QnBkft5/7kBRoDaT8Po3xwQB8AuBzI2URCATpEYqMQGAdR0Gl2opWUvrS+SuoBjauAAA3VElEQVTxyUtf553yZxA5N0JueuzytIqULDNc/M4XRhkOmSSlCwOEg0n/Lki79wcAnHH1cfmQ+xFDLSE9W7SeD0ONj7cmfERrlqUajunCWgHMAnCCkbIIBAI+hAEiEFgHA7ArFPJB2rOZVZWBT1//lubOWJB3CqABaPabGXTpWQ2P1502GX3yvKWZGiBGGSFmhAzl1Rxy/cffpe1TSZKw28E7ONUASefpMKpdas8ng8HP4fRfZtF3E39NuRaH8dEMYC8D2ywQCHSQV5OHQOBA6hHd9CqlYL1W0iRjDONueJ7CobDV8tuRTBWKjAw6l9uF4y86LOGaSncuGJFx/puGeUFi8trBE5IX1Lf50RpUTANI6OM9DtvJyX2YbIDE6wBGGQZaxoehfRcMhPD0na9lYnwEEC0GklFspEAgyB5hgAgE1vMfgCugMx9Ejsi4/sR7xE7pyuS0U/Y8fBdGEqX1gnw7fwmtb8mokpnac6DXCBGhWCoc+ez7SvNhQr8TUb6FXxlNzowPWZZx/Un3pCSds/QDIgNwHoDlFvaTQFDwCANEILAHzwKYpPSBlhHS2tyG284ZK97jVDJRdjJWkNxuF7bZZUhaLwhjDMe/8GGm90vLCMlJOw26vu1oaAtgWV2D0kcJ92rI8M2sFtVIjPZ+5Mz4AIBbRzwg+Vv8yZfiudZbAN40Wh6BQKAPobgIBPbhGAArlD7QMkLWrViPN8dPdLwSaAI5Xak+f9SpLLkkr5IXZFldI/5clvGmkmpt0jOWCy9IEoc89bZS/yX0ExHh8tFnO7X0LmBesjmQY+PjuXvepJq19SnXYizttRYhuhmsQCCwGGGACAT2oj9U4pK1KmP98Mnv9Of3MxytBJqAXsUnq/7z+jzYbvchCUaI2h07/ZWPMh17tRQ6K40Qxz57G/x+rGxoTtumTbboC5fbZbW4RhHftmyNqpwaHz99+gdN/WGGUt5HumttALCp0fIIBILMEAaIQGA/doFCUrpWZSzGGJ4f/SY11TdDkIAe5SqTpO4Ezh91GpNcicOq0qJsMCJj93GvWmmECC9IO9ve/wKX9+OGRy91svdDjWyfg5waH3VrN+D1cR9Ssq3BkXTuB7CT0fIIBILMEQaIQGA/5gIYAeWd0jUrY4084z5JjuSjnpQVehShrIwQt8eNw87Yn8sLsrKhGRe/+2Wm19Jqk8TZhoL3ghz3wgeSyv1J2fcj2bDME7J5BtTeFTnL8yoSDoVx69kPSBkYHxFEw1sXGi2TQCDInLwcUQWCPOA9ABOUPtCacIOBkEhKTyWTUKyMlekjRxzAkvcFkVW03C/mLKLfFq/I9FpaihdPGwraC/LDgqU0lSMXx1fkxZ6H75yPla+yWanQMj5M4dYzH5DCoUjC7ziMDwC4H8DXZsklEAgyQygqAoF9uRrRnXpT0Jp416+qwYRRLzlGEcwRehWjrIyQkU9ekXI9RSOEAae9OinT0rztZ9BsQ65xxHO3sqEJZ77+KZesYz+4LR9dimZ5Pkxh7LXPSHXrE6uUcRoffwG41Sy5BAJB5ggDRCCwNzsDaFL6QGsCnvnHHJr84c+OUAZzSCaekIzGyF79u6NHv65IroqlKBRj2Gf8G2bkg4BD/oL0guz/+FsSz/Y51467iHl9XqvFNQoW92c2m3Um31/DdzeP59NXv6Z5MxKjpziNj3oAu5kll0AgyA5hgAgE9sYPYHcAils0a+WEvPPEJFq9bJ3V8tuJTJWujMbJGx+9THYl5Q2ohWK1BEM48aWJVhghBWeAHP70u5LKjucJdOvdFZtvPcjpoVeERKPBaM+HKcnmMZbMW4GPX/4m4Zoc1a6AaBGPXaAybgoEAuvJm5qCAkEesx7R+vXHQkW5I5Wl9h8n/UH7Hrsb83o9VrfBTmSiIBN0Kloenwc77r89+27ir4kKFKDoGVnV2AyXRNi5f69M28U02pZOfqONBlsq7vd/+wd9OntB2rYSEca+d6tMkq1tKUXRsdFzR2l+MjlvPKYaH00bWnD7OQ9JSVfguSYDcCKA38ySTSAQZI/wgAgEzuANAK9BefJlarWW5IiMm08ZI97zjWSjMOnux269OmOvI3bm2qAQDHj4u6m0oGZDNu3TCk1Rk78gvCCz19biyV/+Ip7180vuPstpVa+SjQ6930l3XE6NDwC4+bQxEpMTLsE4vB8MwNMAPjZTNoFAkD2OGmEFggLnbABzlD5gGnuEBPxB3HPxo+Jd30g28eq6+/H0q45j3fp0TfgdY8pGCGMMhzz1ttQUCPKeXm/7cmmE2IaallYc+cx7klKXJ/+iW++u2G7XIbHfx3sUkn+y3jfGAHiNiHTnUGuL0u9NKbMbz61nPSiFksLkOEOv/gRwmZmyCQQCYxBKiUDgLHYC0KL0gdYEvXzBKkwY9aLVypKdyKkn5M7nr5G9vsQwOLW7FY7I2OGhl6SInFVer5aSqKSw5q0BEghHsNsjr3b0p0QUa3xKyJrb48atz1wpg8+jkGyc5Pr9MvKalPRnfPtimJpsHuOhq56S1q2sSfgdZ9J5I4B9zJZPIBAYgzBABAJn0QZgCKKba6WgXRnrP/r5synCCImSbQiJrrFTckkY/8ndfKV5EVWadxr7crbjc0xhVLqI2u7VeQVjwI5jX5aC7Ztztt90xqL9ktAHRIQzrz2e+Yq8mSr2ufKIxAweo4k3QpL7wPSQKwD4+r0faf6sxQm/4zQ+QgA2BxAwW0aBQGAMwgARCJzHCgCHQkUh0JqwX3vkA6pbu8Fq+e1CtgqVLkVVckm459UbuY2Q2lY/jnr2PSPGaDVDhChRYcs7A+Tgp96WGv2BWONYDCTNfUSETbboi10OHJ6tAWG2EWL2nG1JvgcArF1Rg/ef/iy54hWP8cEA7AdAlPwTCByEqIIlEDiTxQA6A9gROitjff/Rr3TwKfs4LcnWLLQqR/Gg67ulnUow75/FVLumLvEkKvuFrG1qxbyaOhw+ZLCR7Y1XJmMKXuxhMEp5ttyYGfHaJGn6irUbG70xRDHF+CgqLcLoV2806tJmGCEZ70mTJTnZhDEYCOKmU+9NSDrXYXzcB+BlC/pGIBBkgQjHEAiczV8AtlX6IBrqrqzZlpQV45GJd+TjDs+ZYITCqGuV+NJDRkrhUDjhd5LGpoUX7LYtG3XgbqYo9RQNSZLi5DdC0bX02brx4+/p7elzCEgwPlI8HwDgdrvw6Cd3wWN8qWqjPAdWrRTk7B5ecdRtUqB1ozOO0/gAoknnu+S4XwQCgQGIJVCBwNkMg0rogVZlrNbmNowWlbFiGKEo6jJiHnzvFplnl/QYz/42gz6eOc+UBSNmn4pOhvDKn7Po7b/nbGzLRuMjpX2SJOGMa443w/gAsu9Tq7weQA6Nj9vPfSjZ+OB9F1dAGB8CgWMRCsj/27vzOCfKw4/jn2d2YTlU6oGIAip4Vbz4ebVoW9taq7b92Vqxar1qrdVWK4qgVRERsGgteOBdjyIqXngCP6toFW+sioiCyiEgCMjNLrvLZub3R1jMZjPJzGzmSPb7fr32tbLJJM8zicnznecSKX37Aetz3ZBx5beZBZ8v5om7JpVFo7MIinGl2vO57LhFB77704Oa7A9i52t3OfCXJ6eYN+ctCvP1amwwt/RcxDb86oXZ88xVk6eaxhI4jSse5wgDxhj27/tt+v70oDCLFDSExBkII3v9xo1+wny1YHn2c3t5/jXAvhGfFxEpIgUQkdK3nPTyvBtz3ZjviuK/H33FvP/GTIWQtGJc9fX8mXrmwH7OVltv0bQABULIb8c9Z96a92UYu5Zn7ntRkl75/AtzziPPZ4aPzPd+s/Cx9XZbcd7QM+Iudi5x90ZFEkDemfK+mTqxyap8XjYahPTn3IGkl90VkRKlACJSHmYDJ+LSiM43pvrOIQ+Y6rU1cZc/KSLtCbn+0Sub7Q+SL4TYtsPJDzxrpi9eXuihIym/i8h7QF6fu8ic+dBk09h+3RQ+sifYpytnDO3aVzFy/BVRFc9PoIhjP5FMkbx2q5av4d6Rj2SveOXluW3gWNKLcIhICVMAESkfzwDD8Lk8r+M4DDxxuNXQkEKiDSDGGP4xYYidvSKZvbkh7TTbMd1xHH51zxPWsvXVXp8mqnoX83E8m79qDaeOe840ab+6NGaNMVRUWMVc8aqY4v4+jmS53fq6jVx+6kgr8yXyseLVQOCl2M6QiBRN3B94IlJc1wBT3W50+6JPNaQYeMIwy05pYSyKMxTLcwipateW2yZf22xSuuM46QkMDs1CiG07HH7jOGtdXX3S6h1pAFldW8uRt45v2pj9Zt5HZr1sDI5lGc4fcRZbfKtjlMUsJM7J5o0iCR8NDSku6df0c8bHilfPAzfGcnZEpOji/tATkeL7IfCB241uX/g16zdw9e9H6TMhLdIkZlVY3DJxeJMQktkazHU9vz5l851RY62NqaL2XAVthEbSgM1Ut7GB74x6wGrIbMziOpTHWMYyx511NHsftHuUxcwsWi5JmO+Ra5PKUFx1+t9bstzuzyI/OyISGjU2RMrTgcAqtxvdvviXLlrOyD+P0edCWksaZb4blW2r2nDr5BGuy/PmmhtSXb+RH982vpivV5A6O8QQQI4Y85BVm7WXisv72liWZfbv29s5+qQjYt8gMUMS5ntEdj6G/mG0tWLZNx9JPsLH12i5XZGyo4aGSPnaA3Ado+M26XPe7IWMH/N0ya6GVEQtbaD5PoeVbSq56dlrfIWQBSvXcuwdjxbzs9xP70/kwQPgR7eOt5asbToHxs7xfjYmHT5222cXzht6WlzhI9f5jPu7N7JeD4B7R443i+d9tfnfPsJHHdAr2lMjIlGI+0NQRMKzEjgZ9walk3twD/zn6TeTvjxv47j57J8wl6iNRLv2VYx44FJfIeTjpSv41T0TogwhsfR6ABx9+yPW3K+bdu45OcpiDMYYy+y2765cMvpc+5u7RirX88X5vds45Coy0176wLwz5YPNb2Yf4cMGjsNljyMRKW0VcRdAREI1C+gA9MWlcb6podvstv++8qH53s8Oddq1r4q7Ds2KjHvQCGtMfaRhrMOW7Tn8mEOcKU+81mSfhMZyOGx+3Tb7am01/1201By/3x7FXtHK5PhbLL0JJ9z3lPVh1hLELvM+jGVZpusuXbj81vOzG7xRvpaZ5Yp7snnkgXHV8jX8/eI7Ni8S4GOXcwcYDIyN9AyJSGSSfIVTRIrnLeAg3ENIzoZRm7aV3PzcMNuyEtNZ6jdgFPNqr9+T0OIGn52yOe+nf7Xc2m1Wjl6SX/Tu5dxywlFJmutQFKePe868OmdhswpvGnrVpKFvWZbpvNN2XHPfgFw9SVG9mTPfe3H/DxT58naphhQX/Hywldq0vLfT/HVy4wCvAUdEXWYRiU7cH4oiEo3vAIvcbnQbFrGxvoH+/zvEsu1ELM8bpHejGMOyYrtybVVY3PnidXZVu7YbyNGIzDUc69mZc8w/Xn67rC4uXTVpqlv4aPqHTXM+uvbozLD7L8kVPqI6L0kJH5EPuYJ0+Oh/3JBvwgeewwekNxk8Iuoyi0i0FEBEWo+9gLVuN7qFkLraegafdn0SPiuCNh5bGiBib8zfMnF4VWVVm+VAszV3c4WQW6a+Zx56N9FzeDy7bep7Zuy0j5rVJbtXyJj0Urvbdd2WIfcMiDMxNz533EOuIp1onunK066z6us2Nv6z+W6a7lYB+8ZRZhGJVll8QYmIZ52AJYDrxA634Vjde3Xlyjv7x9WwK9bcDr/lD9qALPp4eztlc/6xVyxraEjtkLOg2Vf7DfT/wUFO/x8cXLLDsa6e/Jq5f9oMk30mHadJi9Y2m2y7w9YMHzvIdQJ/46kKsciZ4SPO79fYAtjgM2+wli3aPE/H8THvYwOwPVATV9lFJDqahC7SutQB/wZOx/3/f8fkaMGtXbWetSvXsd93vh1HuYvVoPPzGJnP6Xg8NrRJ2sYyHH3yD9s//+grS+2UvWWuJ85+2d6av9jM+XoVx+5deiuZnvXwRPPkh58VHHbVGD6267otw/51iZf5SmEFg8aCxb2/R2zh455rHzafTp+7qe5OVk7MqxY4mPTFERFpBRRARFqfxcB7wEnkaSjlCiFffPql2bpzJ3rsvlPUZS7mFWWvj2NlHdM4pMWtURV6T4NlWebY3/6o46RxU+ochza5CpD9sn26fJWp3riR7/fqHnbximbg0y+biTPneAkfGGPosduODLnn4kI9H00OLXKRG98Xcc/3iK2368UnXjMvPPbq5sDuI3zYpHc5fyeusotI9BRARFqnz4EtgO/i1hgzYGjeopvx1iyzU68d6Npj+yjLW+yGXWOgcQrcnv232IczGWPM0Sf/sHLSgy81lqmJXCHkvYVLzaI16zhqr13jLn5BFzz+b/PkjMI9HwCWZdGl23Zccftf/K7UFkYAabXh443n3zUP3/xU5l4ffpbbHYKW2xVpdTQHRKR1eww43u3GTb0gJsffGXrfJXaXbttFVc4wG3e5Gm/5elwSsSSY4zj88chLXc9LriV6++66Iw+dflwiyp/Lr+6ZYL2/aGnOuma/QBWVFey6V3cG3fSnIPUpZo+a1+F5YYn19Vw4ZzEjzr05c68PP+W5Dzg7zvKLSDwUQERkDrCL242uIcQyDL1ngN2le+coyhjF1eXMhlO+BmqsV5szLV24nMG/+7vlVppcIeTQnXfkkTOTF0KOu/sJa/riZc3+nit8WBUWB/5gP+cPV5wS9HWIepJ4WCEl1tdx/qeLGHn+GMuxA4WP2cDecZZfROKjACIiAF8A3dxudFsZy6qwuOW5YXZlm8qwyxfV8JbGcFGogZqYEDJ7+udm1IC7jNugF5MeStfkb/vvtD1Pn/3rxISQY+541Ppk6Ypmf9+0y3lWfQyHHtnHOeuyk1py/qMMIF7fU0EeMza1G+rof9yQoOFjAZD88YAiEpokrO0vIvHbA6h2u9GtcWGnbAacMCwpGxUWg9e9G+JeZnWzPfffzTlj4ImO2wRsx0nPn8jsR5j+5TJOGft0Ij7/f3nPBF/h43/PPKql4aPx4aOSuTJaMZ439vDR0JBiUL/hQcPHWtKfNyLSiiXiC1REEuFbwFfQfHWlRm49Ie06tuOmp4eGmUIS0VjOITHJa+w/HjevT55m8s3/ze4N6dOtC0/+/vjY6vCLux63ZixZ3uzvucIHwHnXnO70OWyfYjW+ox7WlylogI09fDiOw4W/uMqqq61v/Lef908dsB3a60Ok1Uvql7qIRG810Jc8jWq3xkZtdS1XnHZdFBu8JU1iPkNPH3CCs88hezn5lqJt7A1p9P6ipRx52/hY6vCDMQ96Dh/GGC6/9QK7iOGj8anClO896+A/TMQePgCuPPW6zPDhpzwp4CAUPkQELcMrIk0tId1Q+CF5JmHn2iOkZv0Gpr8+03z/F98Js5GUxF7bRCzPC3Doj/uwctlqFs1Zkvc8ZS7Vu7Kmlic+/NScdeh+kdXh0NFjrS9Xr89Zrlzh46Znr7G367pNGEUJ6/3kNTB77QlJRPi46swbrOVLVmwqkOOnTDbQH5gUdx1EJBkUQEQk21SgO3AAPkPI2lXrWTzvKw46Yv+wypbEAJIoB/Ttzcbajcz5+AvPIWRtbR33vTPDnHdYn9Abub3/9k9rVU1t7jLlCB9X3X2RvU3nb4VVnLA2JPT63F6ePxG9f6MH3m198emib+rpfaNBB7gJGBF3HUQkORRARCSXZ4HvkX+lmpwhZMmCZaZz123o1mvHMMoV954LbhLTCwLw7QN3Z+vOnZjx1iyTr53obCq5wVDXkGLMa++Z8w7r41T429TPk9qNDez1t7utuoZUzttz7XI++K7+dreeXcM8VY1PWoz3lJ/wYXl8zkSEj1eefdO8/NQbQTYaBHgOOCvuOohIsiiAiIibB4B+QL6NPnKGkOlvfGx277Mr23UJZdhMUkNIovTYfSd27d2daVOmFzxXjb0htuMwZup7plO7tvTp1qVoZblt6nvmlAeetWw7d7s1V/i48va/2N13CyXEugn6nvI7PMpLukvEkCuA91//yNx/3WOZ4cNPKJoGHBl3HUQkefQlLiL5VALzgLwtwVyrYxljuPLOC8O8gp2YCeCbJKbRmGnNirVcetK1luM4FLpwvXnjQgPf79XdGfvbn7e4Pv3uf8qatmBJzjOTa5NBYwx/ve0Ce5c9unl6/CLyuzJVkN6Jkgof82ctZOQFtwbd5Xwh6R7URNRFRJJFAURECqkEVgId3e7gtlu6VWFx0zPX2G2r2hCSpIWQRAyZyeY4Dhf87EprY32D9xAC7LzNVrxywW8D16nv6LHW4rXNt5dxW2bXqrAYdv9Au/OO28Z1qryEkKABoaTCR211HRcdf7Vlp9Ivv8/wsQ7YlvSCFiIizSiAiIgX7UmHkLZudzAGk95poqk2bSsZM2lEa9kjJDENyFwG/WaEtWbFWl8hpF2bSj7+69m2Zbx/XTSkbHqP/Kfn+R4AbavaMuxfA+2tO3eK+zQ1yq5wS17XkgofjuPw52OusFKbXj+f4aMW6AQ0xF0PEUkuBRAR8WpXYCZQ5XYH140K21dx07PXtIYQkphGpJvrL7zNmjPzCzYvpOoiM3BYluGsQ/dzrjyqb8G6DXz6ZfP49Nk5N0R0cjynMYatt9uKEeMusysqy3Jaopf3ZqJ6zv7y88HZe314fU/Xkt7l/Mu46yAiyaYAIiJ+fBuYTp4FLNxCSOcdt2P42IHlHkISH0AApk5624wbNcEAeXtDmvR6GNi2fTvevvgMu7Ki+anemEpx8Kix1uoNtbnne7iEj8OPPcQ57eJfJ/6cBVRy4eOvJ19rrVy+BvAdPlLAXsDcuOsgIsmnACIifn0fmEKexpVbCOm68/Zcfc+Acg4hJRFAAFZ/vZbLTrnWcmzHewgBMLDbttvw7z+daFvGsDGV4se3jbcWrFrrWvNcQ64sy2LgjefavXrvEvepCEvJhY8rTrvO+nrJSmBT/5j3vT5soC/pVa9ERApSABGRIP5EenMx3yGkW8+uDL6rfzmHkCQ0Kk3W72wOQO2GOmdQv+FWXW29r3khbF4sy3zTRvUYPowxtGnbhr8/fqXdvkO7uM9TWEoufFx15g3W0kXLgUDh4xzgvrjrICKloywH3IpI6KYBOwAHEmC39JnvzDaHH3tIWD0Fce4TkoTeD0Ph1ZwMYCrbVJpjTvkRH741i7Ur15FvnnnmzuneTkTuIVddunXmuvGXh7kyWtwKhY/E9ZINP/cma/H8pY3FC7LL+fVx10FESot6QESkJcYDJ5Dns8StJ2TPA3px8Q3nxN0TUuywEnfj0u9eFpt9On0Ooy65m0L7hZhNO6e7sV2ONcZwyoW/dH7wi+8mqvFdZCUXPkb+5VZr3scLGouXa2uWfO4Dzo67DiJSehRARKSl3gAOzXO7MS6Xzg/50QHO7y8/OcwGmdcGYbGGbcXZwAwcPhpVr6/h8pNHUruhLl2ZvEGk+VPlur8xBssyXBPv/h5RKLnwcftVY80Hb8xsfCEdp9A4vKamAEfFXQcRKU0agiUiLXUPcBzpIVk5bWqsNmuxfjnvK7Ny2WoO6Ns7rLIV6uEwGfeDll+UKcnej0Zt27bhmFN+yIb1tcyftTD9oD6GXW0uiDGbfyoqK/j7o4OTtL9HGEoufNw94iHz3tQZQcPH28ARcddBREqXAoiIFMNdwBnAt9zu4BZCFn6+2HTcsj27frtHWGXzEkKcjPtmNxa9tMCT0Lgs2uT73gfvyRHH9eX159+loT69n5yfINJ4362378QNjw2223Wo8nxsCSp03hM12Rxg4kNTzMtPvrH5BfUZPmaRnvslIhKYhmCJSLFUAosB13E2bvNBjDGcetHxTogT0yF/Q7HQFers3gXH5b/j0uLeDzerlq9hyFk3ULdh88Z0BY+prKzgwhvOdvbct1cSzk1YvJzzxIWPl5563Twy5pnM8OGnjMuA7miXcxFpIQUQESmmtsBXgOt4m3wh5IKRv3N6H7hnXCEkcY1FH0ILII3WrlzHsHNvZN2qatcQYozhZ6f+2Pn56Uc6QYZulZCSDB//nTrD3H3Ng5t3qfcZPlaSHmaZirseIlL6yvobQkRiUQWs2vQ7p3wh5JyrT3X+57B9wgwhbo3HxI3T9yjqfU+c+rp6543n3zWfzphH+6oqdt27B7167+J03Xn7uM9FFEoyfLwz5X1z78hHMsOHn/d7LenhlRvjroeIlAcFEBEJw7bAQgKGkMtuPd/eZY9uYZbPrRGZuIZjwHpEodTOVTGU3GRzgE/e/8zcNOieoOFjA9B5028RkaKIe8dgESlPK4BdyXPF1G34h+M4jPzzGOuL2QvDLF8iG4oBxHkRqbV9f5RF+ABf4aMe2BGFDxEpstb2BSIi0VkK7EvAEPK382+1Fs5ZHGb5cjXESqlXOAlltRJSjijqmU8iw8dnM+ZmhQ/8bDRYD+wOrI27HiJSfrQMr4iEaSUwCfgd7p83jttGhVMnvmN67tODzl1D38DOZP13Y8M6c4hT0hracQ6/yi5HOSvJ8DH9rU/MzZfdmxk+/Cy3W0/64sH8uOshIuWp3L84RCQZegIfA23c7pBvTsigG8+ze/beOewyeu0RTkqDMykBJFM5zQvxcn6T8l5oYvpbn5jbB/8rO3x4fW3qgN1IL6ktIhIK9YCISBRWAY8BZ+EeQlx7Qt54/l2zw87bs+MuXcIqn5+d0BsbpnE3PJMYQJJwXorBy9CyRIaPqZPeNvdeOz5o+Kgm3fMR6gQsEZGkfXmJSHnbAZgDtHO7Q76ekD8NP93Z79C9gzb6sjcSzBxa5Xfn88zHiasRmsQA0qiUe0K89IQlMny8/dL75r6/PRI0fNQAPUhfLBARCZUmoYtIlL4CDiHPTsr5JqbfduVYM3+W74uzueZ0ZP6brP/203hufKw4JK4BnKFUJ6d7eS1tEnju532ygBzhw8+cj31Q+BCRiJTiF4SIlL5dgNlApdsd3HpCKiosRj11td2uvesWI00ehuA9Gn6DRRxXxZPcCwIJ7SnIwet5TGTPzob1G7j419dYduqb4vnY66Oe9BytJXHXQ0RaD/WAiEgc5gP7k78nJGfjKZWyueiXV1vrVlcXeo6WhA/w39jM7FmJStIb90kPSH7KmMjwsXLZai46fmh2+PDaS7MR2AuFDxGJWNK/GESkvO0NfID7ghjGbWJ6RYXF6KeH2lXt2uY8Dv+fb25XjIM2oqNssJbCxaQkNuBLdr4HQM26DQw4IXDPRwPp8DEv7nqISOtTCl9aIlK+PgZ+CqRcbncK9YSsX1OT6+YggcHJ8/cgjecoe0MSOS8hS9K+b0o6fKxavqZZ+PBR3gbgUBQ+RCQmSftCEJHW52XgePKEEFwaVamGFINOHGatW7U+inIGCSFRTlIPGpSilJTvnJIOHyuWruLyU0c2Cx8eJ503AD8h3fMoIhKLpHwZiEjr9hzp3dJzhpB8w0pSKZtLTxph1W+oa/xTmL0OQXsaou4NSXKPSJzfO14DYWLDR211HVeefn1Lwkc/4NW46yEirZvmgIhIkhwCTMVldSy3lbEAKior+MeEq+z2HdoFbeD6aXS2ZHJ11L0USZwInuQVwxIbPtauXM9lJ4+wUsHDx8HAh3HXQ0QkaV9KIiL/A7xJgBBiVViMfPhyOm2zZZDnDdLwbMnV/DiGSyUpjCRxkn5ih7CtXLqaK06/LmjPR+NqV/PjroeICGgIlogkz3vA0bg0BvPt7GynbP568rXU1dQHed6oV7qKY7O+xnkiSRimFVXdSz58rF25viXhIwV8D4UPEUkQBRARSaKXgZMIEEJSKZv+vxqCh31CiqUlDfk4d1KHpoEksUOPAvJzbhMbPlYtX8Ogk4a3JHz8LzAt7nqIiGRSABGRpHoCOI2APSGDfjOctSvXRVXWljbe4+gNcatDVD0kYQ4H8zPfI7HhY8XSVfz1t3+zHLvJy+A1fNjAr4H/i7seIiLZ4v7CExEppB/wEC4XTDZtVJh7s8LKCkY9OYR27au8PE+xegBaemGnFHoiihUewqir1/Of6PO8btV6Lj0p8IRzm3TPx+S46yEikot6QEQk6R4D+uPeE+I4OK77hFz8y6upr/M0J6RYF2Ra2nOQpInibrJ7SpIwpwT8DbmKu6yuaqvrGNQ8fOAjfPwBhQ8RSbCKuAsgIuLBNGAh8AvcG+fOpt6Qpn90HF547FUOO/pg2nXI2xMSRoM0aJAohRBSjDobinPey2K+B8DXS1Zy2cnXZs/5yDvkMKtupwIPxl0PEZF8SvULTkRapx8AL1KgsZlrqd6KygrGTBqOZeU8NMzhOMXoaU50o7mF9W1p3fyEtUSfx4aNDfzl54Nz9Xx4KXcKOBx4J+56iIgUoiFYIlJKXgEupUBDMteQrFRDiv7/O4QNNbXf3K3pT1iK0ei1yP95bTLuk/lTyj0pXs9LyU82B6heX0P/464OGj5s4GwUPkSkRJTzF5OIlK9zgVvI0yh327CwqkMVNz51te3SExKmYoaBxkZp0Md0sn7HWcegwaAsJptDetW2/scNsepqm85V8hE+TgcejrseIiJeKYCISKk6C7iTACGk41bt+ccTQ+wcU0bCVswQ4hTxsTIfs6WN9bCHYPk5h8kPH7bNgOOHWjXra5v83cewq9+SXqhBRKRkKICISCk7HngUl8+yfEv0brXNFvz90cFxDcspxeGvXntNwgwgfh470UOuIL1AwoBfD7Oq11Zn/91rz8exwAtx10NExC+tgiUipewTYC1wFPlDSDN1G+p5fdI75sgTvh/HFfLG5yyli0DG44/fnhmv579shlw1GnTicGv9mmbhw0vZHeDPqOdDREqUAoiIlLq3Nv3+Abkbvo5bCKmtqePd/0w3Pzyub1wN1jCGUcWt2PXxs8RuyYSPy0651lqzYl128b2U3wH+SnoOlIhISVIAEZFy8AqwO7AP7iGEXLetX1PDzHc/NYcfc0icISRn2cTXKlclETwAhv5htLX8yxXN6uA4nsLH3cDlcddBRKQlFEBEpFw8CfQADsDnZoWrl69h9gdzTd+fHhR3I1Yh5Btl1+sBMOLcm6xFc5c0q4OHoVcOcBtwftx1EBFpKQUQESknzwA7AAfiM4SsXLqKRXO+4uAf7h93HVpbCDE5/u0lfJRU8AAYPegua87MBc3q4TF8jAIujrsOIiLFoAAiIuVmIgFDyFcLl5mFny+JO4SU47yQQjJXK/NS98SvcJVt1CV3WbPfn5P9Z6/hYzQwKO46iIgUiwKIiJQjryGE7NuXLlxuFnz6JYf86IA4y99a54UUqm/J9XoA3Djon9as9z9vXhlv4WM4cEXcdRARKSYFEBEpVxNJB5A9CtyvWW/I0kVfm7kzF5jv/OR/4m7slktvSEvq4VCiwQPghovusGZPb9bz4WWvDwcYD/wl7jqIiBSbAoiIlLPxwOFAzwL3axZCli9ZwddLVtLn8H3irkOphxAH9xCRr24lGzoa3TXiQfPR27Ob1c/jRoOTgH5x10FEJAwKICJS7h4ADsNTCAH4JogsmrvEpBpS7NVnt7jrUI5DsgpNNi/puj5485Pmref/GzR8TACOj7sOIiJhUQARkdZgHPBzYEcvd87sDfl8xnzjpBz27NMr7jpsLl7cBSgCr/t7NO6sXlLGj3navPL0m0HDx5vAMXHXQUQkTAogItJa3A2cAmzr4b5NhmR9/tF8U1dbz94H7h53HaD0ekOyA4TX/T1K0oM3TjCvPvt20PAxAzgk7jqIiIRNAUREWpMxwO+ATh7u68A3vSFzP15gNlTX0vvgQnPaI1MKc0Myw4fX/T2ylUwvyL9ueMy8Nmla0PAxB+gddx1ERKJQ1leiRERy6Aks8nhfZ1Pj0XEchykTXjNTJ76dpEZ/UvfDyDXpvCXnLUnnPKd/P/aKeeP/3s0VPryEp7kUXq1NRKRsqAdERFqjG4HzgI4+jnEAM+PtWWbr7TvRY7ed4q5DZrkg+kZ6vvBT7GFXie4FeeHxV80Td05yCx+Fyv0lhRdIEBEpKwogItJajQbOAbbwcYwDDtPf+CRpE9M3lS3SEOI1FGTuct7S+iXOI7c+YyaOm5Krfl7CxyJg57jrICISNQUQEWmtHGAU8AdgS7/HfvbRPIMxZs/9E3XxOokT1Mt2qO8jtz5jXnry9Zzhw8PQq7mo50NEWqmy/WIQEfGoO+nGoC+O7TjP3v9v55Vn3kzalXmH5M4NaYkkhSomj/+PS/hwvISPj4BELKkmIhIH9YCIiMCdwB/xNycEgBlvz8Kx7fo9++xWGXclskTRG1JoGFaxL3IlIuxNuGuSmfjAiy49H56GXe1DeYZEERFPFEBERCBF8OFY5tMP51WYSlO3x349kxZCIL7lesPoYY89gEz452Tz/COv5DyfHno+viA97CoVdz1EROKkACIikuYAtwF/Atr7PNbMfn9OpWM71Xv26dU27oq41C3KIBLW8N5YA8iz979gJj/0klv4KNSj8TWwC+r5EBHRHBARkQy1wHakl0b17blxL3Z86anXG+KuRB424Tfiy/J7ZeKDL5rnxr0YNHwsALqgng8REUA9ICIiuTTOCeng98CPps22LLD32L9XoiZNZwlrfkixltwtVO5ITbhrkpn0YOCej6+AXqjnQ0RkMwUQEZHmNgI3AH8mQAiZPX2u6dCxyum5985JDiFQ3GFZZRk+Jo6b0pLwsRTYCYUPEZEmyrKrXESkCBygK7A8yMGP3vGcefPF/5ZCw7MYw7LCDh8UoYy+TZnwmnn2Xy+47fNR6LVdQjp8iIhIFvWAiIi4c4BbgPOBdn4Pnv76x2bb7bd2uu+2Y9J7QhrrmtnI91LmxmPCvpgVS/h47PbnTI6Frbzs87ES6IHmfIiI5KQAIiKSXwq4AzgPqPJ78PQ3PzZdune2d9p1h1IIIZncVs5ysv47ivARaQB58YnXzON3BA4fq4GdSS9oICIiOWgIlohIYWuAHUlf2fbFcRzuGfGwNe0/02PfwyIgO+vHIbplfSMPH6//37SWhI9VpN8n1VGWWUSk1KgHRETEmwbgLtKrY/kejvXeqzPMVttswS57do+7HsUU5kWsyOfPvDhhqhl/89MtGXa1C7Ah6nKLiJQaBRAREe/qgDGkNyv0HUJmvD2LDlu0T/X8do9y6X0udg+Ik/U7MpPH/8c8edfkoOFjBdANDbsSEfFEAURExJ+NwD+BswiwRO/MabMt23Ya9urTq9RDSLFWvootdDR6/K6JZvK4l4KGj6+APYGauMovIlJqFEBERPzbAIwiPTG9o9+DP/twrmm/Zcn3hOQLIPka7U7WT6wmPfSymTRuSo56OI7jFCzfYqA76Z4xERHxqNRWZRERSZI2pPd72DrAsc5hRx/MGQP7lerncKHwlPg9UO4c+oB5b+pHzc7/pl6PQuHja9ITzrXUroiIT+oBEREJzgZGA78DtvJ5rFn4+WKz/MuvU32+t28p9oQUCk6GBPRwuLn9qrHm/ddnNg8feAof80kvtZv4kCUikkSleuVNRCRp5pMejuPbXn124+Ibzom7/H55mQOSiGFW2a7vf7s156P5OcvrYc7HF0DPuOsgIlLKFEBERIrnU6BXkAN33mMn+4rbLyylnhCvk9AT1Usw/I83WgvnLMl1k5fwMRPYL+46iIiUOgUQEZHimk06hPj+fO3SrbMz7F8DS+lz2UtgSkwvyBW/HWl9vXRVriIWmnDukH5de8ddBxGRclBKV9tERErBXsA0AjS6ly5abgb9ZkTc5ffKa1BKRKAa2G9YS8LHSyh8iIgUjQKIiEhxOcB3gTeCHLz66zVc9psRtp1K1MilXBIRLApJNaQY2G+YtXbV+ma3OY6npXb/AxwVdz1ERMpJSXyBiIiUqBeBIwjwWduhY3vnxmeGJvUz2u8mhLEMw3Ich4t/dbVVs742122FEp4DTASOi7rcIiLlTj0gIiLhORJ4ggCN75rqDWbAr4c21NfVJ2L+RBa/wSjyILWhppZLTrimJeHjYRQ+RERCoQAiIhKu3wD/DHLgutXVlZf0G56ybTtJISSpvTKb2Smby07+m7V+TU2z2zyGjxuB0+Kuh4hIuVIAEREJ37nALQToCamtrq0ccPw1DQkKIYkOIKmGFANOGGbVVgfu+RgBXBJ3PUREylmiv0hERMrMaOACAnz2VrVru/7m54a1N8ZUxFh+v3M/MoU+q962bQb2G9aSno8RwJCwyyki0topgIiIROse4AwCfP5alll6xwvXbQW0j6nsLQkgoU5EdxyHQScOs9auqs5xU8ENBh3gdtLhUEREQqYAIiISvdOAewkwDNYYs/6WicMa2la1/VYM5W5JAMmlKKGkrraegScMs+pq65s+eOFeD0j3zJwKPFLEeomISB6aAyIiEr0HgMEEGJbkOM4W5x97Zcf6uvplcVeiCAzp76HAoaZ2Qx0XHTckaPhIAReh8CEiEqk4xxKLiLRmrwHLgGPw3wCvmPTgS+32OXiv5Vt37rRFhGUudg9Iix73sxlzzZDf/cPKmp/vZcgVQAPpoXD3hnGiRETEnQKIiEh8/gu8B5yI/x5p67XJ73TotttOc7r26LxNhGUOc+iu58d+/42Z5pbL7zNOsPCRIr27+cQQ6yIiIi4UQERE4vUZ8CFwAv5DiHn35Q+27r57tw936N65C9HM6wv7OQo+/gdvfmzuHPKAycwaDo6D42k+yUbS4eOVkOshIiIuNAldRCQZ9gXeBSoDHOscdvRBr5458MTvOeHP7Ytq7mDOCepP3/e8mfzQy5nhw2uvB6TDR29gTkR1EBGRHBRARESSY0dgFtAxyMG99tll3mU3/WnnkENIWPNAcmkSQsZccb+Z8fYnm5/b40TzRuuAnsDKiMouIiIuFEBERJKlA/AlsFWQg7fotMWnoydctVvIISTKFRRtgKF/GG0tnvcV4Dt4AKwGtic990NERGKmACIikjwVwApgyyAHt2lTuXbM5BFtjTHtQipfZL0gdsp2BpwwzNSsq/EzzyPTKqALCh8iIomhfUBERJInBWwHLAly8MaNDVud+5NLKxZ/sXRNSOULbUfzTIvmLuH8n11patZVO47j2AHCxyKgMwofIiKJoh4QEZHksoCPgd0DHu/88erTlh34vX27hFi+ULzz8nTuvfbh9Axz75PMM30M7EdEYUlERLxTABERSb5JwE+DHrzfd3qvOH/EGdsQzmd+0UPIbVeNZfobMzf/e1MA8RMkniC9t4qIiCSQAoiISGm4DTiHgJ/bnbtut2zEuEGdgx5fQLHmhDjD/3ijWTin6cgzHwHEBm4GBoRQRxERKRIFEBGR0nEhcAMBex0qKyuq//7Y4MqOW3WoCql8QcrlAM661dVcecb1Vm11ba67OE7h+R8p4A/Av0Kqm4iIFIkCiIhIadkPeBMIusJV6pr7B9bs0L1zoBW2PMrXI9KsN2PhnMWMOO9my7FzZwwPPSA1wEHA7BDrJCIiRaIAIiJSerYGFpDeMyQI56QLjlv6o18e1oWYvwdefvp188iYZ02+eeYFlt9dD+y06beIiJQABRARkdI1D+gR9OAeu++0avAdF3YKedNCVyPPH2PNm7Ww4P3yBJDPgT3jKLuIiASnACIiUroMMAX4PgE/z9u0ray5dfK1DtAxqkLbts2A44daNetrPd0/RwBxgJeAo6Iqs4iIFI82IhQRKV0O8CNgJOkVoHzbWN/Q4ZwjB7VbvmTFh0SwZ8byxSv48zFXeA4fQHb4SAGDUfgQESlZ6gERESkP+wJvA0FXuHL6/vTg6WcO6ndAWAV87PbnzJQJrxk/+wpmTUDfAPQBPgurjCIiEj4FEBGR8rElMAPoHvQB9tivp33J6HOL3jt+Q/87rM8+mufrGMdxMnt15gL7AHXFLpuIiERLAUREpLwY4FXguwT4jDfGmE7bbmWuf+SKQEO6stkpm4EnDrPWr6nxc5jjfNNN4gAvAMeEe9pERCQqFXEXQEREiu4+0uHjewQIIXUb6s3z4/9j9j54T+db224VuBCzPvjMXP37UVZtTb3XQzKDB6TntVwKnB/ZmRMRkdCpB0REpHwdQHq1qE4+jzObcPRvjnB+efbRvien+5zvkR08ANYAhwMfx3DeREQkRAogIiLlrQqYA3T1e6AxxgLY+8A9uPC633seknXDRXdYn83wNN8jV/AAWATsSsCVvUREJNkUQEREWodJwE/wufx6Ywip6lBF/+vPtnvu5b7v4fxPFzHq4jututrCQ65cNhe0gWeB4+M+WSIiIiIi0nK/I72UbcrXj8E2xjjGGKdN20qnqn2VU1lZ4VS2qXQq21Q67dpXOZVtKp3G+xT4sV2epwY4Ie4TJCIi4VMPiIhI67Il6SFZ2wY83hhjwP/3R+Noq+xeDwf4GuhJOoSIiEiZ007oIiKtyzpge2AKwXY+dzaxPR7feH+H3OFjIrADCh8iIiIiImXvctIb+/kbktX8xwZsY9K/PR5TB/SP+wSIiIiIiEi09gJW0PIQ4udnKbBz3BUXEREREZF4VAFTgQbCDR4NwPNAZdwVFhERERGR+P0EWEs44WM16Y0FRURERERENmtHevf0jRQneGwEJgNt466YiIiIiIgk12HAJ0A9wYJHHfARcEjcFRERERERkdJxLPAksITCK2bVAV8CY4Fj4i64iIgkkzYiFBERryzS3xtbAj8GugKLgBdJ77DukF6GV0RERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERESa+H8qN9wrT1buVwAAAK5lWElmTU0AKgAAAAgABwEGAAMAAAABAAIAAAENAAIAAAARAAAAYgESAAMAAAABAAEAAAEaAAUAAAABAAAAdAEbAAUAAAABAAAAfAEoAAMAAAABAAIAAIdpAAQAAAABAAAAhAAAAABVbnRpdGxlZCBBcnR3b3JrAAAAAACEAAAAAQAAAIQAAAABAAOgAQADAAAAAQABAACgAgAEAAAAAQAACqygAwAEAAAAAQAACAAAAAAADOvx9QAAACV0RVh0ZGF0ZTpjcmVhdGUAMjAyNS0xMS0wOFQwODozNzozOSswMDowMLypWUYAAAAldEVYdGRhdGU6bW9kaWZ5ADIwMjUtMTEtMDhUMDg6Mzc6MzkrMDA6MDDN9OH6AAAAKHRFWHRkYXRlOnRpbWVzdGFtcAAyMDI1LTExLTA4VDA4OjM4OjEwKzAwOjAwvFfZBgAAABF0RVh0ZXhpZjpDb2xvclNwYWNlADEPmwJJAAAAInRFWHRleGlmOkRvY3VtZW50TmFtZQBVbnRpdGxlZCBBcnR3b3JrwM+IbwAAABN0RVh0ZXhpZjpFeGlmT2Zmc2V0ADEzMlhvemQAAAAgdEVYdGV4aWY6UGhvdG9tZXRyaWNJbnRlcnByZXRhdGlvbgAyooyJKwAAABl0RVh0ZXhpZjpQaXhlbFhEaW1lbnNpb24AMjczMhVHewAAAAAZdEVYdGV4aWY6UGl4ZWxZRGltZW5zaW9uADIwNDgGZ8m0AAAAKXRFWHRJcHRjNHhtcEV4dDpBcnR3b3JrVGl0bGUAVW50aXRsZWQgQXJ0d29ya3VJHAcAAAASdEVYdHRpZmY6Q29tcHJlc3Npb24ANd40aWoAAAAidEVYdHRpZmY6RG9jdW1lbnROYW1lAFVudGl0bGVkIEFydHdvcmt1Q3V6AAAAEnRFWHR0aWZmOk9yaWVudGF0aW9uADG3q/w7AAAAIHRFWHR0aWZmOlBob3RvbWV0cmljSW50ZXJwcmV0YXRpb24AMiPCMJAAAAAVdEVYdHRpZmY6UmVzb2x1dGlvblVuaXQAMpwqT6MAAAAUdEVYdHRpZmY6WFJlc29sdXRpb24AMTMymp/UIAAAABR0RVh0dGlmZjpZUmVzb2x1dGlvbgAxMzIjZA/IAAAAEHRFWHR4bXA6Q29sb3JTcGFjZQAxBQ7I0QAAABh0RVh0eG1wOlBpeGVsWERpbWVuc2lvbgAyNzMyhlSL0AAAABh0RVh0eG1wOlBpeGVsWURpbWVuc2lvbgAyMDQ4lXQ5ZAAAAABJRU5ErkJggg==" # <-- PASTE YOUR FULL STRING
-        
         st.markdown(
-            f'<img src="{LOGO_BASE64}" class="corner-logo">',
+            inline_payload('logo', f'<img src="{static_url("images/logo.png")}" class="corner-logo">'),
             unsafe_allow_html=True
         )
 
@@ -53,7 +68,7 @@ def show_home_page():
     col1, col2, col3 = st.columns([0.5, 25, 0.5])
 
     with col2:
-        st.image("app/static/images/home.png", width=20000)
+        st.image(static_url("images/home.png"), width=20000)
         st.markdown(
             '<p class="homepage-subtitle">'
             'Find your perfect county based on your preferences.'
@@ -78,15 +93,6 @@ def show_preferences_page():
         format_func=lambda x: str(x) 
     )
     
-    if age_preference >= 60:
-        features["Age.Percent 65 and Older"] = 0.6
-        features["Age.Percent Under 18 Years"] = 0.3
-        features["Age.Percent Under 5 Years"] = 0.1
-    else:
-        features["Age.Percent 65 and Older"] = 0.3
-        features["Age.Percent Under 18 Years"] = 0.6
-        features["Age.Percent Under 5 Years"] = 0.1
-
     # education (orange)
     education_preference = st.select_slider(
         'On a scale of 1 to 10, how important is high average education level to you? (1 = not important, 10 = very important)',
@@ -95,9 +101,6 @@ def show_preferences_page():
         format_func=lambda x: str(x)
     )
 
-    features["Education.Bachelor's Degree or Higher"] = education_preference / 10.0
-    features["Education.High School or Higher"] = 1 - (education_preference / 10.0)
-
     # prefered demographics (yellow)
     st.subheader("Which demographic groups are important to you? (Select all that apply)")
     col1, col2 = st.columns(2)
@@ -116,50 +119,6 @@ def show_preferences_page():
 
     demographic_preference = [key for key, value in demographics.items() if value]
 
-    if len(demographic_preference) != 0:
-        demographic_percentage = 1.0 / len(demographic_preference)
-
-    features["Miscellaneous.Foreign Born"] = 0.0
-    features["Miscellaneous.Language Other than English at Home"] = 0.0
-    features["Ethnicities.American Indian and Alaska Native Alone"] = 0.0
-    features["Ethnicities.Asian Alone"] = 0.0
-    features["Ethnicities.Black Alone"] = 0.0
-    features['Ethnicities.Hispanic or Latino'] = 0.0
-    features['Ethnicities.Native Hawaiian and Other Pacific Islander Alone'] = 0.0
-    features['Ethnicities.White Alone'] = 0.0
-    features['Miscellaneous.Percent Female'] = 0.0
-    features['Miscellaneous.Veterans'] = 0.0
-    features['Ethnicities.Two or More Races'] = 0.0
-    features['Ethnicities.White Alone	 not Hispanic or Latino'] = 0.0
-
-    if 'native' in demographic_preference:
-        features["Ethnicities.American Indian and Alaska Native Alone"] = demographic_percentage
-    if 'asian' in demographic_preference:
-        features["Ethnicities.Asian Alone"] = demographic_percentage
-        features["Miscellaneous.Foreign Born"] = 0.3
-        features["Miscellaneous.Language Other than English at Home"] = 0.3
-    if 'black' in demographic_preference:
-        features["Ethnicities.Black Alone"] = demographic_percentage
-        features["Miscellaneous.Foreign Born"] = 0.3  
-    if 'hispanic' in demographic_preference:
-        features["Ethnicities.Hispanic or Latino"] = demographic_percentage
-        features["Miscellaneous.Foreign Born"] = 0.3
-        features["Miscellaneous.Language Other than English at Home"] = 0.3
-    if 'pacific' in demographic_preference:
-        features["Ethnicities.Native Hawaiian and Other Pacific Islander Alone"] = demographic_percentage
-        features["Miscellaneous.Foreign Born"] = 0.3
-        features["Miscellaneous.Language Other than English at Home"] = 0.3
-    if 'white' in demographic_preference:
-        features["Ethnicities.White Alone"] = demographic_percentage
-    if 'female' in demographic_preference:
-        features["Miscellaneous.Percent Female"] = demographic_percentage
-    if 'veteran' in demographic_preference:
-        features["Miscellaneous.Veterans"] = demographic_percentage
-    if len(demographic_preference) > 1: 
-        features['Ethnicities.Two or More Races'] = 1.0
-    if 'white' in demographic_preference and "hispanic" not in demographic_preference:
-        features['Ethnicities.White Alone	 not Hispanic or Latino'] = 1.0
-
     # house ownership (green)
     houseownership_preference = st.select_slider(
         'How much do you value housing stability and ownership? (1 = prefer rental, 10 = prefer homeownership)',
@@ -168,17 +127,6 @@ def show_preferences_page():
         format_func=lambda x: str(x)
     )
 
-    if houseownership_preference >= 6:
-        features["Housing.Homeownership Rate"] = 1.0
-        features["Housing.Households"] = 1.0
-        features["Housing.Housing Units"] = 1.0
-        features["Miscellaneous.Living in Same House +1 Years"] = 1.0
-    else:
-        features["Housing.Homeownership Rate"] = 0.0
-        features["Housing.Households"] = 1.0
-        features["Housing.Housing Units"] = 1.0
-        features["Miscellaneous.Living in Same House +1 Years"] = 0.0
-
     # average income (purple])
     myListIncome = ["25", "50", "75", "100", "125", "150", "175", "200", "225", "250", "275", "300+"]
     income_preference = st.select_slider(
@@ -192,11 +140,6 @@ def show_preferences_page():
     else:
         income_value = int(income_preference)
 
-    income_percentage = income_value / 300
-    features["Housing.Median Value of Owner-Occupied Units"] = income_percentage
-    features["Income.Median Household Income"] = income_percentage
-    features["Income.Per Capita Income"] = income_percentage
-                 
     # urban vs rural (dark red)
     population_preference = st.select_slider(
         'On a scale of 1 to 10, how much do you prefer urban vs rural areas? (1 = very rural, 10 = major metropolitan)',
@@ -205,13 +148,6 @@ def show_preferences_page():
         format_func=lambda x: str(x)
     )
 
-    features['Population.Population per Square Mile'] = population_preference / 10
-    features['Sales.Accommodation and Food Services Sales'] = population_preference / 10
-    features['Sales.Retail Sales'] = population_preference / 10
-    features['Miscellaneous.Manufacturers Shipments'] = population_preference / 10
-    features['Miscellaneous.Mean Travel Time to Work'] = population_preference / 10
-    features['Employment.Firms.Total'] = population_preference / 10
-
     # prefered storeowner demographic (blue)
     st.subheader("Which storeowner demographics are of high priority? (Select all that apply)")
     col1, col2, = st.columns(2)
@@ -226,23 +162,14 @@ def show_preferences_page():
 
     storeowner_preferences = [key for key, value in storeowner.items() if value]
 
-    features['Employment.Firms.Women-Owned'] = 0.0
-    features['Employment.Firms.Men-Owned'] = 0.0
-    features['Employment.Firms.Minority-Owned'] = 0.0
-    features['Employment.Firms.Nonminority-Owned'] = 1.0
-    features['Employment.Firms.Veteran-Owned'] = 0.0
-    features['Employment.Firms.Nonveteran-Owned'] = 1.0
-
-    if 'women owner' in storeowner:
-        features['Employment.Firms.Women-Owned'] = 1.0
-    if 'men owner' in storeowner:
-        features['Employment.Firms.Men-Owned'] = 1.0
-    if 'minority owner' in storeowner:
-        features['Employment.Firms.Minority-Owned'] = 1.0
-        features['Employment.Firms.Nonminority-Owned'] = 0.0
-    if 'veteran owner' in storeowner:
-       features['Employment.Firms.Veteran-Owned'] = 1.0
-       features['Employment.Firms.Nonveteran-Owned'] = 0.0
+    st.session_state.filters = show_filters()
+
+    features.update(build_features(
+        age_preference, education_preference, demographic_preference,
+        houseownership_preference, income_value, population_preference, storeowner,
+    ))
+    cancel_superseded_match()
+    show_preview()
 
     # for degubbing, see text at bottom of screen
     st.subheader("Summary:")
@@ -298,6 +225,9 @@ def show_preferences_page():
     if storeowner_preferences:
         st.write(f"Selected demographics: {', '.join(storeowner_preferences)}")
         preferences['storeowner'] = storeowner_preferences
+    if st.session_state.filters is not None:
+        from algorithms.filters import describe_filter
+        st.write(f'Only counties matching: {describe_filter(st.session_state.filters)}.')
     
     # back button
     col1, col2, col3 = st.columns([1, 5, 2])
@@ -306,7 +236,57 @@ def show_preferences_page():
     with col3:
         st.button('See Your Results', on_click=change_page, args=('results',), use_container_width=True)
 
+def show_preview():
+    # best matches for the answers so far, re-scored on every widget change (see algorithms/incremental.py)
+    from algorithms.filters import NoMatchingCounties
+    from algorithms.incremental import IncrementalScorer
+    if 'scorer' not in st.session_state:
+        st.session_state.scorer = IncrementalScorer()
+    try:
+        preview = st.session_state.scorer.top_matches(
+            st.session_state.features, PREVIEW_MATCHES, st.session_state.filters
+        )
+    except NoMatchingCounties:
+        st.caption('No county passes your filters yet.')
+        return
+    best = preview.iloc[0]
+    st.markdown(f'<p class="homepage-subtitle">Best match so far: {best["County"]}, {best["State"]}</p>', unsafe_allow_html=True)
+    if len(preview) > 1:
+        st.caption('Runners-up: ' + '; '.join(f"{row['County']}, {row['State']}" for _, row in preview.iloc[1:].iterrows()))
+
+def show_filters():
+    # hard limits on the candidate counties, applied before scoring (see algorithms/filters.py)
+    from algorithms.filters import county_filter, get_filter_index
+    index = get_filter_index()
+    st.subheader("Limit the search (optional)")
+    states = st.multiselect('Only in these states (leave empty for all states)', options=index.states)
+    population_options = [0, 10000, 25000, 50000, 100000, 250000, 500000, 1000000]
+    min_population = st.select_slider(
+        'Minimum population',
+        options = population_options,
+        value = 0,
+        format_func=lambda x: 'any' if x == 0 else f'{x:,}'
+    )
+    _, max_density = index.bounds('Population.Population per Square Mile')
+    density_options = [0, 10, 25, 50, 100, 250, 500, 1000, 5000, max_density]
+    density_range = st.select_slider(
+        'Population density (people per square mile)',
+        options = density_options,
+        value = (0, max_density),
+        format_func=lambda x: 'no limit' if x == max_density else f'{x:,}'
+    )
+    return county_filter(states, {
+        'Population.2020 Population': (min_population or None, None),
+        'Population.Population per Square Mile': (
+            density_range[0] or None, None if density_range[1] == max_density else density_range[1]
+        ),
+    })
+
+@traced("map")
 def show_map_page():
+    from algorithms.result_store import get_result_store, preference_hash
+    from utils.choropleth import get_choropleth_base
+
     st.title('Map Display')
     st.write('Hover to see county details.')
 
@@ -324,16 +304,6 @@ def show_map_page():
         ],
         index=0
     )
-    metric_mapping = {
-        'Match Index': 'DistanceToIdeal',
-        'Elderly Population': 'Age.Percent 65 and Older',
-        'Youth Population': 'Age.Percent Under 18 Years',
-        'Education Level': "Education.Bachelor's Degree or Higher",
-        'Income Level': 'Income.Median Household Income',
-        'Housing Ownership': 'Housing.Homeownership Rate',
-        'Population Density': 'Population.Population per Square Mile',
-    }
-
     if selected_metric == 'Match Index':
         st.write('Counties with lower Match Index values are better matches to your preferences.')
     elif selected_metric == 'Elderly Population':
@@ -350,68 +320,20 @@ def show_map_page():
         st.write('Scale is population per square mile normalized.')
 
     try:
-        # Load GeoJSON for US counties
-        with urlopen('https://raw.githubusercontent.com/plotly/datasets/master/geojson-counties-fips.json') as response:
-            counties = json.load(response)
-
-        # Load and prepare county data
-        csv_path = 'app/data/county_demographics_with_distances.csv'
-        df = pd.read_csv(csv_path, dtype={"fips": str})
-        # Clean up FIPS codes - remove decimals and ensure 5-digit format
-        df['fips'] = df['fips'].astype(str).apply(lambda x: x.split('.')[0].zfill(5))
-
-        display_column = metric_mapping[selected_metric]
-
-        # Quantile-based normalization: spreads colors evenly across values
-        valid_count = df[display_column].notna().sum()
-        if valid_count > 0:
-            df['__norm'] = (df[display_column].rank(method='average', na_option='keep') - 0.5) / float(valid_count)
-        else:
-            df['__norm'] = pd.NA
-
-        # Color scale: for Match Index lower is better -> green
-        color_scale = "RdYlGn_r" if selected_metric == 'Match Index' else "RdYlGn"
-
-        fig = px.choropleth(
-            df,
-            geojson=counties,
-            locations='fips',
-            color='__norm',
-            color_continuous_scale=color_scale,
-            range_color=(0, 1),
-            scope="usa",
-            labels={'__norm': selected_metric},
-            hover_name='County',
-            hover_data={'fips': False, display_column: ':.3f'}
-        )
+        # Prebuilt figure and color arrays (see utils/choropleth.py), only Match Index is per user
+        pref_hash = preference_hash(st.session_state.features, st.session_state.filters)
+        distances = get_result_store().get(current_session_id(), pref_hash)
+        if distances is None and selected_metric == 'Match Index':
+            st.info('Run an algorithm on the results page to see your Match Index.')
 
-        # Show colorbar ticks in original units for readability
-        q_levels = [0.05, 0.25, 0.5, 0.75, 0.95]
-        quantiles = df[display_column].quantile(q_levels)
-        def _fmt(v):
-            try:
-                v = float(v)
-            except Exception:
-                return str(v)
-            if abs(v) >= 1000:
-                return f"{v:,.0f}"
-            if abs(v) >= 100:
-                return f"{v:.0f}"
-            if abs(v) >= 10:
-                return f"{v:.1f}"
-            return f"{v:.2f}"
-        tickvals = q_levels
-        ticktext = [_fmt(quantiles.get(q)) for q in q_levels]
-        fig.update_layout(
-            margin={"r":0,"t":0,"l":0,"b":0},
-            coloraxis_colorbar=dict(
-                title=selected_metric,
-                tickvals=tickvals,
-                ticktext=ticktext
-            )
-        )
+        # per-state best matches of the last run, if it was for these preferences
+        winners_hash, winners = st.session_state.get('state_winners', (None, None))
+        highlight = winners if winners_hash == pref_hash else None
+        if highlight:
+            st.write('Outlined counties are your best match in each state.')
 
-        st.plotly_chart(fig, use_container_width=True)
+        with span("map_render"), get_choropleth_base().figure(selected_metric, distances, highlight) as fig:
+            st.plotly_chart(fig, use_container_width=True)
 
     except Exception as e:
         st.error(f"Error displaying map: {str(e)}")
@@ -420,71 +342,265 @@ def show_map_page():
     with col1:
         st.button('Start Over', on_click=change_page, args=('home',), use_container_width=True)
 
+def show_matches(matches):
+    # ranked list of counties, best match first
+    best = matches.iloc[0]
+    st.markdown('<p class="homepage-subtitle">Your best match:</p>', unsafe_allow_html=True)
+    st.markdown(f'<p class="result-text">{best["County"]}, {best["State"]}</p>', unsafe_allow_html=True)
+    if len(matches) > 1:
+        st.markdown(f'<p class="homepage-subtitle">Your top {len(matches)} matches:</p>', unsafe_allow_html=True)
+        for rank, (_, row) in enumerate(matches.iterrows(), start=1):
+            st.write(f"{rank}. {row['County']}, {row['State']} (distance {row['DistanceToIdeal']:.3f})")
+
+def show_state_matches(matches, pref_hash):
+    # best county in every state, from one grouped pass over the distances (see algorithms/ranking.py)
+    per_state = matches.attrs.get('per_state')
+    if per_state is None or per_state.empty:
+        return
+    # the map page outlines these counties while the preferences stay the same
+    st.session_state.state_winners = (pref_hash, per_state.index.tolist())
+    st.markdown(f'<p class="homepage-subtitle">Your best match in your top {min(TOP_STATES, len(per_state))} states:</p>', unsafe_allow_html=True)
+    for _, row in per_state.head(TOP_STATES).iterrows():
+        st.write(f"{row['State']}: {row['County']} (distance {row['DistanceToIdeal']:.3f})")
+    with st.expander(f'Best match in each of {len(per_state)} states'):
+        st.dataframe(per_state[['State', 'County', 'DistanceToIdeal']], hide_index=True, use_container_width=True)
+
+def county_choices():
+    # "County, State" of every labelled feature store row, keyed by row, for the county pickers
+    import numpy as np
+    from algorithms.feature_store import get_feature_store
+    store = get_feature_store()
+    rows = np.flatnonzero(store.label_valid)
+    return dict(zip(rows.tolist(), (
+        f"{county}, {state}" for county, state in zip(store.county_labels(rows), store.state_labels(rows))
+    )))
+
+def show_similar():
+    # nearest neighbors of one county from a persistent index (see algorithms/similarity.py)
+    from algorithms.similarity import similar_counties
+    labels = county_choices()
+    options = list(labels)
+    default = st.session_state.similar_to
+    st.subheader('Counties similar to this one')
+    row = st.selectbox(
+        'County', options=options, index=options.index(default) if default in labels else 0,
+        format_func=labels.get,
+    )
+    k = st.select_slider('How many similar counties?', options=[5, 10, 20], value=10)
+    feature_names = list(st.session_state.features) or None
+    try:
+        similar, query_time = similar_counties(row, k, feature_names)
+    except KeyError:
+        st.info('This county has no data for some of your preferences.')
+        return
+    st.caption(f'Found in {query_time * 1000:.2f} ms, compared on the features you set.')
+    st.dataframe(similar, hide_index=True, use_container_width=True)
+
+def show_my_county():
+    # one county's path to the ideal and its route to the best match (see county_to_ideal and
+    # route_to_best_match in algorithms/dijkstra.py)
+    from algorithms.dijkstra import county_to_ideal, route_to_best_match
+    from algorithms.filters import NoMatchingCounties
+    if not st.session_state.features:
+        return
+    labels = county_choices()
+    st.subheader('How does your current county score?')
+    row = st.selectbox('Your county', options=list(labels), index=None, format_func=labels.get,
+                       placeholder='Pick the county you live in')
+    if row is None:
+        return
+    try:
+        result = county_to_ideal(st.session_state.features, row, st.session_state.filters)
+        route = route_to_best_match(st.session_state.features, row, st.session_state.filters)
+    except NoMatchingCounties:
+        st.info('No county passes your filters, widen them on the preferences page.')
+        return
+    except KeyError:
+        st.info('This county is not scored for your preferences (missing data or outside your filters).')
+        return
+    st.markdown(f'<p class="result-text">{labels[row]}: distance {result.distance:.3f}</p>', unsafe_allow_html=True)
+    st.caption(
+        f"Path: {' → '.join(result.labels)}, found by A* in {result.search_time * 1000:.2f} ms, settling "
+        f"{result.settled} of {result.n_nodes} nodes. The direct edge is always the shortest path, so this is "
+        'the same straight-line distance the matchers rank by.'
+    )
+    if len(route.labels) == 1:
+        st.caption('Your county is your best match.')
+    elif route.labels:
+        st.write(f"Route through similar counties to your best match: {' → '.join(route.labels)}")
+        st.caption(
+            f"Found by A* on the similar-county graph in {route.search_time * 1000:.2f} ms, settling "
+            f"{route.settled} of {route.n_nodes} counties."
+        )
+    else:
+        st.caption('No chain of similar counties connects your county to your best match.')
+
+def show_timings(matches):
+    # per-stage breakdown of this request, see algorithms/instrumentation.py
+    timings = matches.attrs.get('timings')
+    if not timings:
+        return
+    total = sum(seconds for _, seconds in timings)
+    with st.expander(f'Timing breakdown ({total * 1000:.2f} ms)'):
+        st.table([{'Stage': name, 'ms': round(seconds * 1000, 3)} for name, seconds in timings])
+
+def show_comparison(comparison):
+    # every search on the same graph, see algorithms/compare.py
+    st.success(
+        f"Compared {len(comparison.table)} searches on one graph of {comparison.n_nodes} nodes "
+        f"and {comparison.n_edges} edges (built in {comparison.build_time * 1000:.1f} ms)"
+    )
+    st.dataframe(comparison.table, hide_index=True, use_container_width=True)
+    if comparison.concurrency < len(comparison.table):
+        st.caption(
+            f'Searches ran {comparison.concurrency} at a time, not all at once; each search time is measured '
+            'inside its own worker and leaves out the wait for one.'
+        )
+    if comparison.consistent:
+        st.caption('All searches found the same distance for every county.')
+    else:
+        st.error('The searches disagree on some distances, see the Max diff column.')
+
+def show_startup_timings():
+    # cold start (background warm-up) and the first match served by this process
+    warmup = start_warmup()
+    first = first_request_times()
+    first_match = [first[name] for name in ('dijkstra', 'bellman_ford') if name in first]
+    parts = []
+    if warmup.done:
+        parts.append(f"Warm-up {'failed' if warmup.error else 'finished'} in {warmup.cold_start:.2f} s")
+    else:
+        parts.append("Warm-up still running")
+    if first_match:
+        parts.append(f"first match in this process took {first_match[0] * 1000:.1f} ms")
+    st.caption(", ".join(parts))
+
+def cancel_superseded_match():
+    # a pending match for preferences the user has since changed is no longer wanted
+    job = st.session_state.get('match_job')
+    if job is None:
+        return
+    from algorithms.jobs import get_match_pool
+    from algorithms.result_store import preference_hash
+    if job.pref_hash != preference_hash(st.session_state.features, st.session_state.filters):
+        get_match_pool().cancel(job)
+        st.session_state.match_job = None
+
+def submit_match(algorithm, features, k, mode='vectorized'):
+    from algorithms.jobs import PoolBusy, get_match_pool
+    try:
+        # submitting again cancels this session's previous job
+        st.session_state.match_job = get_match_pool().submit(
+            algorithm, features, k=k, mode=mode, session_id=current_session_id(),
+            filters=st.session_state.filters, per_state=True,
+        )
+    except PoolBusy:
+        st.warning('The server is busy with other searches, please try again in a moment.')
+
+def wait_for_match(job):
+    # poll the worker pool; a rerun (another click, a widget change) stops this loop but not the job
+    label = {'dijkstra': "Dijkstra's algorithm", 'compare': 'Comparison'}.get(job.algorithm, f"Bellman-Ford ({job.mode})")
+    placeholder = st.empty()
+    while not job.done():
+        done, total = job.progress()
+        if job.algorithm in ('dijkstra', 'compare') and total:
+            placeholder.progress(min(done / total, 1.0), text=f'{label}: {job.describe_progress()}')
+        else:
+            placeholder.caption(f'{label}: {job.describe_progress()}')
+        time.sleep(0.05)
+    placeholder.empty()
+    return job.result()
+
 def show_results_page():
+    from algorithms.filters import NoMatchingCounties, describe_filter
+    from algorithms.jobs import JobCancelled
+    from algorithms.result_cache import get_match_cache
+    from algorithms.result_store import preference_hash
+
     features = st.session_state.features
     st.title('Your County Match Results')
     st.markdown('<p class="homepage-subtitle">Choose an algorithm.</p>', unsafe_allow_html=True)    
-    runDijkstra = False
-    runBellman = False
+
+    if st.session_state.filters is not None:
+        st.caption(f'Searching only {describe_filter(st.session_state.filters)}.')
+
+    top_k = st.select_slider('How many matches to show?', options=[1, 3, 5, 10, 20], value=5)
 
     col1, col2 = st.columns([1, 1])
     with col1:
         if st.button('Run Dijkstra', use_container_width=True):
-            runDijkstra = True; 
-            result, elapsed_time = dijkstra_algorithm(features)
+            submit_match('dijkstra', features, top_k)
     with col2:
+        bellman_mode = st.selectbox(
+            'Bellman-Ford variant',
+            options=['vectorized', 'spfa', 'classic'],
+            format_func=lambda m: {'vectorized': 'Vectorized (NumPy)', 'spfa': 'SPFA (queue)', 'classic': 'Classic (edge list)'}[m],
+        )
         if st.button('Run Bellman-Ford', use_container_width=True):
-            runBellman = True; 
-            result, elapsed_time = bellman_ford_algorithm(features)
+            submit_match('bellman_ford', features, top_k, mode=bellman_mode)
+    if st.button('Compare all algorithms', use_container_width=True):
+        submit_match('compare', features, top_k)
 
-    if runDijkstra:
-        st.success(f"Dijkstra's algorithm search for ideal county completed in {elapsed_time:.3f} seconds")
-        st.markdown('<p class="homepage-subtitle">Your best match:</p>', unsafe_allow_html=True)    
+    # matching runs on the worker pool (algorithms/jobs.py), this rerun only waits for it
+    job = st.session_state.get('match_job')
+    if job is not None:
         try:
-            # Handle Series or DataFrame directly to avoid JSON string formatting
-            row = result.iloc[0] if hasattr(result, 'iloc') else result
-            county = None
-            state = None
-            if hasattr(row, 'get'):
-                county = row.get('County') or row.get('county')
-                state = row.get('State') or row.get('state')
-            if county is None or state is None:
-                # Fallback: try JSON parsing if needed
-                record = json.loads(result.to_json()) if hasattr(result, 'to_json') else None
-                if isinstance(record, dict):
-                    county = county or record.get('County') or record.get('county')
-                    state = state or record.get('State') or record.get('state')
-            if county and state:
-                st.markdown(f'<p class="result-text">{county}, {state}</p>', unsafe_allow_html=True)
+            if job.algorithm == 'compare':
+                result, elapsed_time = wait_for_match(job), None
             else:
-                st.markdown(f'<p class="result-text">{str(result)}</p>', unsafe_allow_html=True)
-        except Exception:
-            st.markdown(f'<p class="result-text">{str(result)}</p>', unsafe_allow_html=True)
-        runDijkstra = True
+                result, elapsed_time = wait_for_match(job)
+                # the similar counties section starts from the best match
+                st.session_state.similar_to = int(result.index[0])
+            # kept so reruns from the widgets below (similar counties, your county) still show it
+            st.session_state.last_match = {
+                'algorithm': job.algorithm, 'mode': job.mode, 'pref_hash': job.pref_hash,
+                'result': result, 'elapsed_time': elapsed_time,
+            }
+        except JobCancelled:
+            st.warning('The search was cancelled.')
+        except NoMatchingCounties:
+            st.warning('No county passes your filters, widen them on the preferences page.')
+            st.session_state.last_match = None
+        st.session_state.match_job = None
+
+    # the last result stays on the page until the preferences or filters change
+    last = st.session_state.get('last_match')
+    if last is not None and last['pref_hash'] != preference_hash(features, st.session_state.filters):
+        last = st.session_state.last_match = None
+    runDijkstra = last is not None and last['algorithm'] == 'dijkstra'
+    runBellman = last is not None and last['algorithm'] == 'bellman_ford'
+    runCompare = last is not None and last['algorithm'] == 'compare'
+    if last is not None:
+        result, elapsed_time, bellman_mode = last['result'], last['elapsed_time'], last['mode']
+
+    if (runDijkstra or runBellman) and result.attrs.get('cached'):
+        served_from = f" (served from cache in {elapsed_time * 1e6:.0f} µs)"
+    else:
+        served_from = ""
+
+    if runDijkstra:
+        st.success(f"Dijkstra's algorithm search for ideal county completed in {elapsed_time:.3f} seconds{served_from}")
+        show_matches(result)
+        show_state_matches(result, last['pref_hash'])
     elif runBellman:
-        st.success(f"Bellman-Ford's algorithm search for ideal county completed in {elapsed_time:.3f} seconds")
-        st.markdown('<p class="homepage-subtitle">Your best match:</p>', unsafe_allow_html=True)    
-        try:
-            row = result.iloc[0] if hasattr(result, 'iloc') else result
-            county = None
-            state = None
-            if hasattr(row, 'get'):
-                county = row.get('County') or row.get('county')
-                state = row.get('State') or row.get('state')
-            if county is None or state is None:
-                record = json.loads(result.to_json()) if hasattr(result, 'to_json') else None
-                if isinstance(record, dict):
-                    county = county or record.get('County') or record.get('county')
-                    state = state or record.get('State') or record.get('state')
-            if county and state:
-                st.markdown(f'<p class="result-text">{county}, {state}</p>', unsafe_allow_html=True)
-            else:
-                st.markdown(f'<p class="result-text">{str(result)}</p>', unsafe_allow_html=True)
-        except Exception:
-            st.markdown(f'<p class="result-text">{str(result)}</p>', unsafe_allow_html=True)
-        runBellman = True
+        st.success(f"Bellman-Ford's algorithm ({bellman_mode}) search for ideal county completed in {elapsed_time:.3f} seconds{served_from}")
+        show_matches(result)
+        show_state_matches(result, last['pref_hash'])
+    elif runCompare:
+        show_comparison(result)
     
+    if 'similar_to' in st.session_state:
+        show_similar()
+    show_my_county()
+
     if (runDijkstra or runBellman):
+        show_timings(result)
+        cache_stats = get_match_cache().stats()
+        st.caption(
+            f"Match cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, "
+            f"{cache_stats['evictions']} evictions, {cache_stats['entries']} entries"
+        )
+        show_startup_timings()
         col1, col2, col3, col4 = st.columns([1, 2, 2, 1])
         with col1:
             st.button('Start Over', on_click=change_page, args=('home',), use_container_width=True)
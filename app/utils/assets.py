@@ -0,0 +1,145 @@
+import base64
+import hashlib
+import logging
+import mimetypes
+import os
+import re
+from functools import lru_cache
+
+from algorithms.instrumentation import count
+
+# Static asset pipeline for the Streamlit pages. style.css is authored with its
+# background image inlined as a base64 data URI (~3.6 MB); it is processed once
+# per process: data URIs are written out under static/generated/ with content
+# hashed names, comments and whitespace are stripped and repeated rules and
+# declarations are dropped. Images are served by Streamlit's static file
+# endpoint (server.enableStaticServing in .streamlit/config.toml) so each rerun
+# only sends a URL. Bytes inlined into the page are counted per rerun.
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "static")
+GENERATED_DIR = os.path.join(STATIC_DIR, "generated")
+CSS_PATH = os.path.join(STATIC_DIR, "css", "style.css")
+
+#Where Streamlit serves the app's static/ directory
+STATIC_URL = "/app/static"
+
+logger = logging.getLogger(__name__)
+
+_STRING_OR_COMMENT = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|/\*.*?\*/""", re.S)
+_STRING = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')""")
+_DATA_URI = re.compile(r"""url\(\s*(['"]?)data:([\w.+-]+/[\w.+-]+);base64,([A-Za-z0-9+/=\s]+)\1\s*\)""")
+
+
+def static_url(relative_path):
+    return f"{STATIC_URL}/{relative_path}"
+
+
+def externalize_data_uris(css, out_dir=GENERATED_DIR):
+    """Replace base64 data URIs with URLs of files written to out_dir, named by content hash."""
+    def replace(match):
+        mime, encoded = match.group(2), match.group(3)
+        data = base64.b64decode(re.sub(r"\s+", "", encoded))
+        ext = mimetypes.guess_extension(mime) or ".bin"
+        name = hashlib.sha1(data).hexdigest()[:16] + ext
+        path = os.path.join(out_dir, name)
+        try:
+            if not os.path.exists(path):
+                os.makedirs(out_dir, exist_ok=True)
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+        except OSError:
+            #Read-only deployments keep the image inline
+            logger.warning("Could not write %s, keeping the data URI inline", path, exc_info=True)
+            return match.group(0)
+        return f"url('{static_url(os.path.relpath(path, STATIC_DIR).replace(os.sep, '/'))}')"
+
+    return _DATA_URI.sub(replace, css)
+
+
+def _minify_code(code):
+    #Whitespace rules for the parts of the stylesheet outside string literals
+    code = re.sub(r"\s+", " ", code)
+    code = re.sub(r"\s*([{};,>])\s*", r"\1", code)
+    code = re.sub(r":\s+", ":", code)
+    return code.replace(";}", "}")
+
+
+def minify_css(css):
+    css = _STRING_OR_COMMENT.sub(lambda m: m.group(1) or "", css)
+    parts = _STRING.split(css)
+    #Odd parts are the string literals captured by the split, kept verbatim
+    return "".join(part if i % 2 else _minify_code(part) for i, part in enumerate(parts)).strip()
+
+
+def _top_level_statements(css):
+    #Split minified css into top-level @-statements and blocks, strings never contain braces here
+    statements = []
+    depth = 0
+    start = 0
+    for i, ch in enumerate(css):
+        if ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                statements.append(css[start:i + 1])
+                start = i + 1
+        elif ch == ";" and depth == 0:
+            statements.append(css[start:i + 1])
+            start = i + 1
+    if css[start:].strip():
+        statements.append(css[start:])
+    return statements
+
+
+def _dedupe_declarations(body):
+    #Repeated identical declarations keep the last copy, fallbacks with different values stay
+    declarations = [d for d in body.split(";") if d]
+    kept = []
+    seen = set()
+    for declaration in reversed(declarations):
+        if declaration not in seen:
+            seen.add(declaration)
+            kept.append(declaration)
+    return ";".join(reversed(kept))
+
+
+def dedupe_css(css):
+    """Drop exact duplicate top-level rules and repeated declarations from minified css."""
+    statements = []
+    for statement in _top_level_statements(css):
+        prelude, brace, body = statement.partition("{")
+        if brace and "{" not in body and ";" not in prelude.rstrip(";"):
+            statement = f"{prelude}{{{_dedupe_declarations(body[:-1])}}}"
+        statements.append(statement)
+
+    #A later identical rule wins anyway, so removing the earlier copy keeps the cascade
+    kept = []
+    seen = set()
+    for statement in reversed(statements):
+        if statement not in seen:
+            seen.add(statement)
+            kept.append(statement)
+    return "".join(reversed(kept))
+
+
+@lru_cache(maxsize=4)
+def _build_stylesheet(path, mtime):
+    with open(path) as f:
+        source = f.read()
+    css = dedupe_css(minify_css(externalize_data_uris(source)))
+    logger.info("%s: %d -> %d bytes", os.path.basename(path), len(source.encode("utf-8")), len(css.encode("utf-8")))
+    return css
+
+
+def stylesheet(path=CSS_PATH):
+    """Processed stylesheet text, rebuilt only when the source file changes."""
+    return _build_stylesheet(path, os.stat(path).st_mtime_ns)
+
+
+def inline_payload(asset, html):
+    """Count markup inlined into the page on this rerun and return it unchanged."""
+    count("county_asset_bytes_total", len(html.encode("utf-8")), asset=asset)
+    return html
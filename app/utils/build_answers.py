@@ -0,0 +1,82 @@
+import argparse
+import itertools
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms.answer_table import ANSWER_DEPTH, answer_key, get_answer_table, write_answers  # noqa: E402
+from algorithms.batch import read_profiles, score_profiles  # noqa: E402
+from utils.preferences import reachable_features  # noqa: E402
+
+# Offline fill of the answer table (app/algorithms/answer_table.py). Ranks the
+# ANSWER_DEPTH best counties for every features dict the preferences page can
+# produce, or for the most frequent profiles in a file of logged requests, with
+# the batch scorer, and rewrites the table with those answers plus everything
+# the app has already written back.
+#
+#   python app/utils/build_answers.py
+#   python app/utils/build_answers.py --profiles logged.jsonl --top 50000
+
+#Profiles ranked per pass, bounds the memory of one pass
+CHUNK_PROFILES = 1 << 16
+
+
+def logged_features(path, top=None):
+    """The distinct profiles in a CSV, JSON lines or Parquet file, most frequent first."""
+    _, feature_names, values = read_profiles(path)
+    distinct, counts = np.unique(values, axis=0, return_counts=True)
+    order = np.argsort(-counts, kind="stable")[:top]
+    for row in distinct[order]:
+        yield dict(zip(feature_names, row.tolist()))
+
+
+def rank_features(features_iter):
+    """(keys, ranked rows) for every features dict, scored in chunks."""
+    keys, ranked = [], []
+    while True:
+        chunk = list(itertools.islice(features_iter, CHUNK_PROFILES))
+        if not chunk:
+            break
+        feature_names = list(chunk[0])
+        profiles = np.array([list(features.values()) for features in chunk], dtype=np.float64)
+        keys.append(np.array([answer_key(features) for features in chunk], dtype=np.uint64))
+        for _, top_rows, _ in score_profiles(profiles, feature_names, ANSWER_DEPTH):
+            ranked.append(top_rows)
+    if not keys:
+        return np.empty(0, dtype=np.uint64), np.empty((0, ANSWER_DEPTH), dtype=np.intp)
+    return np.concatenate(keys), np.concatenate(ranked)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Precompute the answer table for the preferences page.")
+    parser.add_argument("--profiles", help="logged profiles (columns are feature names) instead of every reachable one")
+    parser.add_argument("--top", type=int, help="only the most frequent profiles of --profiles")
+    parser.add_argument("--limit", type=int, help="stop after this many preferences")
+    args = parser.parse_args(argv)
+
+    if args.profiles:
+        features_iter = logged_features(args.profiles, args.top)
+    else:
+        features_iter = reachable_features()
+    features_iter = itertools.islice(features_iter, args.limit)
+
+    start_time = time.perf_counter()
+    keys, ranked = rank_features(features_iter)
+    rank_time = time.perf_counter() - start_time
+
+    table = get_answer_table()
+    #Answers written back by the app stay, freshly ranked ones are inserted first
+    old_keys, old_rows = table.entries()
+    n_entries = write_answers(table.path, table.dtype, np.concatenate([keys, old_keys]),
+                              itertools.chain(ranked, old_rows))
+    print(f"Ranked {len(keys)} preferences in {rank_time:.1f} s; {table.path} holds {n_entries} answers "
+          f"({os.path.getsize(table.path) / 2**20:.0f} MB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,269 @@
+import argparse
+import os
+import struct
+import sys
+
+import numpy as np
+
+# Offline build step for app/data/county_geometry.npz, the vendored county
+# shapes used by the map page. Reads a Census cartographic boundary shapefile
+# (the cb_2016_us_county_500k files shipped in the plotly-geo package work),
+# quantizes coordinates to a fixed grid, splits rings into arcs shared between
+# neighbouring counties (TopoJSON style) and ranks every arc vertex with its
+# Douglas-Peucker tolerance so the loader can simplify at any level without
+# opening gaps between counties.
+#
+#   python app/utils/build_geometry.py path/to/cb_2016_us_county_500k.shp
+
+OUTPUT_PATH = os.path.join(os.path.dirname(__file__), "../data/county_geometry.npz")
+
+#Grid step in degrees, roughly 11 m
+QUANTUM = 1e-4
+#Vertices less important than this are dropped at build time
+MIN_TOLERANCE = 0.002
+
+
+def read_dbf(path):
+    with open(path, "rb") as f:
+        header = f.read(32)
+        n_records, header_len, record_len = struct.unpack("<IHH", header[4:12])
+        fields = []
+        while True:
+            desc = f.read(32)
+            if desc[0] == 0x0D:
+                break
+            name = desc[:11].split(b"\x00")[0].decode("ascii")
+            fields.append((name, desc[16]))
+        f.seek(header_len)
+        records = []
+        for _ in range(n_records):
+            raw = f.read(record_len)
+            pos = 1  #deletion flag
+            record = {}
+            for name, length in fields:
+                record[name] = raw[pos:pos + length].decode("utf-8", errors="replace").strip()
+                pos += length
+            records.append(record)
+    return records
+
+
+def read_polygons(path):
+    #Each record is a list of rings, every ring an (n, 2) float array
+    shapes = []
+    with open(path, "rb") as f:
+        f.seek(100)
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                break
+            _, length = struct.unpack(">ii", header)
+            content = f.read(length * 2)
+            shape_type = struct.unpack("<i", content[:4])[0]
+            if shape_type == 0:
+                shapes.append([])
+                continue
+            if shape_type != 5:
+                raise ValueError(f"Expected polygon shapes, found shape type {shape_type}")
+            n_parts, n_points = struct.unpack("<ii", content[36:44])
+            parts = np.frombuffer(content, dtype="<i4", count=n_parts, offset=44)
+            points = np.frombuffer(content, dtype="<f8", count=2 * n_points, offset=44 + 4 * n_parts)
+            points = points.reshape(-1, 2)
+            bounds = list(parts) + [n_points]
+            shapes.append([points[bounds[i]:bounds[i + 1]] for i in range(n_parts)])
+    return shapes
+
+
+def signed_area(ring):
+    x, y = ring[:, 0], ring[:, 1]
+    return 0.5 * float(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y))
+
+
+def quantize_ring(ring):
+    #Grid coordinates without the closing point or repeated vertices
+    q = np.round(ring / QUANTUM).astype(np.int64)
+    keep = np.ones(len(q), dtype=bool)
+    keep[1:] = (q[1:] != q[:-1]).any(axis=1)
+    q = q[keep]
+    if len(q) > 1 and (q[0] == q[-1]).all():
+        q = q[:-1]
+    return q
+
+
+def point_keys(q):
+    return (q[:, 0] + (1 << 31)) << 32 | (q[:, 1] + (1 << 31))
+
+
+def find_junctions(rings):
+    #A point is a junction when its neighbours differ between the rings that use it
+    points, lows, highs = [], [], []
+    for q in rings:
+        keys = point_keys(q)
+        prev_keys = np.roll(keys, 1)
+        next_keys = np.roll(keys, -1)
+        points.append(keys)
+        lows.append(np.minimum(prev_keys, next_keys))
+        highs.append(np.maximum(prev_keys, next_keys))
+    triples = np.unique(np.column_stack([np.concatenate(points), np.concatenate(lows), np.concatenate(highs)]), axis=0)
+    keys, counts = np.unique(triples[:, 0], return_counts=True)
+    return set(keys[counts > 1].tolist())
+
+
+def split_arcs(rings, junctions):
+    arcs = []
+    arc_index = {}
+    ring_refs = []
+
+    def add_arc(points):
+        key = tuple(points)
+        if key in arc_index:
+            return arc_index[key]
+        reverse_key = key[::-1]
+        if reverse_key in arc_index:
+            return ~arc_index[reverse_key]
+        arc_index[key] = len(arcs)
+        arcs.append(points)
+        return arc_index[key]
+
+    for q in rings:
+        keys = point_keys(q).tolist()
+        cuts = [i for i, key in enumerate(keys) if key in junctions]
+        if not cuts:
+            #A ring nobody else touches (or an exact shared hole), canonical start and direction
+            start = keys.index(min(keys))
+            ring = keys[start:] + keys[:start]
+            forward = ring + [ring[0]]
+            ring_refs.append([add_arc(forward)])
+            continue
+        ring = keys[cuts[0]:] + keys[:cuts[0]] + [keys[cuts[0]]]
+        offsets = [c - cuts[0] for c in cuts] + [len(keys)]
+        refs = []
+        for a, b in zip(offsets[:-1], offsets[1:]):
+            refs.append(add_arc(ring[a:b + 1]))
+        ring_refs.append(refs)
+    return arcs, ring_refs
+
+
+def decode_keys(keys):
+    keys = np.asarray(keys, dtype=np.int64)
+    x = (keys >> 32) - (1 << 31)
+    y = (keys & 0xFFFFFFFF) - (1 << 31)
+    return np.column_stack([x, y])
+
+
+def douglas_peucker_importance(points):
+    #Tolerance at which each vertex would be dropped, kept monotone so a vertex never
+    #outlives the vertex that split its segment. Endpoints are always kept.
+    n = len(points)
+    importance = np.zeros(n)
+    importance[0] = importance[-1] = np.inf
+    closed = n > 2 and (points[0] == points[-1]).all()
+    stack = []
+    if closed:
+        #Split a closed arc at its farthest point from the start so it stays a ring
+        far = int(np.argmax(np.hypot(*(points - points[0]).T)))
+        if 0 < far < n - 1:
+            importance[far] = np.inf
+            stack = [(0, far, np.inf), (far, n - 1, np.inf)]
+    else:
+        stack = [(0, n - 1, np.inf)]
+    while stack:
+        a, b, ceiling = stack.pop()
+        if b - a < 2:
+            continue
+        seg = points[b] - points[a]
+        rel = points[a + 1:b] - points[a]
+        length = np.hypot(*seg)
+        if length == 0:
+            dist = np.hypot(rel[:, 0], rel[:, 1])
+        else:
+            dist = np.abs(seg[0] * rel[:, 1] - seg[1] * rel[:, 0]) / length
+        i = int(np.argmax(dist))
+        mid = a + 1 + i
+        importance[mid] = min(dist[i], ceiling)
+        stack.append((a, mid, importance[mid]))
+        stack.append((mid, b, importance[mid]))
+    return importance
+
+
+def build(shp_path, output_path=OUTPUT_PATH, min_tolerance=MIN_TOLERANCE):
+    records = read_dbf(os.path.splitext(shp_path)[0] + ".dbf")
+    shapes = read_polygons(shp_path)
+
+    fips, names = [], []
+    rings, ring_is_hole, county_rings = [], [], []
+    for record, shape in zip(records, shapes):
+        own = []
+        for ring in shape:
+            q = quantize_ring(ring)
+            if len(q) < 3:
+                continue
+            own.append(len(rings))
+            rings.append(q)
+            #Shapefile outer rings are clockwise (negative signed area)
+            ring_is_hole.append(signed_area(ring) > 0)
+        if own:
+            fips.append(record.get("GEOID") or record["STATEFP"] + record["COUNTYFP"])
+            names.append(record.get("NAME", ""))
+            county_rings.append(own)
+
+    junctions = find_junctions(rings)
+    arcs, ring_refs = split_arcs(rings, junctions)
+
+    arc_offsets = [0]
+    arc_points, arc_importance = [], []
+    for arc in arcs:
+        q = decode_keys(arc)
+        importance = douglas_peucker_importance(q * QUANTUM)
+        keep = importance >= min_tolerance
+        q, importance = q[keep], importance[keep]
+        #Delta encoding keeps the compressed file small
+        deltas = np.diff(q, axis=0, prepend=np.zeros((1, 2), dtype=np.int64))
+        arc_points.append(deltas)
+        arc_importance.append(importance)
+        arc_offsets.append(arc_offsets[-1] + len(q))
+
+    #County -> polygons -> rings -> arcs, flattened into offset arrays
+    county_offsets, polygon_offsets, ring_offsets, ring_arcs = [0], [0], [0], []
+    for own in county_rings:
+        n_polygons = 0
+        for r in own:
+            if not ring_is_hole[r] or n_polygons == 0:
+                n_polygons += 1
+                polygon_offsets.append(polygon_offsets[-1])
+            ring_arcs.extend(ring_refs[r])
+            ring_offsets.append(len(ring_arcs))
+            polygon_offsets[-1] += 1
+        county_offsets.append(county_offsets[-1] + n_polygons)
+
+    np.savez_compressed(
+        output_path,
+        fips=np.array(fips, dtype="U5"),
+        names=np.array(names),
+        quantum=np.float64(QUANTUM),
+        min_tolerance=np.float64(min_tolerance),
+        arc_offsets=np.array(arc_offsets, dtype=np.int32),
+        arc_deltas=np.concatenate(arc_points).astype(np.int32),
+        arc_importance=np.concatenate(arc_importance).astype(np.float16),
+        county_offsets=np.array(county_offsets, dtype=np.int32),
+        polygon_offsets=np.array(polygon_offsets, dtype=np.int32),
+        ring_offsets=np.array(ring_offsets, dtype=np.int32),
+        ring_arcs=np.array(ring_arcs, dtype=np.int32),
+    )
+    return len(fips), len(arcs), arc_offsets[-1]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the vendored county geometry file.")
+    parser.add_argument("shapefile", help="Census county cartographic boundary .shp (with .dbf alongside)")
+    parser.add_argument("--output", default=OUTPUT_PATH)
+    parser.add_argument("--min-tolerance", type=float, default=MIN_TOLERANCE,
+                        help="drop vertices below this Douglas-Peucker tolerance, in degrees")
+    args = parser.parse_args(argv)
+
+    n_counties, n_arcs, n_points = build(args.shapefile, args.output, args.min_tolerance)
+    size = os.path.getsize(args.output)
+    print(f"{n_counties} counties, {n_arcs} arcs, {n_points} points -> {args.output} ({size / 1024:.0f} KB)")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+import queue
+import threading
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from algorithms.feature_store import get_feature_store
+from utils.geometry import DEFAULT_LEVEL, county_geojson
+
+# Static parts of the map page, built once per process: the county order by
+# FIPS, the choropleth trace carrying the geometry, and the rank-normalized
+# color arrays with tick labels for every fixed metric. A render only swaps
+# the color array on a prebuilt figure; the per-user Match Index column is the
+# only one normalized on demand.
+
+METRIC_MAPPING = {
+    'Match Index': 'DistanceToIdeal',
+    'Elderly Population': 'Age.Percent 65 and Older',
+    'Youth Population': 'Age.Percent Under 18 Years',
+    'Education Level': "Education.Bachelor's Degree or Higher",
+    'Income Level': 'Income.Median Household Income',
+    'Housing Ownership': 'Housing.Homeownership Rate',
+    'Population Density': 'Population.Population per Square Mile',
+}
+MATCH_INDEX = 'Match Index'
+
+Q_LEVELS = [0.05, 0.25, 0.5, 0.75, 0.95]
+
+#Prebuilt figures each hold their own copy of the geometry (~20 MB), so keep only a few
+MAX_FIGURES = 2
+
+#County outlines, the highlighted ones are the per-state best matches
+LINE_WIDTH = 0.2
+HIGHLIGHT_LINE_WIDTH = 2.5
+LINE_COLOR = 'white'
+HIGHLIGHT_LINE_COLOR = 'black'
+
+
+def format_tick(v):
+    try:
+        v = float(v)
+    except Exception:
+        return str(v)
+    if abs(v) >= 1000:
+        return f"{v:,.0f}"
+    if abs(v) >= 100:
+        return f"{v:.0f}"
+    if abs(v) >= 10:
+        return f"{v:.1f}"
+    return f"{v:.2f}"
+
+
+def rank_normalize(values):
+    #Quantile-based normalization: spreads colors evenly across values
+    values = pd.Series(values)
+    valid_count = values.notna().sum()
+    if valid_count == 0:
+        return np.full(len(values), np.nan)
+    return ((values.rank(method='average', na_option='keep') - 0.5) / float(valid_count)).to_numpy()
+
+
+def tick_text(values):
+    values = np.asarray(values, dtype=np.float64)
+    if np.isnan(values).all():
+        return [format_tick(np.nan) for _ in Q_LEVELS]
+    return [format_tick(v) for v in np.nanquantile(values, Q_LEVELS)]
+
+
+class ChoroplethBase:
+    def __init__(self, level=DEFAULT_LEVEL):
+        store = get_feature_store()
+        self.rows = np.flatnonzero(store.label_valid)
+        self.positions = np.full(store.n_rows, -1, dtype=np.intp)
+        self.positions[self.rows] = np.arange(len(self.rows))
+        self.fips = store.fips_codes(self.rows)
+        self.counties = store.county_labels(self.rows)
+        self.geojson = county_geojson(level)
+
+        #Raw values, normalized colors and tick labels for every fixed metric
+        self.metrics = {}
+        for label, column in METRIC_MAPPING.items():
+            if label == MATCH_INDEX:
+                continue
+            raw = store.matrix[self.rows, store.column_index[column]].astype(np.float64)
+            self.metrics[label] = (raw, rank_normalize(raw), tick_text(raw))
+
+        self._figures = queue.LifoQueue()
+        self._n_figures = 0
+        self._figures_lock = threading.Lock()
+
+    def metric(self, label, distances=None):
+        """(raw, normalized, ticktext) for a metric, in FIPS order."""
+        if label != MATCH_INDEX:
+            return self.metrics[label]
+        if distances is None:
+            raw = np.full(len(self.rows), np.nan)
+        else:
+            raw = np.asarray(distances, dtype=np.float64)[self.rows]
+        return raw, rank_normalize(raw), tick_text(raw)
+
+    def _new_figure(self):
+        fig = go.Figure(go.Choropleth(
+            geojson=self.geojson,
+            locations=self.fips,
+            z=np.zeros(len(self.fips)),
+            zmin=0,
+            zmax=1,
+            hovertext=self.counties,
+            marker_line_width=LINE_WIDTH,
+        ))
+        fig.update_layout(
+            geo=dict(scope="usa"),
+            margin={"r":0,"t":0,"l":0,"b":0},
+        )
+        return fig
+
+    def outlines(self, highlight=None):
+        """(widths, colors) of the county outlines, in FIPS order, highlighting the given feature store rows."""
+        if not highlight:
+            return LINE_WIDTH, LINE_COLOR
+        positions = self.positions[np.asarray(highlight, dtype=np.intp)]
+        positions = positions[positions >= 0]
+        widths = np.full(len(self.rows), LINE_WIDTH)
+        widths[positions] = HIGHLIGHT_LINE_WIDTH
+        colors = np.full(len(self.rows), LINE_COLOR, dtype=object)
+        colors[positions] = HIGHLIGHT_LINE_COLOR
+        return widths, colors
+
+    @contextmanager
+    def figure(self, label, distances=None, highlight=None):
+        """Borrow a prebuilt figure colored for one metric; render it inside the with block."""
+        raw, norm, ticktext = self.metric(label, distances)
+        line_width, line_color = self.outlines(highlight)
+        try:
+            fig = self._figures.get_nowait()
+        except queue.Empty:
+            with self._figures_lock:
+                grow = self._n_figures < MAX_FIGURES
+                if grow:
+                    self._n_figures += 1
+            fig = self._new_figure() if grow else self._figures.get()
+
+        # Color scale: for Match Index lower is better -> green
+        color_scale = "RdYlGn_r" if label == MATCH_INDEX else "RdYlGn"
+        fig.update_traces(
+            z=norm,
+            customdata=raw,
+            colorscale=color_scale,
+            hovertemplate=f"<b>%{{hovertext}}</b><br>{label}=%{{customdata:.3f}}<extra></extra>",
+            colorbar=dict(title=label, tickvals=Q_LEVELS, ticktext=ticktext),
+            marker_line_width=line_width,
+            marker_line_color=line_color,
+        )
+        try:
+            yield fig
+        finally:
+            self._figures.put(fig)
+
+
+_base = None
+_base_lock = threading.Lock()
+
+
+def get_choropleth_base():
+    global _base
+    if _base is None:
+        with _base_lock:
+            if _base is None:
+                _base = ChoroplethBase()
+    return _base
@@ -0,0 +1,130 @@
+import os
+import threading
+from functools import lru_cache
+
+import numpy as np
+
+# Vendored US county shapes for the map page, so rendering never depends on
+# downloading plotly's geojson-counties-fips.json. The file is produced by
+# build_geometry.py: quantized, delta-encoded arcs shared between neighbouring
+# counties, each vertex tagged with the Douglas-Peucker tolerance at which it
+# can be dropped. Decoding at a tolerance gives a consistent simplification.
+
+GEOMETRY_PATH = os.path.join(os.path.dirname(__file__), "../data/county_geometry.npz")
+
+#Tolerance in degrees for each named level, higher means a smaller payload
+SIMPLIFICATION_LEVELS = {
+    "full": 0.0,
+    "high": 0.005,
+    "medium": 0.01,
+    "low": 0.03,
+}
+DEFAULT_LEVEL = os.environ.get("COUNTY_GEOMETRY_LEVEL", "medium")
+
+
+class CountyGeometry:
+    def __init__(self, path=GEOMETRY_PATH):
+        with np.load(path) as data:
+            self.fips = data["fips"]
+            self.names = data["names"]
+            quantum = float(data["quantum"])
+            arc_offsets = data["arc_offsets"]
+            points = np.cumsum(data["arc_deltas"].astype(np.int64), axis=0)
+            self.arc_importance = data["arc_importance"].astype(np.float64)
+            self.county_offsets = data["county_offsets"]
+            self.polygon_offsets = data["polygon_offsets"]
+            self.ring_offsets = data["ring_offsets"]
+            self.ring_arcs = data["ring_arcs"]
+
+        #Deltas restart at every arc, so subtract the running sum carried in from earlier arcs
+        carried = np.zeros((len(arc_offsets) - 1, 2), dtype=np.int64)
+        carried[1:] = points[arc_offsets[1:-1] - 1]
+        points -= np.repeat(carried, np.diff(arc_offsets), axis=0)
+        self.arc_points = points * quantum
+        self.arc_offsets = arc_offsets
+        self.index = {code: i for i, code in enumerate(self.fips.tolist())}
+
+    def arcs(self, tolerance):
+        #Arc coordinate lists with every vertex below the tolerance removed
+        keep = self.arc_importance >= tolerance
+        coords = np.round(self.arc_points, 4)
+        arcs = []
+        for a, b in zip(self.arc_offsets[:-1].tolist(), self.arc_offsets[1:].tolist()):
+            arcs.append(coords[a:b][keep[a:b]].tolist())
+        return arcs
+
+    def _ring(self, arcs, r):
+        ring = []
+        for ref in self.ring_arcs[self.ring_offsets[r]:self.ring_offsets[r + 1]].tolist():
+            points = arcs[ref] if ref >= 0 else arcs[~ref][::-1]
+            #Consecutive arcs share their junction point
+            ring.extend(points[1:] if ring else points)
+        return ring
+
+    def county_polygons(self, i, arcs):
+        polygons = []
+        for p in range(self.county_offsets[i], self.county_offsets[i + 1]):
+            rings = []
+            for r in range(self.polygon_offsets[p], self.polygon_offsets[p + 1]):
+                ring = self._ring(arcs, r)
+                if len(ring) >= 4:
+                    rings.append(ring)
+                elif not rings:
+                    #Outer ring collapsed, its holes go with it
+                    break
+            if rings:
+                polygons.append(rings)
+        return polygons
+
+    def geojson(self, tolerance):
+        arcs = self.arcs(tolerance)
+        full_arcs = None
+        features = []
+        for i, code in enumerate(self.fips.tolist()):
+            polygons = self.county_polygons(i, arcs)
+            if not polygons:
+                #Tiny counties can vanish at coarse levels, keep them at full detail
+                full_arcs = full_arcs or self.arcs(0.0)
+                polygons = self.county_polygons(i, full_arcs)
+            features.append({
+                "type": "Feature",
+                "id": code,
+                "properties": {"NAME": str(self.names[i])},
+                "geometry": {"type": "MultiPolygon", "coordinates": polygons},
+            })
+        return {"type": "FeatureCollection", "features": features}
+
+
+_geometry = None
+_geometry_lock = threading.Lock()
+
+
+def get_county_geometry():
+    global _geometry
+    if _geometry is None:
+        with _geometry_lock:
+            if _geometry is None:
+                _geometry = CountyGeometry()
+    return _geometry
+
+
+def _tolerance(level):
+    if isinstance(level, str):
+        if level not in SIMPLIFICATION_LEVELS:
+            raise ValueError(f"Unknown simplification level {level!r}, expected one of {list(SIMPLIFICATION_LEVELS)}")
+        return SIMPLIFICATION_LEVELS[level]
+    return float(level)
+
+
+@lru_cache(maxsize=4)
+def county_geojson(level=DEFAULT_LEVEL):
+    """FeatureCollection of every county keyed by 5-digit FIPS id, built once per level."""
+    return get_county_geometry().geojson(_tolerance(level))
+
+
+def county_feature(fips, level=DEFAULT_LEVEL):
+    """Single county Feature by 5-digit FIPS code, or None if it is not in the file."""
+    i = get_county_geometry().index.get(fips)
+    if i is None:
+        return None
+    return county_geojson(level)["features"][i]
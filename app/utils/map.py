@@ -1,16 +1,18 @@
-from urllib.request import urlopen
-import json
-import pandas as pd
-from urllib.request import urlopen
+import os
+import sys
 
-# so it know what fips code is for each county
-with urlopen('https://raw.githubusercontent.com/plotly/datasets/master/geojson-counties-fips.json') as response:
-    counties = json.load(response)
+import plotly.express as px
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# fips codes
-df = pd.read_csv('app/data/county_demographics.csv', dtype={"fips": str})
+from algorithms.feature_store import get_feature_store  # noqa: E402
+from geometry import county_geojson  # noqa: E402
+
+# so it know what fips code is for each county
+counties = county_geojson()
 
-df['fips'] = df['fips'].astype(str).str.zfill(5)
+# fips codes are already five-digit strings in the built dataset
+df = get_feature_store().frame()
 
 fig = px.choropleth(df, geojson=counties, locations='fips', color='Age.Percent 65 and Older',
                            color_continuous_scale="PiYG",
@@ -19,4 +21,4 @@ fig = px.choropleth(df, geojson=counties, locations='fips', color='Age.Percent 6
                            labels={'Age.Percent 65 and Older':'Percent 65 and Older'}
                           )
 fig.update_layout(margin={"r":0,"t":0,"l":0,"b":0})
-fig.show()
\ No newline at end of file
+fig.show()
@@ -0,0 +1,173 @@
+import itertools
+
+# Mapping from the preferences page inputs to the features dict the
+# algorithms score against. Keys are always inserted in the same order, so a
+# session's features dict (and every cache keyed by its column order) has the
+# order of FEATURE_NAMES. Every input is discrete, so reachable_features can
+# enumerate every features dict the page can produce (see build_answers.py).
+
+
+def build_features(age_preference, education_preference, demographic_preference,
+                   houseownership_preference, income_value, population_preference, storeowner):
+    """Features dict for one set of answers; storeowner is the page's {label: checked} dict."""
+    features = {}
+
+    # average age
+    if age_preference >= 60:
+        features["Age.Percent 65 and Older"] = 0.6
+        features["Age.Percent Under 18 Years"] = 0.3
+        features["Age.Percent Under 5 Years"] = 0.1
+    else:
+        features["Age.Percent 65 and Older"] = 0.3
+        features["Age.Percent Under 18 Years"] = 0.6
+        features["Age.Percent Under 5 Years"] = 0.1
+
+    # education
+    features["Education.Bachelor's Degree or Higher"] = education_preference / 10.0
+    features["Education.High School or Higher"] = 1 - (education_preference / 10.0)
+
+    # preferred demographics
+    if len(demographic_preference) != 0:
+        demographic_percentage = 1.0 / len(demographic_preference)
+
+    features["Miscellaneous.Foreign Born"] = 0.0
+    features["Miscellaneous.Language Other than English at Home"] = 0.0
+    features["Ethnicities.American Indian and Alaska Native Alone"] = 0.0
+    features["Ethnicities.Asian Alone"] = 0.0
+    features["Ethnicities.Black Alone"] = 0.0
+    features['Ethnicities.Hispanic or Latino'] = 0.0
+    features['Ethnicities.Native Hawaiian and Other Pacific Islander Alone'] = 0.0
+    features['Ethnicities.White Alone'] = 0.0
+    features['Miscellaneous.Percent Female'] = 0.0
+    features['Miscellaneous.Veterans'] = 0.0
+    features['Ethnicities.Two or More Races'] = 0.0
+    features['Ethnicities.White Alone not Hispanic or Latino'] = 0.0
+
+    if 'native' in demographic_preference:
+        features["Ethnicities.American Indian and Alaska Native Alone"] = demographic_percentage
+    if 'asian' in demographic_preference:
+        features["Ethnicities.Asian Alone"] = demographic_percentage
+        features["Miscellaneous.Foreign Born"] = 0.3
+        features["Miscellaneous.Language Other than English at Home"] = 0.3
+    if 'black' in demographic_preference:
+        features["Ethnicities.Black Alone"] = demographic_percentage
+        features["Miscellaneous.Foreign Born"] = 0.3  
+    if 'hispanic' in demographic_preference:
+        features["Ethnicities.Hispanic or Latino"] = demographic_percentage
+        features["Miscellaneous.Foreign Born"] = 0.3
+        features["Miscellaneous.Language Other than English at Home"] = 0.3
+    if 'pacific' in demographic_preference:
+        features["Ethnicities.Native Hawaiian and Other Pacific Islander Alone"] = demographic_percentage
+        features["Miscellaneous.Foreign Born"] = 0.3
+        features["Miscellaneous.Language Other than English at Home"] = 0.3
+    if 'white' in demographic_preference:
+        features["Ethnicities.White Alone"] = demographic_percentage
+    if 'female' in demographic_preference:
+        features["Miscellaneous.Percent Female"] = demographic_percentage
+    if 'veteran' in demographic_preference:
+        features["Miscellaneous.Veterans"] = demographic_percentage
+    if len(demographic_preference) > 1: 
+        features['Ethnicities.Two or More Races'] = 1.0
+    if 'white' in demographic_preference and "hispanic" not in demographic_preference:
+        features['Ethnicities.White Alone not Hispanic or Latino'] = 1.0
+
+    # house ownership
+    if houseownership_preference >= 6:
+        features["Housing.Homeownership Rate"] = 1.0
+        features["Housing.Households"] = 1.0
+        features["Housing.Housing Units"] = 1.0
+        features["Miscellaneous.Living in Same House +1 Years"] = 1.0
+    else:
+        features["Housing.Homeownership Rate"] = 0.0
+        features["Housing.Households"] = 1.0
+        features["Housing.Housing Units"] = 1.0
+        features["Miscellaneous.Living in Same House +1 Years"] = 0.0
+
+    # average income
+    income_percentage = income_value / 300
+    features["Housing.Median Value of Owner-Occupied Units"] = income_percentage
+    features["Income.Median Household Income"] = income_percentage
+    features["Income.Per Capita Income"] = income_percentage
+
+    # urban vs rural
+    features['Population.Population per Square Mile'] = population_preference / 10
+    features['Sales.Accommodation and Food Services Sales'] = population_preference / 10
+    features['Sales.Retail Sales'] = population_preference / 10
+    features['Miscellaneous.Manufacturers Shipments'] = population_preference / 10
+    features['Miscellaneous.Mean Travel Time to Work'] = population_preference / 10
+    features['Employment.Firms.Total'] = population_preference / 10
+
+    # storeowner demographics
+    features['Employment.Firms.Women-Owned'] = 0.0
+    features['Employment.Firms.Men-Owned'] = 0.0
+    features['Employment.Firms.Minority-Owned'] = 0.0
+    features['Employment.Firms.Nonminority-Owned'] = 1.0
+    features['Employment.Firms.Veteran-Owned'] = 0.0
+    features['Employment.Firms.Nonveteran-Owned'] = 1.0
+
+    if 'women owner' in storeowner:
+        features['Employment.Firms.Women-Owned'] = 1.0
+    if 'men owner' in storeowner:
+        features['Employment.Firms.Men-Owned'] = 1.0
+    if 'minority owner' in storeowner:
+        features['Employment.Firms.Minority-Owned'] = 1.0
+        features['Employment.Firms.Nonminority-Owned'] = 0.0
+    if 'veteran owner' in storeowner:
+       features['Employment.Firms.Veteran-Owned'] = 1.0
+       features['Employment.Firms.Nonveteran-Owned'] = 0.0
+
+    return features
+
+
+#Column order of every features dict the page builds
+FEATURE_NAMES = tuple(build_features(50, 5, [], 5, 175, 5, {}))
+
+#Checkbox keys of the demographics and storeowner sections of the page
+DEMOGRAPHICS = ('native', 'asian', 'black', 'hispanic', 'pacific', 'white', 'female', 'veteran')
+STOREOWNERS = ('woman owner', 'men owner', 'minority owner', 'veteran owner')
+
+#Choices the preferences page offers for each build_features argument, keep in step with show_preferences_page
+PAGE_CHOICES = {
+    "age_preference": tuple(range(10, 101, 10)),
+    "education_preference": tuple(range(1, 11)),
+    "demographic_preference": tuple(
+        [name for name, checked in zip(DEMOGRAPHICS, mask) if checked]
+        for mask in itertools.product((False, True), repeat=len(DEMOGRAPHICS))
+    ),
+    "houseownership_preference": tuple(range(1, 11)),
+    "income_value": tuple(range(25, 300, 25)) + (400,),
+    "population_preference": tuple(range(1, 11)),
+    "storeowner": tuple(
+        dict(zip(STOREOWNERS, mask)) for mask in itertools.product((False, True), repeat=len(STOREOWNERS))
+    ),
+}
+
+DEFAULT_ANSWERS = {
+    "age_preference": 50,
+    "education_preference": 5,
+    "demographic_preference": [],
+    "houseownership_preference": 5,
+    "income_value": 175,
+    "population_preference": 5,
+    "storeowner": {},
+}
+
+
+def preference_space():
+    """{argument: choices} with choices that build the same features dropped, e.g. ages only split at 60."""
+    #Each argument sets its own feature keys, so choices can be told apart one argument at a time
+    space = {}
+    for name, choices in PAGE_CHOICES.items():
+        distinct = {}
+        for choice in choices:
+            features = build_features(**{**DEFAULT_ANSWERS, name: choice})
+            distinct.setdefault(tuple(features.values()), choice)
+        space[name] = list(distinct.values())
+    return space
+
+
+def reachable_features():
+    """Yield every distinct features dict the preferences page can produce, each once."""
+    space = preference_space()
+    for answers in itertools.product(*space.values()):
+        yield build_features(**dict(zip(space, answers)))
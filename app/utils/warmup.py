@@ -0,0 +1,103 @@
+import logging
+import threading
+import time
+
+from algorithms.instrumentation import current_trace, span, traced
+from utils.preferences import FEATURE_NAMES
+
+# Background warm-up for a fresh server process. The first script run starts
+# one daemon thread that pays for the heavy imports, the feature store, the
+# filter index, the normalized matrix and kNN graph for the preferences page's
+# column set, the map geometry and the match worker processes, while the home
+# page (which needs none of them) renders.
+# Cold start is the warm-up's own duration; first-match latency is reported
+# separately by instrumentation.first_request_times().
+
+logger = logging.getLogger(__name__)
+
+
+class WarmUp:
+    def __init__(self):
+        self.thread = None
+        self.started = None
+        self.finished = None
+        self.timings = []
+        self.error = None
+
+    @property
+    def done(self):
+        return self.finished is not None
+
+    @property
+    def cold_start(self):
+        """Seconds from warm-up start to everything loaded, None while running."""
+        return self.finished - self.started if self.done else None
+
+    def wait(self, timeout=None):
+        if self.thread is not None:
+            self.thread.join(timeout)
+        return self.done
+
+
+@traced("warmup")
+def warm_up():
+    """Load everything the first match and the first map render would otherwise pay for."""
+    with span("imports"):
+        import sklearn.neighbors  # noqa: F401
+        import plotly.graph_objects  # noqa: F401
+        import algorithms.dijkstra  # noqa: F401
+        import algorithms.bellman_ford  # noqa: F401
+        from algorithms.feature_store import get_feature_store
+        from algorithms.filters import get_filter_index
+        from algorithms.jobs import get_match_pool
+        from algorithms.knn_cache import county_knn
+        from utils.choropleth import get_choropleth_base
+        from utils.geometry import county_geojson
+
+    with span("load"):
+        store = get_feature_store()
+    with span("normalize"):
+        store.normalized(list(FEATURE_NAMES))
+    with span("filters"):
+        get_filter_index()
+    with span("knn"):
+        county_knn(list(FEATURE_NAMES))
+    with span("geometry"):
+        county_geojson()
+    with span("choropleth"):
+        get_choropleth_base()
+    with span("workers"):
+        get_match_pool().warm()
+
+    trace = current_trace()
+    return list(trace.spans) if trace is not None else []
+
+
+_warmup = WarmUp()
+_warmup_lock = threading.Lock()
+
+
+def _run():
+    try:
+        _warmup.timings = warm_up()
+    except Exception as e:
+        #Requests load whatever is missing on demand, the warm-up is only a head start
+        _warmup.error = e
+        logger.exception("Warm-up failed")
+    finally:
+        _warmup.finished = time.perf_counter()
+    logger.info("Warm-up finished in %.2f s", _warmup.cold_start)
+
+
+def start_warmup():
+    """Start the warm-up thread on the first call in this process; later calls just return it."""
+    with _warmup_lock:
+        if _warmup.thread is None:
+            _warmup.started = time.perf_counter()
+            _warmup.thread = threading.Thread(target=_run, name="county-warmup", daemon=True)
+            _warmup.thread.start()
+    return _warmup
+
+
+def get_warmup():
+    return _warmup
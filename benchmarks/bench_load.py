@@ -0,0 +1,434 @@
+import argparse
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from datetime import datetime, timezone
+
+import numpy as np
+
+# Load test for the Streamlit app. Starts a local `streamlit run` server (or
+# uses --url) and drives --sessions concurrent users through home ->
+# preferences -> results -> map over the same websocket protocol the browser
+# uses: every journey is a fresh session that sets random preferences and
+# filters, runs one algorithm and opens the map. Records the latency of each
+# script rerun from request to script_finished, per page, plus the overall
+# throughput, and appends one JSON line per run to
+# benchmarks/results/load_history.jsonl so releases can be compared.
+#
+# AppTest is not used: every AppTest run shares one session id and swaps a
+# process-wide runtime, so concurrent AppTests would cancel each other's jobs.
+#
+#   python benchmarks/bench_load.py --sessions 8 --journeys 5
+#   python benchmarks/bench_load.py --compare
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+APP_PATH = os.path.join(ROOT, "app", "streamlit_app.py")
+HISTORY_PATH = os.path.join(ROOT, "benchmarks", "results", "load_history.jsonl")
+
+#Steps of one journey, the match step is the results page rerun that runs the algorithm
+STEPS = ("home", "preferences", "results", "match", "map")
+
+ALGORITHM_BUTTONS = {
+    "dijkstra": "Run Dijkstra",
+    "bellman_ford": "Run Bellman-Ford",
+    "compare": "Compare all algorithms",
+}
+
+#Labels of the preferences page's filter widgets, only set for --filter-rate of journeys
+STATES_LABEL = "Only in these states (leave empty for all states)"
+FILTER_SLIDERS = ("Minimum population", "Population density (people per square mile)")
+
+PERCENTILES = (50, 95, 99)
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class LocalServer:
+    """`streamlit run` of the app on a free local port, stopped on exit."""
+
+    def __init__(self, log_path, timeout=60):
+        self.port = free_port()
+        self.log_path = log_path
+        self.timeout = timeout
+        self.process = None
+
+    def __enter__(self):
+        command = [
+            sys.executable, "-m", "streamlit", "run", APP_PATH,
+            "--server.headless", "true",
+            "--server.address", "127.0.0.1",
+            "--server.port", str(self.port),
+            "--server.fileWatcherType", "none",
+            "--browser.gatherUsageStats", "false",
+        ]
+        #Run from the repository root so .streamlit/config.toml applies, as the README says
+        with open(self.log_path, "wb") as log:
+            self.process = subprocess.Popen(command, cwd=ROOT, stdout=log, stderr=subprocess.STDOUT)
+        deadline = time.monotonic() + self.timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"streamlit exited with code {self.process.returncode}, see {self.log_path}")
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{self.port}/_stcore/health", timeout=1) as r:
+                    if r.status == 200:
+                        return self
+            except OSError:
+                time.sleep(0.2)
+        self.__exit__(None, None, None)
+        raise RuntimeError(f"streamlit did not become healthy within {self.timeout} s, see {self.log_path}")
+
+    def __exit__(self, *exc):
+        if self.process is not None and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+
+    @property
+    def url(self):
+        return f"ws://127.0.0.1:{self.port}"
+
+    def rss_mb(self):
+        #Resident memory of the server process, None where /proc is missing
+        try:
+            with open(f"/proc/{self.process.pid}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        return int(line.split()[1]) / 1024
+        except OSError:
+            pass
+        return None
+
+
+class RunResult:
+    """Elements of one script run: widgets by label, error and exception texts."""
+
+    def __init__(self):
+        self.widgets = {}
+        self.errors = []
+        self.warnings = []
+
+    def add_element(self, element):
+        kind = element.WhichOneof("type")
+        proto = getattr(element, kind)
+        if kind == "exception":
+            self.errors.append(f"{proto.type}: {proto.message}")
+        elif kind == "alert":
+            if proto.format == proto.Format.ERROR:
+                self.errors.append(proto.body)
+            elif proto.format == proto.Format.WARNING:
+                self.warnings.append(proto.body)
+        elif hasattr(proto, "id") and hasattr(proto, "label") and proto.id:
+            self.widgets[proto.label] = (kind, proto)
+
+    def button(self, label):
+        widget = self.widgets.get(label)
+        return widget[1] if widget is not None and widget[0] == "button" else None
+
+
+class Session:
+    """One browser session on the app's websocket, reruns the script like the frontend does."""
+
+    def __init__(self, ws, timeout):
+        self.ws = ws
+        self.timeout = timeout
+        self.page_script_hash = ""
+        self.values = {}
+        self.last = RunResult()
+
+    def rerun(self, trigger=None):
+        """Rerun the script with the widget values set so far (and trigger clicked); returns (seconds, RunResult)."""
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        message = BackMsg()
+        state = message.rerun_script
+        state.page_script_hash = self.page_script_hash
+        current_ids = {proto.id for _, proto in self.last.widgets.values()}
+        for widget_id, widget_state in self.values.items():
+            if widget_id in current_ids:
+                state.widget_states.widgets.append(widget_state)
+        if trigger is not None:
+            clicked = WidgetState(id=trigger.id, trigger_value=True)
+            state.widget_states.widgets.append(clicked)
+
+        result = RunResult()
+        start = time.perf_counter()
+        self.ws.send(message.SerializeToString())
+        while True:
+            msg = ForwardMsg()
+            msg.ParseFromString(self.ws.recv(timeout=self.timeout))
+            kind = msg.WhichOneof("type")
+            if kind == "new_session":
+                self.page_script_hash = msg.new_session.page_script_hash
+            elif kind == "delta" and msg.delta.WhichOneof("type") == "new_element":
+                result.add_element(msg.delta.new_element)
+            elif kind == "script_finished":
+                if msg.script_finished == ForwardMsg.ScriptFinishedStatus.FINISHED_EARLY_FOR_RERUN:
+                    continue
+                break
+        seconds = time.perf_counter() - start
+
+        #Widgets that are gone (another page) lose their values, as in the browser
+        self.values = {i: s for i, s in self.values.items() if i in {p.id for _, p in result.widgets.values()}}
+        self.last = result
+        return seconds, result
+
+    def set_value(self, label, **value):
+        """Set a widget of the last run by label, value is one WidgetState field (bool_value=True, ...)."""
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        widget = self.last.widgets.get(label)
+        if widget is None:
+            return False
+        (field, data), = value.items()
+        state = WidgetState(id=widget[1].id)
+        if field == "string_array_value":
+            state.string_array_value.data[:] = data
+        else:
+            setattr(state, field, data)
+        self.values[state.id] = state
+        return True
+
+
+def random_preferences(session, rng, filter_rate):
+    """Set every preference widget on the preferences page to a random value."""
+    for label, (kind, proto) in list(session.last.widgets.items()):
+        if kind == "checkbox":
+            session.set_value(label, bool_value=rng.random() < 0.3)
+        elif kind == "slider" and proto.type == proto.Type.SELECT_SLIDER and label not in FILTER_SLIDERS:
+            session.set_value(label, string_array_value=[rng.choice(list(proto.options))])
+
+    if rng.random() >= filter_rate:
+        return
+    states = session.last.widgets.get(STATES_LABEL)
+    if states is not None:
+        options = list(states[1].options)
+        session.set_value(STATES_LABEL, string_array_value=rng.sample(options, rng.randint(1, 5)))
+    population = session.last.widgets.get(FILTER_SLIDERS[0])
+    if population is not None:
+        options = list(population[1].options)
+        session.set_value(FILTER_SLIDERS[0], string_array_value=[rng.choice(options[:4])])
+
+
+def journey(url, rng, algorithms, filter_rate, timeout, record):
+    """One user from the home page to the map; record(step, seconds, errors). Returns True if it reached the map."""
+    from websockets.sync.client import connect
+
+    #No Origin header, like a same-host client; the server picks the session id
+    with connect(f"{url}/_stcore/stream", subprotocols=["streamlit"], max_size=None, open_timeout=timeout) as ws:
+        session = Session(ws, timeout)
+
+        def step(name, trigger=None):
+            seconds, result = session.rerun(trigger)
+            record(name, seconds, result.errors)
+            return result
+
+        home = step("home")
+        start_button = home.button("Find Your Match")
+        if start_button is None:
+            return False
+        preferences = step("preferences", start_button)
+        if preferences.button("See Your Results") is None:
+            return False
+        random_preferences(session, rng, filter_rate)
+        preferences = step("preferences")
+        results = step("results", preferences.button("See Your Results"))
+
+        algorithm = rng.choice(algorithms)
+        run_button = results.button(ALGORITHM_BUTTONS[algorithm])
+        if run_button is None:
+            return False
+        matched = step("match", run_button)
+        map_button = matched.button("View Map")
+        if map_button is None:
+            #A comparison or a filter that kept no county has no map link
+            return algorithm == "compare" or bool(matched.warnings)
+        step("map", map_button)
+        return True
+
+
+def run_load(url, n_sessions, n_journeys, algorithms, filter_rate, timeout, seed):
+    """Drive n_sessions concurrent users through n_journeys journeys each; returns (samples, journeys, failures, seconds)."""
+    samples = {step: [] for step in STEPS}
+    errors = {step: 0 for step in STEPS}
+    failures = []
+    completed = [0]
+    lock = threading.Lock()
+
+    def record(step, seconds, step_errors):
+        with lock:
+            samples[step].append(seconds)
+            errors[step] += bool(step_errors)
+            for message in step_errors[:1]:
+                failures.append(f"{step}: {message.splitlines()[0] if message else message}")
+
+    def user(index):
+        rng = random.Random(seed * 100003 + index)
+        for _ in range(n_journeys):
+            try:
+                ok = journey(url, rng, algorithms, filter_rate, timeout, record)
+            except Exception as e:
+                ok = False
+                with lock:
+                    failures.append(f"{type(e).__name__}: {e}")
+            if ok:
+                with lock:
+                    completed[0] += 1
+
+    threads = [threading.Thread(target=user, args=(i,), daemon=True) for i in range(n_sessions)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return samples, errors, completed[0], failures, time.perf_counter() - start
+
+
+def summarize(samples, errors):
+    pages = {}
+    for step in STEPS:
+        values = np.array(samples[step])
+        if not len(values):
+            continue
+        pages[step] = {
+            "count": len(values),
+            "errors": errors[step],
+            "mean": float(values.mean()),
+            "max": float(values.max()),
+            **{f"p{p}": float(np.percentile(values, p)) for p in PERCENTILES},
+        }
+    return pages
+
+
+def load_history(path=HISTORY_PATH):
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def compare(history):
+    #Latest run against the run before it with the same number of sessions
+    if not history:
+        return
+    after = history[-1]
+    before = next((r for r in reversed(history[:-1]) if r["sessions"] == after["sessions"]), None)
+    if before is None:
+        print(f"No earlier run with {after['sessions']} sessions to compare against")
+        return
+    print(f"{after['sessions']} sessions: {before['commit']} -> {after['commit']}")
+    for step, stats in after["pages"].items():
+        old = before["pages"].get(step)
+        if not old:
+            continue
+        change = (stats["p95"] - old["p95"]) / old["p95"] * 100
+        flag = "  <-- slower" if change > 20 else ""
+        print(f"  {step:12s} p95 {old['p95'] * 1000:9.1f} ms -> {stats['p95'] * 1000:9.1f} ms  {change:+6.1f}%{flag}")
+    print(f"  {'throughput':12s}     {before['journeys_per_second']:9.2f}    -> "
+          f"{after['journeys_per_second']:9.2f}    journeys/s")
+
+
+def print_report(record):
+    print(f"{record['sessions']} concurrent sessions, {record['journeys']} journeys "
+          f"({record['completed']} completed) in {record['seconds']:.1f} s")
+    print(f"{'page':<14}{'count':>7}{'errors':>8}" + "".join(f"{f'p{p} ms':>11}" for p in PERCENTILES)
+          + f"{'max ms':>11}")
+    for step, stats in record["pages"].items():
+        print(f"{step:<14}{stats['count']:>7}{stats['errors']:>8}"
+              + "".join(f"{stats[f'p{p}'] * 1000:>11.1f}" for p in PERCENTILES) + f"{stats['max'] * 1000:>11.1f}")
+    print(f"Throughput: {record['journeys_per_second']:.2f} journeys/s, {record['reruns_per_second']:.1f} reruns/s")
+    if record["server_rss_mb"] is not None:
+        print(f"Server RSS after the run: {record['server_rss_mb']:.0f} MB")
+    for failure in record["failures"][:10]:
+        print(f"  failed: {failure}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Drive concurrent sessions through the app and report latencies.")
+    parser.add_argument("--sessions", type=int, default=8, help="concurrent users")
+    parser.add_argument("--journeys", type=int, default=5, help="home-to-map journeys per user, each a new session")
+    parser.add_argument("--algorithms", nargs="+", choices=list(ALGORITHM_BUTTONS), default=["dijkstra", "bellman_ford"],
+                        help="algorithms picked at random on the results page")
+    parser.add_argument("--filter-rate", type=float, default=0.2, help="share of journeys that also set filters")
+    parser.add_argument("--warmup", type=int, default=1, help="unmeasured journeys run first, to exclude the cold start")
+    parser.add_argument("--url", help="websocket base of an already running local server, e.g. ws://127.0.0.1:8501")
+    parser.add_argument("--timeout", type=float, default=120, help="seconds to wait for one rerun")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--history", default=HISTORY_PATH, help="JSON lines file the report is appended to")
+    parser.add_argument("--no-record", action="store_true", help="print the report without appending to history")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    parser.add_argument("--compare", action="store_true", help="compare the last recorded run with the one before")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(load_history(args.history))
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        server = None
+        if args.url is None:
+            server = LocalServer(os.path.join(tmp_dir, "streamlit.log")).__enter__()
+        try:
+            url = args.url or server.url
+            if args.warmup:
+                run_load(url, 1, args.warmup, args.algorithms, args.filter_rate, args.timeout, seed=-1)
+            samples, errors, completed, failures, seconds = run_load(
+                url, args.sessions, args.journeys, args.algorithms, args.filter_rate, args.timeout, args.seed)
+            server_rss = server.rss_mb() if server is not None else None
+        finally:
+            if server is not None:
+                server.__exit__(None, None, None)
+
+    n_journeys = args.sessions * args.journeys
+    record = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "sessions": args.sessions,
+        "journeys": n_journeys,
+        "completed": completed,
+        "algorithms": args.algorithms,
+        "seconds": seconds,
+        "journeys_per_second": completed / seconds,
+        "reruns_per_second": sum(len(v) for v in samples.values()) / seconds,
+        "server_rss_mb": server_rss,
+        "pages": summarize(samples, errors),
+        "failures": failures[:50],
+    }
+    if args.json:
+        print(json.dumps(record, indent=2))
+    else:
+        print_report(record)
+    if not args.no_record:
+        os.makedirs(os.path.dirname(args.history), exist_ok=True)
+        with open(args.history, "a") as f:
+            f.write(json.dumps(record) + "\n")
+    return 0 if completed == n_journeys else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+
+# Memory benchmark for the county table. Each of --workers spawned processes
+# (like the match pool's worker processes) imports the app, loads the feature
+# store, runs one match and then --sessions more matches with distinct session
+# ids, reporting RSS and PSS after every stage. PSS splits pages shared between
+# processes (the memory-mapped table) evenly, so its growth per process is the
+# memory that is actually private to that process.
+#
+#   python benchmarks/bench_memory.py --workers 4 --sessions 50
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "app"))
+
+STAGES = ("imports", "load", "first_match", "sessions")
+
+
+def memory_kb():
+    """(rss, pss) of this process in kB, pss is None where /proc/self/smaps_rollup is missing."""
+    rss = pss = None
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            for line in f:
+                if line.startswith("Rss:"):
+                    rss = int(line.split()[1])
+                elif line.startswith("Pss:"):
+                    pss = int(line.split()[1])
+    except OSError:
+        import resource
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss, pss
+
+
+def worker(n_sessions, barrier, results):
+    measurements = {}
+    import numpy  # noqa: F401
+    import pandas  # noqa: F401
+    import sklearn.neighbors  # noqa: F401
+    from algorithms.dijkstra import dijkstra_algorithm
+    from algorithms.feature_store import get_feature_store
+    from algorithms.result_cache import get_match_cache
+    from utils.preferences import build_features
+    measurements["imports"] = memory_kb()
+
+    get_feature_store()
+    measurements["load"] = memory_kb()
+
+    features = build_features(50, 5, [], 5, 175, 5, {})
+    dijkstra_algorithm(features, 5, session_id="session-0")
+    measurements["first_match"] = memory_kb()
+
+    for i in range(n_sessions):
+        #A fresh ideal per session so every match misses the cache and keeps its own result
+        get_match_cache().clear()
+        dijkstra_algorithm(build_features(10 * (i % 10), 1 + i % 10, [], 5, 175, 5, {}), 5,
+                           session_id=f"session-{i + 1}")
+    measurements["sessions"] = memory_kb()
+
+    #Measure while every worker is still alive, so shared pages are split between all of them
+    barrier.wait()
+    measurements["final"] = memory_kb()
+    results.put(measurements)
+    barrier.wait()
+
+
+def run(n_workers, n_sessions):
+    context = multiprocessing.get_context("spawn")
+    barrier = context.Barrier(n_workers)
+    results = context.Queue()
+    processes = [context.Process(target=worker, args=(n_sessions, barrier, results)) for _ in range(n_workers)]
+    for process in processes:
+        process.start()
+    collected = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    return collected
+
+
+def summarize(collected, n_sessions):
+    def mean(values):
+        values = [v for v in values if v is not None]
+        return sum(values) / len(values) if values else None
+
+    summary = {}
+    for stage in STAGES + ("final",):
+        summary[stage] = {
+            "rss_kb": mean([m[stage][0] for m in collected]),
+            "pss_kb": mean([m[stage][1] for m in collected]),
+        }
+    sessions_growth = mean([m["sessions"][0] - m["first_match"][0] for m in collected])
+    summary["rss_kb_per_session"] = sessions_growth / n_sessions if n_sessions else None
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure per-process and per-session memory of the matcher.")
+    parser.add_argument("--workers", type=int, default=4, help="processes loading the table at once")
+    parser.add_argument("--sessions", type=int, default=50, help="matches with distinct session ids per process")
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    args = parser.parse_args(argv)
+
+    summary = summarize(run(args.workers, args.sessions), args.sessions)
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return 0
+
+    print(f"{args.workers} processes, {args.sessions} sessions each (mean per process, MB)")
+    print(f"{'stage':<14}{'RSS':>10}{'PSS':>10}")
+    for stage in STAGES + ("final",):
+        rss, pss = summary[stage]["rss_kb"], summary[stage]["pss_kb"]
+        pss_text = f"{pss / 1024:>10.1f}" if pss is not None else f"{'n/a':>10}"
+        print(f"{stage:<14}{rss / 1024:>10.1f}{pss_text}")
+    print(f"RSS growth per session: {summary['rss_kb_per_session']:.1f} kB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
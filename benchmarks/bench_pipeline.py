@@ -0,0 +1,210 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+# Phase-level benchmark of the matching pipeline behind dijkstra_algorithm and
+# bellman_ford_algorithm: load, normalize, distance, kNN fit, graph build,
+# each search variant, result materialization and the optional CSV export.
+# Runs on the real county table and on synthetic tables with the same schema,
+# and appends one JSON line per dataset to benchmarks/results/history.jsonl so
+# runs from different commits can be compared.
+#
+#   python benchmarks/bench_pipeline.py --sizes real 10000 100000
+#   python benchmarks/bench_pipeline.py --compare
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "app"))
+
+from algorithms.bellman_ford import bellman_ford, bellman_ford_vectorized, spfa  # noqa: E402
+from algorithms.dijkstra import dijkstra, dijkstra_top_k  # noqa: E402
+from algorithms.build_dataset import SOURCE_PATH, build_table, read_source, validate  # noqa: E402
+from algorithms.feature_store import FeatureStore, write_table  # noqa: E402
+from algorithms.graph import add_perfect_county, fit_knn, knn_csr  # noqa: E402
+from algorithms.ranking import ranked_matches  # noqa: E402
+from algorithms.result_store import export_distances  # noqa: E402
+import sklearn.neighbors  # noqa: E402,F401  imported up front so knn_fit does not time the import
+
+HISTORY_PATH = os.path.join(ROOT, "benchmarks", "results", "history.jsonl")
+
+#Columns the preferences page never sets
+UNUSED_COLUMNS = {
+    "fips",
+    "Employment.Nonemployer Establishments",
+    "Housing.Persons per Household",
+    "Miscellaneous.Land Area",
+    "Population.2020 Population",
+    "Population.2010 Population",
+}
+
+#Searches too slow to be worth timing past this many rows
+SLOW_SEARCH_LIMIT = {"search_bellman_ford_classic": 20000, "search_spfa": 200000}
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def synthetic_csv(n_rows, directory, seed=0):
+    """Write a table with the county schema by resampling real rows with multiplicative noise."""
+    rng = np.random.default_rng(seed)
+    real = pd.read_csv(SOURCE_PATH).dropna()
+    sample = real.iloc[rng.integers(0, len(real), n_rows)].reset_index(drop=True)
+    numeric = [c for c in sample.columns if c not in ("County", "State", "fips")]
+    sample[numeric] = sample[numeric].to_numpy() * rng.lognormal(0.0, 0.1, (n_rows, len(numeric)))
+    sample["County"] = [f"Synthetic County {i}" for i in range(n_rows)]
+    sample["fips"] = np.arange(1, n_rows + 1, dtype=np.float64)
+    path = os.path.join(directory, f"synthetic_{n_rows}.csv")
+    sample.to_csv(path, index=False)
+    return path
+
+
+def timed(fn, repeats):
+    times = []
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), result
+
+
+def bench_dataset(csv_path, repeats, k=5, n_neighbors=5, seed=0):
+    phases = {}
+    with tempfile.TemporaryDirectory() as cache_dir:
+        #The build step parses and validates the CSV once, the app only maps the result
+        dataset_path = os.path.join(cache_dir, "dataset.bin")
+
+        def build():
+            #Synthetic tables can outnumber the 99999 FIPS codes, which only the map cares about
+            data, _ = validate(read_source(csv_path))
+            return write_table(dataset_path, *build_table(data))
+        phases["build_dataset"], _ = timed(build, 1)
+        phases["load"], store = timed(lambda: FeatureStore(dataset_path, os.path.join(cache_dir, "c")), repeats)
+
+        feature_names = [c for c in store.columns if c not in UNUSED_COLUMNS]
+        ideal = np.random.default_rng(seed).random(len(feature_names))
+
+        def normalize():
+            store._normalized.clear()
+            return store.normalized(feature_names)
+        phases["normalize"], (rows, normalized) = timed(normalize, repeats)
+        phases["distance"], distance_to_ideal = timed(lambda: np.linalg.norm(normalized - ideal, axis=1), repeats)
+
+        phases["knn_fit"], (indices, distances) = timed(lambda: fit_knn(normalized, n_neighbors), 1)
+        phases["graph_build_cold"], csr = timed(lambda: knn_csr(indices, distances), repeats)
+        phases["graph_build_warm"], graph = timed(lambda: add_perfect_county(*csr, distance_to_ideal), repeats)
+
+        searches = {
+            "search_dijkstra_top_k": lambda: dijkstra_top_k(graph, graph.perfect_index, k),
+            "search_dijkstra_full": lambda: dijkstra(graph, graph.perfect_index),
+            "search_bellman_ford_vectorized": lambda: bellman_ford_vectorized(graph, graph.perfect_index),
+            "search_spfa": lambda: spfa(graph, graph.perfect_index),
+            "search_bellman_ford_classic": lambda: bellman_ford(graph, graph.perfect_index),
+        }
+        county_distances = None
+        for name, search in searches.items():
+            if len(rows) > SLOW_SEARCH_LIMIT.get(name, float("inf")):
+                continue
+            phases[name], result = timed(search, repeats)
+            if name == "search_dijkstra_full":
+                county_distances = result[:graph.perfect_index]
+
+        def materialize():
+            distance_column = np.full(store.n_rows, np.nan)
+            distance_column[rows] = county_distances
+            top = np.argsort(county_distances)[:k]
+            return ranked_matches(store, rows, top, county_distances[top]), distance_column
+        phases["materialize"], (_, distance_column) = timed(materialize, repeats)
+
+        export_path = os.path.join(cache_dir, "export.csv")
+        phases["export_csv"], _ = timed(lambda: export_distances(store.frame(), distance_column, export_path), 1)
+
+    return {"rows": int(len(rows)), "features": len(feature_names), "phases": phases}
+
+
+def load_history(path=HISTORY_PATH):
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def compare(history):
+    #Latest run of each dataset against the run before it
+    by_dataset = {}
+    for record in history:
+        by_dataset.setdefault(record["dataset"], []).append(record)
+    for dataset, records in by_dataset.items():
+        if len(records) < 2:
+            continue
+        before, after = records[-2], records[-1]
+        #Phases come and go as the pipeline changes, those only one run has are flagged, not skipped
+        old_phases, new_phases = before["phases"], after["phases"]
+        print(f"\n{dataset}: {before['commit']} -> {after['commit']}")
+        for phase, seconds in new_phases.items():
+            old = old_phases.get(phase)
+            if old is None:
+                print(f"  {phase:32s} {'':>13} -> {seconds * 1000:10.2f} ms  WARNING: not in {before['commit']}")
+            elif old:
+                change = (seconds - old) / old * 100
+                flag = "  <-- slower" if change > 20 else ""
+                print(f"  {phase:32s} {old * 1000:10.2f} ms -> {seconds * 1000:10.2f} ms  {change:+6.1f}%{flag}")
+        for phase, old in old_phases.items():
+            if phase not in new_phases:
+                print(f"  {phase:32s} {old * 1000:10.2f} ms -> {'':>13}  WARNING: not in {after['commit']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark each phase of the matching pipeline.")
+    parser.add_argument("--sizes", nargs="+", default=["real", "10000", "100000"],
+                        help="'real' for the county table, or synthetic row counts (e.g. 1000000)")
+    parser.add_argument("--repeats", type=int, default=3, help="runs per phase, the median is recorded")
+    parser.add_argument("--history", default=HISTORY_PATH, help="JSON lines file the results are appended to")
+    parser.add_argument("--no-record", action="store_true", help="print results without appending to history")
+    parser.add_argument("--compare", action="store_true", help="compare the last two recorded runs and exit")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(load_history(args.history))
+        return
+
+    commit = git_commit()
+    with tempfile.TemporaryDirectory() as data_dir:
+        for size in args.sizes:
+            csv_path = SOURCE_PATH if size == "real" else synthetic_csv(int(size), data_dir)
+            dataset = "real" if size == "real" else f"synthetic_{int(size)}"
+            result = bench_dataset(csv_path, args.repeats)
+
+            print(f"\n{dataset} ({result['rows']} rows, {result['features']} features)")
+            for phase, seconds in result["phases"].items():
+                print(f"  {phase:32s} {seconds * 1000:10.2f} ms")
+
+            if not args.no_record:
+                record = {
+                    "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                    "commit": commit,
+                    "dataset": dataset,
+                    "python": platform.python_version(),
+                    "numpy": np.__version__,
+                    "machine": platform.machine(),
+                    **result,
+                }
+                os.makedirs(os.path.dirname(args.history), exist_ok=True)
+                with open(args.history, "a") as f:
+                    f.write(json.dumps(record) + "\n")
+
+
+if __name__ == "__main__":
+    main()
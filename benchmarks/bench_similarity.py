@@ -0,0 +1,106 @@
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+# Benchmark of the "counties similar to this one" indexes in
+# app/algorithms/similarity.py: build time, index memory, query latency and
+# recall@k of each method against the exact answer, on the real county table
+# and on synthetic tables made like bench_pipeline.py makes them. Queries are
+# --queries random counties of the table, each asking for its k nearest other
+# counties.
+#
+#   python benchmarks/bench_similarity.py --sizes real 100000 --k 10
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "app"))
+
+from algorithms.build_dataset import SOURCE_PATH, build_table, read_source, validate  # noqa: E402
+from algorithms.feature_store import FeatureStore, write_table  # noqa: E402
+from algorithms.similarity import SIMILARITY_METHODS  # noqa: E402
+from bench_pipeline import synthetic_csv  # noqa: E402
+import sklearn.neighbors  # noqa: E402,F401  imported up front so the ball tree build does not time the import
+
+
+def load_store(csv_path, directory):
+    dataset_path = os.path.join(directory, "dataset.bin")
+    data, _ = validate(read_source(csv_path))
+    write_table(dataset_path, *build_table(data))
+    return FeatureStore(dataset_path, os.path.join(directory, "cache"))
+
+
+def bench_method(cls, X, queries, k, exact):
+    start = time.perf_counter()
+    index = cls(X)
+    build_time = time.perf_counter() - start
+
+    query_times, recalls = [], []
+    for position, expected in zip(queries, exact):
+        start = time.perf_counter()
+        positions, _ = index.query(X[position], k + 1)
+        query_times.append(time.perf_counter() - start)
+        found = positions[positions != position][:k]
+        recalls.append(len(np.intersect1d(found, expected)) / k)
+    query_times.sort()
+    return {
+        "build_ms": build_time * 1000,
+        "index_mb": index.nbytes / 2**20,
+        "query_p50_ms": statistics.median(query_times) * 1000,
+        "query_p95_ms": query_times[int(0.95 * (len(query_times) - 1))] * 1000,
+        "recall": float(np.mean(recalls)),
+    }
+
+
+def bench_dataset(csv_path, k, n_queries, seed=0):
+    with tempfile.TemporaryDirectory() as directory:
+        store = load_store(csv_path, directory)
+        _, X = store.normalized(list(store.columns))
+        queries = np.random.default_rng(seed).choice(len(X), min(n_queries, len(X)), replace=False)
+
+        #Ground truth from a full sort of every distance, independent of the indexes
+        exact = []
+        for position in queries:
+            distances = np.linalg.norm(X - X[position], axis=1)
+            distances[position] = np.inf
+            exact.append(np.argsort(distances, kind="stable")[:k])
+
+        methods = {name: bench_method(cls, X, queries, k, exact) for name, cls in SIMILARITY_METHODS.items()}
+    return {"rows": len(X), "features": X.shape[1], "matrix_mb": X.nbytes / 2**20, "methods": methods}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the similar counties indexes.")
+    parser.add_argument("--sizes", nargs="+", default=["real", "100000"],
+                        help="'real' for the county table, or synthetic row counts")
+    parser.add_argument("--k", type=int, default=10, help="similar counties per query")
+    parser.add_argument("--queries", type=int, default=200, help="query counties per dataset")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args(argv)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as data_dir:
+        for size in args.sizes:
+            csv_path = SOURCE_PATH if size == "real" else synthetic_csv(int(size), data_dir)
+            dataset = "real" if size == "real" else f"synthetic_{int(size)}"
+            results[dataset] = result = bench_dataset(csv_path, args.k, args.queries)
+            if args.json:
+                continue
+
+            print(f"\n{dataset} ({result['rows']} rows, {result['features']} features, "
+                  f"matrix {result['matrix_mb']:.1f} MB), recall@{args.k} against exact")
+            print(f"  {'method':12s}{'build ms':>12}{'index MB':>10}{'p50 ms':>10}{'p95 ms':>10}{'recall':>9}")
+            for name, m in result["methods"].items():
+                print(f"  {name:12s}{m['build_ms']:12.1f}{m['index_mb']:10.2f}{m['query_p50_ms']:10.3f}"
+                      f"{m['query_p95_ms']:10.3f}{m['recall']:9.3f}")
+    if args.json:
+        print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+import os
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+from algorithms import answer_table  # noqa: E402
+from algorithms.answer_table import AnswerTable, write_answers  # noqa: E402
+
+DEPTH = 4
+
+
+@pytest.fixture
+def store(tmp_path):
+    #AnswerTable only reads the cache dir, digest and row count of the feature store
+    return SimpleNamespace(cache_dir=str(tmp_path), digest="0123456789abcdef" * 4, n_rows=100)
+
+
+@pytest.fixture
+def small_tables(monkeypatch):
+    monkeypatch.setattr(answer_table, "INITIAL_CAPACITY", 8)
+
+
+def test_put_and_get(store, small_tables):
+    table = AnswerTable(store, DEPTH)
+    assert table.get(5) is None
+
+    table.put(5, [3, 1, 4, 1])
+    table.put(6, [2, 7])
+    assert table.get(5).tolist() == [3, 1, 4, 1]
+    #Short rankings come back without the padding
+    assert table.get(6).tolist() == [2, 7]
+    assert table.get(7) is None
+    assert len(table) == 2
+
+
+def test_existing_key_is_kept(store, small_tables):
+    table = AnswerTable(store, DEPTH)
+    table.put(5, [1, 2, 3, 4])
+    table.put(5, [9, 9, 9, 9])
+    assert table.get(5).tolist() == [1, 2, 3, 4]
+
+
+def test_colliding_keys_probe_linearly(store, small_tables):
+    table = AnswerTable(store, DEPTH)
+    #Same home slot in a table of 8
+    keys = [3, 11, 19]
+    for i, key in enumerate(keys):
+        table.put(key, [i, i, i, i])
+    assert table.capacity == 8
+    assert [table.get(key).tolist() for key in keys] == [[0] * 4, [1] * 4, [2] * 4]
+    assert table.get(27) is None
+
+
+def test_growth_keeps_every_answer(store, small_tables):
+    table = AnswerTable(store, DEPTH)
+    keys = range(1, 41)
+    for key in keys:
+        table.put(key, [key % 100] * DEPTH)
+    assert table.capacity > 8
+    assert len(table) <= answer_table.MAX_LOAD * table.capacity
+    assert all(table.get(key).tolist() == [key % 100] * DEPTH for key in keys)
+    assert len(table) == len(table.entries()[0])
+
+
+def test_count_catches_up_with_other_writers(store, small_tables, monkeypatch):
+    monkeypatch.setattr(answer_table, "MAX_PROBES", 1)
+    first = AnswerTable(store, DEPTH)
+    first.put(1, [1, 1, 1, 1])
+    second = AnswerTable(store, DEPTH)
+    #In-place inserts keep the file, so the second writer does not reopen it
+    first.put(2, [2, 2, 2, 2])
+    first.put(3, [3, 3, 3, 3])
+    assert len(second) == 1
+    #Same home slot as 1, probing past it recounts
+    second.put(9, [9, 9, 9, 9])
+    assert len(second) == 4
+
+
+def test_reopens_after_another_writer_replaces_the_file(store, small_tables):
+    reader = AnswerTable(store, DEPTH)
+    writer = AnswerTable(store, DEPTH)
+    writer.put(5, [1, 2, 3, 4])
+    #The reader opened before the file existed
+    assert reader.get(5).tolist() == [1, 2, 3, 4]
+
+    #An offline rebuild replaces the whole file
+    write_answers(reader.path, reader.dtype, np.array([9], dtype=np.uint64), [[4, 3, 2, 1]])
+    assert reader.get(9).tolist() == [4, 3, 2, 1]
+    assert reader.get(5) is None
+
+    #Growth by another writer replaces it with a bigger one
+    for key in range(10, 30):
+        writer.put(key, [0, 0, 0, 0])
+    assert reader.get(29).tolist() == [0, 0, 0, 0]
+    assert reader.capacity == writer.capacity